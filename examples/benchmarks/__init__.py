@@ -0,0 +1,6 @@
+"""
+Benchmarks of SDK hot paths.
+
+These scripts run offline (no API credentials or network) and print the CPU time
+per operation of the paths they compare.
+"""
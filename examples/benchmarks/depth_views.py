@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Depth Views - CPU time per single-level depth update of incremental and full re-aggregation.
+
+Applies single-level UPDATE messages to books of increasing depth, with 1, 5 and 25 bps
+and 10 tick views maintained by ``DepthAggregator``, and compares them with grouping
+the whole book again on every message. Both give the same views. Nothing is sent.
+
+Usage:
+    python -m examples.benchmarks.depth_views
+"""
+
+from typing import Callable
+
+import random
+import time
+from decimal import Decimal
+from functools import partial
+
+from sdk.async_api.depth import Depth
+from sdk.async_api.depth_type import DepthType
+from sdk.async_api.level import Level
+from sdk.reya_data.depth_views import DepthAggregator
+
+SYMBOL = "WETHRUSD"
+TICK_SIZE = Decimal("0.01")
+MID_TICKS = 350000
+GRANULARITIES = ("1bps", "5bps", "25bps", "10ticks")
+BOOK_LEVELS = (100, 1000, 5000)
+UPDATES = 2000
+
+
+def depth(kind: DepthType, bids: dict[int, str], asks: dict[int, str], updated_at: int) -> Depth:
+    """Depth message with levels given as price ticks -> quantity."""
+    return Depth(
+        symbol=SYMBOL,
+        type=kind,
+        bids=[Level(px=str(price * TICK_SIZE), qty=qty) for price, qty in sorted(bids.items(), reverse=True)],
+        asks=[Level(px=str(price * TICK_SIZE), qty=qty) for price, qty in sorted(asks.items())],
+        updatedAt=updated_at,
+    )
+
+
+def apply_and_regroup(aggregator: DepthAggregator, message: Depth) -> None:
+    """Apply a message, then group the whole book again."""
+    aggregator.apply_depth(message)
+    aggregator.rebase(SYMBOL)
+
+
+def cpu_us(messages: list[Depth], apply: Callable[[Depth], object]) -> float:
+    """CPU microseconds per message."""
+    started = time.process_time()
+    for message in messages:
+        apply(message)
+    return (time.process_time() - started) / len(messages) * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rng = random.Random(7)  # nosec B311
+    print(f"CPU time per single-level update, {len(GRANULARITIES)} granularities, {UPDATES} updates")
+    print(f"{'levels':>8}{'full':>12}{'incremental':>14}{'speedup':>10}")
+    for levels in BOOK_LEVELS:
+        bids = {MID_TICKS - 1 - index * 2: f"{rng.uniform(0.1, 5):.3f}" for index in range(levels)}
+        asks = {MID_TICKS + 1 + index * 2: f"{rng.uniform(0.1, 5):.3f}" for index in range(levels)}
+        snapshot = depth(DepthType.SNAPSHOT, bids, asks, 0)
+        updates = []
+        for index in range(UPDATES):
+            price = MID_TICKS - 1 - rng.randrange(levels) * 2
+            qty = "0" if rng.random() < 0.2 else f"{rng.uniform(0.1, 5):.3f}"
+            updates.append(depth(DepthType.UPDATE, {price: qty}, {}, index + 1))
+
+        incremental = DepthAggregator(GRANULARITIES, {SYMBOL: str(TICK_SIZE)})
+        incremental.apply_depth(snapshot)
+        incremental_us = cpu_us(updates, incremental.apply_depth)
+
+        # Full re-aggregation: every message rebuilds the views from the whole book
+        full = DepthAggregator(GRANULARITIES, {SYMBOL: str(TICK_SIZE)})
+        full.apply_depth(snapshot)
+        full_us = cpu_us(updates, partial(apply_and_regroup, full))
+
+        for granularity in GRANULARITIES:
+            assert incremental.view(SYMBOL, granularity).bid_prices == full.view(SYMBOL, granularity).bid_prices
+        print(f"{levels * 2:>8}{full_us:>12.1f}{incremental_us:>14.1f}{full_us / incremental_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
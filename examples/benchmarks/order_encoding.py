@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Order Encoding - CPU time per order of the generic and direct request serializers.
+
+Compares, for create order, cancel order and mass cancel requests, the generic
+OpenAPI path (``param_serialize`` and ``json.dumps``, as done by ``OrderEntryApi``)
+with ``encode_request`` as used by ``ReyaOrderEntryApi``, with the standard library
+encoder and, if installed, orjson. Nothing is sent.
+
+Usage:
+    python -m examples.benchmarks.order_encoding
+"""
+
+from typing import Any, Callable
+
+import json
+import time
+from functools import partial
+
+from sdk.open_api.api.order_entry_api import OrderEntryApi
+from sdk.open_api.configuration import Configuration
+from sdk.open_api.models.cancel_order_request import CancelOrderRequest
+from sdk.open_api.models.create_order_request import CreateOrderRequest
+from sdk.open_api.models.mass_cancel_request import MassCancelRequest
+from sdk.open_api.models.order_type import OrderType
+from sdk.open_api.models.time_in_force import TimeInForce
+from sdk.reya_rest_api.api_client import ReyaApiClient
+from sdk.reya_rest_api.order_entry import OrderEntryRequest, encode_request, orjson
+
+ITERATIONS = 20_000
+
+CREATE_ORDER = CreateOrderRequest(
+    exchangeId=5,
+    symbol="WETHRUSD",
+    accountId=10000000002,
+    isBuy=True,
+    limitPx="3512.25",
+    qty="0.015",
+    orderType=OrderType.LIMIT,
+    timeInForce=TimeInForce.GTC,
+    signature="0x" + "5c" * 65,
+    nonce="1760000000000001",
+    signerWallet="0x" + "a1" * 20,
+    expiresAfter=1760086400000,
+    clientOrderId=123456789,
+)
+CANCEL_ORDER = CancelOrderRequest(
+    orderId="1856060584567504896",
+    signature="0x" + "5c" * 65,
+    nonce="1760000000000002",
+    symbol="WETHRUSD",
+    accountId=10000000002,
+    expiresAfter=1760000010000,
+)
+MASS_CANCEL = MassCancelRequest(
+    accountId=10000000002,
+    symbol="WETHRUSD",
+    signature="0x" + "5c" * 65,
+    nonce="1760000000000003",
+    expiresAfter=1760000010000,
+)
+
+
+def cpu_us(operation: Callable[[], object]) -> float:
+    """CPU microseconds per call of an operation."""
+    for _ in range(ITERATIONS // 10):  # Warm up
+        operation()
+    started = time.process_time()
+    for _ in range(ITERATIONS):
+        operation()
+    return (time.process_time() - started) / ITERATIONS * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    api = OrderEntryApi(ReyaApiClient(Configuration(host="http://localhost")))
+    serializers: dict[str, tuple[Callable[..., Any], OrderEntryRequest]] = {
+        "create order": (api._create_order_serialize, CREATE_ORDER),  # pylint: disable=protected-access
+        "cancel order": (api._cancel_order_serialize, CANCEL_ORDER),  # pylint: disable=protected-access
+        "mass cancel": (api._cancel_all_serialize, MASS_CANCEL),  # pylint: disable=protected-access
+    }
+
+    print(f"CPU time per request, {ITERATIONS} iterations")
+    print(f"{'request':<14}{'generic':>10}{'direct':>10}{'orjson':>10}{'speedup':>10}")
+    for name, (serialize, request) in serializers.items():
+
+        def generic(serialize=serialize, request=request) -> bytes:
+            _method, _url, _headers, body, _post = serialize(request, None, None, None, 0)
+            return json.dumps(body).encode()  # As RESTClientObject.request and aiohttp do
+
+        assert encode_request(request) == generic()
+        generic_us = cpu_us(generic)
+        direct_us = cpu_us(partial(encode_request, request))
+        best_us = direct_us
+        orjson_column = "-"
+        if orjson is not None:
+            orjson_us = cpu_us(partial(encode_request, request, use_orjson=True))
+            best_us = min(direct_us, orjson_us)
+            orjson_column = f"{orjson_us:.2f}"
+        print(f"{name:<14}{generic_us:>10.2f}{direct_us:>10.2f}{orjson_column:>10}{generic_us / best_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Record Memory - Memory per row of execution models and compact records.
+
+Decodes pages of perp executions as they arrive from the API and keeps every row as a
+REST model (``PerpExecution``), a WebSocket model (``sdk.async_api``) or a
+``PerpExecutionRecord``, and reports the memory held by the rows, their strings
+included, as measured by tracemalloc. The REST models and records share interned
+symbols (``sdk.reya_data.interning``); the WebSocket models are validated directly and
+keep a copy per row. Nothing is sent.
+
+Usage:
+    python -m examples.benchmarks.record_memory [rows]
+"""
+
+from typing import Any, Callable, Iterator
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from sdk.async_api.perp_execution import PerpExecution as AsyncPerpExecution
+from sdk.open_api.models.perp_execution import PerpExecution
+from sdk.reya_data.records import PerpExecutionRecord
+from sdk.reya_rest_api.trusted_responses import construct_model
+
+DEFAULT_ROWS = 1_000_000
+PAGE_SIZE = 100
+
+
+def page_text() -> str:
+    """JSON body of a page of perp executions, as from the wallet executions endpoint."""
+    return json.dumps(
+        [
+            {
+                "exchangeId": 1,
+                "symbol": "ETHRUSDPERP",
+                "accountId": 10000000002,
+                "qty": f"0.{index * 7 % 1000:03d}",
+                "side": "B" if index % 2 else "A",
+                "price": f"{3400 + index}.25",
+                "fee": f"0.0{index * 13 % 997:03d}",
+                "type": "ORDER_MATCH",
+                "timestamp": 1760000000000 + index,
+                "sequenceNumber": 880000 + index,
+            }
+            for index in range(PAGE_SIZE)
+        ]
+    )
+
+
+def pages(rows: int, text: str) -> Iterator[list[dict[str, Any]]]:
+    """Decoded pages; every decode creates new string and int objects, as fresh responses do."""
+    for start in range(0, rows, PAGE_SIZE):
+        yield json.loads(text)[: rows - start]
+
+
+def measure(name: str, rows: int, convert: Callable[[dict[str, Any]], Any]) -> None:
+    """Print the memory held by rows kept in one representation."""
+    text = page_text()
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    kept = [convert(row) for page in pages(rows, text) for row in page]
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    held, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<18}{held / 2**20:>10.0f}{held / len(kept):>10.0f}{elapsed:>10.1f}")
+    del kept
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    print(f"Memory held by {rows} perp executions")
+    print(f"{'representation':<18}{'MiB':>10}{'B/row':>10}{'seconds':>10}  (build time, slowed by tracing)")
+    measure("REST model", rows, lambda row: construct_model(PerpExecution, row))
+    measure("WebSocket model", rows, AsyncPerpExecution.model_validate)
+    measure("record", rows, PerpExecutionRecord.from_json)
+
+
+if __name__ == "__main__":
+    main()
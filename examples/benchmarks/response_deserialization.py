@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Response Deserialization - CPU time per response of the strict and trusted deserializers.
+
+Deserializes real-size JSON bodies (summaries of every market, a page of executions,
+open orders, a deep order book) with the generated models' validating ``from_dict``
+path and with the trusted path used by ``ReyaApiClient(trusted_responses=True)``, and
+checks that both give equal models. Nothing is sent.
+
+Usage:
+    python -m examples.benchmarks.response_deserialization
+"""
+
+from typing import Any, Callable
+
+import json
+import time
+from functools import partial
+
+from sdk.open_api.configuration import Configuration
+from sdk.reya_rest_api.api_client import ReyaApiClient
+
+ITERATIONS = 200
+MARKETS = 100
+PAGE_SIZE = 100
+DEPTH_LEVELS = 100
+
+CONTENT_TYPE = "application/json; charset=utf-8"
+
+
+def market_summaries() -> list[dict[str, Any]]:
+    """GET /markets/summary body."""
+    return [
+        {
+            "symbol": f"MKT{index}RUSDPERP",
+            "updatedAt": 1760000000000 + index,
+            "longOiQty": "1523.125",
+            "shortOiQty": "1498.5",
+            "oiQty": "1510.8125",
+            "fundingRate": "-0.0000125",
+            "longFundingValue": "12.000051",
+            "shortFundingValue": "-11.99875",
+            "fundingRateVelocity": "0.000000002",
+            "volume24h": "18234521.75",
+            "pxChange24h": "-1.25",
+            "throttledOraclePrice": "3512.2534",
+            "throttledPoolPrice": "3512.31",
+            "pricesUpdatedAt": 1760000000000 + index,
+        }
+        for index in range(MARKETS)
+    ]
+
+
+def perp_executions() -> dict[str, Any]:
+    """GET /wallet/{address}/perpExecutions body."""
+    return {
+        "data": [
+            {
+                "exchangeId": 1,
+                "symbol": "ETHRUSDPERP",
+                "accountId": 10000000002,
+                "qty": "0.015",
+                "side": "B" if index % 2 else "A",
+                "price": "3512.25",
+                "fee": "0.0263",
+                "type": "ORDER_MATCH",
+                "timestamp": 1760000000000 + index,
+                "sequenceNumber": 880000 + index,
+            }
+            for index in range(PAGE_SIZE)
+        ],
+        "meta": {"limit": PAGE_SIZE, "count": PAGE_SIZE, "endTime": 1760000000100, "startTime": 1760000000000},
+    }
+
+
+def open_orders() -> list[dict[str, Any]]:
+    """GET /wallet/{address}/openOrders body."""
+    return [
+        {
+            "exchangeId": 5,
+            "symbol": "WETHRUSD",
+            "accountId": 10000000002,
+            "orderId": str(1856060584567504896 + index),
+            "qty": "0.015",
+            "execQty": "0",
+            "cumQty": "0",
+            "side": "B",
+            "limitPx": f"{3400 + index}.25",
+            "orderType": "LIMIT",
+            "timeInForce": "GTC",
+            "status": "OPEN",
+            "createdAt": 1760000000000 + index,
+            "lastUpdateAt": 1760000000000 + index,
+        }
+        for index in range(PAGE_SIZE)
+    ]
+
+
+def depth() -> dict[str, Any]:
+    """GET /market/{symbol}/depth body."""
+    return {
+        "symbol": "WETHRUSD",
+        "type": "SNAPSHOT",
+        "bids": [{"px": f"{3500 - index}.5", "qty": "1.25"} for index in range(DEPTH_LEVELS)],
+        "asks": [{"px": f"{3501 + index}.5", "qty": "0.75"} for index in range(DEPTH_LEVELS)],
+        "updatedAt": 1760000000000,
+    }
+
+
+def cpu_us(operation: Callable[[], object]) -> float:
+    """CPU microseconds per call of an operation."""
+    for _ in range(ITERATIONS // 10):  # Warm up
+        operation()
+    started = time.process_time()
+    for _ in range(ITERATIONS):
+        operation()
+    return (time.process_time() - started) / ITERATIONS * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    strict = ReyaApiClient(Configuration(host="http://localhost"))
+    trusted = ReyaApiClient(Configuration(host="http://localhost"), trusted_responses=True)
+    responses = {
+        "market summaries": ("List[MarketSummary]", market_summaries()),
+        "perp executions": ("PerpExecutionList", perp_executions()),
+        "open orders": ("List[Order]", open_orders()),
+        "depth": ("Depth", depth()),
+    }
+
+    print(f"CPU time per response, {ITERATIONS} iterations")
+    print(f"{'response':<18}{'bytes':>8}{'strict':>12}{'trusted':>12}{'speedup':>10}")
+    for name, (response_type, body) in responses.items():
+        text = json.dumps(body)
+        assert trusted.deserialize(text, response_type, CONTENT_TYPE) == strict.deserialize(
+            text, response_type, CONTENT_TYPE
+        )
+        strict_us = cpu_us(partial(strict.deserialize, text, response_type, CONTENT_TYPE))
+        trusted_us = cpu_us(partial(trusted.deserialize, text, response_type, CONTENT_TYPE))
+        print(f"{name:<18}{len(text):>8}{strict_us:>12.1f}{trusted_us:>12.1f}{strict_us / trusted_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Signing - Signatures per second of each signer backend by number of workers.
+
+Signs a batch of spot limit order digests (as ``build_limit_order_requests`` does)
+with ``LocalSignerBackend``, ``ProcessPoolSignerBackend`` and, if coincurve is
+installed, ``NativeSignerBackend`` with 1 up to ``os.cpu_count()`` workers, and checks
+that every backend returns the signatures ``eth_account`` produces. Nothing is sent.
+
+Usage:
+    python -m examples.benchmarks.signing
+"""
+
+from typing import Callable
+
+import os
+import time
+
+from eth_account import Account
+
+from sdk.reya_rest_api.auth.signatures import SignatureGenerator
+from sdk.reya_rest_api.auth.signer_backends import (
+    LocalSignerBackend,
+    NativeSignerBackend,
+    ProcessPoolSignerBackend,
+    SignerBackend,
+    coincurve,
+)
+from sdk.reya_rest_api.config import TradingConfig
+
+BATCH_SIZE = 256
+ROUNDS = 4
+
+# Throwaway key of the benchmark; it holds nothing
+PRIVATE_KEY = "0x" + "4c" * 32
+
+
+def order_digests(generator: SignatureGenerator, count: int) -> list[bytes]:
+    """Digests of spot GTC limit orders with consecutive nonces."""
+    inputs = generator.encode_inputs_limit_order(is_buy=True, limit_px="3512.25", qty="0.015")
+    deadline = int(time.time()) + 60
+    nonce = int(time.time() * 1_000_000)
+    return [
+        generator.raw_order_digest(10000000002, 5, 5, [], 0, inputs, deadline, nonce + index) for index in range(count)
+    ]
+
+
+def signatures_per_second(backend: SignerBackend, digests: list[bytes]) -> float:
+    """Wall-clock signatures per second of a backend over several batches."""
+    backend.sign_digests(digests[: BATCH_SIZE // 4])  # Warm up
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        backend.sign_digests(digests)
+    return ROUNDS * len(digests) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    config = TradingConfig(
+        api_url="http://localhost", chain_id=89346162, owner_wallet_address="", private_key=PRIVATE_KEY
+    )
+    generator = SignatureGenerator(config)
+    digests = order_digests(generator, BATCH_SIZE)
+    # pylint: disable-next=no-value-for-parameter
+    expected = [bytes(Account.unsafe_sign_hash(digest, PRIVATE_KEY).signature) for digest in digests]
+
+    backends: dict[str, Callable[[int], SignerBackend]] = {
+        "process pool": lambda workers: ProcessPoolSignerBackend(PRIVATE_KEY, workers=workers),
+    }
+    if coincurve is not None:
+        backends["native"] = lambda workers: NativeSignerBackend(PRIVATE_KEY, workers=workers)
+
+    cpus = os.cpu_count() or 1
+    print(f"Signatures per second, batches of {BATCH_SIZE}, {cpus} CPUs")
+    print(f"{'backend':<14}{'workers':>8}{'sig/s':>10}{'speedup':>10}")
+
+    with LocalSignerBackend(PRIVATE_KEY) as local:
+        assert local.sign_digests(digests) == expected
+        local_rate = signatures_per_second(local, digests)
+    print(f"{'local':<14}{1:>8}{local_rate:>10.0f}{1:>9.1f}x")
+
+    for name, create in backends.items():
+        for workers in range(1, cpus + 1):
+            with create(workers) as backend:
+                assert backend.sign_digests(digests) == expected
+                rate = signatures_per_second(backend, digests)
+            print(f"{name:<14}{workers:>8}{rate:>10.0f}{rate / local_rate:>9.1f}x")
+    if coincurve is None:
+        print("native: coincurve not installed (pip install reya-python-sdk[speedups])")
+
+
+if __name__ == "__main__":
+    main()
@@ -64,15 +64,15 @@ async def mass_cancel_account(account_number: int, name: str) -> bool:
     await client.start()
 
     try:
-        for symbol in SYMBOLS:
-            try:
-                result = await client.mass_cancel(symbol=symbol, account_id=config.account_id)
-                logger.info(f"✅ {name} ({config.account_id}): Cancelled {result.cancelled_count} orders for {symbol}")
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                if "No orders" in str(e) or "no active" in str(e).lower():
-                    logger.info(f"ℹ️  {name} ({config.account_id}): No orders to cancel for {symbol}")
-                else:
-                    logger.error(f"❌ {name} ({config.account_id}): Error cancelling {symbol}: {e}")
+        # All symbols are validated up front and cancelled concurrently
+        result = await client.mass_cancel_all(symbols=SYMBOLS, account_id=config.account_id)
+        for symbol, response in result.responses.items():
+            logger.info(f"✅ {name} ({config.account_id}): Cancelled {response.cancelled_count} orders for {symbol}")
+        for symbol, e in result.errors.items():
+            if "No orders" in str(e) or "no active" in str(e).lower():
+                logger.info(f"ℹ️  {name} ({config.account_id}): No orders to cancel for {symbol}")
+            else:
+                logger.error(f"❌ {name} ({config.account_id}): Error cancelling {symbol}: {e}")
     finally:
         await client.close()
 
@@ -40,6 +40,7 @@ from sdk.async_api.order_change_update_payload import OrderChangeUpdatePayload
 from sdk.async_api.price_update_payload import PriceUpdatePayload
 from sdk.async_api.subscribed_message_payload import SubscribedMessagePayload
 from sdk.async_api.wallet_spot_execution_update_payload import WalletSpotExecutionUpdatePayload
+from sdk.open_api.exceptions import ApiException
 from sdk.open_api.models.time_in_force import TimeInForce
 from sdk.reya_rest_api import ReyaTradingClient
 from sdk.reya_rest_api.config import TradingConfig
@@ -682,32 +683,44 @@ async def cancel_and_replace_order(
 
     new_qty = generate_random_qty(market_params.min_order_qty, max_qty, market_params.qty_step_size)
 
-    # Cancel the existing order first
-    try:
-        await client.cancel_order(
-            order_id=order.order_id,
+    reason_str = f" ({reason})" if reason else ""
+    logger.info(
+        f"[{cycle:04d}] Replacing {side} @ ${order.price}{reason_str} → new {side} @ ${new_price} qty={new_qty}"
+    )
+
+    # Cancel the existing order and place the new one concurrently
+    result = await client.replace_order(
+        order_id=order.order_id,
+        new_params=LimitOrderParameters(
             symbol=symbol,
-            account_id=account_id,
-        )
-        reason_str = f" ({reason})" if reason else ""
-        logger.info(
-            f"[{cycle:04d}] Cancelling {side} @ ${order.price}{reason_str} "
-            f"→ Adding new {side} @ ${new_price} qty={new_qty}"
-        )
-    except (OSError, RuntimeError) as e:
-        error_str = str(e)
+            is_buy=order.is_buy,
+            limit_px=str(new_price),
+            qty=new_qty,
+            time_in_force=TimeInForce.GTC,
+        ),
+        account_id=account_id,
+    )
+
+    if result.cancel_error is not None:
+        error_str = str(result.cancel_error)
         if "Order not found" in error_str or "CANCEL_ORDER_OTHER_ERROR" in error_str:
             state.remove_order(order.order_id)
             logger.info(f"[{cycle:04d}] Removed stale {side} @ ${order.price} from local state")
         else:
-            logger.warning(f"[{cycle:04d}] Failed to cancel {side} @ ${order.price}: {e}")
-        return False
+            logger.warning(f"[{cycle:04d}] Failed to cancel {side} @ ${order.price}: {result.cancel_error}")
 
-    await asyncio.sleep(0.1)
+    if result.create_error is None:
+        return True
 
-    # Try to place the new order, retrying with min qty if balance issues
-    qty_to_use = new_qty
-    for attempt in range(max_retries):
+    # Retry placing the new order with min qty if it failed on balance
+    error_str = str(result.create_error).lower()
+    if not ("insufficient" in error_str or "balance" in error_str or "margin" in error_str):
+        logger.warning(f"[{cycle:04d}] Failed to place new {side} @ ${new_price}: {result.create_error}")
+        return False
+
+    qty_to_use = str(market_params.min_order_qty)
+    for _ in range(max_retries - 1):
+        logger.debug(f"[{cycle:04d}] Retrying {side} @ ${new_price} with min qty={qty_to_use}")
         try:
             await client.create_limit_order(
                 LimitOrderParameters(
@@ -719,16 +732,8 @@ async def cancel_and_replace_order(
                 )
             )
             return True
-        except (OSError, RuntimeError) as e:
-            error_str = str(e).lower()
-            # Check if it's a balance-related error - retry with min qty
-            if "insufficient" in error_str or "balance" in error_str or "margin" in error_str:
-                if attempt < max_retries - 1:
-                    qty_to_use = str(market_params.min_order_qty)
-                    logger.debug(f"[{cycle:04d}] Retrying {side} @ ${new_price} with min qty={qty_to_use}")
-                    continue
+        except (OSError, RuntimeError, ApiException) as e:
             logger.warning(f"[{cycle:04d}] Failed to place new {side} @ ${new_price}: {e}")
-            return False
 
     return False
 
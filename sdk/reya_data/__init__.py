@@ -0,0 +1,37 @@
+"""
+Reya Data - Client-side market data structures built on the REST and WebSocket APIs.
+"""
+
+from sdk.reya_data.candles import Candle, CandleBuffer, CandleBuilder
+from sdk.reya_data.depth_views import DepthAggregator, DepthView
+from sdk.reya_data.execution_store import ExecutionStore, SyncResult
+from sdk.reya_data.fee_model import FeeModel, effective_fee_rates
+from sdk.reya_data.funding_analytics import FundingAnalytics, FundingScreen
+from sdk.reya_data.interning import SHARED_TABLE, InternTable
+from sdk.reya_data.market_snapshot import MarketSnapshot
+from sdk.reya_data.records import LevelRecord, OrderRecord, PerpExecutionRecord, SpotExecutionRecord
+from sdk.reya_data.tick_archive import TickArchive, TickArchiveWriter, TickSlice
+
+__all__ = [
+    "MarketSnapshot",
+    "FundingAnalytics",
+    "FundingScreen",
+    "CandleBuilder",
+    "CandleBuffer",
+    "Candle",
+    "ExecutionStore",
+    "SyncResult",
+    "TickArchiveWriter",
+    "TickArchive",
+    "TickSlice",
+    "FeeModel",
+    "effective_fee_rates",
+    "PerpExecutionRecord",
+    "SpotExecutionRecord",
+    "OrderRecord",
+    "LevelRecord",
+    "InternTable",
+    "SHARED_TABLE",
+    "DepthAggregator",
+    "DepthView",
+]
@@ -0,0 +1,488 @@
+"""
+Candles - Real-time OHLCV candles at several resolutions, built from execution streams.
+
+Market executions from the ``/v2/market/{symbol}/perpExecutions`` and
+``/v2/market/{symbol}/spotExecutions`` channels are aggregated into candles at every
+configured resolution at once. Closed candles are kept in fixed-size ring buffers per
+symbol and resolution, and listeners are notified as each candle closes.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Union
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+
+from sdk.async_api.market_perp_execution_update_payload import MarketPerpExecutionUpdatePayload
+from sdk.async_api.market_spot_execution_update_payload import MarketSpotExecutionUpdatePayload
+from sdk.async_api.perp_execution import PerpExecution
+from sdk.async_api.spot_execution import SpotExecution
+from sdk.open_api.models.candle_history_data import CandleHistoryData
+
+if TYPE_CHECKING:
+    from sdk.reya_rest_api.client import ReyaTradingClient
+
+logger = logging.getLogger("reya_data.candles")
+
+# Candle resolutions supported by the API, in seconds
+RESOLUTIONS = {
+    "1m": 60,
+    "5m": 5 * 60,
+    "15m": 15 * 60,
+    "1h": 60 * 60,
+    "4h": 4 * 60 * 60,
+    "1d": 24 * 60 * 60,
+}
+
+DEFAULT_RESOLUTIONS = ("1m", "5m", "1h")
+DEFAULT_CAPACITY = 1000
+
+# Columns of closed candles, as exposed by ``CandleBuilder.column``
+CANDLE_COLUMNS = ("start", "open", "high", "low", "close", "volume", "trades")
+
+AnyExecution = Union[PerpExecution, SpotExecution]
+
+
+@dataclass(frozen=True)
+class Candle:
+    """
+    One OHLCV candle.
+
+    Attributes:
+        symbol: Trading symbol.
+        resolution: Resolution, e.g. "1m".
+        start: Candle open time in seconds, aligned to the resolution.
+        open: First traded price.
+        high: Highest traded price.
+        low: Lowest traded price.
+        close: Last traded price.
+        volume: Traded base quantity; NaN for candles seeded from history, which has no volume.
+        trades: Number of executions; 0 for candles seeded from history.
+        closed: Whether the candle is final.
+    """
+
+    symbol: str
+    resolution: str
+    start: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    trades: int
+    closed: bool
+
+    @property
+    def end(self) -> int:
+        """Candle close time in seconds (exclusive)."""
+        return self.start + RESOLUTIONS[self.resolution]
+
+
+class CandleBuffer:
+    """Fixed-size ring buffer of closed candles of one symbol and resolution, stored column-wise."""
+
+    def __init__(self, symbol: str, resolution: str, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.symbol = symbol
+        self.resolution = resolution
+        self.capacity = capacity
+        self._columns: dict[str, array] = {
+            name: array("q" if name in ("start", "trades") else "d", [0]) * capacity for name in CANDLE_COLUMNS
+        }
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_start(self) -> Optional[int]:
+        """Open time of the newest candle, or None if empty."""
+        if not self._size:
+            return None
+        return int(self._columns["start"][(self._next - 1) % self.capacity])
+
+    def append(self, candle: Candle) -> None:
+        """Add a closed candle, overwriting the oldest one when full."""
+        index = self._next
+        for name in CANDLE_COLUMNS:
+            self._columns[name][index] = getattr(candle, name)
+        self._next = (index + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def column(self, name: str) -> array:
+        """Copy of one column, oldest candle first."""
+        source = self._columns[name]
+        if self._size < self.capacity:
+            return source[: self._size]
+        return source[self._next :] + source[: self._next]
+
+    def candles(self, n: Optional[int] = None) -> list[Candle]:
+        """The newest n candles (all if None), oldest first."""
+        count = self._size if n is None else max(0, min(n, self._size))
+        first = self._next - count
+        columns = self._columns
+        result = []
+        for offset in range(count):
+            index = (first + offset) % self.capacity
+            result.append(
+                Candle(
+                    symbol=self.symbol,
+                    resolution=self.resolution,
+                    start=columns["start"][index],
+                    open=columns["open"][index],
+                    high=columns["high"][index],
+                    low=columns["low"][index],
+                    close=columns["close"][index],
+                    volume=columns["volume"][index],
+                    trades=columns["trades"][index],
+                    closed=True,
+                )
+            )
+        return result
+
+
+class _FormingCandle:
+    __slots__ = ("start", "open", "high", "low", "close", "volume", "trades", "last_ms")
+
+    def __init__(self, start: int, price: float, volume: float, trades: int, last_ms: int):
+        self.start = start
+        self.open = self.high = self.low = self.close = price
+        self.volume = volume
+        self.trades = trades
+        self.last_ms = last_ms
+
+    def add(self, price: float, qty: float, timestamp_ms: int) -> None:
+        self.high = max(self.high, price)
+        self.low = min(self.low, price)
+        # Executions within a period may arrive out of order; the close is the latest one
+        if timestamp_ms >= self.last_ms:
+            self.close = price
+            self.last_ms = timestamp_ms
+        self.volume += qty
+        self.trades += 1
+
+    def freeze(self, symbol: str, resolution: str, closed: bool) -> Candle:
+        return Candle(
+            symbol=symbol,
+            resolution=resolution,
+            start=self.start,
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+            trades=self.trades,
+            closed=closed,
+        )
+
+
+class CandleBuilder:
+    """
+    Incremental OHLCV aggregator for several symbols and resolutions.
+
+    Pass ``on_message`` to ``ReyaSocket`` (or call it from an existing handler) with the
+    market execution channels of the wanted symbols subscribed, and optionally ``seed``
+    from REST candle history first. A candle closes when the first execution of a later
+    period arrives, or when ``close_elapsed`` is called after its period has ended;
+    periods without executions produce no candle, as in the REST history.
+
+    All methods are thread-safe; listeners run outside the lock.
+    """
+
+    def __init__(self, resolutions: Iterable[str] = DEFAULT_RESOLUTIONS, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize the builder.
+
+        Args:
+            resolutions: Resolutions to build, see RESOLUTIONS.
+            capacity: Closed candles kept per symbol and resolution.
+        """
+        self._resolutions = tuple(resolutions)
+        for resolution in self._resolutions:
+            if resolution not in RESOLUTIONS:
+                raise ValueError(f"Unsupported candle resolution: {resolution}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._buffers: dict[tuple[str, str], CandleBuffer] = {}
+        self._forming: dict[tuple[str, str], _FormingCandle] = {}
+        self._listeners: list[Callable[[Candle], None]] = []
+
+    @property
+    def resolutions(self) -> tuple[str, ...]:
+        """Resolutions being built."""
+        return self._resolutions
+
+    def add_listener(self, listener: Callable[[Candle], None]) -> None:
+        """
+        Register a callback invoked with every candle as it closes.
+
+        Listeners run on the thread that applied the update (the WebSocket thread for
+        ``on_message``) and must not block.
+
+        Args:
+            listener: Callback receiving the closed candle.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Candle], None]) -> None:
+        """
+        Unregister a callback added with ``add_listener``.
+
+        Args:
+            listener: The callback to remove.
+        """
+        self._listeners.remove(listener)
+
+    async def seed(self, client: "ReyaTradingClient", symbols: Iterable[str], end_time: Optional[int] = None) -> None:
+        """
+        Load recent candle history for each symbol and resolution concurrently.
+
+        Args:
+            client: Client to fetch with.
+            symbols: Symbols to seed.
+            end_time: Millisecond timestamp the history ends at; defaults to now.
+        """
+        end_time = end_time if end_time is not None else int(time.time() * 1000)
+        keys = [(symbol, resolution) for symbol in symbols for resolution in self._resolutions]
+        histories = await asyncio.gather(
+            *(
+                client.markets.get_candles(symbol=symbol, resolution=resolution, end_time=end_time)
+                for symbol, resolution in keys
+            )
+        )
+        for (symbol, resolution), history in zip(keys, histories):
+            self.load_history(symbol, resolution, history, now=end_time // 1000)
+
+    def load_history(self, symbol: str, resolution: str, history: CandleHistoryData, now: Optional[int] = None) -> int:
+        """
+        Load REST candle history, replacing any candles already stored for the pair.
+
+        A history candle whose period has not ended yet becomes the forming candle and
+        keeps being updated by executions.
+
+        Args:
+            symbol: Trading symbol.
+            resolution: Resolution of the history.
+            history: Result of ``get_candles``.
+            now: Current time in seconds; defaults to now.
+
+        Returns:
+            Number of closed candles loaded.
+        """
+        if resolution not in self._resolutions:
+            raise ValueError(f"Resolution {resolution} is not being built")
+        now = now if now is not None else int(time.time())
+        period = RESOLUTIONS[resolution]
+        rows = sorted(zip(history.t, history.o, history.h, history.l, history.c))
+
+        buffer = CandleBuffer(symbol, resolution, self._capacity)
+        forming: Optional[_FormingCandle] = None
+        for start, open_px, high_px, low_px, close_px in rows:
+            candle = Candle(
+                symbol=symbol,
+                resolution=resolution,
+                start=start,
+                open=float(open_px),
+                high=float(high_px),
+                low=float(low_px),
+                close=float(close_px),
+                volume=math.nan,
+                trades=0,
+                closed=True,
+            )
+            if start + period > now:
+                forming = _FormingCandle(start, candle.open, math.nan, 0, start * 1000)
+                forming.high, forming.low, forming.close = candle.high, candle.low, candle.close
+            else:
+                buffer.append(candle)
+
+        key = (symbol, resolution)
+        with self._lock:
+            self._buffers[key] = buffer
+            if forming is not None:
+                self._forming[key] = forming
+            else:
+                self._forming.pop(key, None)
+        return len(buffer)
+
+    def on_message(self, _ws: Any, message: Any) -> None:
+        """
+        Apply a WebSocket message; messages other than market executions are ignored.
+
+        Args:
+            _ws: The WebSocket connection (unused, for ``ReyaSocket`` compatibility).
+            message: Typed WebSocket message.
+        """
+        if isinstance(message, (MarketPerpExecutionUpdatePayload, MarketSpotExecutionUpdatePayload)):
+            self.apply_executions(message.data)
+
+    def apply_executions(self, executions: Iterable[AnyExecution]) -> list[Candle]:
+        """
+        Aggregate executions into candles.
+
+        Args:
+            executions: Executions from the WebSocket, oldest first.
+
+        Returns:
+            Candles closed by these executions.
+        """
+        closed: list[Candle] = []
+        with self._lock:
+            for execution in executions:
+                self._add_trade(
+                    execution.symbol,
+                    float(execution.price),
+                    abs(float(execution.qty)),
+                    execution.timestamp,
+                    closed,
+                )
+        self._notify(closed)
+        return closed
+
+    def apply_trade(self, symbol: str, price: float, qty: float, timestamp_ms: int) -> list[Candle]:
+        """
+        Aggregate a single trade into candles.
+
+        Args:
+            symbol: Trading symbol.
+            price: Trade price.
+            qty: Traded base quantity.
+            timestamp_ms: Trade time in milliseconds.
+
+        Returns:
+            Candles closed by this trade.
+        """
+        closed: list[Candle] = []
+        with self._lock:
+            self._add_trade(symbol, price, abs(qty), timestamp_ms, closed)
+        self._notify(closed)
+        return closed
+
+    def close_elapsed(self, now: Optional[float] = None) -> list[Candle]:
+        """
+        Close forming candles whose period has ended, for markets without recent trades.
+
+        Args:
+            now: Current time in seconds; defaults to now.
+
+        Returns:
+            Candles closed.
+        """
+        now = now if now is not None else time.time()
+        closed: list[Candle] = []
+        with self._lock:
+            for key, forming in list(self._forming.items()):
+                if forming.start + RESOLUTIONS[key[1]] <= now:
+                    closed.append(self._close(key, forming))
+                    del self._forming[key]
+        self._notify(closed)
+        return closed
+
+    async def run_closer(self, interval: float = 1.0) -> None:
+        """
+        Call ``close_elapsed`` periodically until cancelled.
+
+        Args:
+            interval: Seconds between checks.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            self.close_elapsed()
+
+    def candles(self, symbol: str, resolution: str, n: Optional[int] = None) -> list[Candle]:
+        """
+        Closed candles, oldest first.
+
+        Args:
+            symbol: Trading symbol.
+            resolution: Resolution.
+            n: Number of newest candles to return; all stored candles if None.
+
+        Returns:
+            Closed candles.
+        """
+        with self._lock:
+            buffer = self._buffers.get((symbol, resolution))
+            return buffer.candles(n) if buffer is not None else []
+
+    def forming(self, symbol: str, resolution: str) -> Optional[Candle]:
+        """
+        The candle of the current period, updated on every execution.
+
+        Args:
+            symbol: Trading symbol.
+            resolution: Resolution.
+
+        Returns:
+            The forming candle, or None if there was no execution in the current period.
+        """
+        with self._lock:
+            forming = self._forming.get((symbol, resolution))
+            return forming.freeze(symbol, resolution, closed=False) if forming is not None else None
+
+    def column(self, symbol: str, resolution: str, name: str) -> array:
+        """
+        Copy of one column of the closed candles, oldest first, e.g. closes for indicators.
+
+        Args:
+            symbol: Trading symbol.
+            resolution: Resolution.
+            name: One of CANDLE_COLUMNS.
+
+        Returns:
+            A float64 ("d") or int64 ("q") array.
+        """
+        if name not in CANDLE_COLUMNS:
+            raise KeyError(f"Unknown candle column: {name}")
+        with self._lock:
+            buffer = self._buffers.get((symbol, resolution))
+            if buffer is None:
+                return array("q" if name in ("start", "trades") else "d")
+            return buffer.column(name)
+
+    def _add_trade(self, symbol: str, price: float, qty: float, timestamp_ms: int, closed: list[Candle]) -> None:
+        """Add a trade to the forming candle of every resolution. Caller must hold the lock."""
+        second = timestamp_ms // 1000
+        for resolution in self._resolutions:
+            key = (symbol, resolution)
+            start = second - second % RESOLUTIONS[resolution]
+            forming = self._forming.get(key)
+            if forming is not None and start == forming.start:
+                forming.add(price, qty, timestamp_ms)
+                continue
+            if forming is not None and start < forming.start:
+                logger.debug(f"Ignoring late {symbol} execution for closed {resolution} candle")
+                continue
+            buffer = self._buffers.get(key)
+            if forming is None and buffer is not None and (buffer.last_start or -1) >= start:
+                logger.debug(f"Ignoring late {symbol} execution for closed {resolution} candle")
+                continue
+            if forming is not None:
+                closed.append(self._close(key, forming))
+            self._forming[key] = _FormingCandle(start, price, qty, 1, timestamp_ms)
+
+    def _close(self, key: tuple[str, str], forming: _FormingCandle) -> Candle:
+        """Move a forming candle into the ring buffer. Caller must hold the lock."""
+        candle = forming.freeze(key[0], key[1], closed=True)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = CandleBuffer(key[0], key[1], self._capacity)
+        buffer.append(candle)
+        return candle
+
+    def _notify(self, closed: list[Candle]) -> None:
+        """Invoke listeners for closed candles. Must be called without holding the lock."""
+        for candle in closed:
+            for listener in list(self._listeners):
+                try:
+                    listener(candle)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error(f"Candle listener failed: {e}")
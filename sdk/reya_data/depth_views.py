@@ -0,0 +1,365 @@
+"""
+Depth Views - Order book depth grouped into coarser price buckets, maintained incrementally.
+
+``DepthAggregator`` follows the ``/v2/market/{symbol}/depth`` stream and keeps the book
+grouped at several granularities at once, such as 1, 5 and 25 bps or N ticks. A
+snapshot rebuilds every view; each level of an update changes the size of one bucket
+per granularity, so updates cost the same however deep the book is.
+
+Levels are keyed by their exact price in millionths of a tick (the tick archive's
+``PRICE_SUBTICKS``), so perp levels priced off the pool between ticks stay distinct.
+Buckets are aligned to multiples of their width in ticks: bids are grouped down and
+asks up, so a bucket's price is never better than the levels in it. Basis point
+widths are converted to ticks at the mid price of each snapshot (or on ``rebase``)
+and stay fixed until the next one, so buckets do not move with every mid change.
+
+Views are returned as ``array`` columns, best bucket first, with cumulative sizes for
+sizing; ``numpy.frombuffer`` wraps them without copying.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+
+import asyncio
+import re
+import threading
+from array import array
+from dataclasses import dataclass
+from decimal import Decimal
+from itertools import accumulate
+
+from sdk.async_api.depth import Depth as AsyncDepth
+from sdk.async_api.market_depth_update_payload import MarketDepthUpdatePayload
+from sdk.open_api.models.depth import Depth
+from sdk.reya_data.tick_archive import PRICE_SUBTICKS
+
+if TYPE_CHECKING:
+    from sdk.reya_rest_api.client import ReyaTradingClient
+
+DEFAULT_GRANULARITIES = ("1bps", "5bps", "25bps")
+
+# "<n>bps" (basis points of the mid price) or "<n>ticks"
+_GRANULARITY = re.compile(r"(\d+(?:\.\d+)?)(bps|ticks?)")
+
+AnyDepth = Union[Depth, AsyncDepth]
+
+
+def _units(unit: Decimal, price: str) -> int:
+    return int((Decimal(price) / unit).to_integral_value())
+
+
+def _parse_granularity(granularity: str) -> tuple[Decimal, bool]:
+    """(size, is_bps) of a granularity."""
+    match = _GRANULARITY.fullmatch(granularity)
+    if match is None:
+        raise ValueError(f"Invalid granularity {granularity!r}; expected e.g. '5bps' or '10ticks'")
+    size = Decimal(match.group(1))
+    is_bps = match.group(2) == "bps"
+    if size <= 0 or (not is_bps and size != size.to_integral_value()):
+        raise ValueError(f"Invalid granularity {granularity!r}; sizes are positive, ticks whole")
+    return size, is_bps
+
+
+@dataclass(frozen=True)
+class DepthView:
+    """
+    Both sides of the book at one granularity, best bucket first.
+
+    Attributes:
+        symbol: Trading symbol.
+        granularity: Granularity, e.g. "5bps".
+        width: Bucket width in price.
+        updated_at: Time of the last depth message applied, in milliseconds.
+        bid_prices: Bid bucket prices, descending.
+        bid_sizes: Total size of each bid bucket.
+        bid_cumulative: Size of the bid buckets up to and including each one.
+        ask_prices: Ask bucket prices, ascending.
+        ask_sizes: Total size of each ask bucket.
+        ask_cumulative: Size of the ask buckets up to and including each one.
+    """
+
+    symbol: str
+    granularity: str
+    width: Decimal
+    updated_at: int
+    bid_prices: array
+    bid_sizes: array
+    bid_cumulative: array
+    ask_prices: array
+    ask_sizes: array
+    ask_cumulative: array
+
+
+class _Buckets:
+    """Bucket sizes of one side of the book at one granularity."""
+
+    __slots__ = ("is_bid", "width", "sizes", "counts", "_order", "_columns")
+
+    def __init__(self, is_bid: bool):
+        self.is_bid = is_bid
+        self.width = 0  # In price units, a whole number of ticks; 0 until a basis point width is anchored
+        self.sizes: dict[int, float] = {}
+        self.counts: dict[int, int] = {}  # Levels in each bucket, so empty buckets are dropped exactly
+        self._order: Optional[list[int]] = None
+        self._columns: Optional[tuple[array, array, array]] = None
+
+    def reset(self, width: int, levels: dict[int, float]) -> None:
+        self.width = width
+        self.sizes.clear()
+        self.counts.clear()
+        self._order = None
+        self._columns = None
+        for price, qty in levels.items():
+            self.add(price, qty, 1)
+
+    def add(self, price: int, delta: float, levels: int) -> None:
+        """Add a size change at a price in price units; levels is +1 for a new level, -1 for a removed one."""
+        width = self.width
+        if not width:
+            return
+        bucket = price // width if self.is_bid else -(-price // width)
+        count = self.counts.get(bucket, 0) + levels
+        if not count:
+            del self.sizes[bucket], self.counts[bucket]
+            self._order = None
+        elif count == levels:
+            self.sizes[bucket] = delta
+            self.counts[bucket] = count
+            self._order = None
+        else:
+            self.sizes[bucket] += delta
+            self.counts[bucket] = count
+        self._columns = None
+
+    def columns(self, unit: Decimal) -> tuple[array, array, array]:
+        """(prices, sizes, cumulative sizes), best bucket first; cached until the next change."""
+        if self._columns is None:
+            if self._order is None:
+                self._order = sorted(self.sizes, reverse=self.is_bid)
+            step = unit * self.width
+            sizes = array("d", [self.sizes[bucket] for bucket in self._order])
+            self._columns = (
+                array("d", [float(step * bucket) for bucket in self._order]),
+                sizes,
+                array("d", accumulate(sizes)),
+            )
+        return self._columns
+
+
+class _Book:
+    """Levels of one symbol in price units, and their buckets at every granularity."""
+
+    __slots__ = ("tick", "unit", "bids", "asks", "granularities", "views", "updated_at", "_sides")
+
+    def __init__(self, tick: Decimal, granularities: dict[str, tuple[Decimal, bool]]):
+        self.tick = tick
+        self.unit = tick / PRICE_SUBTICKS
+        self.bids: dict[int, float] = {}
+        self.asks: dict[int, float] = {}
+        self.granularities = granularities
+        self.views = {granularity: (_Buckets(True), _Buckets(False)) for granularity in granularities}
+        self.updated_at = 0
+        # Buckets of every granularity, by side (bids, asks)
+        self._sides = tuple([views[side] for views in self.views.values()] for side in (0, 1))
+
+    def set_level(self, is_bid: bool, price: int, qty: float) -> None:
+        levels = self.bids if is_bid else self.asks
+        old = levels.get(price)
+        if qty > 0:
+            levels[price] = qty
+            delta, added = (qty, 1) if old is None else (qty - old, 0)
+        elif old is not None:
+            del levels[price]
+            delta, added = -old, -1
+        else:
+            return
+        for buckets in self._sides[0 if is_bid else 1]:
+            buckets.add(price, delta, added)
+
+    def anchored(self) -> bool:
+        return all(bids.width for bids, _ in self.views.values())
+
+    def rebuild(self) -> None:
+        """Set the bucket widths at the current mid price and regroup every level."""
+        best_bid = max(self.bids) if self.bids else None
+        best_ask = min(self.asks) if self.asks else None
+        if best_bid is not None and best_ask is not None:
+            mid = Decimal(best_bid + best_ask) / 2
+        else:
+            mid = Decimal(best_bid if best_bid is not None else best_ask or 0)
+        for granularity, (bids, asks) in self.views.items():
+            size, is_bps = self.granularities[granularity]
+            if is_bps:
+                ticks = max(1, int((mid * size / 10000 / PRICE_SUBTICKS).to_integral_value())) if mid else 0
+            else:
+                ticks = int(size)
+            width = ticks * PRICE_SUBTICKS
+            bids.reset(width, self.bids)
+            asks.reset(width, self.asks)
+
+
+class DepthAggregator:
+    """
+    Maintains bucketed views of order book depth from the depth stream.
+
+    Pass ``on_message`` to ``ReyaSocket`` (or call it from an existing handler) with the
+    market depth channels subscribed, or apply REST depth snapshots with
+    ``apply_depth``. The tick size of each symbol must be known before its first
+    message, from ``tick_sizes``, ``set_tick_size`` or ``load_tick_sizes``.
+
+    Example:
+        aggregator = DepthAggregator(granularities=("1bps", "5bps", "25bps", "10ticks"))
+        await aggregator.load_tick_sizes(client)
+        socket = ReyaSocket(on_message=aggregator.on_message, ...)
+        view = aggregator.view("WETHRUSD", "5bps", depth=10)
+        size_within_5_buckets = view.ask_cumulative[4]
+    """
+
+    def __init__(
+        self, granularities: Iterable[str] = DEFAULT_GRANULARITIES, tick_sizes: Optional[dict[str, str]] = None
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            granularities: Bucket widths, each "<n>bps" of the mid price or "<n>ticks".
+            tick_sizes: Tick size by symbol.
+
+        Raises:
+            ValueError: If a granularity is invalid.
+        """
+        self._granularities = {granularity: _parse_granularity(granularity) for granularity in granularities}
+        self._lock = threading.Lock()
+        self._tick_sizes: dict[str, Decimal] = {}
+        self._books: dict[str, _Book] = {}
+        for symbol, tick_size in (tick_sizes or {}).items():
+            self.set_tick_size(symbol, tick_size)
+
+    @property
+    def granularities(self) -> tuple[str, ...]:
+        """Maintained granularities."""
+        return tuple(self._granularities)
+
+    def set_tick_size(self, symbol: str, tick_size: Union[str, Decimal]) -> None:
+        """
+        Set the tick size of a symbol; its book is cleared if the tick size changes.
+
+        Args:
+            symbol: Trading symbol.
+            tick_size: Price tick size.
+        """
+        tick = Decimal(tick_size)
+        with self._lock:
+            if self._tick_sizes.get(symbol) != tick:
+                self._tick_sizes[symbol] = tick
+                self._books.pop(symbol, None)
+
+    async def load_tick_sizes(self, client: "ReyaTradingClient") -> None:
+        """
+        Set the tick sizes of all perp and spot markets from their definitions.
+
+        Args:
+            client: Client to fetch the market definitions with.
+        """
+        definitions, spot_definitions = await asyncio.gather(
+            client.reference.get_market_definitions(),
+            client.reference.get_spot_market_definitions(),
+        )
+        for definition in definitions:
+            self.set_tick_size(definition.symbol, definition.tick_size)
+        for spot_definition in spot_definitions:
+            self.set_tick_size(spot_definition.symbol, spot_definition.tick_size)
+
+    def on_message(self, _ws: Any, message: Any) -> None:
+        """
+        Apply a WebSocket message; messages other than market depth are ignored.
+
+        Args:
+            _ws: The WebSocket connection (unused, for ``ReyaSocket`` compatibility).
+            message: Typed WebSocket message.
+        """
+        if isinstance(message, MarketDepthUpdatePayload):
+            self.apply_depth(message.data)
+
+    def apply_depth(self, depth: AnyDepth) -> None:
+        """
+        Apply a depth snapshot or update.
+
+        Args:
+            depth: Depth from REST or the WebSocket; update levels with quantity 0 are removed.
+
+        Raises:
+            KeyError: If the tick size of the symbol is unknown.
+        """
+        with self._lock:
+            book = self._book(depth.symbol)
+            unit = book.unit
+            snapshot = depth.type.value == "SNAPSHOT"
+            if snapshot:
+                book.bids.clear()
+                book.asks.clear()
+            for is_bid, levels in ((True, depth.bids), (False, depth.asks)):
+                for level in levels:
+                    if snapshot:
+                        qty = float(level.qty)
+                        if qty > 0:
+                            (book.bids if is_bid else book.asks)[_units(unit, level.px)] = qty
+                    else:
+                        book.set_level(is_bid, _units(unit, level.px), float(level.qty))
+            if snapshot or not book.anchored():
+                book.rebuild()
+            book.updated_at = depth.updated_at
+
+    def rebase(self, symbol: str) -> None:
+        """
+        Recompute the basis point bucket widths at the current mid price and regroup the book.
+
+        Args:
+            symbol: Trading symbol.
+        """
+        with self._lock:
+            book = self._books.get(symbol)
+            if book is not None:
+                book.rebuild()
+
+    def view(self, symbol: str, granularity: str, depth: Optional[int] = None) -> DepthView:
+        """
+        Bucketed view of a symbol's book.
+
+        Args:
+            symbol: Trading symbol.
+            granularity: One of the aggregator's granularities.
+            depth: Number of buckets per side (all if None).
+
+        Returns:
+            The view; its arrays are copies, empty before the first depth message.
+
+        Raises:
+            KeyError: If the granularity is not maintained.
+        """
+        if granularity not in self._granularities:
+            raise KeyError(f"Granularity {granularity} is not maintained; maintained: {self.granularities}")
+        with self._lock:
+            book = self._books.get(symbol)
+            if book is None:
+                return DepthView(symbol, granularity, Decimal(0), 0, *(array("d") for _ in range(6)))
+            bids, asks = book.views[granularity]
+            bid_columns = [column[:depth] for column in bids.columns(book.unit)]
+            ask_columns = [column[:depth] for column in asks.columns(book.unit)]
+            return DepthView(
+                symbol,
+                granularity,
+                book.tick * (bids.width // PRICE_SUBTICKS),
+                book.updated_at,
+                *bid_columns,
+                *ask_columns,
+            )
+
+    def _book(self, symbol: str) -> _Book:
+        """Book of a symbol, created on first use. Caller must hold the lock."""
+        book = self._books.get(symbol)
+        if book is None:
+            tick = self._tick_sizes.get(symbol)
+            if tick is None:
+                raise KeyError(f"Unknown tick size for {symbol}; call set_tick_size or load_tick_sizes first")
+            book = self._books[symbol] = _Book(tick, self._granularities)
+        return book
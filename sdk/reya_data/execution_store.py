@@ -0,0 +1,615 @@
+"""
+Execution Store - Persistent local store of wallet executions with incremental sync.
+
+Wallet perp and spot executions are kept in a SQLite database. ``sync`` only pages
+through executions newer than the last synced high-water mark, live executions from
+the wallet WebSocket channels are merged as they arrive, and rows received from both
+sources are stored once. Range queries by symbol and time are answered from local
+indexes, as models or (with ``lean=True``) as compact records.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Literal, Optional, Union, overload
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+
+from sdk.async_api.perp_execution import PerpExecution as AsyncPerpExecution
+from sdk.async_api.spot_execution import SpotExecution as AsyncSpotExecution
+from sdk.async_api.wallet_perp_execution_update_payload import WalletPerpExecutionUpdatePayload
+from sdk.async_api.wallet_spot_execution_update_payload import WalletSpotExecutionUpdatePayload
+from sdk.open_api.models.execution_type import ExecutionType
+from sdk.open_api.models.perp_execution import PerpExecution
+from sdk.open_api.models.side import Side
+from sdk.open_api.models.spot_execution import SpotExecution
+from sdk.reya_data.records import PerpExecutionRecord, SpotExecutionRecord
+
+if TYPE_CHECKING:
+    from sdk.reya_rest_api.client import ReyaTradingClient
+
+logger = logging.getLogger("reya_data.execution_store")
+
+AnyPerpExecution = Union[PerpExecution, AsyncPerpExecution, PerpExecutionRecord]
+AnySpotExecution = Union[SpotExecution, AsyncSpotExecution, SpotExecutionRecord]
+
+PERP = "perp"
+SPOT = "spot"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS perp_executions (
+    wallet TEXT NOT NULL,
+    sequence_number INTEGER NOT NULL,
+    exchange_id INTEGER NOT NULL,
+    symbol TEXT NOT NULL,
+    account_id INTEGER NOT NULL,
+    qty TEXT NOT NULL,
+    side TEXT NOT NULL,
+    price TEXT NOT NULL,
+    fee TEXT NOT NULL,
+    type TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    PRIMARY KEY (wallet, sequence_number)
+);
+CREATE INDEX IF NOT EXISTS perp_executions_symbol_time ON perp_executions (wallet, symbol, timestamp);
+CREATE INDEX IF NOT EXISTS perp_executions_time ON perp_executions (wallet, timestamp);
+
+-- Spot executions have no sequence number; they are deduplicated on all of their
+-- identifying fields, with missing IDs stored as empty strings so they compare equal
+CREATE TABLE IF NOT EXISTS spot_executions (
+    wallet TEXT NOT NULL,
+    exchange_id INTEGER,
+    symbol TEXT NOT NULL,
+    account_id INTEGER NOT NULL,
+    maker_account_id INTEGER NOT NULL,
+    order_id TEXT NOT NULL,
+    maker_order_id TEXT NOT NULL,
+    side TEXT NOT NULL,
+    qty TEXT NOT NULL,
+    price TEXT NOT NULL,
+    fee TEXT NOT NULL,
+    type TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    UNIQUE (wallet, timestamp, account_id, maker_account_id, order_id, maker_order_id, side, qty, price)
+);
+CREATE INDEX IF NOT EXISTS spot_executions_symbol_time ON spot_executions (wallet, symbol, timestamp);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    wallet TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    high_water_timestamp INTEGER NOT NULL,
+    PRIMARY KEY (wallet, kind)
+);
+"""
+
+_PERP_COLUMNS = (
+    "sequence_number",
+    "exchange_id",
+    "symbol",
+    "account_id",
+    "qty",
+    "side",
+    "price",
+    "fee",
+    "type",
+    "timestamp",
+)
+_SPOT_COLUMNS = (
+    "exchange_id",
+    "symbol",
+    "account_id",
+    "maker_account_id",
+    "order_id",
+    "maker_order_id",
+    "side",
+    "qty",
+    "price",
+    "fee",
+    "type",
+    "timestamp",
+)
+
+# Rows per page returned by the wallet execution endpoints
+PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    """
+    Outcome of one ``ExecutionStore.sync`` call.
+
+    Attributes:
+        perp_inserted: New perp executions stored.
+        spot_inserted: New spot executions stored.
+        pages: REST pages fetched.
+    """
+
+    perp_inserted: int
+    spot_inserted: int
+    pages: int
+
+
+def _perp_row(wallet: str, execution: AnyPerpExecution) -> tuple:
+    return (
+        wallet,
+        execution.sequence_number,
+        execution.exchange_id,
+        execution.symbol,
+        execution.account_id,
+        execution.qty,
+        execution.side.value,
+        execution.price,
+        execution.fee,
+        execution.type.value,
+        execution.timestamp,
+    )
+
+
+def _spot_row(wallet: str, execution: AnySpotExecution) -> tuple:
+    return (
+        wallet,
+        execution.exchange_id,
+        execution.symbol,
+        execution.account_id,
+        execution.maker_account_id,
+        execution.order_id or "",
+        execution.maker_order_id or "",
+        execution.side.value,
+        execution.qty,
+        execution.price,
+        execution.fee,
+        execution.type.value,
+        execution.timestamp,
+    )
+
+
+def _wallet_from_channel(channel: str) -> str:
+    """Wallet address of a ``/v2/wallet/{address}/...`` channel."""
+    return channel.split("/")[3].lower()
+
+
+class ExecutionStore:
+    """
+    SQLite-backed store of wallet perp and spot executions.
+
+    The REST high-water mark only moves forward through ``sync``; executions merged
+    from the WebSocket do not advance it, so a gap in the live stream is filled by the
+    next sync instead of being skipped.
+
+    All methods are thread-safe, so ``on_message`` can be called from the WebSocket
+    thread while queries run elsewhere.
+
+    Example:
+        with ExecutionStore("executions.db") as store:
+            await store.sync(client)
+            fills = store.perp_executions(symbol="ETHRUSDPERP", start_time=day_start_ms)
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Open (and create if needed) a store.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a transient store.
+        """
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ExecutionStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def high_water_mark(self, wallet: str, kind: str = PERP) -> Optional[int]:
+        """
+        Timestamp (ms) up to which executions of a wallet have been synced from REST.
+
+        Args:
+            wallet: Wallet address.
+            kind: "perp" or "spot".
+
+        Returns:
+            The high-water timestamp, or None if the wallet was never synced.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT high_water_timestamp FROM sync_state WHERE wallet = ? AND kind = ?", (wallet.lower(), kind)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    async def sync(self, client: "ReyaTradingClient", wallet: Optional[str] = None) -> SyncResult:
+        """
+        Fetch executions newer than the high-water marks, perp and spot concurrently.
+
+        Args:
+            client: Client to fetch with.
+            wallet: Wallet address; defaults to the client's owner wallet.
+
+        Returns:
+            Counts of new rows and pages fetched.
+        """
+        address = (wallet or client.owner_wallet_address).lower()
+        (perp_inserted, perp_pages), (spot_inserted, spot_pages) = await asyncio.gather(
+            self._sync_kind(client, address, PERP),
+            self._sync_kind(client, address, SPOT),
+        )
+        logger.debug(f"Synced {perp_inserted} perp and {spot_inserted} spot executions for {address}")
+        return SyncResult(perp_inserted=perp_inserted, spot_inserted=spot_inserted, pages=perp_pages + spot_pages)
+
+    async def _sync_kind(self, client: "ReyaTradingClient", wallet: str, kind: str) -> tuple[int, int]:
+        """Page backwards from now to the high-water mark. Returns (rows inserted, pages)."""
+        high_water = self.high_water_mark(wallet, kind)
+        newest: Optional[int] = None
+        end_time: Optional[int] = None
+        inserted = 0
+        pages = 0
+        while True:
+            pages += 1
+            if kind == PERP:
+                perp_page = await client.wallet.get_wallet_perp_executions(
+                    address=wallet, start_time=high_water, end_time=end_time
+                )
+                inserted += self.add_perp_executions(wallet, perp_page.data)
+                timestamps = [execution.timestamp for execution in perp_page.data]
+            else:
+                spot_page = await client.wallet.get_wallet_spot_executions(
+                    address=wallet, start_time=high_water, end_time=end_time
+                )
+                inserted += self.add_spot_executions(wallet, spot_page.data)
+                timestamps = [execution.timestamp for execution in spot_page.data]
+            if not timestamps:
+                break
+
+            newest = max(newest or 0, *timestamps)
+            oldest = min(timestamps)
+            if len(timestamps) < PAGE_SIZE or (high_water is not None and oldest <= high_water):
+                break
+            # End times are inclusive, so step past a page made of a single timestamp
+            end_time = oldest if end_time is None or oldest < end_time else oldest - 1
+
+        if newest is not None and (high_water is None or newest > high_water):
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_state (wallet, kind, high_water_timestamp) VALUES (?, ?, ?)",
+                    (wallet, kind, newest),
+                )
+        return inserted, pages
+
+    def on_message(self, _ws: Any, message: Any) -> None:
+        """
+        Merge a WebSocket message; messages other than wallet executions are ignored.
+
+        Args:
+            _ws: The WebSocket connection (unused, for ``ReyaSocket`` compatibility).
+            message: Typed WebSocket message.
+        """
+        if isinstance(message, WalletPerpExecutionUpdatePayload):
+            self.add_perp_executions(_wallet_from_channel(message.channel), message.data)
+        elif isinstance(message, WalletSpotExecutionUpdatePayload):
+            self.add_spot_executions(_wallet_from_channel(message.channel), message.data)
+
+    def add_perp_executions(self, wallet: str, executions: Iterable[AnyPerpExecution]) -> int:
+        """
+        Store perp executions, ignoring ones already stored.
+
+        Args:
+            wallet: Wallet address the executions belong to.
+            executions: Executions from REST or the WebSocket.
+
+        Returns:
+            Number of new rows.
+        """
+        rows = [_perp_row(wallet.lower(), execution) for execution in executions]
+        return self._insert("perp_executions", ("wallet", *_PERP_COLUMNS), rows)
+
+    def add_spot_executions(self, wallet: str, executions: Iterable[AnySpotExecution]) -> int:
+        """
+        Store spot executions, ignoring ones already stored.
+
+        Args:
+            wallet: Wallet address the executions belong to.
+            executions: Executions from REST or the WebSocket.
+
+        Returns:
+            Number of new rows.
+        """
+        rows = [_spot_row(wallet.lower(), execution) for execution in executions]
+        return self._insert("spot_executions", ("wallet", *_SPOT_COLUMNS), rows)
+
+    def _insert(self, table: str, columns: tuple[str, ...], rows: list[tuple]) -> int:
+        if not rows:
+            return 0
+        placeholders = ", ".join("?" * len(columns))
+        sql = f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(sql, rows)
+            return self._conn.total_changes - before
+
+    @overload
+    def perp_executions(
+        self,
+        wallet: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        account_id: Optional[int] = None,
+        lean: Literal[False] = False,
+    ) -> list[PerpExecution]:
+        """Stored perp executions as models."""
+
+    @overload
+    def perp_executions(
+        self,
+        wallet: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        account_id: Optional[int] = None,
+        *,
+        lean: Literal[True],
+    ) -> list[PerpExecutionRecord]:
+        """Stored perp executions as records."""
+
+    @overload
+    def perp_executions(
+        self,
+        wallet: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        account_id: Optional[int] = None,
+        lean: bool = False,
+    ) -> Union[list[PerpExecution], list[PerpExecutionRecord]]:
+        """Stored perp executions as models or records."""
+
+    def perp_executions(
+        self,
+        wallet: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        account_id: Optional[int] = None,
+        lean: bool = False,
+    ) -> Union[list[PerpExecution], list[PerpExecutionRecord]]:
+        """
+        Stored perp executions, oldest first.
+
+        Args:
+            wallet: Only executions of this wallet.
+            symbol: Only executions of this symbol.
+            start_time: Only executions at or after this timestamp (ms).
+            end_time: Only executions before this timestamp (ms).
+            account_id: Only executions of this account.
+            lean: Return PerpExecutionRecord tuples instead of models, for long histories.
+
+        Returns:
+            Matching executions.
+        """
+        rows = self._select("perp_executions", _PERP_COLUMNS, wallet, symbol, start_time, end_time, account_id)
+        if lean:
+            sides = {member.value: member for member in Side}
+            types = {member.value: member for member in ExecutionType}
+            return [
+                PerpExecutionRecord(
+                    exchange_id,
+                    row_symbol,
+                    row_account_id,
+                    qty,
+                    sides[side],
+                    price,
+                    fee,
+                    types[execution_type],
+                    timestamp,
+                    sequence_number,
+                )
+                for (
+                    sequence_number,
+                    exchange_id,
+                    row_symbol,
+                    row_account_id,
+                    qty,
+                    side,
+                    price,
+                    fee,
+                    execution_type,
+                    timestamp,
+                ) in rows
+            ]
+        return [
+            PerpExecution(
+                sequenceNumber=sequence_number,
+                exchangeId=exchange_id,
+                symbol=row_symbol,
+                accountId=row_account_id,
+                qty=qty,
+                side=Side(side),
+                price=price,
+                fee=fee,
+                type=ExecutionType(execution_type),
+                timestamp=timestamp,
+            )
+            for (
+                sequence_number,
+                exchange_id,
+                row_symbol,
+                row_account_id,
+                qty,
+                side,
+                price,
+                fee,
+                execution_type,
+                timestamp,
+            ) in rows
+        ]
+
+    @overload
+    def spot_executions(
+        self,
+        wallet: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        account_id: Optional[int] = None,
+        lean: Literal[False] = False,
+    ) -> list[SpotExecution]:
+        """Stored spot executions as models."""
+
+    @overload
+    def spot_executions(
+        self,
+        wallet: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        account_id: Optional[int] = None,
+        *,
+        lean: Literal[True],
+    ) -> list[SpotExecutionRecord]:
+        """Stored spot executions as records."""
+
+    @overload
+    def spot_executions(
+        self,
+        wallet: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        account_id: Optional[int] = None,
+        lean: bool = False,
+    ) -> Union[list[SpotExecution], list[SpotExecutionRecord]]:
+        """Stored spot executions as models or records."""
+
+    def spot_executions(
+        self,
+        wallet: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        account_id: Optional[int] = None,
+        lean: bool = False,
+    ) -> Union[list[SpotExecution], list[SpotExecutionRecord]]:
+        """
+        Stored spot executions, oldest first.
+
+        Args:
+            wallet: Only executions of this wallet.
+            symbol: Only executions of this symbol.
+            start_time: Only executions at or after this timestamp (ms).
+            end_time: Only executions before this timestamp (ms).
+            account_id: Only executions where this account is the taker or the maker.
+            lean: Return SpotExecutionRecord tuples instead of models, for long histories.
+
+        Returns:
+            Matching executions.
+        """
+        rows = self._select("spot_executions", _SPOT_COLUMNS, wallet, symbol, start_time, end_time, account_id)
+        if lean:
+            sides = {member.value: member for member in Side}
+            types = {member.value: member for member in ExecutionType}
+            return [
+                SpotExecutionRecord(
+                    exchange_id,
+                    row_symbol,
+                    row_account_id,
+                    maker_account_id,
+                    order_id or None,
+                    maker_order_id or None,
+                    sides[side],
+                    qty,
+                    price,
+                    fee,
+                    types[execution_type],
+                    timestamp,
+                )
+                for (
+                    exchange_id,
+                    row_symbol,
+                    row_account_id,
+                    maker_account_id,
+                    order_id,
+                    maker_order_id,
+                    side,
+                    qty,
+                    price,
+                    fee,
+                    execution_type,
+                    timestamp,
+                ) in rows
+            ]
+        return [
+            SpotExecution(
+                exchangeId=exchange_id,
+                symbol=row_symbol,
+                accountId=row_account_id,
+                makerAccountId=maker_account_id,
+                orderId=order_id or None,
+                makerOrderId=maker_order_id or None,
+                side=Side(side),
+                qty=qty,
+                price=price,
+                fee=fee,
+                type=ExecutionType(execution_type),
+                timestamp=timestamp,
+            )
+            for (
+                exchange_id,
+                row_symbol,
+                row_account_id,
+                maker_account_id,
+                order_id,
+                maker_order_id,
+                side,
+                qty,
+                price,
+                fee,
+                execution_type,
+                timestamp,
+            ) in rows
+        ]
+
+    def _select(
+        self,
+        table: str,
+        columns: tuple[str, ...],
+        wallet: Optional[str],
+        symbol: Optional[str],
+        start_time: Optional[int],
+        end_time: Optional[int],
+        account_id: Optional[int],
+    ) -> list[tuple]:
+        conditions = []
+        params: list[Any] = []
+        if wallet is not None:
+            conditions.append("wallet = ?")
+            params.append(wallet.lower())
+        if symbol is not None:
+            conditions.append("symbol = ?")
+            params.append(symbol)
+        if start_time is not None:
+            conditions.append("timestamp >= ?")
+            params.append(start_time)
+        if end_time is not None:
+            conditions.append("timestamp < ?")
+            params.append(end_time)
+        if account_id is not None:
+            if table == "spot_executions":
+                conditions.append("(account_id = ? OR maker_account_id = ?)")
+                params.extend((account_id, account_id))
+            else:
+                conditions.append("account_id = ?")
+                params.append(account_id)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        order = "timestamp, sequence_number" if table == "perp_executions" else "timestamp, rowid"
+        sql = f"SELECT {', '.join(columns)} FROM {table} {where} ORDER BY {order}"  # nosec B608
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
@@ -0,0 +1,290 @@
+"""
+Fee Model - Effective maker and taker fee rates of a wallet, precomputed per tier and status.
+
+Fee tiers, global discounts and the wallet configuration are loaded once and every
+(tier, OG status, referee status) combination is turned into integer fixed-point rates,
+so fee estimates on the quoting path are a table lookup and a multiplication, with no
+``Decimal`` parsing. Array estimates require the optional ``numpy`` dependency
+(``pip install reya-python-sdk[analytics]``).
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+import threading
+from decimal import Decimal
+
+from sdk.open_api.models.fee_tier_parameters import FeeTierParameters
+from sdk.open_api.models.global_fee_parameters import GlobalFeeParameters
+from sdk.open_api.models.wallet_configuration import WalletConfiguration
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from sdk.reya_rest_api.client import ReyaTradingClient
+
+# Rates are stored as integers in millionths of a basis point
+RATE_SCALE = 10_000 * 1_000_000
+
+# Status index: bit 0 is the OG status, bit 1 the referee status
+_STATUSES = ((False, False), (True, False), (False, True), (True, True))
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("FeeModel.estimate_fees requires numpy: pip install reya-python-sdk[analytics]")
+
+
+def _status_index(og_status: bool, referee_status: bool) -> int:
+    return int(og_status) | int(referee_status) << 1
+
+
+def effective_fee_rates(
+    fee_tier: FeeTierParameters,
+    global_fees: Optional[GlobalFeeParameters] = None,
+    configuration: Optional[WalletConfiguration] = None,
+) -> tuple[Decimal, Decimal]:
+    """
+    Maker and taker fee rates of a wallet.
+
+    The OG and referee discounts of ``global_fees`` apply to positive fees when the
+    wallet configuration has the matching status; rebates (negative fees) are kept.
+
+    Args:
+        fee_tier: Fee tier of the wallet.
+        global_fees: Global fee parameters.
+        configuration: Wallet configuration (OG and referee status).
+
+    Returns:
+        (maker_fee, taker_fee) as fractions of notional.
+    """
+    discount = Decimal(1)
+    if global_fees is not None and configuration is not None:
+        if configuration.og_status:
+            discount *= 1 - Decimal(global_fees.og_discount)
+        if configuration.referee_status:
+            discount *= 1 - Decimal(global_fees.referee_discount)
+
+    def apply(rate: Decimal) -> Decimal:
+        return rate * discount if rate > 0 else rate
+
+    return apply(Decimal(fee_tier.maker_fee)), apply(Decimal(fee_tier.taker_fee))
+
+
+def to_fixed_rate(rate: Decimal) -> int:
+    """Convert a fee rate (fraction of notional) to ``RATE_SCALE`` fixed point."""
+    return int((rate * RATE_SCALE).to_integral_value())
+
+
+def _rate_table(
+    fee_tiers: Iterable[FeeTierParameters], global_fees: Optional[GlobalFeeParameters]
+) -> tuple[dict[int, FeeTierParameters], dict[tuple[int, int], tuple[int, int]]]:
+    """Tiers by id, and (tier_id, status index) -> (maker, taker) rates in RATE_SCALE units."""
+    tiers: dict[int, FeeTierParameters] = {}
+    table: dict[tuple[int, int], tuple[int, int]] = {}
+    for tier in fee_tiers:
+        tiers[tier.tier_id] = tier
+        for index, (og_status, referee_status) in enumerate(_STATUSES):
+            status = WalletConfiguration(
+                feeTierId=tier.tier_id, ogStatus=og_status, affiliateStatus=False, refereeStatus=referee_status
+            )
+            maker, taker = effective_fee_rates(tier, global_fees, status)
+            table[(tier.tier_id, index)] = (to_fixed_rate(maker), to_fixed_rate(taker))
+    return tiers, table
+
+
+def _configuration_key(
+    configuration: WalletConfiguration, table: dict[tuple[int, int], tuple[int, int]]
+) -> tuple[int, int]:
+    """Rate table key of a wallet configuration; ValueError if its fee tier is not in the table."""
+    key = (configuration.fee_tier_id, _status_index(configuration.og_status, configuration.referee_status))
+    if key not in table:
+        raise ValueError(f"Unknown fee tier {configuration.fee_tier_id}")
+    return key
+
+
+class FeeModel:
+    """
+    Fee estimator for one wallet.
+
+    Rates for every tier and status are computed when the model is built; changing
+    the wallet configuration (``set_configuration`` or ``refresh``) only selects
+    another row of that table.
+
+    Example:
+        fees = await FeeModel.from_client(client)
+        fee = fees.estimate_fee(qty, px, is_maker=False)
+        fee_array = fees.estimate_fees(qtys, pxs, is_makers)
+        await fees.refresh(client)  # e.g. daily, picks up tier changes
+    """
+
+    def __init__(
+        self,
+        fee_tiers: Iterable[FeeTierParameters],
+        global_fees: Optional[GlobalFeeParameters] = None,
+        configuration: Optional[WalletConfiguration] = None,
+    ):
+        """
+        Precompute the rate table.
+
+        Args:
+            fee_tiers: All fee tiers.
+            global_fees: Global fee parameters (OG and referee discounts).
+            configuration: Wallet configuration selecting the current rates; the
+                           first tier without discounts if None.
+
+        Raises:
+            ValueError: If there are no fee tiers.
+        """
+        self._lock = threading.Lock()
+        self._global_fees = global_fees
+        self._tiers, self._table = _rate_table(fee_tiers, global_fees)
+        if not self._tiers:
+            raise ValueError("FeeModel requires at least one fee tier")
+        self._configuration: Optional[WalletConfiguration] = None
+        self._key = (next(iter(self._tiers)), 0)
+        self._maker, self._taker = self._table[self._key]
+        if configuration is not None:
+            self.set_configuration(configuration)
+
+    @classmethod
+    async def from_client(cls, client: "ReyaTradingClient") -> "FeeModel":
+        """
+        Load the fee tiers, global fees and the client wallet's configuration.
+
+        Args:
+            client: Trading client of the wallet.
+
+        Returns:
+            A model with the wallet's current rates selected.
+        """
+        fee_tiers = await client.reference.get_fee_tier_parameters()
+        global_fees = await client.reference.get_global_fee_parameters()
+        configuration = await client.get_configuration()
+        return cls(fee_tiers, global_fees, configuration)
+
+    async def refresh(self, client: "ReyaTradingClient", reload_tiers: bool = False) -> bool:
+        """
+        Reload the wallet configuration and switch rates if its tier or status changed.
+
+        Args:
+            client: Trading client of the wallet.
+            reload_tiers: Also reload the tier and global fee parameters.
+
+        Returns:
+            Whether the selected rates changed.
+        """
+        if not reload_tiers:
+            return self.set_configuration(await client.get_configuration())
+
+        fee_tiers = await client.reference.get_fee_tier_parameters()
+        global_fees = await client.reference.get_global_fee_parameters()
+        tiers, table = _rate_table(fee_tiers, global_fees)
+        configuration = await client.get_configuration()
+        key = _configuration_key(configuration, table)
+        # Swap the table and select from it together; a failure above leaves the model unchanged
+        with self._lock:
+            self._global_fees, self._tiers, self._table = global_fees, tiers, table
+            return self._select(key, configuration)
+
+    def set_configuration(self, configuration: WalletConfiguration) -> bool:
+        """
+        Select the rates of a wallet configuration.
+
+        Args:
+            configuration: Wallet configuration (fee tier, OG and referee status).
+
+        Returns:
+            Whether the selected rates changed.
+
+        Raises:
+            ValueError: If the configuration's fee tier is unknown.
+        """
+        with self._lock:
+            return self._select(_configuration_key(configuration, self._table), configuration)
+
+    @property
+    def tier_id(self) -> int:
+        """Fee tier of the selected rates."""
+        return self._key[0]
+
+    @property
+    def configuration(self) -> Optional[WalletConfiguration]:
+        """Wallet configuration of the selected rates."""
+        return self._configuration
+
+    @property
+    def maker_rate(self) -> int:
+        """Maker fee rate in ``RATE_SCALE`` units (negative for a rebate)."""
+        return self._maker
+
+    @property
+    def taker_rate(self) -> int:
+        """Taker fee rate in ``RATE_SCALE`` units."""
+        return self._taker
+
+    @property
+    def maker_bps(self) -> float:
+        """Maker fee rate in basis points."""
+        return self._maker * 10_000 / RATE_SCALE
+
+    @property
+    def taker_bps(self) -> float:
+        """Taker fee rate in basis points."""
+        return self._taker * 10_000 / RATE_SCALE
+
+    def rates(self, tier_id: int, og_status: bool = False, referee_status: bool = False) -> tuple[int, int]:
+        """
+        Precomputed rates of any tier and status.
+
+        Args:
+            tier_id: Fee tier.
+            og_status: OG status.
+            referee_status: Referee status.
+
+        Returns:
+            (maker, taker) in ``RATE_SCALE`` units.
+        """
+        return self._table[(tier_id, _status_index(og_status, referee_status))]
+
+    def estimate_fee(self, qty: float, px: float, is_maker: bool) -> float:
+        """
+        Fee of one order at the selected rates.
+
+        Args:
+            qty: Base quantity (sign is ignored).
+            px: Price.
+            is_maker: Whether the order provides liquidity.
+
+        Returns:
+            Fee in the quote asset; negative for a rebate.
+        """
+        return abs(qty * px) * (self._maker if is_maker else self._taker) / RATE_SCALE
+
+    def estimate_fees(self, qty: Any, px: Any, is_maker: Any) -> "np.ndarray":
+        """
+        Fees of many orders at the selected rates (requires numpy).
+
+        Args:
+            qty: Base quantities (signs are ignored).
+            px: Prices.
+            is_maker: Booleans, True where the order provides liquidity; arrays broadcast.
+
+        Returns:
+            Fees in the quote asset as a float64 array; negative for rebates.
+        """
+        _require_numpy()
+        notional = np.abs(np.asarray(qty, dtype=np.float64) * np.asarray(px, dtype=np.float64))
+        rates = np.where(np.asarray(is_maker, dtype=bool), float(self._maker), float(self._taker))
+        fees: np.ndarray = notional * rates / RATE_SCALE
+        return fees
+
+    def _select(self, key: tuple[int, int], configuration: WalletConfiguration) -> bool:
+        """Select the rates of a table key; whether they changed. Caller must hold the lock."""
+        self._configuration = configuration
+        previous = (self._maker, self._taker)
+        self._key = key
+        self._maker, self._taker = self._table[key]
+        return previous != (self._maker, self._taker)
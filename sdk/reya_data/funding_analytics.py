@@ -0,0 +1,291 @@
+"""
+Funding Analytics - Vectorized funding and open interest metrics across all markets.
+
+Market summaries are parsed into NumPy arrays as they arrive, and every metric is
+computed for all markets in one array pass. Requires the optional ``numpy``
+dependency (``pip install reya-python-sdk[analytics]``).
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+
+import threading
+from dataclasses import dataclass
+
+from sdk.async_api.market_summary import MarketSummary as AsyncMarketSummary
+from sdk.async_api.market_summary_update_payload import MarketSummaryUpdatePayload
+from sdk.async_api.markets_summary_update_payload import MarketsSummaryUpdatePayload
+from sdk.open_api.models.market_summary import MarketSummary
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from sdk.reya_data.market_snapshot import MarketSnapshot
+
+# Summary fields ingested, in column order
+FIELDS = (
+    "funding_rate",
+    "funding_rate_velocity",
+    "long_funding_value",
+    "short_funding_value",
+    "long_oi_qty",
+    "short_oi_qty",
+    "oi_qty",
+)
+_COLUMN = {name: index for index, name in enumerate(FIELDS)}
+
+INITIAL_CAPACITY = 64
+
+AnySummary = Union[MarketSummary, AsyncMarketSummary]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("FundingAnalytics requires numpy: pip install reya-python-sdk[analytics]")
+
+
+@dataclass(frozen=True)
+class FundingScreen:
+    """
+    Funding metrics of every market, as arrays aligned with ``symbols``.
+
+    Rates are in the units of ``MarketSummary.funding_rate``; the horizon is expressed
+    in the same time unit, and ``funding_rate_velocity`` is taken as the change in rate
+    per unit of time.
+
+    Attributes:
+        symbols: Market symbols.
+        horizon: Horizon the projections were computed for.
+        funding_rate: Current funding rate.
+        velocity: Funding rate velocity.
+        extrapolated_rate: Rate at the end of the horizon, extrapolated linearly.
+        projected_funding: Funding accrued over the horizon under linear extrapolation.
+        oi_imbalance: (long OI - short OI) / (long OI + short OI), 0 when there is no OI.
+        oi_qty: Total open interest.
+    """
+
+    symbols: list[str]
+    horizon: float
+    funding_rate: "np.ndarray"
+    velocity: "np.ndarray"
+    extrapolated_rate: "np.ndarray"
+    projected_funding: "np.ndarray"
+    oi_imbalance: "np.ndarray"
+    oi_qty: "np.ndarray"
+
+    def ranked(self, metric: str = "projected_funding", descending: bool = True, by_abs: bool = False) -> list[str]:
+        """
+        Symbols ordered by a metric; markets with a NaN metric are placed last.
+
+        Args:
+            metric: Name of an array attribute, e.g. "projected_funding" or "oi_imbalance".
+            descending: Highest values first.
+            by_abs: Rank by absolute value.
+
+        Returns:
+            Symbols in rank order.
+        """
+        values = getattr(self, metric)
+        if by_abs:
+            values = np.abs(values)
+        keys = np.where(np.isnan(values), np.inf, -values if descending else values)
+        return [self.symbols[index] for index in np.argsort(keys, kind="stable")]
+
+    def top(self, n: int, metric: str = "projected_funding", by_abs: bool = True) -> list[tuple[str, float]]:
+        """
+        The n markets with the largest metric (by absolute value by default).
+
+        Args:
+            n: Number of markets.
+            metric: Name of an array attribute.
+            by_abs: Rank by absolute value.
+
+        Returns:
+            (symbol, value) pairs in rank order.
+        """
+        index_by_symbol = {symbol: index for index, symbol in enumerate(self.symbols)}
+        values = getattr(self, metric)
+        return [
+            (symbol, float(values[index_by_symbol[symbol]]))
+            for symbol in self.ranked(metric, descending=True, by_abs=by_abs)[:n]
+        ]
+
+
+class FundingAnalytics:
+    """
+    Incrementally updated funding and open interest arrays for all markets.
+
+    Feed it ``/v2/markets/summary`` updates through ``on_message`` (or a REST
+    ``get_markets_summary`` result through ``apply_summaries``); only the rows of the
+    updated markets are parsed. ``screen`` then computes every metric for all markets
+    with array operations.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        """
+        Initialize empty analytics.
+
+        Args:
+            capacity: Initial number of market rows to allocate; grows as needed.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        _require_numpy()
+        self._lock = threading.Lock()
+        self._symbols: list[str] = []
+        self._row_by_symbol: dict[str, int] = {}
+        self._values = np.full((max(1, capacity), len(FIELDS)), np.nan)
+        self._updated_at = np.zeros(max(1, capacity), dtype=np.int64)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: "MarketSnapshot") -> "FundingAnalytics":
+        """
+        Create analytics from the summary columns of a market snapshot.
+
+        Args:
+            snapshot: Market snapshot to copy the funding and OI columns from.
+
+        Returns:
+            Analytics with one row per snapshot market that has a summary.
+        """
+        columns = snapshot.columns(*FIELDS, "summary_updated_at")
+        symbols = snapshot.symbols
+        analytics = cls(capacity=len(symbols))
+        updated_at = np.frombuffer(columns["summary_updated_at"], dtype=np.int64)
+        rows = np.flatnonzero(updated_at > 0)
+        with analytics._lock:
+            for row in rows:
+                analytics._row(symbols[row])
+            n = len(rows)
+            analytics._values[:n] = np.column_stack(
+                [np.frombuffer(columns[name], dtype=np.float64)[rows] for name in FIELDS]
+            )
+            analytics._updated_at[:n] = updated_at[rows]
+        return analytics
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols in row order."""
+        with self._lock:
+            return list(self._symbols)
+
+    def on_message(self, _ws: Any, message: Any) -> None:
+        """
+        Apply a WebSocket message; messages other than market summaries are ignored.
+
+        Args:
+            _ws: The WebSocket connection (unused, for ``ReyaSocket`` compatibility).
+            message: Typed WebSocket message.
+        """
+        if isinstance(message, MarketsSummaryUpdatePayload):
+            self.apply_summaries(message.data)
+        elif isinstance(message, MarketSummaryUpdatePayload):
+            self.apply_summaries([message.data])
+
+    def apply_summaries(self, summaries: Iterable[AnySummary]) -> int:
+        """
+        Parse a batch of summaries into the arrays, skipping updates older than the stored row.
+
+        Args:
+            summaries: Summaries from REST or the WebSocket.
+
+        Returns:
+            Number of rows updated.
+        """
+        with self._lock:
+            latest: dict[int, AnySummary] = {}
+            for summary in summaries:
+                row = self._row(summary.symbol)
+                current = latest.get(row)
+                if summary.updated_at >= self._updated_at[row] and (
+                    current is None or summary.updated_at >= current.updated_at
+                ):
+                    latest[row] = summary
+            if not latest:
+                return 0
+
+            rows = np.fromiter(latest.keys(), dtype=np.intp, count=len(latest))
+            raw = [[getattr(summary, name) for name in FIELDS] for summary in latest.values()]
+            # Strings are converted in one vectorized cast
+            self._values[rows] = np.array(raw, dtype=np.str_).astype(np.float64)
+            self._updated_at[rows] = [summary.updated_at for summary in latest.values()]
+            return len(rows)
+
+    def column(self, name: str) -> "np.ndarray":
+        """
+        Copy of one ingested field for all markets.
+
+        Args:
+            name: One of FIELDS.
+
+        Returns:
+            Float64 array aligned with ``symbols``.
+        """
+        with self._lock:
+            return np.array(self._values[: len(self._symbols), _COLUMN[name]])
+
+    def screen(self, horizon: float = 1.0, symbols: Optional[list[str]] = None) -> FundingScreen:
+        """
+        Compute funding projections and OI imbalance for all markets in one pass.
+
+        With rate r and velocity v, the rate is extrapolated as r + v * t, so the
+        funding accrued over the horizon h is r * h + v * h² / 2.
+
+        Args:
+            horizon: Projection horizon, in the time unit of the funding rate.
+            symbols: Restrict the screen to these symbols (unknown ones are skipped).
+
+        Returns:
+            Metrics for every market.
+        """
+        with self._lock:
+            if symbols is None:
+                names = list(self._symbols)
+                values = self._values[: len(names)].copy()
+            else:
+                names = [symbol for symbol in symbols if symbol in self._row_by_symbol]
+                values = self._values[[self._row_by_symbol[symbol] for symbol in names]]
+
+        rate = values[:, _COLUMN["funding_rate"]]
+        velocity = values[:, _COLUMN["funding_rate_velocity"]]
+        long_oi = values[:, _COLUMN["long_oi_qty"]]
+        short_oi = values[:, _COLUMN["short_oi_qty"]]
+
+        total_oi = long_oi + short_oi
+        with np.errstate(invalid="ignore", divide="ignore"):
+            imbalance = np.where(total_oi > 0, (long_oi - short_oi) / total_oi, 0.0)
+        imbalance[np.isnan(total_oi)] = np.nan
+
+        return FundingScreen(
+            symbols=names,
+            horizon=horizon,
+            funding_rate=rate,
+            velocity=velocity,
+            extrapolated_rate=rate + velocity * horizon,
+            projected_funding=rate * horizon + 0.5 * velocity * horizon * horizon,
+            oi_imbalance=imbalance,
+            oi_qty=values[:, _COLUMN["oi_qty"]],
+        )
+
+    def _row(self, symbol: str) -> int:
+        """Row of a symbol, allocating one if needed. Caller must hold the lock."""
+        row = self._row_by_symbol.get(symbol)
+        if row is not None:
+            return row
+        row = len(self._symbols)
+        if row == len(self._values):
+            capacity = 2 * len(self._values)
+            values = np.full((capacity, len(FIELDS)), np.nan)
+            values[:row] = self._values
+            updated_at = np.zeros(capacity, dtype=np.int64)
+            updated_at[:row] = self._updated_at
+            self._values, self._updated_at = values, updated_at
+        self._symbols.append(symbol)
+        self._row_by_symbol[symbol] = row
+        return row
@@ -0,0 +1,124 @@
+"""
+Interning - Shared table of low-cardinality strings in decoded payloads.
+
+Every decoded message carries fresh copies of the same few hundred strings: market
+symbols, asset names and channel paths (which include the wallet address). Replacing
+them with one shared instance per value frees the copies as soon as the message is
+built, and lets dict lookups keyed by them reuse the hash cached on the shared string.
+
+The WebSocket parser, the trusted REST deserializer and the compact records intern
+these fields through ``SHARED_TABLE``, which ``ReyaTradingClient`` seeds from the
+market definitions. Enum fields (side, status, execution type) are not strings once
+decoded: they are mapped straight to the enum members.
+"""
+
+from typing import Any, Iterable, Union
+
+import threading
+
+from sdk.open_api.models.market_definition import MarketDefinition
+from sdk.open_api.models.spot_market_definition import SpotMarketDefinition
+
+# JSON keys of the string fields interned in decoded rows
+INTERNED_KEYS = ("symbol", "asset")
+
+DEFAULT_MAX_SIZE = 65536
+
+
+class InternTable:
+    """
+    Bounded table of shared string instances.
+
+    Values seen once the table is full are returned as they are, so an unexpected stream
+    of distinct values cannot grow it without limit.
+    """
+
+    __slots__ = ("max_size", "_strings", "_lock")
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize the table.
+
+        Args:
+            max_size: Maximum number of distinct strings kept.
+        """
+        self.max_size = max_size
+        self._strings: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._strings
+
+    def intern(self, value: Any) -> Any:
+        """
+        Shared instance of a string.
+
+        Args:
+            value: Decoded value; anything but a string is returned unchanged.
+
+        Returns:
+            The shared string equal to value, or value itself.
+        """
+        if not isinstance(value, str):
+            return value
+        interned = self._strings.get(value)
+        if interned is not None:
+            return interned
+        if len(self._strings) >= self.max_size:
+            return value
+        with self._lock:
+            return self._strings.setdefault(value, value)
+
+    def intern_fields(self, row: Any) -> Any:
+        """
+        Intern the ``INTERNED_KEYS`` fields of a decoded JSON object in place.
+
+        Args:
+            row: Decoded JSON object, or a list of them; other values are left alone.
+
+        Returns:
+            The same row.
+        """
+        if isinstance(row, list):
+            for item in row:
+                self.intern_fields(item)
+        elif isinstance(row, dict):
+            for key in INTERNED_KEYS:
+                value = row.get(key)
+                if value is not None:
+                    row[key] = self.intern(value)
+        return row
+
+    def seed(self, values: Iterable[str]) -> None:
+        """
+        Add known values to the table.
+
+        Args:
+            values: Strings to intern.
+        """
+        for value in values:
+            self.intern(value)
+
+    def seed_market_definitions(self, definitions: Iterable[Union[MarketDefinition, SpotMarketDefinition]]) -> None:
+        """
+        Add the symbols and asset names of perp and spot market definitions.
+
+        Args:
+            definitions: Perp and spot market definitions.
+        """
+        for definition in definitions:
+            self.intern(definition.symbol)
+            if isinstance(definition, SpotMarketDefinition):
+                self.intern(definition.base_asset)
+                self.intern(definition.quote_asset)
+
+    def clear(self) -> None:
+        """Remove every string from the table."""
+        with self._lock:
+            self._strings.clear()
+
+
+SHARED_TABLE = InternTable()
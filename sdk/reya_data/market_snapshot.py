@@ -0,0 +1,320 @@
+"""
+Market Snapshot - Columnar table of all markets, kept fresh from WebSocket deltas.
+
+Market summaries, prices and market definitions are fetched concurrently and joined
+into one table keyed by market ID. Numeric fields are parsed once into typed
+``array.array`` columns (float64 / int64), so scanning every market is a pass over
+contiguous buffers, which can also be wrapped without copying (e.g. ``numpy.frombuffer``).
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+
+import asyncio
+import logging
+import math
+import threading
+from array import array
+
+from sdk.async_api.market_summary import MarketSummary as AsyncMarketSummary
+from sdk.async_api.market_summary_update_payload import MarketSummaryUpdatePayload
+from sdk.async_api.markets_summary_update_payload import MarketsSummaryUpdatePayload
+from sdk.async_api.price import Price as AsyncPrice
+from sdk.async_api.price_update_payload import PriceUpdatePayload
+from sdk.async_api.prices_update_payload import PricesUpdatePayload
+from sdk.open_api.models.market_definition import MarketDefinition
+from sdk.open_api.models.market_summary import MarketSummary
+from sdk.open_api.models.price import Price
+from sdk.open_api.models.spot_market_definition import SpotMarketDefinition
+
+if TYPE_CHECKING:
+    from sdk.reya_rest_api.client import ReyaTradingClient
+
+logger = logging.getLogger("reya_data.market_snapshot")
+
+# Float columns parsed from the string fields of each source, NaN when absent
+SUMMARY_COLUMNS = (
+    "long_oi_qty",
+    "short_oi_qty",
+    "oi_qty",
+    "funding_rate",
+    "long_funding_value",
+    "short_funding_value",
+    "funding_rate_velocity",
+    "volume24h",
+    "px_change24h",
+    "throttled_oracle_price",
+    "throttled_pool_price",
+)
+PRICE_COLUMNS = ("oracle_price", "pool_price")
+DEFINITION_COLUMNS = (
+    "min_order_qty",
+    "qty_step_size",
+    "tick_size",
+    "liquidation_margin_parameter",
+    "initial_margin_parameter",
+    "max_leverage",
+    "oi_cap",
+)
+FLOAT_COLUMNS = SUMMARY_COLUMNS + PRICE_COLUMNS + DEFINITION_COLUMNS
+
+# Int64 columns; timestamps are 0 until the first update
+INT_COLUMNS = ("market_id", "is_spot", "summary_updated_at", "price_updated_at")
+
+AnySummary = Union[MarketSummary, AsyncMarketSummary]
+AnyPrice = Union[Price, AsyncPrice]
+
+
+def _to_float(value: Any) -> float:
+    return float(value) if value is not None else math.nan
+
+
+class MarketSnapshot:
+    """
+    Table of every perp and spot market, one row per market ordered by market ID.
+
+    Call ``refresh`` to (re)build the table from REST, then pass ``on_message`` to
+    ``ReyaSocket`` (or call it from an existing handler) with the ``/v2/markets/summary``
+    and ``/v2/prices`` channels subscribed to apply deltas. Updates older than the
+    stored row are ignored; updates for unknown symbols are ignored until the next
+    refresh.
+
+    All methods are thread-safe; column reads return copies so they are consistent
+    with each other when taken in one ``columns`` call.
+    """
+
+    def __init__(self, client: Optional["ReyaTradingClient"] = None):
+        """
+        Initialize an empty snapshot.
+
+        Args:
+            client: Client used by ``refresh``.
+        """
+        self._client = client
+        self._lock = threading.Lock()
+        self._symbols: list[str] = []
+        self._row_by_symbol: dict[str, int] = {}
+        self._row_by_market_id: dict[int, int] = {}
+        self._floats: dict[str, array] = {name: array("d") for name in FLOAT_COLUMNS}
+        self._ints: dict[str, array] = {name: array("q") for name in INT_COLUMNS}
+        self._version = 0
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._row_by_symbol
+
+    @property
+    def version(self) -> int:
+        """Counter incremented on every change, for cheap staleness checks."""
+        return self._version
+
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols in row order."""
+        with self._lock:
+            return list(self._symbols)
+
+    async def refresh(self, client: Optional["ReyaTradingClient"] = None) -> None:
+        """
+        Fetch summaries, prices and definitions concurrently and rebuild the table.
+
+        Args:
+            client: Client to fetch with (defaults to the one given at construction).
+        """
+        client = client or self._client
+        if client is None:
+            raise ValueError("A client is required to refresh the market snapshot")
+        summaries, prices, definitions, spot_definitions = await asyncio.gather(
+            client.markets.get_markets_summary(),
+            client.markets.get_prices(),
+            client.reference.get_market_definitions(),
+            client.reference.get_spot_market_definitions(),
+        )
+        self.load(definitions, spot_definitions, summaries, prices)
+
+    def load(
+        self,
+        definitions: Iterable[MarketDefinition],
+        spot_definitions: Iterable[SpotMarketDefinition],
+        summaries: Iterable[AnySummary] = (),
+        prices: Iterable[AnyPrice] = (),
+    ) -> None:
+        """
+        Rebuild the table from already fetched data.
+
+        Args:
+            definitions: Perp market definitions.
+            spot_definitions: Spot market definitions.
+            summaries: Market summaries.
+            prices: Prices.
+        """
+        rows: list[Union[MarketDefinition, SpotMarketDefinition]] = [*definitions, *spot_definitions]
+        rows.sort(key=lambda definition: definition.market_id)
+
+        floats = {name: array("d", [math.nan]) * len(rows) for name in FLOAT_COLUMNS}
+        ints = {name: array("q", [0]) * len(rows) for name in INT_COLUMNS}
+        symbols = []
+        for row, definition in enumerate(rows):
+            symbols.append(definition.symbol)
+            ints["market_id"][row] = definition.market_id
+            ints["is_spot"][row] = int(isinstance(definition, SpotMarketDefinition))
+            for name in DEFINITION_COLUMNS:
+                floats[name][row] = _to_float(getattr(definition, name, None))
+
+        with self._lock:
+            self._symbols = symbols
+            self._row_by_symbol = {symbol: row for row, symbol in enumerate(symbols)}
+            self._row_by_market_id = {market_id: row for row, market_id in enumerate(ints["market_id"])}
+            self._floats = floats
+            self._ints = ints
+            self._apply_summaries(summaries)
+            self._apply_prices(prices)
+            self._version += 1
+        logger.debug(f"Market snapshot loaded {len(symbols)} markets")
+
+    def on_message(self, _ws: Any, message: Any) -> None:
+        """
+        Apply a WebSocket message; messages other than summaries and prices are ignored.
+
+        Args:
+            _ws: The WebSocket connection (unused, for ``ReyaSocket`` compatibility).
+            message: Typed WebSocket message.
+        """
+        if isinstance(message, MarketsSummaryUpdatePayload):
+            self.apply_summaries(message.data)
+        elif isinstance(message, MarketSummaryUpdatePayload):
+            self.apply_summaries([message.data])
+        elif isinstance(message, PricesUpdatePayload):
+            self.apply_prices(message.data)
+        elif isinstance(message, PriceUpdatePayload):
+            self.apply_prices([message.data])
+
+    def apply_summaries(self, summaries: Iterable[AnySummary]) -> int:
+        """
+        Apply market summary updates.
+
+        Args:
+            summaries: Summaries from REST or the WebSocket.
+
+        Returns:
+            Number of rows changed.
+        """
+        with self._lock:
+            changed = self._apply_summaries(summaries)
+            if changed:
+                self._version += 1
+        return changed
+
+    def apply_prices(self, prices: Iterable[AnyPrice]) -> int:
+        """
+        Apply price updates.
+
+        Args:
+            prices: Prices from REST or the WebSocket.
+
+        Returns:
+            Number of rows changed.
+        """
+        with self._lock:
+            changed = self._apply_prices(prices)
+            if changed:
+                self._version += 1
+        return changed
+
+    def column(self, name: str) -> array:
+        """
+        Copy of one column, in row order.
+
+        Args:
+            name: Column name (see FLOAT_COLUMNS and INT_COLUMNS).
+
+        Returns:
+            A float64 ("d") or int64 ("q") array.
+        """
+        return self.columns(name)[name]
+
+    def columns(self, *names: str) -> dict[str, array]:
+        """
+        Consistent copies of several columns, in row order.
+
+        Args:
+            names: Column names; all columns if none are given.
+
+        Returns:
+            Arrays by column name.
+        """
+        with self._lock:
+            selected = names or (*INT_COLUMNS, *FLOAT_COLUMNS)
+            result = {}
+            for name in selected:
+                source = self._floats.get(name)
+                if source is None:
+                    source = self._ints.get(name)
+                if source is None:
+                    raise KeyError(f"Unknown market snapshot column: {name}")
+                result[name] = array(source.typecode, source)
+            return result
+
+    def row(self, market_id: int) -> Optional[dict[str, Any]]:
+        """
+        All fields of one market.
+
+        Args:
+            market_id: Market ID.
+
+        Returns:
+            Field values by column name (plus "symbol"), or None if the market is unknown.
+        """
+        with self._lock:
+            return self._row_values(self._row_by_market_id.get(market_id))
+
+    def row_for_symbol(self, symbol: str) -> Optional[dict[str, Any]]:
+        """
+        All fields of one market, looked up by symbol.
+
+        Args:
+            symbol: Trading symbol.
+
+        Returns:
+            Field values by column name (plus "symbol"), or None if the market is unknown.
+        """
+        with self._lock:
+            return self._row_values(self._row_by_symbol.get(symbol))
+
+    def _row_values(self, index: Optional[int]) -> Optional[dict[str, Any]]:
+        """Field values of a row. Caller must hold the lock."""
+        if index is None:
+            return None
+        values: dict[str, Any] = {"symbol": self._symbols[index]}
+        values.update({name: column[index] for name, column in self._ints.items()})
+        values.update({name: column[index] for name, column in self._floats.items()})
+        return values
+
+    def _apply_summaries(self, summaries: Iterable[AnySummary]) -> int:
+        """Write summaries into their rows. Caller must hold the lock."""
+        changed = 0
+        updated_at_column = self._ints["summary_updated_at"]
+        for summary in summaries:
+            row = self._row_by_symbol.get(summary.symbol)
+            if row is None or summary.updated_at < updated_at_column[row]:
+                continue
+            updated_at_column[row] = summary.updated_at
+            for name in SUMMARY_COLUMNS:
+                self._floats[name][row] = _to_float(getattr(summary, name))
+            changed += 1
+        return changed
+
+    def _apply_prices(self, prices: Iterable[AnyPrice]) -> int:
+        """Write prices into their rows. Caller must hold the lock."""
+        changed = 0
+        updated_at_column = self._ints["price_updated_at"]
+        for price in prices:
+            row = self._row_by_symbol.get(price.symbol)
+            if row is None or price.updated_at < updated_at_column[row]:
+                continue
+            updated_at_column[row] = price.updated_at
+            self._floats["oracle_price"][row] = _to_float(price.oracle_price)
+            self._floats["pool_price"][row] = _to_float(price.pool_price)
+            changed += 1
+        return changed
@@ -0,0 +1,228 @@
+"""
+Records - Compact tuple-backed rows for high-volume executions, orders and depth levels.
+
+The generated REST and WebSocket models are Pydantic models, each with an instance
+dict, a set of explicitly set fields and an ``additional_properties`` dict, which
+costs over a kilobyte per row. The records here are named tuples with the same field
+names and enum types as the REST models, a fraction of the size, so code reading
+``execution.price`` or ``execution.side.value`` accepts either. They are returned by
+``lean`` queries and subscriptions (``ExecutionStore``, ``ReyaSocket``) and convert to
+and from the models with ``from_model``, ``from_json`` and ``to_model``.
+
+Symbols are interned through the shared table of ``sdk.reya_data.interning``. Unknown
+JSON keys (``additional_properties``) are not kept.
+"""
+
+from typing import Any, NamedTuple, Optional, Type, TypeVar, Union
+
+from enum import Enum
+
+from pydantic import BaseModel
+
+from sdk.async_api.level import Level as AsyncLevel
+from sdk.async_api.order import Order as AsyncOrder
+from sdk.async_api.perp_execution import PerpExecution as AsyncPerpExecution
+from sdk.async_api.spot_execution import SpotExecution as AsyncSpotExecution
+from sdk.open_api.models.execution_type import ExecutionType
+from sdk.open_api.models.level import Level
+from sdk.open_api.models.order import Order
+from sdk.open_api.models.order_status import OrderStatus
+from sdk.open_api.models.order_type import OrderType
+from sdk.open_api.models.perp_execution import PerpExecution
+from sdk.open_api.models.side import Side
+from sdk.open_api.models.spot_execution import SpotExecution
+from sdk.open_api.models.time_in_force import TimeInForce
+from sdk.reya_data.interning import INTERNED_KEYS, SHARED_TABLE
+
+RecordT = TypeVar("RecordT", bound=tuple)
+
+
+class PerpExecutionRecord(NamedTuple):
+    """Perp execution, as ``PerpExecution``."""
+
+    exchange_id: int
+    symbol: str
+    account_id: int
+    qty: str
+    side: Side
+    price: str
+    fee: str
+    type: ExecutionType
+    timestamp: int
+    sequence_number: int
+
+    @classmethod
+    def from_model(cls, execution: Union[PerpExecution, AsyncPerpExecution]) -> "PerpExecutionRecord":
+        """Convert a REST or WebSocket perp execution."""
+        return _from_model(cls, execution)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "PerpExecutionRecord":
+        """Build from a decoded JSON object, without validation."""
+        return _from_json(cls, data)
+
+    def to_model(
+        self, model: Type[Union[PerpExecution, AsyncPerpExecution]] = PerpExecution
+    ) -> Union[PerpExecution, AsyncPerpExecution]:
+        """Convert to a validated REST (default) or WebSocket model."""
+        return model.model_validate(_to_json(self))
+
+
+class SpotExecutionRecord(NamedTuple):
+    """Spot execution, as ``SpotExecution``."""
+
+    exchange_id: Optional[int]
+    symbol: str
+    account_id: int
+    maker_account_id: int
+    order_id: Optional[str]
+    maker_order_id: Optional[str]
+    side: Side
+    qty: str
+    price: str
+    fee: str
+    type: ExecutionType
+    timestamp: int
+
+    @classmethod
+    def from_model(cls, execution: Union[SpotExecution, AsyncSpotExecution]) -> "SpotExecutionRecord":
+        """Convert a REST or WebSocket spot execution."""
+        return _from_model(cls, execution)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "SpotExecutionRecord":
+        """Build from a decoded JSON object, without validation."""
+        return _from_json(cls, data)
+
+    def to_model(
+        self, model: Type[Union[SpotExecution, AsyncSpotExecution]] = SpotExecution
+    ) -> Union[SpotExecution, AsyncSpotExecution]:
+        """Convert to a validated REST (default) or WebSocket model."""
+        return model.model_validate(_to_json(self))
+
+
+class OrderRecord(NamedTuple):
+    """Order, as ``Order``."""
+
+    exchange_id: int
+    symbol: str
+    account_id: int
+    order_id: str
+    qty: Optional[str]
+    exec_qty: Optional[str]
+    cum_qty: Optional[str]
+    side: Side
+    limit_px: str
+    order_type: OrderType
+    trigger_px: Optional[str]
+    time_in_force: Optional[TimeInForce]
+    reduce_only: Optional[bool]
+    status: OrderStatus
+    created_at: int
+    last_update_at: int
+
+    @classmethod
+    def from_model(cls, order: Union[Order, AsyncOrder]) -> "OrderRecord":
+        """Convert a REST or WebSocket order."""
+        return _from_model(cls, order)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "OrderRecord":
+        """Build from a decoded JSON object, without validation."""
+        return _from_json(cls, data)
+
+    def to_model(self, model: Type[Union[Order, AsyncOrder]] = Order) -> Union[Order, AsyncOrder]:
+        """Convert to a validated REST (default) or WebSocket model."""
+        return model.model_validate(_to_json(self))
+
+
+class LevelRecord(NamedTuple):
+    """Depth level, as ``Level``."""
+
+    px: str
+    qty: str
+
+    @classmethod
+    def from_model(cls, level: Union[Level, AsyncLevel]) -> "LevelRecord":
+        """Convert a REST or WebSocket depth level."""
+        return cls(level.px, level.qty)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "LevelRecord":
+        """Build from a decoded JSON object, without validation."""
+        return cls(data["px"], data["qty"])
+
+    def to_model(self, model: Type[Union[Level, AsyncLevel]] = Level) -> Union[Level, AsyncLevel]:
+        """Convert to a validated REST (default) or WebSocket model."""
+        return model.model_validate({"px": self.px, "qty": self.qty})
+
+
+def _alias(model: type[BaseModel], name: str) -> str:
+    field = model.model_fields.get(name)
+    return field.alias or name if field is not None else name
+
+
+AnyRecord = Union[PerpExecutionRecord, SpotExecutionRecord, OrderRecord, LevelRecord]
+
+# Enum fields of each record type
+_ENUMS: dict[type, dict[str, type[Enum]]] = {
+    PerpExecutionRecord: {"side": Side, "type": ExecutionType},
+    SpotExecutionRecord: {"side": Side, "type": ExecutionType},
+    OrderRecord: {"side": Side, "order_type": OrderType, "time_in_force": TimeInForce, "status": OrderStatus},
+    LevelRecord: {},
+}
+# (field name, JSON key, enum members by value or None, interned) of each record type, in field order
+_FIELDS: dict[type, tuple[tuple[str, str, Optional[dict[Any, Enum]], bool], ...]] = {
+    record: tuple(
+        (
+            name,
+            _alias(model, name),
+            {member.value: member for member in _ENUMS[record][name]} if name in _ENUMS[record] else None,
+            _alias(model, name) in INTERNED_KEYS,
+        )
+        for name in record._fields
+    )
+    for record, model in (
+        (PerpExecutionRecord, PerpExecution),
+        (SpotExecutionRecord, SpotExecution),
+        (OrderRecord, Order),
+        (LevelRecord, Level),
+    )
+}
+
+
+def _from_model(record: type[RecordT], model: BaseModel) -> RecordT:
+    intern = SHARED_TABLE.intern
+    values = []
+    for name, _, members, interned in _FIELDS[record]:
+        value = getattr(model, name)
+        if value is not None:
+            if members is not None:
+                value = members[value.value]  # The WebSocket models have their own enums
+            elif interned:
+                value = intern(value)
+        values.append(value)
+    return tuple.__new__(record, values)
+
+
+def _from_json(record: type[RecordT], data: dict[str, Any]) -> RecordT:
+    get = data.get
+    intern = SHARED_TABLE.intern
+    values = []
+    for _, key, members, interned in _FIELDS[record]:
+        value = get(key)
+        if value is not None:
+            if members is not None:
+                value = members[value]
+            elif interned:
+                value = intern(value)
+        values.append(value)
+    return tuple.__new__(record, values)
+
+
+def _to_json(record: tuple) -> dict[str, Any]:
+    data = {}
+    for (_, key, members, _), value in zip(_FIELDS[type(record)], record):
+        if value is not None:
+            data[key] = value.value if members is not None else value
+    return data
@@ -0,0 +1,521 @@
+"""
+Tick Archive - Append-only columnar files of market executions and depth, read through memory maps.
+
+Executions and depth levels are appended as fixed-width records into one file per
+column, per symbol, per UTC day. Prices are stored as fixed-point integers in
+millionths of the market's tick size: spot prices are on the tick grid, but perp
+executions and depth are priced off the oracle and the pool and fall between ticks,
+which whole ticks would round by up to half a tick. The reader memory-maps the
+column files into NumPy views without copying, so weeks of ticks can be sliced by
+time without loading them into memory.
+
+Writing only needs the standard library; reading requires the optional ``numpy``
+dependency (``pip install reya-python-sdk[analytics]``).
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Union
+
+import asyncio
+import json
+import os
+import threading
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sdk.async_api.depth import Depth as AsyncDepth
+from sdk.async_api.market_depth_update_payload import MarketDepthUpdatePayload
+from sdk.async_api.market_perp_execution_update_payload import MarketPerpExecutionUpdatePayload
+from sdk.async_api.market_spot_execution_update_payload import MarketSpotExecutionUpdatePayload
+from sdk.async_api.perp_execution import PerpExecution as AsyncPerpExecution
+from sdk.async_api.spot_execution import SpotExecution as AsyncSpotExecution
+from sdk.open_api.models.depth import Depth
+from sdk.open_api.models.perp_execution import PerpExecution
+from sdk.open_api.models.spot_execution import SpotExecution
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from sdk.reya_rest_api.client import ReyaTradingClient
+
+EXECUTIONS = "executions"
+DEPTH = "depth"
+
+# Column name -> array typecode; the same layout is used for the NumPy dtypes
+EXECUTION_COLUMNS = {
+    "timestamp": "q",  # Milliseconds
+    "price_units": "q",  # Price in price units (see PRICE_SUBTICKS)
+    "qty": "d",
+    "side": "b",  # 1 = buy, -1 = sell
+    "sequence": "q",  # Perp sequence number; 0 for spot executions, which have none
+}
+DEPTH_COLUMNS = {
+    "timestamp": "q",  # Milliseconds (depth updatedAt)
+    "side": "b",  # 1 = bid, -1 = ask
+    "level": "h",  # Position in the book for snapshots; -1 for single level updates
+    "price_units": "q",
+    "qty": "d",
+}
+_COLUMNS = {EXECUTIONS: EXECUTION_COLUMNS, DEPTH: DEPTH_COLUMNS}
+
+# Price units per tick. Digits below a price unit are rounded off, and int64 units
+# hold prices of up to 9.2e12 ticks
+PRICE_SUBTICKS = 1_000_000
+
+# Marker file of a day partition whose timestamps are not in order
+UNSORTED_MARKER = "UNSORTED"
+META_FILE = "meta.json"
+
+DEFAULT_FLUSH_SIZE = 4096
+
+AnyExecution = Union[PerpExecution, SpotExecution, AsyncPerpExecution, AsyncSpotExecution]
+AnyDepth = Union[Depth, AsyncDepth]
+
+
+def _day(timestamp_ms: int) -> str:
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _column_path(partition: str, name: str) -> str:
+    return os.path.join(partition, f"{name}.bin")
+
+
+def price_units_to_ticks(units: "np.ndarray", tick_size: Decimal, price_unit: Decimal) -> "np.ndarray":
+    """
+    Round stored prices to whole ticks.
+
+    Args:
+        units: Values of a ``price_units`` column.
+        tick_size: Tick size of the symbol.
+        price_unit: Price unit of the symbol.
+
+    Returns:
+        Prices in ticks, as a new int64 array.
+    """
+    ticks: np.ndarray = np.rint(units / float(tick_size / price_unit)).astype(np.int64)
+    return ticks
+
+
+class _Partition:
+    """Buffered columns of one symbol, kind and day."""
+
+    def __init__(self, path: str, kind: str):
+        self.path = path
+        self.kind = kind
+        self.buffers = {name: array(typecode) for name, typecode in _COLUMNS[kind].items()}
+        self.last_timestamp = self._read_last_timestamp()
+        self.unsorted = os.path.exists(os.path.join(path, UNSORTED_MARKER))
+
+    def _read_last_timestamp(self) -> int:
+        path = _column_path(self.path, "timestamp")
+        if not os.path.exists(path):
+            return 0
+        itemsize = array("q").itemsize
+        size = os.path.getsize(path) - os.path.getsize(path) % itemsize
+        if not size:
+            return 0
+        with open(path, "rb") as f:
+            f.seek(size - itemsize)
+            return array("q", f.read(itemsize))[0]
+
+    def append(self, timestamp: int, values: dict[str, Any]) -> None:
+        if timestamp < self.last_timestamp:
+            self.unsorted = True
+        self.last_timestamp = max(self.last_timestamp, timestamp)
+        self.buffers["timestamp"].append(timestamp)
+        for name, value in values.items():
+            self.buffers[name].append(value)
+
+    def __len__(self) -> int:
+        return len(self.buffers["timestamp"])
+
+    def flush(self) -> None:
+        if not self.buffers["timestamp"]:
+            return
+        os.makedirs(self.path, exist_ok=True)
+        for name, buffer in self.buffers.items():
+            with open(_column_path(self.path, name), "ab") as f:
+                buffer.tofile(f)
+            del buffer[:]
+        if self.unsorted:
+            with open(os.path.join(self.path, UNSORTED_MARKER), "w", encoding="utf-8"):
+                pass
+
+
+class TickArchiveWriter:
+    """
+    Appends market executions and depth to the archive.
+
+    Pass ``on_message`` to ``ReyaSocket`` (or call it from an existing handler) with the
+    market execution and depth channels subscribed. Records are buffered and written
+    every ``flush_size`` records per partition, and on ``flush``/``close``.
+
+    The tick size of each symbol must be known before its first record, either from
+    ``tick_sizes``, ``set_tick_size`` or ``load_tick_sizes``; it is stored with the
+    archive, with the price unit, so readers can convert the stored units back to prices.
+
+    Example:
+        writer = TickArchiveWriter("ticks")
+        await writer.load_tick_sizes(client)
+        socket = ReyaSocket(on_message=writer.on_message, ...)
+    """
+
+    def __init__(self, root: str, tick_sizes: Optional[dict[str, str]] = None, flush_size: int = DEFAULT_FLUSH_SIZE):
+        """
+        Initialize the writer.
+
+        Args:
+            root: Archive directory; created if missing.
+            tick_sizes: Tick size by symbol.
+            flush_size: Buffered records per partition before they are written.
+        """
+        self._root = root
+        self._flush_size = flush_size
+        self._lock = threading.Lock()
+        self._price_units: dict[str, Decimal] = {}
+        self._partitions: dict[tuple[str, str, str], _Partition] = {}
+        os.makedirs(root, exist_ok=True)
+        for symbol, tick_size in (tick_sizes or {}).items():
+            self.set_tick_size(symbol, tick_size)
+
+    def __enter__(self) -> "TickArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def set_tick_size(self, symbol: str, tick_size: Union[str, Decimal]) -> None:
+        """
+        Set the tick size of a symbol, recording it in the archive.
+
+        Args:
+            symbol: Trading symbol.
+            tick_size: Price tick size.
+
+        Raises:
+            ValueError: If the archive already holds the symbol with another tick size.
+        """
+        tick = Decimal(tick_size)
+        meta_path = os.path.join(self._root, symbol, META_FILE)
+        with self._lock:
+            if os.path.exists(meta_path):
+                with open(meta_path, encoding="utf-8") as f:
+                    stored = Decimal(json.load(f)["tick_size"])
+                if stored != tick:
+                    raise ValueError(f"{symbol} is archived with tick size {stored}, not {tick}")
+            else:
+                os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+                with open(meta_path, "w", encoding="utf-8") as f:
+                    json.dump({"tick_size": str(tick), "price_unit": f"{tick / PRICE_SUBTICKS:f}"}, f)
+            self._price_units[symbol] = tick / PRICE_SUBTICKS
+
+    async def load_tick_sizes(self, client: "ReyaTradingClient") -> None:
+        """
+        Set the tick sizes of all perp and spot markets from their definitions.
+
+        Args:
+            client: Client to fetch the market definitions with.
+        """
+        definitions, spot_definitions = await asyncio.gather(
+            client.reference.get_market_definitions(),
+            client.reference.get_spot_market_definitions(),
+        )
+        for definition in definitions:
+            self.set_tick_size(definition.symbol, definition.tick_size)
+        for spot_definition in spot_definitions:
+            self.set_tick_size(spot_definition.symbol, spot_definition.tick_size)
+
+    def on_message(self, _ws: Any, message: Any) -> None:
+        """
+        Archive a WebSocket message; messages other than market executions and depth are ignored.
+
+        Args:
+            _ws: The WebSocket connection (unused, for ``ReyaSocket`` compatibility).
+            message: Typed WebSocket message.
+        """
+        if isinstance(message, (MarketPerpExecutionUpdatePayload, MarketSpotExecutionUpdatePayload)):
+            self.append_executions(message.data)
+        elif isinstance(message, MarketDepthUpdatePayload):
+            self.append_depth(message.data)
+
+    def append_executions(self, executions: Iterable[AnyExecution]) -> int:
+        """
+        Append executions.
+
+        Args:
+            executions: Executions from REST or the WebSocket.
+
+        Returns:
+            Number of records appended.
+        """
+        count = 0
+        with self._lock:
+            for execution in executions:
+                partition = self._partition(execution.symbol, EXECUTIONS, execution.timestamp)
+                partition.append(
+                    execution.timestamp,
+                    {
+                        "price_units": self._units(execution.symbol, execution.price),
+                        "qty": float(execution.qty),
+                        "side": 1 if execution.side.value == "B" else -1,
+                        "sequence": getattr(execution, "sequence_number", 0),
+                    },
+                )
+                self._maybe_flush(partition)
+                count += 1
+        return count
+
+    def append_depth(self, depth: AnyDepth) -> int:
+        """
+        Append the levels of a depth message.
+
+        Args:
+            depth: Depth snapshot or update from REST or the WebSocket.
+
+        Returns:
+            Number of level records appended.
+        """
+        snapshot = depth.type.value == "SNAPSHOT"
+        sides: tuple[tuple[int, list[Any]], ...] = ((1, depth.bids), (-1, depth.asks))
+        count = 0
+        with self._lock:
+            partition = self._partition(depth.symbol, DEPTH, depth.updated_at)
+            for side, levels in sides:
+                for index, level in enumerate(levels):
+                    partition.append(
+                        depth.updated_at,
+                        {
+                            "side": side,
+                            "level": index if snapshot else -1,
+                            "price_units": self._units(depth.symbol, level.px),
+                            "qty": float(level.qty),
+                        },
+                    )
+                    count += 1
+            self._maybe_flush(partition)
+        return count
+
+    def flush(self) -> None:
+        """Write all buffered records."""
+        with self._lock:
+            for partition in self._partitions.values():
+                partition.flush()
+
+    def close(self) -> None:
+        """Write all buffered records and release the partitions."""
+        with self._lock:
+            for partition in self._partitions.values():
+                partition.flush()
+            self._partitions.clear()
+
+    def _units(self, symbol: str, price: str) -> int:
+        """Price in price units. Caller must hold the lock."""
+        unit = self._price_units.get(symbol)
+        if unit is None:
+            raise KeyError(f"Unknown tick size for {symbol}; call set_tick_size or load_tick_sizes first")
+        return int((Decimal(price) / unit).to_integral_value())
+
+    def _partition(self, symbol: str, kind: str, timestamp: int) -> _Partition:
+        """Partition of a record, opening it if needed. Caller must hold the lock."""
+        key = (symbol, kind, _day(timestamp))
+        partition = self._partitions.get(key)
+        if partition is None:
+            # A new day has started; earlier days of the stream are complete
+            for stale in [other for other in self._partitions if other[:2] == key[:2]]:
+                self._partitions.pop(stale).flush()
+            partition = self._partitions[key] = _Partition(os.path.join(self._root, *key), kind)
+        return partition
+
+    def _maybe_flush(self, partition: _Partition) -> None:
+        if len(partition) >= self._flush_size:
+            partition.flush()
+
+
+@dataclass(frozen=True)
+class TickSlice:
+    """
+    Records of one symbol and day, as read-only NumPy views of the memory-mapped files.
+
+    Attributes:
+        symbol: Trading symbol.
+        day: UTC day, "YYYY-MM-DD".
+        tick_size: Price tick size of the symbol.
+        price_unit: Price of one stored price unit.
+        columns: Column views by name (see EXECUTION_COLUMNS and DEPTH_COLUMNS).
+    """
+
+    symbol: str
+    day: str
+    tick_size: Decimal
+    price_unit: Decimal
+    columns: dict[str, "np.ndarray"]
+
+    def __len__(self) -> int:
+        return len(self.columns["timestamp"])
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        return self.columns[name]
+
+    @property
+    def price(self) -> "np.ndarray":
+        """Prices as float64, computed from the price units (a new array)."""
+        prices: np.ndarray = self.columns["price_units"] * float(self.price_unit)
+        return prices
+
+    @property
+    def price_ticks(self) -> "np.ndarray":
+        """Prices rounded to whole ticks, as int64 (a new array)."""
+        return price_units_to_ticks(self.columns["price_units"], self.tick_size, self.price_unit)
+
+
+class TickArchive:
+    """
+    Reads the archive written by ``TickArchiveWriter``.
+
+    Column files are memory-mapped, so slicing costs nothing until the data is used
+    and the archive can be larger than memory. Days are located from the directory
+    layout, and records within a day by binary search on the timestamp column (or a
+    mask, for days whose records were appended out of order).
+    """
+
+    def __init__(self, root: str):
+        """
+        Open an archive.
+
+        Args:
+            root: Archive directory.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        if np is None:
+            raise ImportError("TickArchive requires numpy: pip install reya-python-sdk[analytics]")
+        self._root = root
+
+    @property
+    def symbols(self) -> list[str]:
+        """Archived symbols."""
+        if not os.path.isdir(self._root):
+            return []
+        return sorted(entry for entry in os.listdir(self._root) if os.path.isdir(os.path.join(self._root, entry)))
+
+    def days(self, symbol: str, kind: str = EXECUTIONS) -> list[str]:
+        """
+        Archived UTC days of a symbol, in order.
+
+        Args:
+            symbol: Trading symbol.
+            kind: "executions" or "depth".
+        """
+        path = os.path.join(self._root, symbol, kind)
+        return sorted(os.listdir(path)) if os.path.isdir(path) else []
+
+    def tick_size(self, symbol: str) -> Decimal:
+        """Tick size of the symbol's market."""
+        return Decimal(self._meta(symbol)["tick_size"])
+
+    def price_unit(self, symbol: str) -> Decimal:
+        """Price of one unit of the symbol's ``price_units`` column."""
+        return Decimal(self._meta(symbol)["price_unit"])
+
+    def _meta(self, symbol: str) -> dict[str, str]:
+        with open(os.path.join(self._root, symbol, META_FILE), encoding="utf-8") as f:
+            meta: dict[str, str] = json.load(f)
+        return meta
+
+    def iter_slices(
+        self, symbol: str, kind: str = EXECUTIONS, start_time: Optional[int] = None, end_time: Optional[int] = None
+    ) -> Iterator[TickSlice]:
+        """
+        Zero-copy views of the records in a time range, one slice per day.
+
+        Args:
+            symbol: Trading symbol.
+            kind: "executions" or "depth".
+            start_time: Only records at or after this timestamp (ms).
+            end_time: Only records before this timestamp (ms).
+
+        Yields:
+            Non-empty slices, oldest day first.
+        """
+        first_day = _day(start_time) if start_time is not None else None
+        last_day = _day(end_time) if end_time is not None else None
+        tick_size = self.tick_size(symbol)
+        price_unit = self.price_unit(symbol)
+        for day in self.days(symbol, kind):
+            if (first_day is not None and day < first_day) or (last_day is not None and day > last_day):
+                continue
+            columns = self._map(os.path.join(self._root, symbol, kind, day), kind)
+            columns = self._select(columns, os.path.join(self._root, symbol, kind, day), start_time, end_time)
+            if len(columns["timestamp"]):
+                yield TickSlice(symbol=symbol, day=day, tick_size=tick_size, price_unit=price_unit, columns=columns)
+
+    def slices(
+        self, symbol: str, kind: str = EXECUTIONS, start_time: Optional[int] = None, end_time: Optional[int] = None
+    ) -> list[TickSlice]:
+        """Same as ``iter_slices``, as a list."""
+        return list(self.iter_slices(symbol, kind, start_time, end_time))
+
+    def load(
+        self, symbol: str, kind: str = EXECUTIONS, start_time: Optional[int] = None, end_time: Optional[int] = None
+    ) -> dict[str, "np.ndarray"]:
+        """
+        Records in a time range concatenated across days (this copies the data).
+
+        Args:
+            symbol: Trading symbol.
+            kind: "executions" or "depth".
+            start_time: Only records at or after this timestamp (ms).
+            end_time: Only records before this timestamp (ms).
+
+        Returns:
+            Arrays by column name.
+        """
+        parts = self.slices(symbol, kind, start_time, end_time)
+        return {
+            name: (
+                np.concatenate([part.columns[name] for part in parts])
+                if parts
+                else np.empty(0, dtype=np.dtype(typecode))
+            )
+            for name, typecode in _COLUMNS[kind].items()
+        }
+
+    @staticmethod
+    def _map(partition: str, kind: str) -> dict[str, "np.ndarray"]:
+        """Memory-map the columns of a partition, truncated to the shortest (in case of a torn write)."""
+        layout = _COLUMNS[kind]
+        lengths = {}
+        for name, typecode in layout.items():
+            path = _column_path(partition, name)
+            lengths[name] = os.path.getsize(path) // np.dtype(typecode).itemsize if os.path.exists(path) else 0
+        count = min(lengths.values())
+        if not count:
+            return {name: np.empty(0, dtype=np.dtype(typecode)) for name, typecode in layout.items()}
+        return {
+            name: np.memmap(_column_path(partition, name), dtype=np.dtype(typecode), mode="r", shape=(count,))
+            for name, typecode in layout.items()
+        }
+
+    @staticmethod
+    def _select(
+        columns: dict[str, "np.ndarray"], partition: str, start_time: Optional[int], end_time: Optional[int]
+    ) -> dict[str, "np.ndarray"]:
+        """Restrict columns to a time range: a slice (no copy) when sorted, a mask otherwise."""
+        if start_time is None and end_time is None:
+            return columns
+        timestamps = columns["timestamp"]
+        if os.path.exists(os.path.join(partition, UNSORTED_MARKER)):
+            mask = np.ones(len(timestamps), dtype=bool)
+            if start_time is not None:
+                mask &= timestamps >= start_time
+            if end_time is not None:
+                mask &= timestamps < end_time
+            return {name: column[mask] for name, column in columns.items()}
+        lo = int(np.searchsorted(timestamps, start_time, side="left")) if start_time is not None else 0
+        hi = int(np.searchsorted(timestamps, end_time, side="left")) if end_time is not None else len(timestamps)
+        return {name: column[lo:hi] for name, column in columns.items()}
@@ -5,7 +5,56 @@ This package provides a client for interacting with the Reya Trading REST API,
 allowing users to create and manage trading orders.
 """
 
+from sdk.reya_rest_api.api_client import HedgeMetrics, HedgingPolicy, ReyaApiClient
+from sdk.reya_rest_api.auth.signer_backends import (
+    LocalSignerBackend,
+    NativeSignerBackend,
+    ProcessPoolSignerBackend,
+    SignerBackend,
+)
 from sdk.reya_rest_api.client import ReyaTradingClient
 from sdk.reya_rest_api.config import TradingConfig, get_spot_config
+from sdk.reya_rest_api.constants.enums import RequestPriority, RiskRejectReason
+from sdk.reya_rest_api.dead_man_switch import DeadManSwitch
+from sdk.reya_rest_api.exceptions import OrderOutcomeUnknownError, OrderStateError, ReyaTradingError, RiskCheckError
+from sdk.reya_rest_api.order_entry import ReyaOrderEntryApi, encode_request
+from sdk.reya_rest_api.order_tracker import OrderTracker, TrackedOrder
+from sdk.reya_rest_api.presigned_pool import PresignedOrder, PresignedOrderPool, PresignedPoolMetrics
+from sdk.reya_rest_api.rate_limiter import LaneMetrics, RateLimit, RateLimiter
+from sdk.reya_rest_api.retry import RetryMetrics, RetryPolicy
+from sdk.reya_rest_api.risk_engine import MarginState, RiskCheck, RiskEngine
 
-__all__ = ["ReyaTradingClient", "TradingConfig", "get_spot_config"]
+__all__ = [
+    "ReyaTradingClient",
+    "TradingConfig",
+    "get_spot_config",
+    "OrderTracker",
+    "TrackedOrder",
+    "ReyaTradingError",
+    "OrderStateError",
+    "OrderOutcomeUnknownError",
+    "DeadManSwitch",
+    "RateLimiter",
+    "RateLimit",
+    "RequestPriority",
+    "LaneMetrics",
+    "RetryPolicy",
+    "RetryMetrics",
+    "ReyaApiClient",
+    "HedgingPolicy",
+    "HedgeMetrics",
+    "RiskEngine",
+    "RiskCheck",
+    "RiskCheckError",
+    "RiskRejectReason",
+    "MarginState",
+    "ReyaOrderEntryApi",
+    "encode_request",
+    "PresignedOrderPool",
+    "PresignedOrder",
+    "PresignedPoolMetrics",
+    "SignerBackend",
+    "LocalSignerBackend",
+    "ProcessPoolSignerBackend",
+    "NativeSignerBackend",
+]
@@ -0,0 +1,260 @@
+"""
+API Client - OpenAPI client extension with hedged GET requests, pre-encoded bodies and trusted responses.
+
+Hedging sends a duplicate of a slow idempotent request once it has been
+outstanding longer than a recent latency percentile, and uses whichever copy
+completes first. A budget caps the extra load.
+
+Request bodies passed as ``bytes`` are sent as they are, so callers that encode
+JSON themselves (see ``order_entry``) skip the generic serializer.
+
+In trusted response mode, responses are built into the generated models without
+validation (see ``trusted_responses``).
+"""
+
+from typing import Any, Optional, Union
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, replace
+from urllib.parse import urlsplit
+
+import aiohttp
+import aiohttp_retry
+
+from sdk.open_api.api_client import ApiClient
+from sdk.open_api.configuration import Configuration
+from sdk.open_api.rest import ALLOW_RETRY_METHODS, RESTClientObject, RESTResponse
+from sdk.reya_rest_api.trusted_responses import deserialize_trusted
+
+logger = logging.getLogger("reya_trading.api_client")
+
+HEDGED_METHODS = frozenset({"GET", "HEAD"})
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    """
+    When and how often to hedge GET requests.
+
+    Attributes:
+        percentile: Latency percentile of recent requests to the same path after which
+            a duplicate request is sent.
+        initial_delay_s: Hedge delay used until enough latency samples are collected.
+        min_delay_s: Lower bound of the hedge delay.
+        max_delay_s: Upper bound of the hedge delay.
+        window: Number of recent latency samples kept per path.
+        min_samples: Samples needed before the percentile is used.
+        budget_ratio: Hedges allowed per GET request (e.g. 0.05 for at most 5% extra load).
+        max_burst: Maximum number of hedges that can be saved up from the budget.
+    """
+
+    percentile: float = 95.0
+    initial_delay_s: float = 0.1
+    min_delay_s: float = 0.005
+    max_delay_s: float = 1.0
+    window: int = 256
+    min_samples: int = 20
+    budget_ratio: float = 0.05
+    max_burst: float = 10.0
+
+    def __post_init__(self):
+        if not 0 < self.percentile < 100:
+            raise ValueError(f"percentile must be between 0 and 100, got {self.percentile}")
+        if self.min_delay_s > self.max_delay_s:
+            raise ValueError("min_delay_s must not exceed max_delay_s")
+        if self.budget_ratio < 0:
+            raise ValueError(f"budget_ratio must not be negative, got {self.budget_ratio}")
+
+
+@dataclass
+class HedgeMetrics:
+    """Counters of hedged requests."""
+
+    requests: int = 0  # GET requests eligible for hedging
+    hedged: int = 0  # Requests for which a duplicate was sent
+    hedge_wins: int = 0  # Requests answered first by the duplicate
+    budget_exhausted: int = 0  # Slow requests not hedged because the budget was spent
+
+
+class ReyaRESTClient(RESTClientObject):
+    """RESTClientObject that sends ``bytes`` bodies as they are instead of JSON-encoding them again."""
+
+    async def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
+        if not isinstance(body, bytes):
+            return await super().request(method, url, headers, body, post_params, _request_timeout)
+
+        method = method.upper()
+        response = await self._session_for(method).request(
+            method,
+            url,
+            timeout=_request_timeout or 5 * 60,
+            headers={"Content-Type": "application/json", **(headers or {})},
+            data=body,
+            proxy=self.proxy or None,
+            proxy_headers=self.proxy_headers or None,
+        )
+        return RESTResponse(response)
+
+    def _session_for(self, method: str) -> Union[aiohttp.ClientSession, aiohttp_retry.RetryClient]:
+        """
+        Session to send a request with, created on first use as ``RESTClientObject.request`` does.
+
+        Both are stored on the attributes the generated client checks, so JSON and
+        ``bytes`` requests share one connection pool and one retry client.
+        """
+        if self.pool_manager is None:
+            self.pool_manager = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.maxsize, ssl=self.ssl_context),
+                trust_env=True,
+            )
+        if self.retries is None or method not in ALLOW_RETRY_METHODS:
+            return self.pool_manager
+        if self.retry_client is None:
+            self.retry_client = aiohttp_retry.RetryClient(
+                client_session=self.pool_manager,
+                retry_options=aiohttp_retry.ExponentialRetry(
+                    attempts=self.retries, factor=2.0, start_timeout=0.1, max_timeout=120.0
+                ),
+            )
+        return self.retry_client
+
+
+class ReyaApiClient(ApiClient):
+    """
+    ApiClient that can hedge idempotent GET requests, send pre-encoded bodies and skip response validation.
+
+    Without a hedging policy it behaves like ApiClient, except that a ``bytes`` body is
+    sent unchanged (with a JSON content type unless one is given). With one, the body of
+    each GET response is read before it is returned, so the first complete response
+    wins; responses from the ``*_without_preload_content`` methods are therefore
+    already consumed.
+    """
+
+    def __init__(
+        self,
+        configuration: Optional[Configuration] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        trusted_responses: bool = False,
+    ):
+        """
+        Initialize the API client.
+
+        Args:
+            configuration: OpenAPI client configuration.
+            hedging: Hedging policy for GET requests; hedging is disabled if None.
+            trusted_responses: Build response models without validating them; only for a
+                               host trusted to follow the API schema. Can also be changed
+                               later through the ``trusted_responses`` attribute.
+        """
+        super().__init__(configuration)
+        self.rest_client = ReyaRESTClient(self.configuration)
+        self.hedging = hedging
+        self.trusted_responses = trusted_responses
+        self._latencies: dict[str, deque[float]] = {}
+        self._hedge_allowance = hedging.max_burst if hedging is not None else 0.0
+        self._metrics = HedgeMetrics()
+
+    @property
+    def hedge_metrics(self) -> HedgeMetrics:
+        """Get a snapshot of the hedging counters."""
+        return replace(self._metrics)
+
+    def hedge_delay(self, url: str) -> float:
+        """
+        Current hedge delay in seconds for a URL.
+
+        Args:
+            url: Request URL; latencies are tracked per path, ignoring the query string.
+
+        Returns:
+            Seconds to wait for a response before sending a duplicate.
+        """
+        policy = self.hedging
+        if policy is None:
+            raise ValueError("Hedging is not enabled")
+        samples = self._latencies.get(urlsplit(url).path)
+        if samples is None or len(samples) < policy.min_samples:
+            return policy.initial_delay_s
+        ordered = sorted(samples)
+        delay = ordered[min(len(ordered) - 1, int(len(ordered) * policy.percentile / 100))]
+        return min(policy.max_delay_s, max(policy.min_delay_s, delay))
+
+    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]) -> Any:
+        if self.trusted_responses:
+            handled, data = deserialize_trusted(response_text, response_type, content_type)
+            if handled:
+                return data
+        return super().deserialize(response_text, response_type, content_type)
+
+    async def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> RESTResponse:
+        if self.hedging is None or method not in HEDGED_METHODS:
+            return await super().call_api(method, url, header_params, body, post_params, _request_timeout)
+        return await self._hedged_call(method, url, header_params, _request_timeout)
+
+    async def _fetch(self, method, url, header_params, _request_timeout) -> RESTResponse:
+        response = await super().call_api(method, url, header_params, None, None, _request_timeout)
+        await response.read()
+        return response
+
+    async def _hedged_call(self, method, url, header_params, _request_timeout) -> RESTResponse:
+        """Send a request, duplicating it if it is slow, and return the first response to complete."""
+        policy = self.hedging
+        assert policy is not None
+        metrics = self._metrics
+        metrics.requests += 1
+        self._hedge_allowance = min(policy.max_burst, self._hedge_allowance + policy.budget_ratio)
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        primary = asyncio.ensure_future(self._fetch(method, url, header_params, _request_timeout))
+        tasks: list[asyncio.Future[RESTResponse]] = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay(url))
+            if not done:
+                if self._hedge_allowance >= 1.0:
+                    self._hedge_allowance -= 1.0
+                    metrics.hedged += 1
+                    tasks.append(asyncio.ensure_future(self._fetch(method, url, header_params, _request_timeout)))
+                else:
+                    metrics.budget_exhausted += 1
+
+            winner = await self._first_success(tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        if winner is not primary:
+            metrics.hedge_wins += 1
+        for task in tasks:
+            if task is not winner and task.done() and not task.cancelled() and task.exception() is None:
+                task.result().response.release()
+
+        response = winner.result()
+        samples = self._latencies.setdefault(urlsplit(url).path, deque(maxlen=policy.window))
+        samples.append(loop.time() - started_at)
+        return response
+
+    @staticmethod
+    async def _first_success(tasks: "list[asyncio.Future[RESTResponse]]") -> "asyncio.Future[RESTResponse]":
+        """Wait for the first task to return a response; if all fail, return the primary so its error is raised."""
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task in done and task.exception() is None:
+                    return task
+        for task in tasks:
+            if task.exception() is not None:
+                logger.debug(f"Hedged request attempt failed: {task.exception()!r}")
+        return tasks[0]
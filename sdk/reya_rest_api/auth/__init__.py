@@ -3,5 +3,17 @@ Authentication module for Reya Trading API.
 """
 
 from sdk.reya_rest_api.auth.signatures import SignatureGenerator
+from sdk.reya_rest_api.auth.signer_backends import (
+    LocalSignerBackend,
+    NativeSignerBackend,
+    ProcessPoolSignerBackend,
+    SignerBackend,
+)
 
-__all__ = ["SignatureGenerator"]
+__all__ = [
+    "SignatureGenerator",
+    "SignerBackend",
+    "LocalSignerBackend",
+    "ProcessPoolSignerBackend",
+    "NativeSignerBackend",
+]
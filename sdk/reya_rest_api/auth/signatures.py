@@ -2,28 +2,47 @@
 Signature generation utilities for Reya Trading API authentication.
 
 This module provides tools for creating EIP-712 signatures for order creation
-and message signatures for order cancellation.
+and message signatures for order cancellation. Messages are hashed here and the
+digests signed by a pluggable ``SignerBackend`` (see ``signer_backends``).
 """
 
+from typing import Any, Callable, Optional, Sequence, Union
+
 import json
 from decimal import Decimal
 
 from eth_abi import encode
 from eth_account import Account
-from eth_account.messages import encode_defunct
+from eth_account.messages import SignableMessage, encode_defunct, encode_typed_data
+from eth_utils import keccak
 
+from sdk.reya_rest_api.auth.signer_backends import LocalSignerBackend, SignerBackend
 from sdk.reya_rest_api.config import TradingConfig
+from sdk.reya_rest_api.models.fixed_point import WAD_DECIMALS, FixedPoint, to_wad
+
+Numeric = Union[str, int, float, Decimal, FixedPoint]
+
+
+def hash_signable_message(message: SignableMessage) -> bytes:
+    """EIP-191 digest of a message, as signed by ``Account.sign_message``."""
+    return bytes(keccak(b"\x19" + message.version + message.header + message.body))
+
+
+def _to_hex(signature: bytes) -> str:
+    return f"0x{signature.hex()}"
 
 
 class SignatureGenerator:
     """Generate signatures for Reya Trading API requests."""
 
-    def __init__(self, config: TradingConfig):
+    def __init__(self, config: TradingConfig, backend: Optional[SignerBackend] = None):
         """
         Initialize the signature generator with configuration.
 
         Args:
             config: Trading API configuration
+            backend: Signer of message digests, holding the config's private key
+                     (defaults to a LocalSignerBackend)
         """
         self.config = config
         self._private_key = config.private_key
@@ -34,46 +53,101 @@ class SignatureGenerator:
 
         # Calculate signer wallet address from private key
         self._signer_wallet_address: str = str(Account.from_key(self._private_key).address)
+        self._backend = backend if backend is not None else LocalSignerBackend(self._private_key)
 
     @property
     def signer_wallet_address(self) -> str:
         """Get the signer wallet address derived from the private key."""
         return self._signer_wallet_address
 
-    def scale(self, decimals: int):
-        """Returns a function that scales a number (str, int, float, or Decimal) to an integer."""
-        factor = 10**decimals
+    @property
+    def backend(self) -> SignerBackend:
+        """Get the signer backend."""
+        return self._backend
+
+    def sign_digest(self, digest: bytes) -> str:
+        """
+        Sign a message digest (e.g. from ``raw_order_digest``).
+
+        Args:
+            digest: 32-byte message digest
 
-        def _scale(value):
-            return int(Decimal(value) * factor)
+        Returns:
+            Hex-encoded signature
+        """
+        return _to_hex(self._backend.sign_digest(digest))
+
+    def sign_digests(self, digests: Sequence[bytes]) -> list[str]:
+        """
+        Sign message digests in one batch (e.g. from ``raw_order_digest``).
+
+        Args:
+            digests: 32-byte message digests
+
+        Returns:
+            Hex-encoded signatures, in the order of the digests
+        """
+        return [_to_hex(signature) for signature in self._backend.sign_digests(digests)]
+
+    async def sign_digest_async(self, digest: bytes) -> str:
+        """
+        Sign a message digest from the event loop.
+
+        With a ProcessPoolSignerBackend or NativeSignerBackend the loop is not blocked,
+        and digests signed concurrently are batched together.
+
+        Args:
+            digest: 32-byte message digest
+
+        Returns:
+            Hex-encoded signature
+        """
+        return _to_hex(await self._backend.sign_digest_async(digest))
+
+    def _typed_data_digest(self, primary_types: dict[str, Any], message: dict[str, Any]) -> bytes:
+        domain = {
+            "name": "Reya",
+            "version": "1",
+            "verifyingContract": self.config.default_orders_gateway_address,
+        }
+        return hash_signable_message(encode_typed_data(domain, primary_types, message))
+
+    def scale(self, decimals: int = WAD_DECIMALS) -> Callable[[Numeric], int]:
+        """Returns a function that scales a number to an integer of 10**-decimals units, truncating like ``to_wad``."""
+        shift = decimals - WAD_DECIMALS
+        factor: int = 10 ** abs(shift)
+
+        def _scale(value: Numeric) -> int:
+            units = to_wad(value)
+            if shift >= 0:
+                return units * factor
+            truncated = abs(units) // factor
+            return truncated if units >= 0 else -truncated
 
         return _scale
 
     def encode_inputs_limit_order(
         self,
         is_buy: bool,
-        limit_px: Decimal,
-        qty: Decimal,
+        limit_px: Numeric,
+        qty: Numeric,
     ) -> str:
-        scaler = self.scale(18)
-
         # Negate qty if it's a sell order
-        signed_qty = qty if is_buy else -qty
+        scaled_qty = to_wad(qty)
+        signed_qty = scaled_qty if is_buy else -scaled_qty
 
-        encoded = encode(["int256", "uint256"], [scaler(signed_qty), scaler(limit_px)])
+        encoded = encode(["int256", "uint256"], [signed_qty, to_wad(limit_px)])
         return encoded.hex() if encoded.hex().startswith("0x") else f"0x{encoded.hex()}"
 
     def encode_inputs_trigger_order(
         self,
         is_buy: bool,
-        trigger_px: Decimal,
-        limit_px: Decimal,
+        trigger_px: Numeric,
+        limit_px: Numeric,
     ) -> str:
-        scaler = self.scale(18)
-
         encoded = encode(
             ["bool", "uint256", "uint256"],
-            [bool(is_buy), scaler(trigger_px), scaler(limit_px)],
+            [bool(is_buy), to_wad(trigger_px), to_wad(limit_px)],
         )
         return encoded.hex() if encoded.hex().startswith("0x") else f"0x{encoded.hex()}"
 
@@ -96,7 +170,7 @@ class SignatureGenerator:
 
         return hash_uint256
 
-    def sign_raw_order(
+    def raw_order_digest(
         self,
         account_id: int,
         market_id: int,
@@ -106,9 +180,9 @@ class SignatureGenerator:
         inputs: str,  # hex-encoded ABI data
         deadline: int,
         nonce: int,
-    ) -> str:
+    ) -> bytes:
         """
-        Sign an Orders Gateway order using EIP-712.
+        Hash an Orders Gateway order for EIP-712 signing.
 
         Args:
             account_id: The Reya account ID
@@ -121,15 +195,8 @@ class SignatureGenerator:
             nonce: The nonce to use for this order (must match the nonce passed to the API)
 
         Returns:
-            Hex-encoded signature
+            32-byte EIP-712 digest
         """
-        # Define EIP-712 domain
-        domain = {
-            "name": "Reya",
-            "version": "1",
-            "verifyingContract": self.config.default_orders_gateway_address,
-        }
-
         # Define the message types for EIP-712 (conditional order format)
         types = {
             "ConditionalOrder": [
@@ -165,14 +232,39 @@ class SignatureGenerator:
             },
         }
 
-        # Sign the message using the correct eth-account format
-        signed_message = Account.sign_typed_data(self._private_key, domain, types, message)
+        return self._typed_data_digest(types, message)
+
+    def sign_raw_order(
+        self,
+        account_id: int,
+        market_id: int,
+        exchange_id: int,
+        counterparty_account_ids: list,
+        order_type: int,
+        inputs: str,  # hex-encoded ABI data
+        deadline: int,
+        nonce: int,
+    ) -> str:
+        """
+        Sign an Orders Gateway order using EIP-712.
+
+        Args:
+            account_id: The Reya account ID
+            market_id: The market ID for this order
+            exchange_id: Exchange ID (usually 2)
+            counterparty_account_ids: List of counterparty account IDs
+            order_type: Order type enum value
+            inputs: ABI-encoded order inputs
+            deadline: Signature expiration timestamp
+            nonce: The nonce to use for this order (must match the nonce passed to the API)
 
-        return (
-            signed_message.signature.hex()
-            if signed_message.signature.hex().startswith("0x")
-            else f"0x{signed_message.signature.hex()}"
+        Returns:
+            Hex-encoded signature
+        """
+        digest = self.raw_order_digest(
+            account_id, market_id, exchange_id, counterparty_account_ids, order_type, inputs, deadline, nonce
         )
+        return self.sign_digest(digest)
 
     def sign_cancel_order_perps(self, order_id: str) -> str:
         """
@@ -184,6 +276,18 @@ class SignatureGenerator:
         Returns:
             Hex-encoded signature
         """
+        return self.sign_digest(self.cancel_order_perps_digest(order_id))
+
+    def cancel_order_perps_digest(self, order_id: str) -> bytes:
+        """
+        Hash an order cancellation message for personal_sign (for perp orders).
+
+        Args:
+            order_id: ID of the order to cancel
+
+        Returns:
+            32-byte EIP-191 digest
+        """
         # Create cancellation message
         cancel_message = {
             "orderId": order_id,
@@ -197,16 +301,9 @@ class SignatureGenerator:
         # Prepare an EIP-191 message
         signable_message = encode_defunct(text=message_str)
 
-        # Sign the message
-        signed_message = Account.sign_message(signable_message, private_key=self._private_key)
-
-        return (
-            signed_message.signature.hex()
-            if signed_message.signature.hex().startswith("0x")
-            else f"0x{signed_message.signature.hex()}"
-        )
+        return hash_signable_message(signable_message)
 
-    def sign_cancel_order_spot(
+    def cancel_order_spot_digest(
         self,
         account_id: int,
         market_id: int,
@@ -214,12 +311,9 @@ class SignatureGenerator:
         client_order_id: int,
         nonce: int,
         deadline: int,
-    ) -> str:
+    ) -> bytes:
         """
-        Sign an order cancellation message using EIP-712 (for SPOT orders).
-
-        This method generates an EIP-712 signature for cancelling a specific order.
-        For SPOT market orders, both orderId and clientOrderId must be provided.
+        Hash an order cancellation message for EIP-712 signing (for SPOT orders).
 
         Args:
             account_id: The Reya account ID
@@ -230,15 +324,8 @@ class SignatureGenerator:
             deadline: Signature expiration timestamp (milliseconds)
 
         Returns:
-            Hex-encoded signature
+            32-byte EIP-712 digest
         """
-        # Define EIP-712 domain
-        domain = {
-            "name": "Reya",
-            "version": "1",
-            "verifyingContract": self.config.default_orders_gateway_address,
-        }
-
         # Define the message types for EIP-712 (OrderCancel format for SPOT)
         types = {
             "OrderCancel": [
@@ -268,44 +355,56 @@ class SignatureGenerator:
             },
         }
 
-        # Sign the message using EIP-712
-        signed_message = Account.sign_typed_data(self._private_key, domain, types, message)
-
-        return (
-            signed_message.signature.hex()
-            if signed_message.signature.hex().startswith("0x")
-            else f"0x{signed_message.signature.hex()}"
-        )
+        return self._typed_data_digest(types, message)
 
-    def sign_mass_cancel(
+    def sign_cancel_order_spot(
         self,
         account_id: int,
         market_id: int,
+        order_id: int,
+        client_order_id: int,
         nonce: int,
         deadline: int,
     ) -> str:
         """
-        Sign a mass cancel request using EIP-712 (for SPOT orders).
+        Sign an order cancellation message using EIP-712 (for SPOT orders).
 
-        This method generates an EIP-712 signature for cancelling all orders
-        for a specific account and market.
+        This method generates an EIP-712 signature for cancelling a specific order.
+        For SPOT market orders, both orderId and clientOrderId must be provided.
 
         Args:
             account_id: The Reya account ID
-            market_id: The market ID
-            nonce: Unique nonce for this mass cancel (microsecond timestamp)
+            market_id: The market ID for this order
+            order_id: Internal matching engine order ID to cancel
+            client_order_id: Client-provided order ID
+            nonce: Unique nonce for this cancellation (microsecond timestamp)
             deadline: Signature expiration timestamp (milliseconds)
 
         Returns:
             Hex-encoded signature
         """
-        # Define EIP-712 domain
-        domain = {
-            "name": "Reya",
-            "version": "1",
-            "verifyingContract": self.config.default_orders_gateway_address,
-        }
+        digest = self.cancel_order_spot_digest(account_id, market_id, order_id, client_order_id, nonce, deadline)
+        return self.sign_digest(digest)
+
+    def mass_cancel_digest(
+        self,
+        account_id: int,
+        market_id: int,
+        nonce: int,
+        deadline: int,
+    ) -> bytes:
+        """
+        Hash a mass cancel request for EIP-712 signing (for SPOT orders).
+
+        Args:
+            account_id: The Reya account ID
+            market_id: The market ID
+            nonce: Unique nonce for this mass cancel (microsecond timestamp)
+            deadline: Signature expiration timestamp (milliseconds)
 
+        Returns:
+            32-byte EIP-712 digest
+        """
         # Define the message types for EIP-712 (MassCancel format for SPOT)
         types = {
             "MassCancel": [
@@ -331,11 +430,29 @@ class SignatureGenerator:
             },
         }
 
-        # Sign the message using EIP-712
-        signed_message = Account.sign_typed_data(self._private_key, domain, types, message)
+        return self._typed_data_digest(types, message)
 
-        return (
-            signed_message.signature.hex()
-            if signed_message.signature.hex().startswith("0x")
-            else f"0x{signed_message.signature.hex()}"
-        )
+    def sign_mass_cancel(
+        self,
+        account_id: int,
+        market_id: int,
+        nonce: int,
+        deadline: int,
+    ) -> str:
+        """
+        Sign a mass cancel request using EIP-712 (for SPOT orders).
+
+        This method generates an EIP-712 signature for cancelling all orders
+        for a specific account and market.
+
+        Args:
+            account_id: The Reya account ID
+            market_id: The market ID
+            nonce: Unique nonce for this mass cancel (microsecond timestamp)
+            deadline: Signature expiration timestamp (milliseconds)
+
+        Returns:
+            Hex-encoded signature
+        """
+        digest = self.mass_cancel_digest(account_id, market_id, nonce, deadline)
+        return self.sign_digest(digest)
@@ -0,0 +1,293 @@
+"""
+Signer Backends - Pluggable ECDSA signing of EIP-712 and EIP-191 digests.
+
+``SignatureGenerator`` hashes each message and hands the 32-byte digest to a backend,
+which returns the 65-byte ``r || s || v`` signature (``v`` of 27 or 28), the same
+bytes ``Account.sign_typed_data`` and ``Account.sign_message`` produce: signing is
+deterministic (RFC 6979) with low ``s`` in every backend.
+
+- ``LocalSignerBackend``: signs in the calling thread with ``eth_keys``; the default.
+- ``ProcessPoolSignerBackend``: keeps the key in worker processes and signs batches of
+  digests there, so bursts scale across cores despite the GIL.
+- ``NativeSignerBackend``: signs with libsecp256k1 through the optional ``coincurve``
+  dependency (``pip install reya-python-sdk[speedups]``), which releases the GIL, on a
+  thread pool.
+
+``sign_digests_async`` is what the trading client awaits. The pooled backends sign
+there without blocking the event loop, and the digests of all calls made in the same
+loop iteration (e.g. concurrent cancels) are signed as one batch.
+"""
+
+from typing import Any, Callable, Optional, Sequence, Union
+
+import asyncio
+import multiprocessing
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from eth_keys.datatypes import PrivateKey
+from hexbytes import HexBytes
+
+try:
+    import coincurve
+except ImportError:  # pragma: no cover - optional dependency
+    coincurve = None  # type: ignore[assignment,unused-ignore]
+
+PrivateKeyLike = Union[str, bytes]
+
+# Offset of the recovery id in Ethereum signatures
+V_OFFSET = 27
+
+# Key of the current worker process (see ProcessPoolSignerBackend)
+_worker_key: Optional[PrivateKey] = None
+
+
+def _key_bytes(private_key: PrivateKeyLike) -> bytes:
+    key = bytes(HexBytes(private_key))
+    if len(key) != 32:
+        raise ValueError("Private key must be 32 bytes")
+    return key
+
+
+def _sign(key: PrivateKey, digest: bytes) -> bytes:
+    signature = key.sign_msg_hash(digest)
+    r: int = signature.r
+    s: int = signature.s
+    return r.to_bytes(32, "big") + s.to_bytes(32, "big") + bytes([signature.v + V_OFFSET])
+
+
+def _init_worker(key: bytes) -> None:
+    global _worker_key  # pylint: disable=global-statement
+    _worker_key = PrivateKey(key)
+
+
+def _sign_in_worker(digests: list[bytes]) -> list[bytes]:
+    assert _worker_key is not None
+    return [_sign(_worker_key, digest) for digest in digests]
+
+
+def _chunks(digests: Sequence[bytes], count: int) -> list[list[bytes]]:
+    size = -(-len(digests) // count)  # Ceiling division
+    return [list(digests[start : start + size]) for start in range(0, len(digests), size)]
+
+
+def _resolve(futures: list["asyncio.Future[bytes]"], chunk: "asyncio.Future[list[bytes]]") -> None:
+    """Hand the signatures of a signed chunk, or its error, to the callers waiting for them."""
+    error = chunk.exception() if not chunk.cancelled() else asyncio.CancelledError()
+    for index, future in enumerate(futures):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(chunk.result()[index])
+
+
+class SignerBackend(ABC):
+    """Signs 32-byte digests with one private key."""
+
+    @abstractmethod
+    def sign_digests(self, digests: Sequence[bytes]) -> list[bytes]:
+        """
+        Sign digests.
+
+        Args:
+            digests: 32-byte message hashes.
+
+        Returns:
+            65-byte ``r || s || v`` signatures, in the order of the digests.
+        """
+
+    def sign_digest(self, digest: bytes) -> bytes:
+        """Sign one digest; see ``sign_digests``."""
+        return self.sign_digests([digest])[0]
+
+    async def sign_digests_async(self, digests: Sequence[bytes]) -> list[bytes]:
+        """
+        Sign digests from the event loop; signs in the calling thread unless overridden.
+
+        Args:
+            digests: 32-byte message hashes.
+
+        Returns:
+            65-byte ``r || s || v`` signatures, in the order of the digests.
+        """
+        return self.sign_digests(digests)
+
+    async def sign_digest_async(self, digest: bytes) -> bytes:
+        """Sign one digest from the event loop; see ``sign_digests_async``."""
+        return (await self.sign_digests_async([digest]))[0]
+
+    def close(self) -> None:
+        """Release worker processes or threads."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class LocalSignerBackend(SignerBackend):
+    """Signs in the calling thread with ``eth_keys`` (libsecp256k1 if coincurve is installed)."""
+
+    def __init__(self, private_key: PrivateKeyLike):
+        """
+        Initialize the backend.
+
+        Args:
+            private_key: Hex string or 32 bytes.
+        """
+        self._key = PrivateKey(_key_bytes(private_key))
+
+    def sign_digests(self, digests: Sequence[bytes]) -> list[bytes]:
+        return [_sign(self._key, digest) for digest in digests]
+
+    def sign_digest(self, digest: bytes) -> bytes:
+        return _sign(self._key, digest)
+
+
+class _PooledSignerBackend(SignerBackend):
+    """
+    Backend signing chunks of digests on an executor.
+
+    From the event loop every digest goes to the executor, including single ones, and
+    the digests requested in one loop iteration are split across the workers together.
+    """
+
+    workers: int
+    _executor: Executor
+    _sign_chunk: Callable[[list[bytes]], list[bytes]]
+
+    def __init__(self) -> None:
+        # Digests waiting for the next flush, per event loop
+        self._pending: dict[asyncio.AbstractEventLoop, list[tuple[bytes, "asyncio.Future[bytes]"]]] = {}
+
+    async def sign_digests_async(self, digests: Sequence[bytes]) -> list[bytes]:
+        if not digests:
+            return []
+        loop = asyncio.get_running_loop()
+        futures: list["asyncio.Future[bytes]"] = [loop.create_future() for _ in digests]
+        pending = self._pending.get(loop)
+        if pending is None:
+            pending = self._pending[loop] = []
+            loop.call_soon(self._flush, loop)
+        pending.extend(zip(digests, futures))
+        return list(await asyncio.gather(*futures))
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Submit the digests requested during the last loop iteration, one chunk per worker."""
+        pending = self._pending.pop(loop)
+        start = 0
+        for chunk in _chunks([digest for digest, _ in pending], self.workers):
+            futures = [future for _, future in pending[start : start + len(chunk)]]
+            start += len(chunk)
+            try:
+                signed = loop.run_in_executor(self._executor, self._sign_chunk, chunk)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # E.g. the executor was shut down; fail the callers rather than leave them waiting
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            signed.add_done_callback(partial(_resolve, futures))
+
+
+class ProcessPoolSignerBackend(_PooledSignerBackend):
+    """
+    Signs in worker processes that each hold the key, splitting batches across them.
+
+    A single signature pays an inter-process round trip, so ``sign_digests`` signs
+    small batches in the calling thread; the pool pays off for bursts of at least
+    ``min_batch`` digests, and for any signature awaited from the event loop.
+    """
+
+    def __init__(
+        self,
+        private_key: PrivateKeyLike,
+        workers: Optional[int] = None,
+        min_batch: int = 4,
+        mp_context: Optional[Any] = None,
+    ):
+        """
+        Start the worker processes.
+
+        Args:
+            private_key: Hex string or 32 bytes; sent once to each worker.
+            workers: Number of processes (defaults to the number of CPUs).
+            min_batch: Batches smaller than this are signed in the calling thread.
+            mp_context: ``multiprocessing`` context (defaults to "spawn", which is safe
+                        with the threads of a running client).
+        """
+        super().__init__()
+        key = _key_bytes(private_key)
+        self.workers = workers or os.cpu_count() or 1
+        self.min_batch = min_batch
+        self._local = LocalSignerBackend(key)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp_context or multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(key,),
+        )
+        self._sign_chunk = _sign_in_worker
+
+    def sign_digests(self, digests: Sequence[bytes]) -> list[bytes]:
+        if len(digests) < self.min_batch:
+            return self._local.sign_digests(digests)
+        signatures: list[bytes] = []
+        for chunk in self._executor.map(_sign_in_worker, _chunks(digests, self.workers)):
+            signatures.extend(chunk)
+        return signatures
+
+    def warm_up(self) -> None:
+        """Start every worker process now rather than on the first batch."""
+        list(self._executor.map(_sign_in_worker, [[bytes(32)]] * self.workers))
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+
+class NativeSignerBackend(_PooledSignerBackend):
+    """Signs with libsecp256k1 (coincurve), which releases the GIL, on a thread pool."""
+
+    def __init__(self, private_key: PrivateKeyLike, workers: Optional[int] = None, min_batch: int = 4):
+        """
+        Initialize the backend.
+
+        Args:
+            private_key: Hex string or 32 bytes.
+            workers: Number of threads (defaults to the number of CPUs).
+            min_batch: Batches smaller than this are signed in the calling thread.
+
+        Raises:
+            ImportError: If coincurve is not installed.
+        """
+        if coincurve is None:
+            raise ImportError("NativeSignerBackend requires coincurve: pip install reya-python-sdk[speedups]")
+        super().__init__()
+        self._key = coincurve.PrivateKey(_key_bytes(private_key))
+        self.workers = workers or os.cpu_count() or 1
+        self.min_batch = min_batch
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="reya-signer")
+        self._sign_chunk = self._sign_native
+
+    def _sign_native(self, digests: list[bytes]) -> list[bytes]:
+        signatures = []
+        for digest in digests:
+            signature = self._key.sign_recoverable(digest, hasher=None)
+            signatures.append(signature[:64] + bytes([signature[64] + V_OFFSET]))
+        return signatures
+
+    def sign_digests(self, digests: Sequence[bytes]) -> list[bytes]:
+        if len(digests) < self.min_batch:
+            return self._sign_native(list(digests))
+        signatures: list[bytes] = []
+        for chunk in self._executor.map(self._sign_native, _chunks(digests, self.workers)):
+            signatures.extend(chunk)
+        return signatures
+
+    def close(self) -> None:
+        self._executor.shutdown()
@@ -4,20 +4,23 @@ Reya Trading Client - Main entry point for the Reya Trading API.
 This module provides a client for interacting with the Reya Trading REST API.
 """
 
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional, Sequence, TypeVar
 
+import asyncio
 import logging
 import threading
 import time
+from dataclasses import dataclass, replace
 from decimal import Decimal
+from functools import partial
 
 from sdk._version import SDK_VERSION
 from sdk.open_api.api.market_data_api import MarketDataApi
-from sdk.open_api.api.order_entry_api import OrderEntryApi
 from sdk.open_api.api.reference_data_api import ReferenceDataApi
 from sdk.open_api.api.wallet_data_api import WalletDataApi
 from sdk.open_api.api_client import ApiClient
 from sdk.open_api.configuration import Configuration
+from sdk.open_api.exceptions import ApiException
 from sdk.open_api.models.account import Account
 from sdk.open_api.models.account_balance import AccountBalance
 from sdk.open_api.models.cancel_order_request import CancelOrderRequest
@@ -28,34 +31,87 @@ from sdk.open_api.models.market_definition import MarketDefinition
 from sdk.open_api.models.mass_cancel_request import MassCancelRequest
 from sdk.open_api.models.mass_cancel_response import MassCancelResponse
 from sdk.open_api.models.order import Order
+from sdk.open_api.models.order_status import OrderStatus
 from sdk.open_api.models.order_type import OrderType
 from sdk.open_api.models.perp_execution_list import PerpExecutionList
 from sdk.open_api.models.position import Position
+from sdk.open_api.models.side import Side
 from sdk.open_api.models.spot_execution_list import SpotExecutionList
 from sdk.open_api.models.time_in_force import TimeInForce
 from sdk.open_api.models.wallet_configuration import WalletConfiguration
+from sdk.reya_data.interning import SHARED_TABLE
+from sdk.reya_rest_api.api_client import HedgeMetrics, HedgingPolicy, ReyaApiClient
 from sdk.reya_rest_api.auth.signatures import SignatureGenerator
+from sdk.reya_rest_api.auth.signer_backends import SignerBackend
 from sdk.reya_rest_api.config import TradingConfig, get_config
-from sdk.reya_rest_api.constants.enums import OrdersGatewayOrderType
-
-from .models.orders import LimitOrderParameters, TriggerOrderParameters
+from sdk.reya_rest_api.constants.enums import OrdersGatewayOrderType, ReplaceOrderStatus, RequestPriority
+from sdk.reya_rest_api.exceptions import OrderOutcomeUnknownError, OrderStateError, RiskCheckError
+from sdk.reya_rest_api.order_entry import ReyaOrderEntryApi
+from sdk.reya_rest_api.order_tracker import OrderTracker, TrackedOrder
+from sdk.reya_rest_api.rate_limiter import (
+    CANCEL_ALL_ENDPOINT,
+    CANCEL_ORDER_ENDPOINT,
+    CREATE_ORDER_ENDPOINT,
+    QUERY_ENDPOINT,
+    RateLimiter,
+)
+from sdk.reya_rest_api.retry import RetryMetrics, RetryPolicy, is_nonce_rejection
+from sdk.reya_rest_api.risk_engine import RiskCheck, RiskEngine
+
+from .models.orders import LimitOrderParameters, MassCancelAllResult, ReplaceOrderResult, TriggerOrderParameters
 
 CONDITIONAL_ORDER_DEADLINE = 10**18
 DEFAULT_DEADLINE_S = 10  # Default deadline for IOC orders and cancel operations
 GTC_DEADLINE_S = 86400  # 24 hours for GTC spot orders
 BUY_TRIGGER_ORDER_PRICE_LIMIT = 100000000000000000000
 
+RequestT = TypeVar("RequestT")
+ResponseT = TypeVar("ResponseT")
+
 
 class ResourceManager:
     """Manages all API resources."""
 
     def __init__(self, api_client: ApiClient):
-        self.orders = OrderEntryApi(api_client)
+        self.orders = ReyaOrderEntryApi(api_client)
         self.wallet = WalletDataApi(api_client)
         self.markets = MarketDataApi(api_client)
         self.reference = ReferenceDataApi(api_client)
 
 
+@dataclass
+class _OrderWaiter:
+    """A pending wait on an order status, resolved from order tracker updates."""
+
+    loop: asyncio.AbstractEventLoop
+    future: "asyncio.Future[TrackedOrder]"
+    status: OrderStatus
+
+    def notify(self, order: TrackedOrder) -> None:
+        """Resolve the wait if the order reached the awaited status or another terminal state.
+
+        Safe to call from any thread; the future is settled on its own event loop.
+        """
+        if order.status == self.status:
+            error = None
+        elif not order.is_open:
+            error = OrderStateError(
+                f"Order {order.order_id} reached {order.status.value} state, expected {self.status.value}", order
+            )
+        else:
+            return
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._settle, order, error)
+
+    def _settle(self, order: TrackedOrder, error: Optional[OrderStateError]) -> None:
+        if self.future.done():
+            return
+        if error is None:
+            self.future.set_result(order)
+        else:
+            self.future.set_exception(error)
+
+
 class ReyaTradingClient:
     """
     Client for interacting with the Reya Trading API.
@@ -68,7 +124,16 @@ class ReyaTradingClient:
     _wallet_nonces: dict[str, int] = {}
     _wallet_nonce_lock = threading.Lock()
 
-    def __init__(self, config: Optional[TradingConfig] = None):
+    def __init__(
+        self,
+        config: Optional[TradingConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        risk_engine: Optional[RiskEngine] = None,
+        signer_backend: Optional[SignerBackend] = None,
+        trusted_responses: bool = False,
+    ):
         """
         Initialize the Reya Trading client.
 
@@ -76,6 +141,20 @@ class ReyaTradingClient:
             config: Optional trading configuration object. If provided, it will be used
                     directly. If not provided, config will be loaded from environment
                     variables using get_config().
+            rate_limiter: Optional client-side scheduler for order entry and wallet queries.
+                    Without one, requests are sent as soon as they are made.
+            retry_policy: Optional policy for retrying create_limit_order after transport
+                    errors. Without one, such errors are raised immediately.
+            hedging_policy: Optional policy for hedging slow GET requests (market data,
+                    prices, wallet queries) with a duplicate request.
+            risk_engine: Optional pre-trade risk checks for create_limit_order and
+                    create_trigger_order. Without one, orders are only checked by the exchange.
+            signer_backend: Optional backend signing with the config's private key, e.g. a
+                    ProcessPoolSignerBackend for bursts; signs in the calling thread by default.
+                    The caller closes it.
+            trusted_responses: Build REST responses from the configured API host into models
+                    without validating them, which is several times faster for large responses.
+                    Responses are validated by default.
         """
         # Initialize symbol to market_id mapping
         self._symbol_to_market_id: dict[str, int] = {}
@@ -88,13 +167,13 @@ class ReyaTradingClient:
         self._config = config if config is not None else get_config()
 
         # Create signature generator
-        self._signature_generator = SignatureGenerator(self._config)
+        self._signature_generator = SignatureGenerator(self._config, signer_backend)
 
         # Initialize resource manager
         api_config = Configuration(host=self._config.api_url)
         self.logger.info(f"API URL: {api_config.host}")
         self.logger.info(f"API base path: {api_config._base_path}")
-        api_client = ApiClient(api_config)
+        api_client = ReyaApiClient(api_config, hedging=hedging_policy, trusted_responses=trusted_responses)
 
         # Set custom SDK headers for all requests
         api_client.set_default_header("X-SDK-Version", f"reya-python-sdk/{SDK_VERSION}")
@@ -109,6 +188,18 @@ class ReyaTradingClient:
         self._resources = ResourceManager(api_client)
         self._api_client = api_client
 
+        # Order state mirror and pending waits resolved from its updates
+        self._order_tracker = OrderTracker()
+        self._order_tracker.add_listener(self._on_order_update)
+        self._order_waiters: dict[str, list[_OrderWaiter]] = {}
+        self._fill_waiters: dict[int, list[_OrderWaiter]] = {}
+        self._waiters_lock = threading.Lock()
+
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._retry_metrics = RetryMetrics()
+        self._risk_engine = risk_engine
+
     async def start(self) -> None:
         await self._load_market_definitions()
 
@@ -119,14 +210,18 @@ class ReyaTradingClient:
 
         # Try to load perp market definitions (may fail if risk matrix data is missing)
         market_definitions: list[MarketDefinition] = await self.reference.get_market_definitions()
-        self._symbol_to_market_id = {market.symbol: market.market_id for market in market_definitions}
+        SHARED_TABLE.seed_market_definitions(market_definitions)
+        self._symbol_to_market_id = {
+            SHARED_TABLE.intern(market.symbol): market.market_id for market in market_definitions
+        }
         perp_count = len(market_definitions)
         self.logger.info(f"Loaded {perp_count} perp market definitions")
 
         # Load spot market definitions from /spotMarketDefinitions endpoint
         spot_market_definitions = await self.reference.get_spot_market_definitions()
+        SHARED_TABLE.seed_market_definitions(spot_market_definitions)
         for market in spot_market_definitions:
-            self._symbol_to_market_id[market.symbol] = market.market_id
+            self._symbol_to_market_id[SHARED_TABLE.intern(market.symbol)] = market.market_id
         spot_count = len(spot_market_definitions)
         self.logger.info(f"Loaded {spot_count} spot market definitions from /spotMarketDefinitions")
 
@@ -183,7 +278,7 @@ class ReyaTradingClient:
         return market_id
 
     @property
-    def orders(self) -> OrderEntryApi:
+    def orders(self) -> ReyaOrderEntryApi:
         """Get the orders resource."""
         return self._resources.orders
 
@@ -202,6 +297,57 @@ class ReyaTradingClient:
         """Get the reference data resource."""
         return self._resources.reference
 
+    @property
+    def order_tracker(self) -> OrderTracker:
+        """
+        Get the order tracker fed by this client's order submissions.
+
+        Route the wallet ``orderChanges`` WebSocket channel into it (e.g. by passing
+        ``client.order_tracker.on_message`` to ``ReyaSocket``) so that ``wait_for_order``
+        and ``wait_for_fill`` resolve as soon as updates arrive.
+        """
+        return self._order_tracker
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Get the client-side rate limiter, if one was configured."""
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, rate_limiter: Optional[RateLimiter]) -> None:
+        """Install or remove (with None) the client-side rate limiter; in-flight requests are unaffected."""
+        self._rate_limiter = rate_limiter
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Get the order submission retry policy, if one was configured."""
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, retry_policy: Optional[RetryPolicy]) -> None:
+        """Install or remove (with None) the order submission retry policy."""
+        self._retry_policy = retry_policy
+
+    @property
+    def risk_engine(self) -> Optional[RiskEngine]:
+        """Get the pre-trade risk engine, if one was configured."""
+        return self._risk_engine
+
+    @risk_engine.setter
+    def risk_engine(self, risk_engine: Optional[RiskEngine]) -> None:
+        """Install or remove (with None) the pre-trade risk engine."""
+        self._risk_engine = risk_engine
+
+    @property
+    def hedge_metrics(self) -> HedgeMetrics:
+        """Get a snapshot of the GET request hedging counters."""
+        return self._api_client.hedge_metrics
+
+    @property
+    def retry_metrics(self) -> RetryMetrics:
+        """Get a snapshot of the order submission retry counters."""
+        return replace(self._retry_metrics)
+
     @property
     def config(self) -> TradingConfig:
         """Get the current configuration."""
@@ -212,6 +358,20 @@ class ReyaTradingClient:
         """Get the signature generator for creating order signatures."""
         return self._signature_generator
 
+    @property
+    def spot_symbols(self) -> list[str]:
+        """Get the symbols of all loaded spot markets."""
+        if not self._initialized:
+            raise ValueError("Client not initialized. Call start() first.")
+        return [symbol for symbol in self._symbol_to_market_id if self._is_spot_market(symbol)]
+
+    @property
+    def last_nonce(self) -> int:
+        """Get the most recent spot nonce issued for the owner wallet (0 if none)."""
+        wallet_address = self._config.owner_wallet_address.lower()
+        with ReyaTradingClient._wallet_nonce_lock:
+            return ReyaTradingClient._wallet_nonces.get(wallet_address, 0)
+
     def get_next_nonce(self) -> int:
         """Get the next nonce for order signing.
 
@@ -220,6 +380,20 @@ class ReyaTradingClient:
         """
         return self._get_next_nonce()
 
+    def consume_nonce(self, nonce: int) -> None:
+        """Record a nonce used outside ``get_next_nonce`` (e.g. by a pre-signed request).
+
+        Nonces issued afterwards are greater than it, so they are not rejected once it
+        has been used.
+
+        Args:
+            nonce: The nonce.
+        """
+        wallet_address = self._config.owner_wallet_address.lower()
+        with ReyaTradingClient._wallet_nonce_lock:
+            if nonce > ReyaTradingClient._wallet_nonces.get(wallet_address, 0):
+                ReyaTradingClient._wallet_nonces[wallet_address] = nonce
+
     @property
     def signer_wallet_address(self) -> str:
         """Get the signer wallet address (derived from private key)."""
@@ -239,35 +413,143 @@ class ReyaTradingClient:
         """
         Create a limit (IOC/GTC) order asynchronously.
 
+        With a retry policy, a request that fails in transport is resent with the same
+        signed payload; if the resend is rejected for its nonce, the earlier attempt
+        landed and its order is returned instead.
+
         Args:
             params: Limit order parameters
 
+        Returns:
+            API response for the order creation (rebuilt from the exchange state if the
+            original response was lost)
+
+        Raises:
+            RiskCheckError: With a risk engine, if it refuses the order (nothing is sent)
+            OrderOutcomeUnknownError: With a retry policy, if the order may or may not
+                have been accepted
+        """
+        if self._risk_engine is not None:
+            self._raise_if_refused(self._risk_engine.check_limit_order(params, self.config.account_id))
+        build = partial(self._sign_limit_order, params)
+        if self._retry_policy is not None:
+            return await self._send_create_order_with_retry(self.config.account_id, build)
+        return await self._send_signed(
+            CREATE_ORDER_ENDPOINT, RequestPriority.CREATE, self.config.account_id, self._send_create_order, build
+        )
+
+    async def send_order_request(
+        self, order_request: CreateOrderRequest, params: Optional[LimitOrderParameters] = None
+    ) -> CreateOrderResponse:
+        """
+        Send a limit order signed ahead of time with ``build_limit_order_request``.
+
+        Args:
+            order_request: Signed order request
+            params: Parameters the request was built from; with them the risk engine
+                    checks the order, and a request rejected for its nonce is re-signed
+                    and resent once
+
         Returns:
             API response for the order creation
+
+        Raises:
+            RiskCheckError: With a risk engine and params, if it refuses the order (nothing is sent)
         """
+        if params is not None and self._risk_engine is not None:
+            self._raise_if_refused(self._risk_engine.check_limit_order(params, order_request.account_id))
+        build = partial(self._sign_limit_order, params) if params is not None else None
+        if self._retry_policy is not None:
+            return await self._send_create_order_with_retry(order_request.account_id, build, order_request)
+        return await self._send_signed(
+            CREATE_ORDER_ENDPOINT,
+            RequestPriority.CREATE,
+            order_request.account_id,
+            self._send_create_order,
+            build,
+            order_request,
+        )
 
-        # Resolve symbol to market_id
-        market_id = self._get_market_id_from_symbol(params.symbol)
+    def build_limit_order_request(
+        self,
+        params: LimitOrderParameters,
+        nonce: Optional[int] = None,
+        deadline: Optional[int] = None,
+    ) -> CreateOrderRequest:
+        """
+        Validate, sign and build a limit order request without sending it.
 
-        if self._signature_generator is None:
-            raise ValueError("Private key is required for creating orders")
+        A spot request signed ahead of time with an explicit nonce is accepted only
+        while no greater nonce has been used for the account; see ``consume_nonce``.
 
-        if params.expires_after is not None and params.time_in_force != TimeInForce.IOC:
-            raise ValueError("Parameter expires_after is only allowed for IOC orders")
+        Args:
+            params: Limit order parameters
+            nonce: Nonce for spot markets (defaults to the next nonce of the wallet)
+            deadline: Expiry as a unix timestamp in seconds for spot markets (defaults to
+                      now + GTC_DEADLINE_S for GTC orders, and expires_after or
+                      now + DEFAULT_DEADLINE_S for IOC orders)
 
-        if params.time_in_force == TimeInForce.GTC and params.reduce_only is True:
-            raise ValueError("Unexpected True value for parameter reduce_only for GTC orders")
+        Returns:
+            Signed order request
 
-        # Prepare signature data
-        if self._signature_generator is None:
-            raise ValueError("Signature generator is required for order signing")
-        if self.config.account_id is None:
-            raise ValueError("Account ID is required for order signing")
+        Raises:
+            ValueError: If the parameters are invalid or signing data is missing
+        """
+        digest, fields = self._prepare_limit_order(params, nonce, deadline)
+        return CreateOrderRequest(signature=self._signature_generator.sign_digest(digest), **fields)
+
+    async def _sign_limit_order(self, params: LimitOrderParameters) -> CreateOrderRequest:
+        """Build a limit order request like ``build_limit_order_request``, signing it without blocking the loop."""
+        digest, fields = self._prepare_limit_order(params, None, None)
+        return CreateOrderRequest(signature=await self._signature_generator.sign_digest_async(digest), **fields)
+
+    def build_limit_order_requests(
+        self,
+        params: Sequence[LimitOrderParameters],
+        nonces: Optional[Sequence[int]] = None,
+        deadline: Optional[int] = None,
+    ) -> list[CreateOrderRequest]:
+        """
+        Validate, sign and build limit order requests in one signing batch.
+
+        With a ProcessPoolSignerBackend or NativeSignerBackend the batch is signed on
+        several cores; see ``build_limit_order_request`` for the arguments.
+
+        Args:
+            params: Limit order parameters of each order
+            nonces: Nonce of each order, for spot markets (defaults to the next nonces of the wallet)
+            deadline: Expiry as a unix timestamp in seconds of all orders, for spot markets
+
+        Returns:
+            Signed order requests, in the order of params
+
+        Raises:
+            ValueError: If any parameters are invalid or signing data is missing
+        """
+        if nonces is not None and len(nonces) != len(params):
+            raise ValueError(f"Got {len(nonces)} nonces for {len(params)} orders")
+        prepared = [
+            self._prepare_limit_order(order, nonces[index] if nonces is not None else None, deadline)
+            for index, order in enumerate(params)
+        ]
+        signatures = self._signature_generator.sign_digests([digest for digest, _ in prepared])
+        return [
+            CreateOrderRequest(signature=signature, **fields) for signature, (_, fields) in zip(signatures, prepared)
+        ]
+
+    def _prepare_limit_order(
+        self, params: LimitOrderParameters, nonce: Optional[int], deadline: Optional[int]
+    ) -> tuple[bytes, dict[str, Any]]:
+        """Validate limit order parameters and return the digest to sign and the other request fields."""
+        market_id = self._check_limit_order(params, nonce, deadline)
+        assert self._signature_generator is not None
+        assert self.config.account_id is not None
 
         # For spot markets, use monotonically increasing nonce (fits in uint64)
         # For perp markets, use 32-byte nonce
         if self._is_spot_market(params.symbol):
-            nonce = self._get_next_nonce()
+            if nonce is None:
+                nonce = self._get_next_nonce()
         else:
             nonce = self._signature_generator.create_orders_gateway_nonce(
                 self.config.account_id, market_id, int(time.time_ns() / 1000000)
@@ -275,22 +557,23 @@ class ReyaTradingClient:
 
         inputs = self._signature_generator.encode_inputs_limit_order(
             is_buy=params.is_buy,
-            limit_px=Decimal(params.limit_px),
-            qty=Decimal(params.qty),
+            limit_px=params.limit_px,
+            qty=params.qty,
         )
 
-        # Determine deadline based on order type and market type
-        if params.time_in_force != TimeInForce.IOC:
-            # For GTC orders: use real timestamp for spot markets, 10^18 for perp markets
-            if self._is_spot_market(params.symbol):
-                deadline = int(time.time()) + GTC_DEADLINE_S  # 24 hours for GTC spot orders
+        # Determine deadline based on order type and market type, unless given
+        if deadline is None:
+            if params.time_in_force != TimeInForce.IOC:
+                # For GTC orders: use real timestamp for spot markets, 10^18 for perp markets
+                if self._is_spot_market(params.symbol):
+                    deadline = int(time.time()) + GTC_DEADLINE_S  # 24 hours for GTC spot orders
+                else:
+                    deadline = CONDITIONAL_ORDER_DEADLINE
+            elif params.expires_after is None:
+                # For IOC orders, use default deadline
+                deadline = int(time.time()) + DEFAULT_DEADLINE_S
             else:
-                deadline = CONDITIONAL_ORDER_DEADLINE
-        elif params.expires_after is None:
-            # For IOC orders, use default deadline
-            deadline = int(time.time()) + DEFAULT_DEADLINE_S
-        else:
-            deadline = params.expires_after
+                deadline = params.expires_after
 
         # For spot markets, ALWAYS use LIMIT_ORDER_SPOT (6) regardless of timeInForce
         # The blockchain only supports matching LimitOrderSpot against LimitOrderSpot for spot trades
@@ -313,7 +596,7 @@ class ReyaTradingClient:
         # Spot trades are matched against an orderbook, rather than directly against the pool.
         counterparty_ids = [] if self._is_spot_market(params.symbol) else [self.config.pool_account_id]
 
-        signature = self._signature_generator.sign_raw_order(
+        digest = self._signature_generator.raw_order_digest(
             account_id=self.config.account_id,
             market_id=market_id,
             exchange_id=self.config.dex_id,
@@ -335,26 +618,51 @@ class ReyaTradingClient:
         # reduceOnly is only supported for perp IOC orders
         is_perp_ioc = params.time_in_force == TimeInForce.IOC and not self._is_spot_market(params.symbol)
 
-        order_request = CreateOrderRequest(
-            accountId=self.config.account_id,
-            symbol=params.symbol,
-            exchangeId=self.config.dex_id,
-            isBuy=params.is_buy,
-            limitPx=params.limit_px,
-            qty=params.qty,
-            orderType=OrderType.LIMIT,
-            timeInForce=params.time_in_force,
-            expiresAfter=deadline if is_ioc_or_spot else None,
-            reduceOnly=params.reduce_only if is_perp_ioc else None,
-            signature=signature,
-            nonce=str(nonce),
-            signerWallet=self.signer_wallet_address,
-            clientOrderId=params.client_order_id,
-        )
+        fields = {
+            "accountId": self.config.account_id,
+            "symbol": params.symbol,
+            "exchangeId": self.config.dex_id,
+            "isBuy": params.is_buy,
+            "limitPx": str(params.limit_px),
+            "qty": str(params.qty),
+            "orderType": OrderType.LIMIT,
+            "timeInForce": params.time_in_force,
+            "expiresAfter": deadline if is_ioc_or_spot else None,
+            "reduceOnly": params.reduce_only if is_perp_ioc else None,
+            "nonce": str(nonce),
+            "signerWallet": self.signer_wallet_address,
+            "clientOrderId": params.client_order_id,
+        }
+
+        return digest, fields
+
+    def _check_limit_order(self, params: LimitOrderParameters, nonce: Optional[int], deadline: Optional[int]) -> int:
+        """Validate limit order parameters and return the market ID."""
+        # Resolve symbol to market_id
+        market_id = self._get_market_id_from_symbol(params.symbol)
 
-        response = await self.orders.create_order(create_order_request=order_request)
+        if self._signature_generator is None:
+            raise ValueError("Private key is required for creating orders")
 
-        return response
+        if params.expires_after is not None and params.time_in_force != TimeInForce.IOC:
+            raise ValueError("Parameter expires_after is only allowed for IOC orders")
+
+        if params.time_in_force == TimeInForce.GTC and params.reduce_only is True:
+            raise ValueError("Unexpected True value for parameter reduce_only for GTC orders")
+
+        if (nonce is not None or deadline is not None) and not self._is_spot_market(params.symbol):
+            raise ValueError("nonce and deadline can only be set for spot market orders")
+
+        if deadline is not None and params.expires_after is not None:
+            raise ValueError("Parameters expires_after and deadline are mutually exclusive")
+
+        # Prepare signature data
+        if self._signature_generator is None:
+            raise ValueError("Signature generator is required for order signing")
+        if self.config.account_id is None:
+            raise ValueError("Account ID is required for order signing")
+
+        return market_id
 
     async def create_trigger_order(self, params: TriggerOrderParameters) -> CreateOrderResponse:
         """
@@ -365,6 +673,9 @@ class ReyaTradingClient:
 
         Returns:
             API response for the order creation
+
+        Raises:
+            RiskCheckError: With a risk engine, if it refuses the order (nothing is sent)
         """
 
         # Resolve symbol to market_id
@@ -372,6 +683,9 @@ class ReyaTradingClient:
         if self._is_spot_market(params.symbol):
             raise ValueError("Trigger orders are not supported for spot markets")
 
+        if self._risk_engine is not None:
+            self._raise_if_refused(self._risk_engine.check_trigger_order(params, self.config.account_id))
+
         market_id = self._get_market_id_from_symbol(params.symbol)
 
         if self._signature_generator is None:
@@ -395,11 +709,11 @@ class ReyaTradingClient:
 
         inputs = self._signature_generator.encode_inputs_trigger_order(
             is_buy=params.is_buy,
-            trigger_px=Decimal(str(params.trigger_px)),
+            trigger_px=params.trigger_px,
             limit_px=limit_px,
         )
 
-        signature = self._signature_generator.sign_raw_order(
+        digest = self._signature_generator.raw_order_digest(
             account_id=self.config.account_id,
             market_id=market_id,
             exchange_id=self.config.dex_id,
@@ -409,6 +723,7 @@ class ReyaTradingClient:
             deadline=CONDITIONAL_ORDER_DEADLINE,
             nonce=nonce,
         )
+        signature = await self._signature_generator.sign_digest_async(digest)
 
         if self.config.account_id is None:
             raise ValueError("Account ID is required for order creation")
@@ -427,8 +742,144 @@ class ReyaTradingClient:
             signerWallet=self.signer_wallet_address,
         )
 
+        return await self._rate_limited(
+            CREATE_ORDER_ENDPOINT,
+            RequestPriority.CREATE,
+            order_request.account_id,
+            lambda: self._send_create_order(order_request),
+        )
+
+    async def _send_create_order(self, order_request: CreateOrderRequest) -> CreateOrderResponse:
+        """Send a signed order and register the response with the order tracker."""
         response = await self.orders.create_order(create_order_request=order_request)
+        self._order_tracker.register_response(response, order_request)
+        if self._risk_engine is not None:
+            self._risk_engine.register_response(response, order_request)
+        return response
+
+    def _raise_if_refused(self, check: RiskCheck) -> None:
+        """Raise RiskCheckError for an order refused by the risk engine."""
+        if not check.passed:
+            self.logger.info(f"Order refused by the risk engine: {check.message}")
+            raise RiskCheckError(check.message, check)
 
+    async def _send_create_order_with_retry(
+        self,
+        account_id: Optional[int],
+        build: Optional[Callable[[], Awaitable[CreateOrderRequest]]],
+        order_request: Optional[CreateOrderRequest] = None,
+    ) -> CreateOrderResponse:
+        """Sign and send an order, resending the same payload after retryable failures.
+
+        The first attempt goes through ``_send_signed``; every resend waits for its own
+        rate limiter slot. The exchange accepts a nonce at most once, so resending is
+        safe: a resend rejected for its nonce means an earlier attempt landed, and the
+        order is then looked up instead of being re-signed into a possible duplicate.
+        If it cannot be found, OrderOutcomeUnknownError is raised.
+        """
+        policy = self._retry_policy
+        assert policy is not None
+        metrics = self._retry_metrics
+        metrics.submissions += 1
+        submitted_at = int(time.time() * 1000)
+        sent: list[CreateOrderRequest] = []
+
+        def send(request: CreateOrderRequest) -> Awaitable[CreateOrderResponse]:
+            sent.append(request)
+            return self._send_create_order(request)
+
+        last_error: Optional[Exception] = None
+        for attempt in range(policy.max_attempts):
+            if attempt:
+                await asyncio.sleep(policy.delay(attempt - 1))
+                metrics.retries += 1
+            try:
+                if attempt:
+                    response = await self._rate_limited(
+                        CREATE_ORDER_ENDPOINT, RequestPriority.CREATE, account_id, partial(send, sent[-1])
+                    )
+                else:
+                    response = await self._send_signed(
+                        CREATE_ORDER_ENDPOINT, RequestPriority.CREATE, account_id, send, build, order_request
+                    )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                if not sent:
+                    raise
+                order_request = sent[-1]
+                if last_error is not None and is_nonce_rejection(e):
+                    # The nonce was consumed, most likely by the earlier attempt
+                    confirmed = await self._confirm_order_landed(order_request, submitted_at)
+                    if confirmed is not None:
+                        return confirmed
+                    metrics.unknown_outcomes += 1
+                    raise OrderOutcomeUnknownError(
+                        f"Order {order_request.client_order_id} nonce was already used after a failed attempt "
+                        f"({last_error!r}), but the order was not found",
+                        order_request,
+                    ) from e
+                if not policy.is_retryable(e):
+                    raise
+                metrics.transport_errors += 1
+                last_error = e
+                self.logger.warning(f"Create order attempt {attempt + 1}/{policy.max_attempts} failed: {e!r}")
+                continue
+            if attempt:
+                metrics.recovered += 1
+            return response
+
+        assert order_request is not None
+        metrics.unknown_outcomes += 1
+        raise OrderOutcomeUnknownError(
+            f"Order {order_request.client_order_id} failed after {policy.max_attempts} attempts: {last_error!r}",
+            order_request,
+        ) from last_error
+
+    async def _confirm_order_landed(
+        self, order_request: CreateOrderRequest, submitted_at: int
+    ) -> Optional[CreateOrderResponse]:
+        """Find the order of a request whose nonce was consumed, refreshing the tracker from REST if needed.
+
+        The order is identified by its client order ID where the exchange reports it.
+        Otherwise it is the newest order without a client order ID created since the
+        first send with the same symbol, account, side, price and quantity.
+        """
+        symbol = order_request.symbol
+        assert symbol is not None
+
+        def find() -> Optional[TrackedOrder]:
+            if order_request.client_order_id is not None:
+                tracked = self._order_tracker.get_by_client_order_id(order_request.client_order_id)
+                if tracked is not None:
+                    return tracked
+            return self._order_tracker.find_unlinked(
+                symbol=symbol,
+                account_id=order_request.account_id,
+                side=Side.B if order_request.is_buy else Side.A,
+                limit_px=order_request.limit_px,
+                qty=order_request.qty,
+                created_after=submitted_at,
+            )
+
+        tracked = find()
+        if tracked is None:
+            try:
+                await self._order_tracker.reconcile(self)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.logger.warning(f"Could not fetch open orders to confirm order submission: {e!r}")
+                return None
+            tracked = find()
+        if tracked is None:
+            return None
+
+        self._retry_metrics.confirmed_landed += 1
+        self.logger.info(f"Order {tracked.order_id} from a failed create attempt was accepted by the exchange")
+        response = CreateOrderResponse(
+            status=tracked.status,
+            cumQty=str(tracked.cum_qty),
+            orderId=tracked.order_id,
+            clientOrderId=order_request.client_order_id,
+        )
+        self._order_tracker.register_response(response)
         return response
 
     async def cancel_order(
@@ -457,26 +908,49 @@ class ReyaTradingClient:
             ValueError: If symbol and account_id are not provided for spot orders
             ValueError: If neither order_id nor client_order_id is provided for spot orders
         """
-        if self._signature_generator is None:
-            raise ValueError("Private key is required for cancelling orders")
+        return await self._send_signed(
+            CANCEL_ORDER_ENDPOINT,
+            RequestPriority.CANCEL,
+            account_id,
+            self.orders.cancel_order,
+            partial(self._sign_cancel_order, order_id, symbol, account_id, client_order_id),
+        )
 
-        # Determine if this is a spot market order
-        is_spot_order = symbol and "RUSD" in symbol and "PERP" not in symbol
+    async def _sign_cancel_order(
+        self,
+        order_id: Optional[str],
+        symbol: Optional[str],
+        account_id: Optional[int],
+        client_order_id: Optional[int],
+    ) -> CancelOrderRequest:
+        """
+        Validate, sign and build a cancel order request without blocking the event loop.
 
-        # For spot markets, symbol and account_id are required
-        if is_spot_order:
-            if symbol is None:
-                raise ValueError("symbol is required for spot market order cancellation")
-            if account_id is None:
-                raise ValueError(f"account_id is required for spot market order cancellation (symbol: {symbol})")
-            # For spot markets: must provide at least one of order_id or client_order_id
-            # If both are provided, the API will prefer order_id
-            if not order_id and not client_order_id:
-                raise ValueError("For spot orders, must provide either order_id or client_order_id")
-        else:
-            # For perp markets, order_id is required
-            if not order_id:
-                raise ValueError("order_id is required for perp market order cancellation")
+        Args:
+            order_id: ID of the order to cancel
+            symbol: Trading symbol (required for spot market orders)
+            account_id: Account ID (required for spot market orders)
+            client_order_id: Client order ID (spot only, alternative to order_id)
+
+        Returns:
+            Signed cancel request
+
+        Raises:
+            ValueError: If the identifying parameters are missing for the market type
+        """
+        digest, fields = self._prepare_cancel_order(order_id, symbol, account_id, client_order_id)
+        return CancelOrderRequest(signature=await self._signature_generator.sign_digest_async(digest), **fields)
+
+    def _prepare_cancel_order(
+        self,
+        order_id: Optional[str],
+        symbol: Optional[str],
+        account_id: Optional[int],
+        client_order_id: Optional[int],
+    ) -> tuple[bytes, dict[str, Any]]:
+        """Validate cancel order parameters and return the digest to sign and the other request fields."""
+        is_spot_order = self._check_cancel_order(order_id, symbol, account_id, client_order_id)
+        assert self._signature_generator is not None
 
         if is_spot_order:
             # Type assertions after validation (symbol and account_id are validated above)
@@ -497,8 +971,8 @@ class ReyaTradingClient:
             order_id_int = int(order_id) if order_id else 0
             client_order_id_int = client_order_id if client_order_id is not None else 0
 
-            # Generate EIP-712 signature for SPOT orders
-            signature = self._signature_generator.sign_cancel_order_spot(
+            # EIP-712 digest for SPOT orders
+            digest = self._signature_generator.cancel_order_spot_digest(
                 account_id=account_id,
                 market_id=market_id,
                 order_id=order_id_int,
@@ -509,22 +983,191 @@ class ReyaTradingClient:
         else:
             # Type assertion after validation (order_id is validated above for perp)
             assert order_id is not None
-            signature = self._signature_generator.sign_cancel_order_perps(order_id)
+            digest = self._signature_generator.cancel_order_perps_digest(order_id)
             nonce = None
             deadline = None
 
-        cancel_order_request = CancelOrderRequest(
-            orderId=order_id,
-            clientOrderId=client_order_id,
-            signature=signature,
-            nonce=str(nonce) if nonce is not None else None,
-            symbol=symbol,
-            accountId=account_id,
-            expiresAfter=deadline,
+        fields = {
+            "orderId": order_id,
+            "clientOrderId": client_order_id,
+            "nonce": str(nonce) if nonce is not None else None,
+            "symbol": symbol,
+            "accountId": account_id,
+            "expiresAfter": deadline,
+        }
+
+        return digest, fields
+
+    def _check_cancel_order(
+        self,
+        order_id: Optional[str],
+        symbol: Optional[str],
+        account_id: Optional[int],
+        client_order_id: Optional[int],
+    ) -> bool:
+        """Validate the parameters of a cancel order request and return whether it is for a spot market."""
+        if self._signature_generator is None:
+            raise ValueError("Private key is required for cancelling orders")
+
+        # Determine if this is a spot market order
+        is_spot_order = symbol and "RUSD" in symbol and "PERP" not in symbol
+
+        # For spot markets, symbol and account_id are required
+        if is_spot_order:
+            if symbol is None:
+                raise ValueError("symbol is required for spot market order cancellation")
+            if account_id is None:
+                raise ValueError(f"account_id is required for spot market order cancellation (symbol: {symbol})")
+            # For spot markets: must provide at least one of order_id or client_order_id
+            # If both are provided, the API will prefer order_id
+            if not order_id and not client_order_id:
+                raise ValueError("For spot orders, must provide either order_id or client_order_id")
+        else:
+            # For perp markets, order_id is required
+            if not order_id:
+                raise ValueError("order_id is required for perp market order cancellation")
+
+        return bool(is_spot_order)
+
+    async def replace_order(
+        self,
+        order_id: str,
+        new_params: LimitOrderParameters,
+        account_id: Optional[int] = None,
+        create_first: bool = False,
+    ) -> ReplaceOrderResult:
+        """
+        Cancel an order and place its replacement in a single round trip.
+
+        Both requests are validated up front and sent concurrently, each signed once
+        the rate limiter grants it a slot, so for spot markets the request sent first
+        also gets the lower nonce; if the two arrive out of order and one is rejected
+        for its nonce, it is re-signed and resent once.
+
+        Args:
+            order_id: ID of the order being replaced (in the same market as new_params)
+            new_params: Parameters of the replacement order
+            account_id: Account ID of the order being replaced (defaults to config account_id)
+            create_first: Dispatch the new order ahead of the cancel. Only use this when
+                briefly having both orders live is an acceptable exposure.
+
+        Returns:
+            Combined result; failures of either leg are reported in it rather than raised
+
+        Raises:
+            ValueError: If either request is invalid (nothing is sent in that case)
+        """
+        if account_id is None:
+            account_id = self.config.account_id
+
+        self._check_cancel_order(order_id, new_params.symbol, account_id, None)
+        self._check_limit_order(new_params, None, None)
+
+        cancel = self._send_signed(
+            CANCEL_ORDER_ENDPOINT,
+            RequestPriority.CANCEL,
+            account_id,
+            self.orders.cancel_order,
+            partial(self._sign_cancel_order, order_id, new_params.symbol, account_id, None),
         )
+        create = self._send_signed(
+            CREATE_ORDER_ENDPOINT,
+            RequestPriority.CREATE,
+            self.config.account_id,
+            self._send_create_order,
+            partial(self._sign_limit_order, new_params),
+        )
+        if create_first:
+            create_outcome, cancel_outcome = await asyncio.gather(create, cancel, return_exceptions=True)
+        else:
+            cancel_outcome, create_outcome = await asyncio.gather(cancel, create, return_exceptions=True)
 
-        response = await self.orders.cancel_order(cancel_order_request)
-        return response
+        for outcome in (cancel_outcome, create_outcome):
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+
+        cancel_error = cancel_outcome if isinstance(cancel_outcome, Exception) else None
+        create_error = create_outcome if isinstance(create_outcome, Exception) else None
+
+        if cancel_error is None and create_error is None:
+            status = ReplaceOrderStatus.REPLACED
+        elif create_error is None:
+            status = ReplaceOrderStatus.CANCEL_FAILED
+        elif cancel_error is None:
+            status = ReplaceOrderStatus.CREATE_FAILED
+        else:
+            status = ReplaceOrderStatus.BOTH_FAILED
+
+        if status != ReplaceOrderStatus.REPLACED:
+            self.logger.warning(
+                f"Replace of order {order_id} {status.value}: cancel_error={cancel_error}, create_error={create_error}"
+            )
+
+        return ReplaceOrderResult(
+            status=status,
+            cancel_response=cancel_outcome if isinstance(cancel_outcome, CancelOrderResponse) else None,
+            create_response=create_outcome if isinstance(create_outcome, CreateOrderResponse) else None,
+            cancel_error=cancel_error,
+            create_error=create_error,
+        )
+
+    async def _send_signed(
+        self,
+        endpoint: str,
+        priority: RequestPriority,
+        account_id: Optional[int],
+        send: Callable[[RequestT], Awaitable[ResponseT]],
+        build: Optional[Callable[[], Awaitable[RequestT]]],
+        request: Optional[RequestT] = None,
+    ) -> ResponseT:
+        """Sign a request once the rate limiter grants it a slot, then send it.
+
+        Spot nonces are then issued in the order requests leave the queue, so a queued
+        request cannot be invalidated by one signed after it. A request still rejected
+        for its nonce (overtaken on the wire) is re-signed and resent once, in a new slot.
+
+        Args:
+            endpoint: Endpoint name used to select the rate limit budget
+            priority: Rate limiter lane
+            account_id: Account the request acts on
+            send: Sends a signed request
+            build: Validates and signs the request; None if it cannot be re-signed
+            request: Request signed ahead of time, sent on the first attempt instead of building one
+        """
+        presigned = request
+
+        async def sign_and_send() -> ResponseT:
+            nonlocal presigned
+            if presigned is not None:
+                signed, presigned = presigned, None
+            else:
+                assert build is not None
+                signed = await build()
+            return await send(signed)
+
+        try:
+            return await self._rate_limited(endpoint, priority, account_id, sign_and_send)
+        except ApiException as e:
+            if build is None or not is_nonce_rejection(e):
+                raise
+            self.logger.info(f"Request rejected for its nonce, re-signing and resending: {e.body}")
+            return await self._rate_limited(endpoint, priority, account_id, sign_and_send)
+
+    async def _rate_limited(
+        self,
+        endpoint: str,
+        priority: RequestPriority,
+        account_id: Optional[int],
+        send: Callable[[], Awaitable[ResponseT]],
+    ) -> ResponseT:
+        """Send a request once the rate limiter grants it a slot (immediately without a limiter).
+
+        Signed order entry requests go through ``_send_signed``, which signs them inside the slot.
+        """
+        if self._rate_limiter is None:
+            return await send()
+        async with self._rate_limiter.acquire(endpoint, priority, account_id):
+            return await send()
 
     async def mass_cancel(
         self,
@@ -546,20 +1189,108 @@ class ReyaTradingClient:
         Raises:
             ValueError: If symbol is not a spot market or account_id is missing
         """
-        if self._signature_generator is None:
-            raise ValueError("Private key is required for mass cancel")
+        return await self._send_signed(
+            CANCEL_ALL_ENDPOINT,
+            RequestPriority.MASS_CANCEL,
+            self._check_mass_cancel(symbol, account_id),
+            self.orders.cancel_all,
+            partial(self._sign_mass_cancel, symbol, account_id),
+        )
 
-        # Verify this is a spot market
-        if not self._is_spot_market(symbol):
-            raise ValueError(
-                f"Mass cancel is only supported for spot markets. " f"Symbol '{symbol}' appears to be a perp market."
-            )
+    async def mass_cancel_all(
+        self,
+        symbols: Optional[list[str]] = None,
+        account_id: Optional[int] = None,
+    ) -> MassCancelAllResult:
+        """
+        Cancel all orders across several spot markets concurrently.
 
-        # Use config account_id if not provided
-        if account_id is None:
-            account_id = self.config.account_id
-            if account_id is None:
-                raise ValueError("account_id is required for mass cancel")
+        Every request is validated before any is sent, then all are fired in parallel,
+        each signed once the rate limiter grants it a slot. Requests rejected for their
+        nonce (because a later-signed request reached the server first) are re-signed
+        and resent once.
+
+        Args:
+            symbols: Spot symbols to cancel (defaults to all loaded spot markets)
+            account_id: Account ID (optional, defaults to config account_id)
+
+        Returns:
+            Per-symbol responses and errors; failures are reported rather than raised
+
+        Raises:
+            ValueError: If a symbol is not a spot market or account_id is missing
+        """
+        if symbols is None:
+            symbols = self.spot_symbols
+
+        account_ids = {symbol: self._check_mass_cancel(symbol, account_id) for symbol in symbols}
+
+        outcomes = await asyncio.gather(
+            *(
+                self._send_signed(
+                    CANCEL_ALL_ENDPOINT,
+                    RequestPriority.MASS_CANCEL,
+                    symbol_account_id,
+                    self.orders.cancel_all,
+                    partial(self._sign_mass_cancel, symbol, account_id),
+                )
+                for symbol, symbol_account_id in account_ids.items()
+            ),
+            return_exceptions=True,
+        )
+
+        responses: dict[str, MassCancelResponse] = {}
+        errors: dict[str, Exception] = {}
+        for symbol, outcome in zip(account_ids, outcomes):
+            if isinstance(outcome, MassCancelResponse):
+                responses[symbol] = outcome
+            elif isinstance(outcome, Exception):
+                errors[symbol] = outcome
+            else:
+                raise outcome
+
+        if errors:
+            self.logger.warning(f"Mass cancel failed for {sorted(errors)}")
+
+        return MassCancelAllResult(responses=responses, errors=errors)
+
+    def build_mass_cancel_request(
+        self,
+        symbol: str,
+        account_id: Optional[int] = None,
+        deadline: Optional[int] = None,
+    ) -> MassCancelRequest:
+        """
+        Sign a mass cancel request for a spot market without sending it.
+
+        Pre-signed requests stay valid until their deadline only while no newer nonce
+        has been issued for the wallet (see ``last_nonce``).
+
+        Args:
+            symbol: Trading symbol (e.g., ETHRUSD, BTCRUSD)
+            account_id: Account ID (optional, defaults to config account_id)
+            deadline: Expiry as a unix timestamp in seconds (defaults to now + DEFAULT_DEADLINE_S)
+
+        Returns:
+            Signed mass cancel request
+
+        Raises:
+            ValueError: If symbol is not a spot market or account_id is missing
+        """
+        digest, fields = self._prepare_mass_cancel(symbol, account_id, deadline)
+        return MassCancelRequest(signature=self._signature_generator.sign_digest(digest), **fields)
+
+    async def _sign_mass_cancel(self, symbol: str, account_id: Optional[int]) -> MassCancelRequest:
+        """Build a mass cancel request like ``build_mass_cancel_request``, signing it without blocking the loop."""
+        digest, fields = self._prepare_mass_cancel(symbol, account_id, None)
+        return MassCancelRequest(signature=await self._signature_generator.sign_digest_async(digest), **fields)
+
+    def _prepare_mass_cancel(
+        self, symbol: str, account_id: Optional[int], deadline: Optional[int]
+    ) -> tuple[bytes, dict[str, Any]]:
+        """Validate mass cancel parameters and return the digest to sign and the other request fields."""
+        account_id = self._check_mass_cancel(symbol, account_id)
+        assert self._signature_generator is not None
 
         # Get market_id from symbol
         market_id = self._get_market_id_from_symbol(symbol)
@@ -568,26 +1299,44 @@ class ReyaTradingClient:
         nonce = self._get_next_nonce()
 
         # Generate deadline (current time + 5 seconds, in seconds)
-        deadline = int(time.time()) + DEFAULT_DEADLINE_S
+        if deadline is None:
+            deadline = int(time.time()) + DEFAULT_DEADLINE_S
 
-        # Generate EIP-712 signature for mass cancel
-        signature = self._signature_generator.sign_mass_cancel(
+        # EIP-712 digest for mass cancel
+        digest = self._signature_generator.mass_cancel_digest(
             account_id=account_id,
             market_id=market_id,
             nonce=nonce,
             deadline=deadline,
         )
 
-        mass_cancel_request = MassCancelRequest(
-            accountId=account_id,
-            symbol=symbol,
-            signature=signature,
-            nonce=str(nonce),
-            expiresAfter=deadline,
-        )
+        fields = {
+            "accountId": account_id,
+            "symbol": symbol,
+            "nonce": str(nonce),
+            "expiresAfter": deadline,
+        }
 
-        response = await self.orders.cancel_all(mass_cancel_request)
-        return response
+        return digest, fields
+
+    def _check_mass_cancel(self, symbol: str, account_id: Optional[int]) -> int:
+        """Validate the parameters of a mass cancel request and return the account ID it acts on."""
+        if self._signature_generator is None:
+            raise ValueError("Private key is required for mass cancel")
+
+        # Verify this is a spot market
+        if not self._is_spot_market(symbol):
+            raise ValueError(
+                f"Mass cancel is only supported for spot markets. " f"Symbol '{symbol}' appears to be a perp market."
+            )
+
+        # Use config account_id if not provided
+        if account_id is None:
+            account_id = self.config.account_id
+            if account_id is None:
+                raise ValueError("account_id is required for mass cancel")
+
+        return account_id
 
     async def get_positions(self, wallet_address: Optional[str] = None) -> list[Position]:
         """
@@ -606,7 +1355,9 @@ class ReyaTradingClient:
         if not wallet:
             raise ValueError("No wallet address available. Private key must be provided.")
 
-        return await self.wallet.get_wallet_positions(address=wallet)
+        return await self._rate_limited(
+            QUERY_ENDPOINT, RequestPriority.QUERY, None, lambda: self.wallet.get_wallet_positions(address=wallet)
+        )
 
     async def get_open_orders(self) -> list[Order]:
         """
@@ -622,7 +1373,9 @@ class ReyaTradingClient:
         if not wallet:
             raise ValueError("No wallet address available. Private key must be provided.")
 
-        return await self.wallet.get_wallet_open_orders(address=wallet)
+        return await self._rate_limited(
+            QUERY_ENDPOINT, RequestPriority.QUERY, None, lambda: self.wallet.get_wallet_open_orders(address=wallet)
+        )
 
     async def get_configuration(self) -> WalletConfiguration:
         """
@@ -638,7 +1391,9 @@ class ReyaTradingClient:
         if not wallet:
             raise ValueError("No wallet address available. Private key must be provided.")
 
-        return await self.wallet.get_wallet_configuration(address=wallet)
+        return await self._rate_limited(
+            QUERY_ENDPOINT, RequestPriority.QUERY, None, lambda: self.wallet.get_wallet_configuration(address=wallet)
+        )
 
     async def get_perp_executions(self) -> PerpExecutionList:
         """
@@ -654,7 +1409,9 @@ class ReyaTradingClient:
         if not wallet:
             raise ValueError("No wallet address available. Private key must be provided.")
 
-        return await self.wallet.get_wallet_perp_executions(address=wallet)
+        return await self._rate_limited(
+            QUERY_ENDPOINT, RequestPriority.QUERY, None, lambda: self.wallet.get_wallet_perp_executions(address=wallet)
+        )
 
     async def get_accounts(self) -> list[Account]:
         """
@@ -670,7 +1427,9 @@ class ReyaTradingClient:
         if not wallet:
             raise ValueError("No wallet address available. Private key must be provided.")
 
-        return await self.wallet.get_wallet_accounts(address=wallet)
+        return await self._rate_limited(
+            QUERY_ENDPOINT, RequestPriority.QUERY, None, lambda: self.wallet.get_wallet_accounts(address=wallet)
+        )
 
     async def get_account_balances(self) -> list[AccountBalance]:
         """
@@ -686,7 +1445,9 @@ class ReyaTradingClient:
         if not wallet:
             raise ValueError("No wallet address available. Private key must be provided.")
 
-        return await self.wallet.get_wallet_account_balances(address=wallet)
+        return await self._rate_limited(
+            QUERY_ENDPOINT, RequestPriority.QUERY, None, lambda: self.wallet.get_wallet_account_balances(address=wallet)
+        )
 
     async def get_spot_executions(self) -> SpotExecutionList:
         """
@@ -702,7 +1463,127 @@ class ReyaTradingClient:
         if not wallet:
             raise ValueError("No wallet address available. Private key must be provided.")
 
-        return await self.wallet.get_wallet_spot_executions(address=wallet)
+        return await self._rate_limited(
+            QUERY_ENDPOINT, RequestPriority.QUERY, None, lambda: self.wallet.get_wallet_spot_executions(address=wallet)
+        )
+
+    async def wait_for_order(self, order_id: str, status: OrderStatus, timeout: float = 10.0) -> TrackedOrder:
+        """
+        Wait until an order reaches the given status.
+
+        Resolves as soon as the order tracker sees the transition, typically from the
+        wallet ``orderChanges`` WebSocket channel (see ``order_tracker``). If nothing
+        arrives within the timeout, a single REST open orders check is made before
+        giving up.
+
+        Args:
+            order_id: ID of the order to wait for
+            status: Status to wait for
+            timeout: Seconds to wait for the update before the REST check
+
+        Returns:
+            The tracked order in the awaited status
+
+        Raises:
+            OrderStateError: If the order reached a different terminal state
+            TimeoutError: If the status could not be confirmed
+        """
+        waiter = self._add_waiter(self._order_waiters, order_id, status)
+        try:
+            tracked = self._order_tracker.get(order_id)
+            if tracked is not None:
+                waiter.notify(tracked)
+            try:
+                return await asyncio.wait_for(waiter.future, timeout)
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            self._remove_waiter(self._order_waiters, order_id, waiter)
+
+        return await self._check_order_status_via_rest(order_id, status, timeout)
+
+    async def wait_for_fill(self, client_order_id: int, timeout: float = 10.0) -> TrackedOrder:
+        """
+        Wait until the order submitted with a client order ID is fully filled.
+
+        IOC orders resolve immediately from their create order response; resting
+        orders resolve from order tracker updates, with a single REST open orders
+        check on timeout.
+
+        Args:
+            client_order_id: Client order ID the order was submitted with
+            timeout: Seconds to wait for the fill before the REST check
+
+        Returns:
+            The filled order
+
+        Raises:
+            OrderStateError: If the order was cancelled or rejected before filling; the
+                partially filled quantity is available on the error's ``order``
+            TimeoutError: If the fill could not be confirmed
+        """
+        waiter = self._add_waiter(self._fill_waiters, client_order_id, OrderStatus.FILLED)
+        try:
+            tracked = self._order_tracker.get_by_client_order_id(client_order_id)
+            if tracked is not None:
+                waiter.notify(tracked)
+            try:
+                return await asyncio.wait_for(waiter.future, timeout)
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            self._remove_waiter(self._fill_waiters, client_order_id, waiter)
+
+        tracked = self._order_tracker.get_by_client_order_id(client_order_id)
+        if tracked is None or tracked.order_id is None:
+            raise TimeoutError(f"Order with client order ID {client_order_id} not filled after {timeout}s")
+        return await self._check_order_status_via_rest(tracked.order_id, OrderStatus.FILLED, timeout)
+
+    async def _check_order_status_via_rest(self, order_id: str, status: OrderStatus, timeout: float) -> TrackedOrder:
+        """Final REST check after a wait timed out.
+
+        The REST API only lists open orders, so it can confirm OPEN but can only tell
+        that an order is no longer open, not its final status.
+        """
+        rest_order = next((order for order in await self.get_open_orders() if order.order_id == order_id), None)
+        if rest_order is not None:
+            self._order_tracker.apply(rest_order, source="rest")
+
+        tracked = self._order_tracker.get(order_id)
+        if tracked is not None and tracked.status == status:
+            return tracked
+        if tracked is not None and not tracked.is_open:
+            raise OrderStateError(
+                f"Order {order_id} reached {tracked.status.value} state, expected {status.value}", tracked
+            )
+
+        rest_state = "open" if rest_order is not None else "not open, final status unknown"
+        raise TimeoutError(f"Order {order_id} did not reach {status.value} state after {timeout}s (REST: {rest_state})")
+
+    def _add_waiter(self, waiters: dict[Any, list[_OrderWaiter]], key: Any, status: OrderStatus) -> _OrderWaiter:
+        loop = asyncio.get_running_loop()
+        waiter = _OrderWaiter(loop=loop, future=loop.create_future(), status=status)
+        with self._waiters_lock:
+            waiters.setdefault(key, []).append(waiter)
+        return waiter
+
+    def _remove_waiter(self, waiters: dict[Any, list[_OrderWaiter]], key: Any, waiter: _OrderWaiter) -> None:
+        with self._waiters_lock:
+            pending = waiters.get(key)
+            if pending is None:
+                return
+            pending.remove(waiter)
+            if not pending:
+                del waiters[key]
+
+    def _on_order_update(self, order: TrackedOrder) -> None:
+        """Order tracker listener resolving pending waits; may run on the WebSocket thread."""
+        with self._waiters_lock:
+            waiters = list(self._order_waiters.get(order.order_id, ())) if order.order_id is not None else []
+            if order.client_order_id is not None:
+                waiters.extend(self._fill_waiters.get(order.client_order_id, ()))
+        for waiter in waiters:
+            waiter.notify(order)
 
     async def close(self) -> None:
         """
@@ -2,7 +2,7 @@
 Enumeration classes for Reya Trading API.
 """
 
-from enum import IntEnum
+from enum import Enum, IntEnum
 
 
 class OrdersGatewayOrderType(IntEnum):
@@ -15,3 +15,37 @@ class OrdersGatewayOrderType(IntEnum):
     REDUCE_ONLY_MARKET_ORDER = 4
     FULL_CLOSE_ORDER = 5
     LIMIT_ORDER_SPOT = 6
+
+
+class ReplaceOrderStatus(str, Enum):
+    """Outcome of a cancel/replace request"""
+
+    REPLACED = "REPLACED"  # Old order cancelled, new order accepted
+    CANCEL_FAILED = "CANCEL_FAILED"  # New order accepted, old order may still be live
+    CREATE_FAILED = "CREATE_FAILED"  # Old order cancelled, no replacement on the book
+    BOTH_FAILED = "BOTH_FAILED"  # Neither request succeeded
+
+
+class RequestPriority(IntEnum):
+    """Rate limiter lanes; lower values are dispatched first"""
+
+    CANCEL = 0
+    MASS_CANCEL = 1
+    CREATE = 2
+    QUERY = 3
+
+
+class RiskRejectReason(str, Enum):
+    """Reasons for refusing an order in the client-side pre-trade checks"""
+
+    UNKNOWN_SYMBOL = "UNKNOWN_SYMBOL"  # No market definition for the symbol
+    NO_PRICE = "NO_PRICE"  # No oracle price to value the order with
+    MIN_ORDER_QTY = "MIN_ORDER_QTY"  # Quantity below the market minimum
+    QTY_STEP = "QTY_STEP"  # Quantity not a multiple of the step size
+    TICK_SIZE = "TICK_SIZE"  # Price not a multiple of the tick size
+    REDUCE_ONLY = "REDUCE_ONLY"  # Reduce-only order with no position to reduce
+    NO_POSITION = "NO_POSITION"  # TP/SL order with no position to close
+    INSUFFICIENT_BALANCE = "INSUFFICIENT_BALANCE"  # Spot balance does not cover the order
+    INSUFFICIENT_MARGIN = "INSUFFICIENT_MARGIN"  # Initial margin would exceed the margin balance
+    MAX_LEVERAGE = "MAX_LEVERAGE"  # Market exposure would exceed its maximum leverage
+    OI_CAP = "OI_CAP"  # Market open interest would exceed its cap
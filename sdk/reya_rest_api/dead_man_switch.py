@@ -0,0 +1,265 @@
+"""
+Dead Man Switch - Client-side cancel-on-disconnect guard for spot orders.
+
+A watchdog thread monitors heartbeats from the WebSocket and the asyncio event loop.
+If any of them stalls past the timeout, it mass-cancels every configured spot market
+using pre-signed requests sent over a synchronous HTTP session, so it still works
+when the event loop itself is blocked.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from sdk._version import SDK_VERSION
+from sdk.open_api.models.mass_cancel_request import MassCancelRequest
+from sdk.open_api.models.mass_cancel_response import MassCancelResponse
+from sdk.reya_rest_api.models.orders import MassCancelAllResult
+
+if TYPE_CHECKING:
+    from sdk.reya_rest_api.client import ReyaTradingClient
+
+logger = logging.getLogger("reya_trading.dead_man_switch")
+
+DEFAULT_HEARTBEAT_TIMEOUT_S = 5.0
+DEFAULT_CHECK_INTERVAL_S = 0.25
+DEFAULT_PRESIGN_TTL_S = 60
+DEFAULT_HTTP_TIMEOUT_S = 5.0
+
+
+class DeadManSwitch:
+    """
+    Watchdog that mass-cancels spot orders when heartbeats stop.
+
+    Heartbeat sources are armed by their first heartbeat: pass ``on_message`` to (or call
+    it from) the ``ReyaSocket`` message handler, and run ``run_loop_heartbeat`` as a task
+    on the event loop. Once tripped, the switch stays tripped until ``reset``.
+
+    Mass cancel requests are signed ahead of time, and the watchdog thread re-signs only
+    those nearing their deadline. Any nonce the client issues afterwards makes the whole
+    set stale (the server would reject it), so a trip then signs each symbol's cancel
+    on its sending thread instead of re-signing the set after every order.
+    """
+
+    def __init__(
+        self,
+        client: "ReyaTradingClient",
+        symbols: Optional[list[str]] = None,
+        account_id: Optional[int] = None,
+        timeout: float = DEFAULT_HEARTBEAT_TIMEOUT_S,
+        check_interval: float = DEFAULT_CHECK_INTERVAL_S,
+        presign_ttl: int = DEFAULT_PRESIGN_TTL_S,
+        http_timeout: float = DEFAULT_HTTP_TIMEOUT_S,
+        on_trip: Optional[Callable[[MassCancelAllResult], None]] = None,
+    ):
+        """
+        Initialize the dead man switch.
+
+        Args:
+            client: Started trading client whose signer and nonces are used.
+            symbols: Spot symbols to cancel (defaults to all loaded spot markets).
+            account_id: Account ID (defaults to the client's config account_id).
+            timeout: Seconds without a heartbeat from an armed source before tripping.
+            check_interval: Seconds between watchdog checks.
+            presign_ttl: Lifetime in seconds of pre-signed requests.
+            http_timeout: Timeout in seconds of each cancel HTTP request.
+            on_trip: Callback invoked on the watchdog thread with the cancel results.
+        """
+        self._client = client
+        self.symbols = symbols if symbols is not None else client.spot_symbols
+        self.account_id = account_id if account_id is not None else client.config.account_id
+        self.timeout = timeout
+        self.check_interval = check_interval
+        self.presign_ttl = presign_ttl
+        self.http_timeout = http_timeout
+        self.on_trip = on_trip
+
+        self._url = f"{client.config.api_url.rstrip('/')}/cancelAll"
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "X-SDK-Version": f"reya-python-sdk/{SDK_VERSION}",
+                "User-Agent": f"reya-python-sdk/{SDK_VERSION}",
+            }
+        )
+
+        self._heartbeats: dict[str, float] = {}
+        self._heartbeat_lock = threading.Lock()
+        self._presigned: dict[str, MassCancelRequest] = {}
+        # Highest nonce of the pre-signed set; a client nonce above it makes the set stale
+        self._presigned_nonce = 0
+        self._presign_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._tripped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def tripped(self) -> bool:
+        """Whether the switch has fired since it was started or reset."""
+        return self._tripped.is_set()
+
+    def heartbeat(self, source: str = "default") -> None:
+        """
+        Record a heartbeat; the first heartbeat of a source arms monitoring of it.
+
+        Args:
+            source: Name of the heartbeat source.
+        """
+        with self._heartbeat_lock:
+            self._heartbeats[source] = time.monotonic()
+
+    def on_message(self, _ws: Any, _message: Any) -> None:
+        """Record a WebSocket heartbeat; compatible with ``ReyaSocket`` on_message."""
+        self.heartbeat("websocket")
+
+    async def run_loop_heartbeat(self, interval: Optional[float] = None) -> None:
+        """
+        Heartbeat from the event loop until cancelled.
+
+        Run as a background task, e.g. ``asyncio.create_task(switch.run_loop_heartbeat())``;
+        a blocked or starved loop stops heartbeating and trips the switch.
+
+        Args:
+            interval: Seconds between heartbeats (defaults to ``check_interval``).
+        """
+        while True:
+            self.heartbeat("event_loop")
+            await asyncio.sleep(interval if interval is not None else self.check_interval)
+
+    def start(self) -> None:
+        """Pre-sign the mass cancel requests and start the watchdog thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._refresh_presigned(force=True)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="reya-dead-man-switch", daemon=True)
+        self._thread.start()
+        logger.info(f"Dead man switch armed for {self.symbols} (timeout={self.timeout}s)")
+
+    def stop(self) -> None:
+        """Stop the watchdog thread without cancelling anything."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def reset(self) -> None:
+        """Clear the tripped state and forget all heartbeat sources."""
+        with self._heartbeat_lock:
+            self._heartbeats.clear()
+        self._tripped.clear()
+
+    def trip(self) -> MassCancelAllResult:
+        """
+        Fire the mass cancels immediately, in parallel, from the calling thread.
+
+        Also usable directly as a synchronous kill switch.
+
+        Returns:
+            Per-symbol responses and errors.
+        """
+        self._tripped.set()
+        now = int(time.time())
+        with self._presign_lock:
+            fresh = self._client.last_nonce <= self._presigned_nonce
+            presigned = {
+                symbol: request
+                for symbol, request in self._presigned.items()
+                if fresh and request.expires_after > now and symbol in self.symbols
+            }
+
+        responses: dict[str, MassCancelResponse] = {}
+        errors: dict[str, Exception] = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(self.symbols))) as executor:
+            futures = {symbol: executor.submit(self._send, symbol, presigned.get(symbol)) for symbol in self.symbols}
+            for symbol, future in futures.items():
+                try:
+                    responses[symbol] = future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    errors[symbol] = e
+
+        result = MassCancelAllResult(responses=responses, errors=errors)
+        logger.warning(
+            f"Dead man switch tripped: cancelled {result.cancelled_count} orders, failed symbols: {sorted(errors)}"
+        )
+        return result
+
+    def _run(self) -> None:
+        """Watchdog loop."""
+        while not self._stop.wait(self.check_interval):
+            if self._tripped.is_set():
+                continue
+            try:
+                self._refresh_presigned()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Failed to refresh pre-signed mass cancels: {e}")
+
+            stalled = self._stalled_sources()
+            if not stalled:
+                continue
+
+            logger.error(f"Heartbeat stalled for {stalled}, cancelling all orders")
+            result = self.trip()
+            if self.on_trip is not None:
+                try:
+                    self.on_trip(result)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error(f"Dead man switch on_trip callback failed: {e}")
+
+    def _stalled_sources(self) -> list[str]:
+        """Names of armed heartbeat sources that missed the timeout."""
+        now = time.monotonic()
+        with self._heartbeat_lock:
+            return [source for source, last in self._heartbeats.items() if now - last > self.timeout]
+
+    def _refresh_presigned(self, force: bool = False) -> None:
+        """
+        Re-sign the requests that are missing or near their deadline.
+
+        Each request is re-signed at most once per half ``presign_ttl``, whatever the
+        order flow. Nonces issued by the client do not trigger a refresh: a stale set is
+        signed again at trip time, or by the next refresh of all symbols.
+
+        Args:
+            force: Re-sign every symbol, e.g. when (re)starting the watchdog.
+        """
+        refresh_before = int(time.time()) + self.presign_ttl // 2
+        with self._presign_lock:
+            fresh = self._client.last_nonce <= self._presigned_nonce
+            expiring = [
+                symbol
+                for symbol in self.symbols
+                if force or symbol not in self._presigned or self._presigned[symbol].expires_after < refresh_before
+            ]
+            if not expiring:
+                return
+            signed = {symbol: self._sign(symbol) for symbol in expiring}
+            self._presigned.update(signed)
+            # The set stays valid only if nothing was issued since the previous signing
+            if fresh or len(expiring) == len(self.symbols):
+                self._presigned_nonce = max(int(request.nonce) for request in signed.values())
+
+    def _sign(self, symbol: str) -> MassCancelRequest:
+        return self._client.build_mass_cancel_request(
+            symbol, self.account_id, deadline=int(time.time()) + self.presign_ttl
+        )
+
+    def _send(self, symbol: str, request: Optional[MassCancelRequest]) -> MassCancelResponse:
+        """POST a mass cancel (signed now if none is given), re-signing and resending once if its nonce was rejected."""
+        if request is None:
+            request = self._sign(symbol)
+        response = self._session.post(self._url, data=request.to_json(), timeout=self.http_timeout)
+        if response.status_code == 400 and "nonce" in response.text.lower():
+            response = self._session.post(self._url, data=self._sign(symbol).to_json(), timeout=self.http_timeout)
+        response.raise_for_status()
+        result = MassCancelResponse.from_json(response.text)
+        if result is None:
+            raise ValueError(f"Empty mass cancel response for {symbol}")
+        return result
@@ -0,0 +1,40 @@
+"""Custom exceptions for the Reya Trading SDK."""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sdk.open_api.models.create_order_request import CreateOrderRequest
+    from sdk.reya_rest_api.order_tracker import TrackedOrder
+    from sdk.reya_rest_api.risk_engine import RiskCheck
+
+
+class ReyaTradingError(Exception):
+    """Base exception for Reya Trading client operations."""
+
+
+class OrderStateError(ReyaTradingError):
+    """Raised when an awaited order reaches a terminal state other than the expected one."""
+
+    def __init__(self, message: str, order: "TrackedOrder"):
+        super().__init__(message)
+        self.order = order
+
+
+class OrderOutcomeUnknownError(ReyaTradingError):
+    """Raised when an order submission failed in a way that leaves its acceptance unknown.
+
+    The order may be live on the exchange; check open orders or the order tracker
+    before submitting it again.
+    """
+
+    def __init__(self, message: str, request: "CreateOrderRequest"):
+        super().__init__(message)
+        self.request = request
+
+
+class RiskCheckError(ReyaTradingError):
+    """Raised when the client-side risk engine refuses an order; nothing was sent."""
+
+    def __init__(self, message: str, check: "RiskCheck"):
+        super().__init__(message)
+        self.check = check
@@ -2,6 +2,15 @@
 Data models for Reya Trading API.
 """
 
-from .orders import LimitOrderParameters, TriggerOrderParameters
+from .fixed_point import MarketGrid, Px, Qty
+from .orders import LimitOrderParameters, MassCancelAllResult, ReplaceOrderResult, TriggerOrderParameters
 
-__all__ = ["LimitOrderParameters", "TriggerOrderParameters"]
+__all__ = [
+    "LimitOrderParameters",
+    "TriggerOrderParameters",
+    "ReplaceOrderResult",
+    "MassCancelAllResult",
+    "Px",
+    "Qty",
+    "MarketGrid",
+]
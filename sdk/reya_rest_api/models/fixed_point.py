@@ -0,0 +1,314 @@
+"""
+Fixed Point - Integer-backed prices and quantities on a market's tick and step grid.
+
+``Px`` and ``Qty`` hold their value as an integer number of 10**-18 units, the scale
+orders are signed at, so signing needs no conversion and rounding to the tick or step
+size is integer division. They are accepted wherever ``LimitOrderParameters`` and
+``TriggerOrderParameters`` take price and quantity strings.
+"""
+
+from typing import Any, Optional, TypeVar, Union
+
+from dataclasses import dataclass
+from decimal import ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP, Decimal
+
+from sdk.open_api.models.market_definition import MarketDefinition
+from sdk.open_api.models.spot_market_definition import SpotMarketDefinition
+
+# Scale of signed order inputs
+WAD_DECIMALS = 18
+WAD: int = 10**WAD_DECIMALS
+
+FixedPointT = TypeVar("FixedPointT", bound="FixedPoint")
+
+
+def to_wad(value: Union[str, int, float, Decimal, "FixedPoint"]) -> int:
+    """
+    Scale a number to an integer of 10**-18 units, truncating extra digits toward zero.
+
+    Fixed-point values are already scaled; floats are converted from their shortest
+    representation (``repr``) rather than their exact binary value.
+
+    Args:
+        value: The number.
+
+    Returns:
+        The value times 10**18, as an int.
+    """
+    if isinstance(value, FixedPoint):
+        return value.units
+    if isinstance(value, int):
+        return value * WAD
+    if isinstance(value, float):
+        value = repr(value)
+    return int(Decimal(value) * WAD)
+
+
+def format_wad(units: int) -> str:
+    """Format an integer of 10**-18 units as a plain decimal string without trailing zeros."""
+    sign = "-" if units < 0 else ""
+    whole, fraction = divmod(abs(units), WAD)
+    if not fraction:
+        return f"{sign}{whole}"
+    return f"{sign}{whole}.{fraction:018d}".rstrip("0")
+
+
+def _round_units(units: int, increment: int, rounding: str) -> int:
+    """Round units to a multiple of increment with a ``decimal`` rounding mode."""
+    quotient, remainder = divmod(units, increment)  # Floor division
+    if not remainder:
+        return units
+    if rounding == ROUND_FLOOR:
+        up = False
+    elif rounding == ROUND_CEILING:
+        up = True
+    elif rounding == ROUND_DOWN:
+        up = units < 0
+    elif rounding == ROUND_UP:
+        up = units > 0
+    elif rounding == ROUND_HALF_EVEN:
+        twice = 2 * remainder
+        up = twice > increment or (twice == increment and quotient % 2 == 1)
+    elif rounding == ROUND_HALF_UP:
+        twice = 2 * remainder
+        up = twice > increment or (twice == increment and units > 0)
+    else:
+        raise ValueError(f"Unsupported rounding mode {rounding}")
+    return (quotient + up) * increment
+
+
+class FixedPoint:
+    """
+    Number stored as an integer of 10**-18 units, with the grid increment it belongs to.
+
+    Arithmetic keeps the increment of the left operand (or the right one if the left has
+    none); values of different subclasses do not mix.
+    """
+
+    __slots__ = ("units", "increment")
+
+    units: int
+    increment: int
+
+    def __init__(
+        self,
+        value: Union[str, int, float, Decimal, "FixedPoint"],
+        increment: Union[str, int, float, Decimal, "FixedPoint", None] = None,
+    ):
+        """
+        Create a value.
+
+        Args:
+            value: The number.
+            increment: Tick or step size the value belongs to; taken from ``value`` if it
+                       is fixed point, and none (no rounding) otherwise.
+        """
+        self.units = to_wad(value)
+        if increment is not None:
+            self.increment = to_wad(increment)
+        else:
+            self.increment = value.increment if isinstance(value, FixedPoint) else 0
+
+    @classmethod
+    def from_units(cls: type[FixedPointT], units: int, increment: int = 0) -> FixedPointT:
+        """Create a value from 10**-18 units without parsing."""
+        value = cls.__new__(cls)
+        value.units = units
+        value.increment = increment
+        return value
+
+    @classmethod
+    def from_steps(cls: type[FixedPointT], steps: int, increment: int) -> FixedPointT:
+        """Create a value that is ``steps`` increments (ticks or qty steps) of 10**-18 units."""
+        return cls.from_units(steps * increment, increment)
+
+    @property
+    def steps(self) -> int:
+        """Number of whole increments in the value (rounded toward negative infinity)."""
+        if not self.increment:
+            raise ValueError(f"{self!r} has no increment")
+        return self.units // self.increment
+
+    @property
+    def is_aligned(self) -> bool:
+        """Whether the value is a multiple of its increment (always True without one)."""
+        return not self.increment or self.units % self.increment == 0
+
+    def quantize(self: FixedPointT, rounding: str = ROUND_HALF_EVEN) -> FixedPointT:
+        """
+        Round to the increment.
+
+        Args:
+            rounding: A ``decimal`` rounding mode (ROUND_FLOOR, ROUND_CEILING, ROUND_DOWN,
+                      ROUND_UP, ROUND_HALF_EVEN or ROUND_HALF_UP).
+
+        Returns:
+            The rounded value (this value if it has no increment or is already aligned).
+        """
+        if not self.increment:
+            return self
+        units = _round_units(self.units, self.increment, rounding)
+        return self if units == self.units else self.from_units(units, self.increment)
+
+    def to_decimal(self) -> Decimal:
+        """The value as a Decimal."""
+        return Decimal(self.units).scaleb(-WAD_DECIMALS)
+
+    def _other_units(self, other: Any) -> Optional[int]:
+        if type(other) is type(self):  # pylint: disable=unidiomatic-typecheck
+            return int(other.units)
+        if isinstance(other, int) and not isinstance(other, bool) and other == 0:
+            return 0  # So that sum() works
+        return None
+
+    def __add__(self: FixedPointT, other: Any) -> FixedPointT:
+        units = self._other_units(other)
+        if units is None:
+            return NotImplemented
+        return self.from_units(self.units + units, self.increment or getattr(other, "increment", 0))
+
+    __radd__ = __add__
+
+    def __sub__(self: FixedPointT, other: Any) -> FixedPointT:
+        units = self._other_units(other)
+        if units is None:
+            return NotImplemented
+        return self.from_units(self.units - units, self.increment or getattr(other, "increment", 0))
+
+    def __mul__(self: FixedPointT, other: Any) -> FixedPointT:
+        if not isinstance(other, int) or isinstance(other, bool):
+            return NotImplemented
+        return self.from_units(self.units * other, self.increment)
+
+    __rmul__ = __mul__
+
+    def __neg__(self: FixedPointT) -> FixedPointT:
+        return self.from_units(-self.units, self.increment)
+
+    def __abs__(self: FixedPointT) -> FixedPointT:
+        return self if self.units >= 0 else -self
+
+    def __bool__(self) -> bool:
+        return self.units != 0
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):  # pylint: disable=unidiomatic-typecheck
+            return NotImplemented
+        return bool(self.units == other.units)
+
+    def __lt__(self, other: Any) -> bool:
+        if type(other) is not type(self):  # pylint: disable=unidiomatic-typecheck
+            return NotImplemented
+        return bool(self.units < other.units)
+
+    def __le__(self, other: Any) -> bool:
+        if type(other) is not type(self):  # pylint: disable=unidiomatic-typecheck
+            return NotImplemented
+        return bool(self.units <= other.units)
+
+    def __gt__(self, other: Any) -> bool:
+        if type(other) is not type(self):  # pylint: disable=unidiomatic-typecheck
+            return NotImplemented
+        return bool(self.units > other.units)
+
+    def __ge__(self, other: Any) -> bool:
+        if type(other) is not type(self):  # pylint: disable=unidiomatic-typecheck
+            return NotImplemented
+        return bool(self.units >= other.units)
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.units))
+
+    def __float__(self) -> float:
+        return self.units / WAD
+
+    def __str__(self) -> str:
+        return format_wad(self.units)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
+
+
+class Px(FixedPoint):
+    """Price on a market's tick grid."""
+
+    __slots__ = ()
+
+    def passive(self, is_buy: bool) -> "Px":
+        """Round to the tick away from the market: buys down, sells up."""
+        return self.quantize(ROUND_FLOOR if is_buy else ROUND_CEILING)
+
+
+class Qty(FixedPoint):
+    """Base quantity on a market's step grid."""
+
+    __slots__ = ()
+
+
+@dataclass(frozen=True)
+class MarketGrid:
+    """
+    Tick size, quantity step and minimum quantity of a market, in 10**-18 units.
+
+    Example:
+        grid = MarketGrid.from_definition(definition)
+        px = grid.px(mid * 0.999, ROUND_FLOOR)
+        qty = grid.qty("0.0123", ROUND_DOWN)
+        await client.create_limit_order(LimitOrderParameters(grid.symbol, True, px, qty, TimeInForce.GTC))
+    """
+
+    symbol: str
+    tick: int
+    step: int
+    min_qty: int
+
+    @classmethod
+    def from_definition(cls, definition: Union[MarketDefinition, SpotMarketDefinition]) -> "MarketGrid":
+        """Build the grid of a perp or spot market definition."""
+        return cls(
+            symbol=definition.symbol,
+            tick=to_wad(definition.tick_size),
+            step=to_wad(definition.qty_step_size),
+            min_qty=to_wad(definition.min_order_qty),
+        )
+
+    def px(self, value: Union[str, int, float, Decimal, FixedPoint], rounding: Optional[str] = None) -> Px:
+        """
+        A price on this market's tick grid.
+
+        Args:
+            value: The price.
+            rounding: ``decimal`` rounding mode to the tick size; the value is kept as is if None.
+
+        Returns:
+            The price.
+        """
+        px = Px.from_units(to_wad(value), self.tick)
+        return px if rounding is None else px.quantize(rounding)
+
+    def qty(self, value: Union[str, int, float, Decimal, FixedPoint], rounding: Optional[str] = None) -> Qty:
+        """
+        A quantity on this market's step grid.
+
+        Args:
+            value: The quantity.
+            rounding: ``decimal`` rounding mode to the step size; the value is kept as is if None.
+
+        Returns:
+            The quantity.
+        """
+        qty = Qty.from_units(to_wad(value), self.step)
+        return qty if rounding is None else qty.quantize(rounding)
+
+    def tick_px(self, ticks: int) -> Px:
+        """The price ``ticks`` ticks above zero."""
+        return Px.from_steps(ticks, self.tick)
+
+    def step_qty(self, steps: int) -> Qty:
+        """The quantity of ``steps`` quantity steps."""
+        return Qty.from_steps(steps, self.step)
+
+    @property
+    def min_order_qty(self) -> Qty:
+        """The minimum order quantity."""
+        return Qty.from_units(self.min_qty, self.step)
@@ -1,19 +1,24 @@
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from dataclasses import dataclass
 
 from sdk.open_api.models import time_in_force
+from sdk.open_api.models.cancel_order_response import CancelOrderResponse
+from sdk.open_api.models.create_order_response import CreateOrderResponse
+from sdk.open_api.models.mass_cancel_response import MassCancelResponse
 from sdk.open_api.models.order_type import OrderType
+from sdk.reya_rest_api.constants.enums import ReplaceOrderStatus
+from sdk.reya_rest_api.models.fixed_point import Px, Qty
 
 
 @dataclass(frozen=True)
 class LimitOrderParameters:
-    """Limit order parameters."""
+    """Limit order parameters; price and quantity are decimal strings or ``Px``/``Qty``."""
 
     symbol: str
     is_buy: bool
-    limit_px: str
-    qty: str
+    limit_px: Union[str, Px]
+    qty: Union[str, Qty]
     time_in_force: time_in_force.TimeInForce
     reduce_only: Optional[bool] = None
     expires_after: Optional[int] = None
@@ -34,11 +39,11 @@ class LimitOrderParameters:
 
 @dataclass(frozen=True)
 class TriggerOrderParameters:
-    """Trigger order parameters."""
+    """Trigger order parameters; the trigger price is a decimal string or ``Px``."""
 
     symbol: str
     is_buy: bool
-    trigger_px: str
+    trigger_px: Union[str, Px]
     trigger_type: OrderType
 
     def to_dict(self) -> dict[str, Any]:
@@ -48,3 +53,37 @@ class TriggerOrderParameters:
             "trigger_px": self.trigger_px,
             "trigger_type": self.trigger_type,
         }
+
+
+@dataclass(frozen=True)
+class ReplaceOrderResult:
+    """Combined outcome of a cancel/replace request."""
+
+    status: ReplaceOrderStatus
+    cancel_response: Optional[CancelOrderResponse] = None
+    create_response: Optional[CreateOrderResponse] = None
+    cancel_error: Optional[Exception] = None
+    create_error: Optional[Exception] = None
+
+    @property
+    def replaced(self) -> bool:
+        """Whether both the cancel and the new order succeeded."""
+        return self.status == ReplaceOrderStatus.REPLACED
+
+
+@dataclass(frozen=True)
+class MassCancelAllResult:
+    """Per-symbol outcome of a multi-market mass cancel."""
+
+    responses: dict[str, MassCancelResponse]
+    errors: dict[str, Exception]
+
+    @property
+    def cancelled_count(self) -> int:
+        """Total number of orders cancelled across all symbols."""
+        return sum(response.cancelled_count for response in self.responses.values())
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every symbol was cancelled successfully."""
+        return not self.errors
@@ -0,0 +1,179 @@
+"""
+Order Entry - Order entry API that encodes request bodies directly.
+
+``ReyaOrderEntryApi`` sends create order, cancel order and mass cancel requests
+without the generic OpenAPI path (argument validation, ``sanitize_for_serialization``
+over ``model_dump`` and ``json.dumps`` of the result). The body bytes are written
+straight from the already validated request model:
+
+- By default (standard library encoder) the bytes are identical to the generic path's.
+- With ``use_orjson`` (``pip install reya-python-sdk[speedups]``) the JSON document is
+  the same, without the optional whitespace.
+"""
+
+from typing import Any, Union
+
+from json import dumps
+from json.encoder import encode_basestring_ascii
+
+from pydantic import BaseModel
+
+from sdk.open_api.api.order_entry_api import OrderEntryApi
+from sdk.open_api.models.cancel_order_request import CancelOrderRequest
+from sdk.open_api.models.cancel_order_response import CancelOrderResponse
+from sdk.open_api.models.create_order_request import CreateOrderRequest
+from sdk.open_api.models.create_order_response import CreateOrderResponse
+from sdk.open_api.models.mass_cancel_request import MassCancelRequest
+from sdk.open_api.models.mass_cancel_response import MassCancelResponse
+from sdk.reya_rest_api.api_client import ReyaRESTClient
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+OrderEntryRequest = Union[CreateOrderRequest, CancelOrderRequest, MassCancelRequest]
+
+_ERROR_RESPONSES = {"400": "RequestError", "500": "ServerError"}
+CREATE_ORDER_RESPONSES = {"200": "CreateOrderResponse", **_ERROR_RESPONSES}
+CANCEL_ORDER_RESPONSES = {"200": "CancelOrderResponse", **_ERROR_RESPONSES}
+CANCEL_ALL_RESPONSES = {"200": "MassCancelResponse", **_ERROR_RESPONSES}
+
+# Field name -> JSON key, in the order model_dump writes the fields
+_ALIASES: dict[type[BaseModel], dict[str, str]] = {
+    model: {name: field.alias or name for name, field in model.model_fields.items() if name != "additional_properties"}
+    for model in (CreateOrderRequest, CancelOrderRequest, MassCancelRequest)
+}
+# Field name -> encoded JSON key and separator
+_KEYS = {
+    model: {name: f"{encode_basestring_ascii(alias)}: " for name, alias in aliases.items()}
+    for model, aliases in _ALIASES.items()
+}
+
+
+def _require_orjson() -> None:
+    if orjson is None:
+        raise ImportError("The orjson encoder requires orjson: pip install reya-python-sdk[speedups]")
+
+
+def encode_request(request: OrderEntryRequest, use_orjson: bool = False) -> bytes:
+    """
+    Encode an order entry request as the JSON body sent to the API.
+
+    Fields that are None are left out and ``additional_properties`` are appended, as
+    ``to_dict()`` does.
+
+    Args:
+        request: Create order, cancel order or mass cancel request.
+        use_orjson: Encode with orjson (compact output) instead of the standard library.
+
+    Returns:
+        The request body.
+
+    Raises:
+        ImportError: If use_orjson is True and orjson is not installed.
+    """
+    if use_orjson:
+        _require_orjson()
+        aliases = _ALIASES[type(request)]
+        body = {
+            aliases[name]: value for name, value in request.__dict__.items() if value is not None and name in aliases
+        }
+        body.update(request.additional_properties)
+        return orjson.dumps(body)  # pylint: disable=no-member
+
+    keys = _KEYS[type(request)]
+    parts = []
+    for name, value in request.__dict__.items():
+        if value is None or name not in keys:
+            continue
+        kind = type(value)
+        if kind is bool:
+            encoded = "true" if value else "false"
+        elif kind is int:
+            encoded = int.__repr__(value)
+        elif isinstance(value, str):  # Includes the str enums OrderType and TimeInForce
+            encoded = encode_basestring_ascii(value)
+        else:
+            encoded = dumps(value)
+        parts.append(keys[name] + encoded)
+    for key, value in request.additional_properties.items():
+        parts.append(f"{encode_basestring_ascii(key)}: {dumps(value)}")
+    return ("{" + ", ".join(parts) + "}").encode()
+
+
+class ReyaOrderEntryApi(OrderEntryApi):
+    """
+    OrderEntryApi whose create_order, cancel_order and cancel_all encode the body directly.
+
+    Calls with any of the generated methods' optional arguments other than
+    ``_request_timeout`` (or made through an ApiClient that cannot send pre-encoded
+    bodies) go through the generic path.
+    """
+
+    def __init__(self, api_client=None, use_orjson: bool = False):
+        """
+        Initialize the API.
+
+        Args:
+            api_client: API client; should be a ReyaApiClient for the direct path.
+            use_orjson: Encode with orjson instead of the standard library; can also be
+                        changed later through the ``use_orjson`` attribute.
+
+        Raises:
+            ImportError: If use_orjson is True and orjson is not installed.
+        """
+        super().__init__(api_client)
+        if use_orjson:
+            _require_orjson()
+        self.use_orjson = use_orjson
+        self._direct = isinstance(self.api_client.rest_client, ReyaRESTClient)
+
+    async def create_order(  # type: ignore[override]  # pylint: disable=arguments-differ
+        self, create_order_request: CreateOrderRequest, _request_timeout: Any = None, **kwargs: Any
+    ) -> CreateOrderResponse:
+        if kwargs or not self._direct:
+            return await super().create_order(create_order_request, _request_timeout=_request_timeout, **kwargs)
+        response: CreateOrderResponse = await self._post(
+            "/createOrder", create_order_request, CREATE_ORDER_RESPONSES, _request_timeout
+        )
+        return response
+
+    async def cancel_order(  # type: ignore[override]  # pylint: disable=arguments-differ
+        self, cancel_order_request: CancelOrderRequest, _request_timeout: Any = None, **kwargs: Any
+    ) -> CancelOrderResponse:
+        if kwargs or not self._direct:
+            return await super().cancel_order(cancel_order_request, _request_timeout=_request_timeout, **kwargs)
+        response: CancelOrderResponse = await self._post(
+            "/cancelOrder", cancel_order_request, CANCEL_ORDER_RESPONSES, _request_timeout
+        )
+        return response
+
+    async def cancel_all(  # type: ignore[override]  # pylint: disable=arguments-differ
+        self, mass_cancel_request: MassCancelRequest, _request_timeout: Any = None, **kwargs: Any
+    ) -> MassCancelResponse:
+        if kwargs or not self._direct:
+            return await super().cancel_all(mass_cancel_request, _request_timeout=_request_timeout, **kwargs)
+        response: MassCancelResponse = await self._post(
+            "/cancelAll", mass_cancel_request, CANCEL_ALL_RESPONSES, _request_timeout
+        )
+        return response
+
+    async def _post(
+        self, resource_path: str, request: OrderEntryRequest, response_types_map: dict[str, str], _request_timeout: Any
+    ) -> Any:
+        """Send an encoded request and deserialize the response as the generated methods do."""
+        api_client = self.api_client
+        headers = {"Accept": "application/json", "Content-Type": "application/json", **api_client.default_headers}
+        if api_client.cookie:
+            headers["Cookie"] = api_client.cookie
+        response_data = await api_client.call_api(
+            "POST",
+            api_client.configuration.host + resource_path,
+            headers,
+            encode_request(request, self.use_orjson),
+            None,
+            _request_timeout,
+        )
+        await response_data.read()
+        return api_client.response_deserialize(response_data, response_types_map).data
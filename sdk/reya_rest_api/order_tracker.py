@@ -0,0 +1,566 @@
+"""
+Order Tracker - Client-side mirror of a wallet's order state.
+
+This module keeps an indexed view of orders built from WebSocket order change
+updates, with periodic reconciliation against the REST open orders endpoint.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from sdk.async_api.order import Order as AsyncOrder
+from sdk.async_api.order_change_update_payload import OrderChangeUpdatePayload
+from sdk.open_api.models.create_order_request import CreateOrderRequest
+from sdk.open_api.models.create_order_response import CreateOrderResponse
+from sdk.open_api.models.order import Order
+from sdk.open_api.models.order_status import OrderStatus
+from sdk.open_api.models.side import Side
+
+if TYPE_CHECKING:
+    from sdk.reya_rest_api.client import ReyaTradingClient
+
+logger = logging.getLogger("reya_trading.order_tracker")
+
+TERMINAL_STATUSES = frozenset({OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED})
+
+# Orders updated this recently are never dropped by reconciliation, since the REST
+# snapshot may have been taken before the WebSocket update that created them.
+DEFAULT_RECONCILE_GRACE_MS = 2000
+DEFAULT_MAX_CLOSED_ORDERS = 10000
+
+
+@dataclass(frozen=True)
+class OrderTransition:
+    """A single state change of a tracked order."""
+
+    status: OrderStatus
+    cum_qty: Decimal
+    fill_qty: Decimal
+    timestamp: int
+    source: str
+
+
+@dataclass
+class TrackedOrder:
+    """Current state of an order as seen by the tracker.
+
+    ``order_id`` is None for IOC orders, which the exchange does not assign an ID;
+    those are only tracked by client order ID, from their create order response.
+    """
+
+    order_id: Optional[str]
+    symbol: str
+    account_id: int
+    side: Side
+    limit_px: str
+    qty: Optional[str]
+    status: OrderStatus
+    cum_qty: Decimal
+    created_at: int
+    last_update_at: int
+    client_order_id: Optional[int] = None
+    transitions: list[OrderTransition] = field(default_factory=list)
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the order can still trade."""
+        return self.status not in TERMINAL_STATUSES
+
+    @property
+    def remaining_qty(self) -> Optional[Decimal]:
+        """Quantity still to be filled, if the order has a quantity."""
+        if self.qty is None:
+            return None
+        return Decimal(self.qty) - self.cum_qty
+
+
+@dataclass(frozen=True)
+class ReconcileResult:
+    """Differences found between the tracker and a REST open orders snapshot."""
+
+    added: list[str]
+    updated: list[str]
+    removed: list[str]
+
+    @property
+    def drifted(self) -> bool:
+        """Whether the tracker had drifted from the exchange state."""
+        return bool(self.added or self.updated or self.removed)
+
+
+class OrderTracker:
+    """
+    Indexed mirror of a wallet's orders.
+
+    Orders are indexed by order ID, client order ID and (symbol, side), so lookups
+    do not scan lists. Updates are applied from WebSocket ``orderChanges`` payloads
+    via ``on_message``, which can be passed directly to ``ReyaSocket`` (or called from
+    an existing ``on_message`` handler), and drift is corrected with ``reconcile``.
+
+    All methods are thread-safe: WebSocket callbacks run on the socket thread while
+    reconciliation typically runs on the asyncio loop.
+    """
+
+    def __init__(
+        self,
+        account_id: Optional[int] = None,
+        max_closed_orders: int = DEFAULT_MAX_CLOSED_ORDERS,
+        reconcile_grace_ms: int = DEFAULT_RECONCILE_GRACE_MS,
+    ):
+        """
+        Initialize the order tracker.
+
+        Args:
+            account_id: Only track orders of this account. Tracks all accounts of the wallet if None.
+            max_closed_orders: Number of closed orders kept for lookups before the oldest are evicted.
+            reconcile_grace_ms: Orders updated within this window are not dropped by reconciliation.
+        """
+        self.account_id = account_id
+        self.max_closed_orders = max_closed_orders
+        self.reconcile_grace_ms = reconcile_grace_ms
+
+        self._lock = threading.RLock()
+        self._open: dict[str, TrackedOrder] = {}
+        self._closed: OrderedDict[str, TrackedOrder] = OrderedDict()
+        self._by_client_order_id: dict[int, str] = {}
+        self._client_order_id_by_order_id: dict[str, int] = {}
+        # IOC orders have no order ID, so they are kept by client order ID only
+        self._closed_without_id: OrderedDict[int, TrackedOrder] = OrderedDict()
+        # Dicts used as insertion-ordered sets of order IDs
+        self._by_symbol_side: dict[tuple[str, Side], dict[str, None]] = {}
+        self._listeners: list[Callable[[TrackedOrder], None]] = []
+
+    def add_listener(self, listener: Callable[[TrackedOrder], None]) -> None:
+        """
+        Register a callback invoked with every order whose state changed.
+
+        Listeners run on the thread that applied the update (the WebSocket thread for
+        ``on_message``), outside the tracker lock, and must not block.
+
+        Args:
+            listener: Callback receiving the changed order.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[TrackedOrder], None]) -> None:
+        """
+        Unregister a callback added with ``add_listener``.
+
+        Args:
+            listener: The callback to remove.
+        """
+        self._listeners.remove(listener)
+
+    def on_message(self, _ws: Any, message: Any) -> None:
+        """
+        Apply a WebSocket message; messages other than order changes are ignored.
+
+        Args:
+            _ws: The WebSocket connection (unused, for ``ReyaSocket`` compatibility).
+            message: Typed WebSocket message.
+        """
+        if isinstance(message, OrderChangeUpdatePayload):
+            self.apply_order_changes(message)
+
+    def apply_order_changes(self, payload: OrderChangeUpdatePayload) -> list[TrackedOrder]:
+        """
+        Apply an ``orderChanges`` payload.
+
+        Args:
+            payload: Order change update from the WebSocket.
+
+        Returns:
+            Orders whose state changed.
+        """
+        changed = []
+        for order in payload.data:
+            tracked = self.apply(order, source="ws")
+            if tracked is not None:
+                changed.append(tracked)
+        return changed
+
+    def apply(self, order: Union[Order, AsyncOrder], source: str = "ws") -> Optional[TrackedOrder]:
+        """
+        Apply a single order update from either the WebSocket or REST models.
+
+        Updates older than the tracked state, and non-terminal updates for orders that
+        already closed, are ignored.
+
+        Args:
+            order: The order update.
+            source: Where the update came from, recorded in the transition history.
+
+        Returns:
+            The tracked order if its state changed, None otherwise.
+        """
+        tracked = self._apply(order, source)
+        if tracked is not None:
+            self._notify(tracked)
+        return tracked
+
+    def _apply(self, order: Union[Order, AsyncOrder], source: str) -> Optional[TrackedOrder]:
+        """Apply an order update without notifying listeners."""
+        if self.account_id is not None and order.account_id != self.account_id:
+            return None
+
+        status = OrderStatus(order.status.value)
+        cum_qty = Decimal(order.cum_qty) if order.cum_qty is not None else Decimal(0)
+
+        with self._lock:
+            tracked = self._open.get(order.order_id) or self._closed.get(order.order_id)
+
+            # Link the client order ID when the payload reports it
+            reported_client_order_id = (order.additional_properties or {}).get("clientOrderId")
+            if reported_client_order_id is not None and order.order_id not in self._client_order_id_by_order_id:
+                self._by_client_order_id[int(reported_client_order_id)] = order.order_id
+                self._client_order_id_by_order_id[order.order_id] = int(reported_client_order_id)
+                if tracked is not None:
+                    tracked.client_order_id = int(reported_client_order_id)
+
+            if tracked is None:
+                tracked = TrackedOrder(
+                    order_id=order.order_id,
+                    symbol=order.symbol,
+                    account_id=order.account_id,
+                    side=Side(order.side.value),
+                    limit_px=order.limit_px,
+                    qty=order.qty,
+                    status=status,
+                    cum_qty=cum_qty,
+                    created_at=order.created_at,
+                    last_update_at=order.last_update_at,
+                    client_order_id=self._client_order_id_by_order_id.get(order.order_id),
+                )
+                tracked.transitions.append(OrderTransition(status, cum_qty, cum_qty, order.last_update_at, source))
+                self._insert(tracked)
+                return tracked
+
+            if order.last_update_at < tracked.last_update_at:
+                return None
+            if not tracked.is_open and status not in TERMINAL_STATUSES:
+                return None
+            if status == tracked.status and cum_qty == tracked.cum_qty:
+                tracked.last_update_at = order.last_update_at
+                return None
+
+            fill_qty = max(cum_qty - tracked.cum_qty, Decimal(0))
+            was_open = tracked.is_open
+            tracked.status = status
+            tracked.cum_qty = max(cum_qty, tracked.cum_qty)
+            tracked.last_update_at = order.last_update_at
+            if order.qty is not None:
+                tracked.qty = order.qty
+            tracked.transitions.append(OrderTransition(status, tracked.cum_qty, fill_qty, order.last_update_at, source))
+
+            if was_open and not tracked.is_open:
+                self._close(tracked)
+            return tracked
+
+    def register_response(
+        self, response: CreateOrderResponse, request: Optional[CreateOrderRequest] = None
+    ) -> Optional[TrackedOrder]:
+        """
+        Record the outcome of an order submission.
+
+        Links the client order ID to the order ID. When the request is given, the order
+        is also seeded from it so it can be looked up before its first WebSocket update
+        arrives; the seed has ``last_update_at=0`` so any exchange update supersedes it.
+        IOC orders, which complete within the request and have no order ID, are only
+        tracked when they carry a client order ID.
+
+        Args:
+            response: Response returned by the create order endpoint.
+            request: The request that produced the response.
+
+        Returns:
+            The tracked order if it was seeded, None otherwise.
+        """
+        if response.order_id is not None and response.client_order_id is not None:
+            self.register_client_order_id(response.client_order_id, response.order_id)
+
+        if request is None or (response.order_id is None and response.client_order_id is None):
+            return None
+        if self.account_id is not None and request.account_id != self.account_id:
+            return None
+
+        cum_qty = Decimal(response.cum_qty) if response.cum_qty is not None else Decimal(0)
+        with self._lock:
+            if response.order_id is not None and self.get(response.order_id) is not None:
+                return None
+            tracked = TrackedOrder(
+                order_id=response.order_id,
+                symbol=request.symbol or "",
+                account_id=request.account_id,
+                side=Side.B if request.is_buy else Side.A,
+                limit_px=request.limit_px,
+                qty=request.qty,
+                status=OrderStatus(response.status.value),
+                cum_qty=cum_qty,
+                created_at=int(time.time() * 1000),
+                last_update_at=0,
+                client_order_id=response.client_order_id,
+            )
+            tracked.transitions.append(OrderTransition(tracked.status, cum_qty, cum_qty, 0, "response"))
+            if tracked.order_id is not None:
+                self._insert(tracked)
+            elif tracked.client_order_id is not None:
+                self._closed_without_id[tracked.client_order_id] = tracked
+                while len(self._closed_without_id) > self.max_closed_orders:
+                    self._closed_without_id.popitem(last=False)
+
+        self._notify(tracked)
+        return tracked
+
+    def register_client_order_id(self, client_order_id: int, order_id: str) -> None:
+        """
+        Link a client order ID to an order ID.
+
+        Order updates do not carry the client order ID, so the link is recorded here
+        and applied when the order is (or already was) seen.
+
+        Args:
+            client_order_id: Client-assigned order ID.
+            order_id: Exchange-assigned order ID.
+        """
+        with self._lock:
+            self._by_client_order_id[client_order_id] = order_id
+            self._client_order_id_by_order_id[order_id] = client_order_id
+            tracked = self._open.get(order_id) or self._closed.get(order_id)
+            if tracked is None or tracked.client_order_id == client_order_id:
+                return
+            tracked.client_order_id = client_order_id
+        self._notify(tracked)
+
+    def get(self, order_id: str) -> Optional[TrackedOrder]:
+        """
+        Get an order (open or recently closed) by order ID.
+
+        Args:
+            order_id: Exchange-assigned order ID.
+
+        Returns:
+            The tracked order, or None if unknown.
+        """
+        with self._lock:
+            return self._open.get(order_id) or self._closed.get(order_id)
+
+    def get_by_client_order_id(self, client_order_id: int) -> Optional[TrackedOrder]:
+        """
+        Get an order (open or recently closed) by client order ID.
+
+        Args:
+            client_order_id: Client-assigned order ID.
+
+        Returns:
+            The tracked order, or None if unknown.
+        """
+        with self._lock:
+            order_id = self._by_client_order_id.get(client_order_id)
+            if order_id is not None:
+                return self.get(order_id)
+            return self._closed_without_id.get(client_order_id)
+
+    def open_orders(self, symbol: Optional[str] = None, side: Optional[Side] = None) -> list[TrackedOrder]:
+        """
+        Get open orders, optionally filtered by symbol and side.
+
+        Args:
+            symbol: Only return orders for this symbol.
+            side: Only return orders on this side. Requires symbol.
+
+        Returns:
+            Open orders in the order they were first seen.
+
+        Raises:
+            ValueError: If side is given without symbol
+        """
+        with self._lock:
+            if symbol is None:
+                if side is not None:
+                    raise ValueError("side filter requires a symbol")
+                return list(self._open.values())
+            sides = [side] if side is not None else [Side.B, Side.A]
+            return [self._open[order_id] for s in sides for order_id in self._by_symbol_side.get((symbol, s), {})]
+
+    def find_unlinked(
+        self,
+        symbol: str,
+        account_id: int,
+        side: Side,
+        limit_px: str,
+        qty: Optional[str],
+        created_after: int,
+    ) -> Optional[TrackedOrder]:
+        """
+        Find the newest order with no client order ID that matches the given fields.
+
+        Order updates do not always carry the client order ID, so this is how an order
+        whose create response was lost is recognised once it is known to have landed.
+        Of several matches the newest is taken, as older ones are more likely other
+        orders placed at the same price. Prices and quantities are compared
+        numerically.
+
+        Args:
+            symbol: Trading symbol.
+            account_id: Account ID.
+            side: Order side.
+            limit_px: Limit price.
+            qty: Order quantity.
+            created_after: Only consider orders created at or after this time (ms).
+
+        Returns:
+            The matching tracked order, or None.
+        """
+        px = Decimal(limit_px)
+        size = Decimal(qty) if qty is not None else None
+        with self._lock:
+            open_ids = self._by_symbol_side.get((symbol, side), {})
+            candidates = [self._open[order_id] for order_id in open_ids] + list(self._closed.values())
+            matches = [
+                tracked
+                for tracked in candidates
+                if tracked.client_order_id is None
+                and tracked.symbol == symbol
+                and tracked.account_id == account_id
+                and tracked.side == side
+                and tracked.created_at >= created_after
+                and Decimal(tracked.limit_px) == px
+                and (Decimal(tracked.qty) if tracked.qty is not None else None) == size
+            ]
+        return max(matches, key=lambda tracked: tracked.created_at, default=None)
+
+    @property
+    def open_count(self) -> int:
+        """Number of open orders."""
+        return len(self._open)
+
+    async def reconcile(self, client: "ReyaTradingClient") -> ReconcileResult:
+        """
+        Diff the tracker against the REST open orders and correct any drift.
+
+        Only orders whose (status, cum_qty, last_update_at) differ from the tracked state
+        are re-applied. Tracked open orders missing from the snapshot are closed as FILLED
+        if fully executed and CANCELLED otherwise, unless they were updated within
+        ``reconcile_grace_ms`` of the snapshot.
+
+        Args:
+            client: Client used to fetch the open orders.
+
+        Returns:
+            The differences that were corrected.
+        """
+        snapshot_started_at = int(time.time() * 1000)
+        orders = await client.get_open_orders()
+
+        added: list[str] = []
+        updated: list[str] = []
+        removed: list[str] = []
+        notifications: list[TrackedOrder] = []
+        with self._lock:
+            seen: set[str] = set()
+            for order in orders:
+                if self.account_id is not None and order.account_id != self.account_id:
+                    continue
+                seen.add(order.order_id)
+                tracked = self._open.get(order.order_id)
+                cum_qty = Decimal(order.cum_qty) if order.cum_qty is not None else Decimal(0)
+                if (
+                    tracked is not None
+                    and tracked.status == OrderStatus(order.status.value)
+                    and tracked.cum_qty == cum_qty
+                    and tracked.last_update_at >= order.last_update_at
+                ):
+                    continue
+                is_new = tracked is None and order.order_id not in self._closed
+                changed = self._apply(order, source="rest")
+                if changed is not None:
+                    notifications.append(changed)
+                    (added if is_new else updated).append(order.order_id)
+
+            cutoff = snapshot_started_at - self.reconcile_grace_ms
+            for order_id, tracked in list(self._open.items()):
+                if order_id in seen or tracked.last_update_at > cutoff:
+                    continue
+                filled = tracked.qty is not None and tracked.cum_qty >= Decimal(tracked.qty)
+                status = OrderStatus.FILLED if filled else OrderStatus.CANCELLED
+                tracked.status = status
+                tracked.transitions.append(
+                    OrderTransition(status, tracked.cum_qty, Decimal(0), snapshot_started_at, "reconcile")
+                )
+                self._close(tracked)
+                notifications.append(tracked)
+                removed.append(order_id)
+
+        for tracked in notifications:
+            self._notify(tracked)
+
+        result = ReconcileResult(added=added, updated=updated, removed=removed)
+        if result.drifted:
+            logger.warning(
+                f"Order tracker drift corrected: {len(added)} added, {len(updated)} updated, {len(removed)} removed"
+            )
+        return result
+
+    async def reconcile_periodically(self, client: "ReyaTradingClient", interval: float = 30.0) -> None:
+        """
+        Reconcile against REST every ``interval`` seconds until cancelled.
+
+        Intended to be run as a background task, e.g.
+        ``asyncio.create_task(tracker.reconcile_periodically(client))``.
+
+        Args:
+            client: Client used to fetch the open orders.
+            interval: Seconds between reconciliations.
+        """
+        while True:
+            try:
+                await self.reconcile(client)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Order tracker reconciliation failed: {e}")
+            await asyncio.sleep(interval)
+
+    def _notify(self, tracked: TrackedOrder) -> None:
+        """Invoke listeners for a changed order. Must be called without holding the lock."""
+        for listener in list(self._listeners):
+            try:
+                listener(tracked)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Order tracker listener failed: {e}")
+
+    def _insert(self, tracked: TrackedOrder) -> None:
+        """Index a newly seen order. Caller must hold the lock."""
+        assert tracked.order_id is not None
+        if tracked.is_open:
+            self._open[tracked.order_id] = tracked
+            self._by_symbol_side.setdefault((tracked.symbol, tracked.side), {})[tracked.order_id] = None
+        else:
+            self._remember_closed(tracked)
+
+    def _close(self, tracked: TrackedOrder) -> None:
+        """Move an order from the open indexes to the closed cache. Caller must hold the lock."""
+        assert tracked.order_id is not None
+        self._open.pop(tracked.order_id, None)
+        key = (tracked.symbol, tracked.side)
+        orders = self._by_symbol_side.get(key)
+        if orders is not None:
+            orders.pop(tracked.order_id, None)
+            if not orders:
+                del self._by_symbol_side[key]
+        self._remember_closed(tracked)
+
+    def _remember_closed(self, tracked: TrackedOrder) -> None:
+        """Add an order to the bounded closed cache. Caller must hold the lock."""
+        assert tracked.order_id is not None
+        self._closed[tracked.order_id] = tracked
+        while len(self._closed) > self.max_closed_orders:
+            evicted_id, _ = self._closed.popitem(last=False)
+            client_order_id = self._client_order_id_by_order_id.pop(evicted_id, None)
+            if client_order_id is not None and self._by_client_order_id.get(client_order_id) == evicted_id:
+                del self._by_client_order_id[client_order_id]
@@ -0,0 +1,319 @@
+"""
+Presigned Pool - Spot limit orders signed ahead of time at candidate prices and sizes.
+
+Signing is the slowest step of sending an order. ``PresignedOrderPool`` signs a ladder
+of candidate orders while the strategy is idle and hands out a ready request in O(1)
+when it is needed, so only encoding and sending remain on the critical path.
+
+Spot nonces must increase per account, so pooled orders are signed with nonces from a
+range reserved ahead of the wallet's nonce stream: the range starts one TTL ahead of the
+current microsecond timestamp, which ordinary nonces only reach once the pooled orders
+have expired. Using a pooled order moves the wallet's nonce past it (``consume_nonce``),
+which invalidates pooled orders with lower nonces. Nonces are therefore assigned from
+the innermost level outwards, so taking inner levels first leaves outer ones usable.
+"""
+
+from typing import Iterable, Optional, Union
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, replace
+from decimal import Decimal
+
+from sdk.open_api.models.create_order_request import CreateOrderRequest
+from sdk.open_api.models.create_order_response import CreateOrderResponse
+from sdk.open_api.models.time_in_force import TimeInForce
+from sdk.reya_rest_api.client import DEFAULT_DEADLINE_S, GTC_DEADLINE_S, ReyaTradingClient
+from sdk.reya_rest_api.models.fixed_point import FixedPoint, Px, Qty, to_wad
+from sdk.reya_rest_api.models.orders import LimitOrderParameters
+
+logger = logging.getLogger("reya_trading.presigned_pool")
+
+# Lifetime of pooled GTC orders; IOC orders live at most DEFAULT_DEADLINE_S
+DEFAULT_PRESIGN_TTL_S = 60
+
+Number = Union[str, int, float, Decimal, FixedPoint]
+
+# (is_buy, price units, quantity units)
+_Key = tuple[bool, int, int]
+
+
+@dataclass(frozen=True)
+class PresignedOrder:
+    """A signed order request with the parameters it was built from."""
+
+    params: LimitOrderParameters
+    request: CreateOrderRequest
+    nonce: int
+    deadline: int  # Unix timestamp in seconds
+
+
+@dataclass
+class PresignedPoolMetrics:
+    """Counters of a presigned order pool."""
+
+    signed: int = 0  # Orders signed into the pool
+    hits: int = 0  # Orders handed out ready to send
+    misses: int = 0  # Requests for an order the pool did not have (signed on demand by submit)
+    expired: int = 0  # Orders evicted near their deadline
+    nonce_stale: int = 0  # Orders evicted because a greater nonce was used
+    out_of_range: int = 0  # Orders evicted because the reference price moved away
+
+
+class PresignedOrderPool:
+    """
+    Pool of pre-signed spot limit orders for one market and time in force.
+
+    Not thread-safe; use it from the event loop the client runs on.
+
+    Example:
+        pool = PresignedOrderPool(client, "WETHRUSD")
+        pool.set_levels(bid_prices=[px - i * step for i in range(5)],
+                        ask_prices=[px + i * step for i in range(1, 6)], sizes=["0.01", "0.1"])
+        asyncio.create_task(pool.run())  # Signs while idle, re-signs before deadlines
+        ...
+        response = await pool.submit(True, bid_price, "0.01")  # No signing if pooled
+    """
+
+    def __init__(
+        self,
+        client: ReyaTradingClient,
+        symbol: str,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        ttl: Optional[int] = None,
+        refresh_margin: Optional[int] = None,
+        max_deviation: Optional[float] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            client: Started trading client whose signer and nonces are used.
+            symbol: Spot market symbol.
+            time_in_force: GTC or IOC.
+            ttl: Lifetime in seconds of pooled orders (defaults to DEFAULT_PRESIGN_TTL_S for
+                 GTC and DEFAULT_DEADLINE_S for IOC; at most GTC_DEADLINE_S or DEFAULT_DEADLINE_S).
+            refresh_margin: Seconds before their deadline at which orders are evicted and
+                            re-signed (defaults to a quarter of the TTL, at least one second).
+            max_deviation: Orders priced further than this fraction from the reference price
+                           (``set_reference_price``) are neither kept nor signed.
+
+        Raises:
+            ValueError: If the symbol is not a spot market or the TTL is out of bounds.
+        """
+        if symbol.upper().endswith("PERP"):
+            raise ValueError(f"Pre-signed orders are only supported for spot markets, got '{symbol}'")
+        max_ttl = DEFAULT_DEADLINE_S if time_in_force == TimeInForce.IOC else GTC_DEADLINE_S
+        if ttl is None:
+            ttl = min(DEFAULT_PRESIGN_TTL_S, max_ttl)
+        if not 0 < ttl <= max_ttl:
+            raise ValueError(f"ttl must be between 1 and {max_ttl} seconds for {time_in_force.value} orders, got {ttl}")
+        if refresh_margin is None:
+            refresh_margin = max(1, ttl // 4)
+        if not 0 <= refresh_margin < ttl:
+            raise ValueError(f"refresh_margin must be between 0 and the ttl ({ttl}), got {refresh_margin}")
+
+        self._client = client
+        self.symbol = symbol
+        self.time_in_force = time_in_force
+        self.ttl = ttl
+        self.refresh_margin = refresh_margin
+        self.max_deviation = max_deviation
+
+        # Candidate orders in nonce order (innermost level first)
+        self._ladder: list[_Key] = []
+        self._wanted: set[_Key] = set()
+        self._entries: dict[_Key, PresignedOrder] = {}
+        self._reference_units: Optional[int] = None
+        self._next_nonce = 0
+        self._metrics = PresignedPoolMetrics()
+
+    @property
+    def metrics(self) -> PresignedPoolMetrics:
+        """Get a snapshot of the pool counters."""
+        return replace(self._metrics)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set_levels(self, bid_prices: Iterable[Number], ask_prices: Iterable[Number], sizes: Iterable[Number]) -> None:
+        """
+        Set the candidate orders: every size at every bid and ask price.
+
+        Pooled orders that are no longer candidates are dropped on the next refresh.
+
+        Args:
+            bid_prices: Buy prices, innermost (closest to the market) first.
+            ask_prices: Sell prices, innermost first.
+            sizes: Base quantities, each pooled at every price.
+        """
+        bids = [to_wad(px) for px in bid_prices]
+        asks = [to_wad(px) for px in ask_prices]
+        qtys = [to_wad(qty) for qty in sizes]
+        ladder: list[_Key] = []
+        for level in range(max(len(bids), len(asks))):
+            for is_buy, prices in ((True, bids), (False, asks)):
+                if level < len(prices):
+                    ladder.extend((is_buy, prices[level], qty) for qty in qtys)
+        self._ladder = list(dict.fromkeys(ladder))
+        self._wanted = set(self._ladder)
+
+    def set_reference_price(self, price: Number) -> int:
+        """
+        Set the price orders are kept around, evicting orders further than max_deviation from it.
+
+        Args:
+            price: Reference (e.g. mid or oracle) price.
+
+        Returns:
+            Number of orders evicted.
+        """
+        self._reference_units = to_wad(price)
+        stale = [key for key in self._entries if not self._in_range(key[1])]
+        for key in stale:
+            del self._entries[key]
+        self._metrics.out_of_range += len(stale)
+        return len(stale)
+
+    def take(
+        self, is_buy: bool, price: Number, qty: Number, client_order_id: Optional[int] = None
+    ) -> Optional[PresignedOrder]:
+        """
+        Remove a pooled order and reserve its nonce.
+
+        Args:
+            is_buy: Side.
+            price: Limit price.
+            qty: Base quantity.
+            client_order_id: Client order ID to attach (it is not part of the signature).
+
+        Returns:
+            The order ready to send (e.g. with ``client.send_order_request``), or None if
+            the pool has no usable order at that price and size.
+        """
+        entry = self._entries.pop((is_buy, to_wad(price), to_wad(qty)), None)
+        if entry is None:
+            self._metrics.misses += 1
+            return None
+        if entry.deadline - self.refresh_margin <= time.time():
+            self._metrics.expired += 1
+            self._metrics.misses += 1
+            return None
+        if entry.nonce <= self._client.last_nonce:
+            self._metrics.nonce_stale += 1
+            self._metrics.misses += 1
+            return None
+
+        self._client.consume_nonce(entry.nonce)
+        self._metrics.hits += 1
+        if client_order_id is not None:
+            entry.request.client_order_id = client_order_id
+            entry = replace(entry, params=replace(entry.params, client_order_id=client_order_id))
+        return entry
+
+    async def submit(
+        self, is_buy: bool, price: Number, qty: Number, client_order_id: Optional[int] = None
+    ) -> CreateOrderResponse:
+        """
+        Send a pooled order, signing it on demand if the pool does not have it.
+
+        Args:
+            is_buy: Side.
+            price: Limit price.
+            qty: Base quantity.
+            client_order_id: Client order ID.
+
+        Returns:
+            API response for the order creation.
+        """
+        entry = self.take(is_buy, price, qty, client_order_id)
+        if entry is not None:
+            return await self._client.send_order_request(entry.request, entry.params)
+        params = self._params((is_buy, to_wad(price), to_wad(qty)), client_order_id)
+        return await self._client.create_limit_order(params)
+
+    def refresh(self, max_signatures: Optional[int] = None) -> int:
+        """
+        Evict unusable orders and sign missing candidates.
+
+        Orders are evicted when they are within refresh_margin of their deadline, when a
+        nonce at least as great has been used, when they are out of range of the
+        reference price, or when they are no longer candidates.
+
+        Args:
+            max_signatures: Maximum number of orders to sign (all missing ones if None).
+
+        Returns:
+            Number of orders signed.
+        """
+        now = time.time()
+        last_nonce = self._client.last_nonce
+        metrics = self._metrics
+        for key, entry in list(self._entries.items()):
+            if key in self._wanted:
+                if entry.deadline - self.refresh_margin <= now:
+                    metrics.expired += 1
+                elif entry.nonce <= last_nonce:
+                    metrics.nonce_stale += 1
+                elif not self._in_range(key[1]):
+                    metrics.out_of_range += 1
+                else:
+                    continue
+            del self._entries[key]
+
+        missing = [key for key in self._ladder if key not in self._entries and self._in_range(key[1])]
+        if max_signatures is not None:
+            missing = missing[:max_signatures]
+        if not missing:
+            return 0
+
+        # Reserve nonces ahead of the wallet's stream, which reaches them once these orders expire
+        nonce = max(self._next_nonce, last_nonce + 1, int(now * 1_000_000) + self.ttl * 1_000_000)
+        deadline = int(now) + self.ttl
+        params = [self._params(key, None) for key in missing]
+        nonces = list(range(nonce, nonce + len(missing)))
+        requests = self._client.build_limit_order_requests(params, nonces, deadline)  # One signing batch
+        for key, order_params, request, order_nonce in zip(missing, params, requests, nonces):
+            self._entries[key] = PresignedOrder(
+                params=order_params, request=request, nonce=order_nonce, deadline=deadline
+            )
+        self._next_nonce = nonce + len(missing)
+        metrics.signed += len(missing)
+        return len(missing)
+
+    async def run(self, interval: float = 1.0, batch_size: int = 1) -> None:
+        """
+        Keep the pool filled until cancelled, signing small batches between other tasks.
+
+        Run as a background task, e.g. ``asyncio.create_task(pool.run())``.
+
+        Args:
+            interval: Seconds between checks once the pool is full.
+            batch_size: Orders signed per batch; raise it (e.g. to a few per core) when the
+                        client signs with a ProcessPoolSignerBackend or NativeSignerBackend.
+        """
+        while True:
+            try:
+                while self.refresh(max_signatures=batch_size):
+                    await asyncio.sleep(0)  # Let latency-sensitive tasks run between batches
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Failed to refresh pre-signed orders for {self.symbol}: {e}")
+            await asyncio.sleep(interval)
+
+    def _in_range(self, px_units: int) -> bool:
+        reference = self._reference_units
+        if reference is None or self.max_deviation is None:
+            return True
+        return abs(px_units - reference) <= reference * self.max_deviation
+
+    def _params(self, key: _Key, client_order_id: Optional[int]) -> LimitOrderParameters:
+        is_buy, px_units, qty_units = key
+        return LimitOrderParameters(
+            symbol=self.symbol,
+            is_buy=is_buy,
+            limit_px=Px.from_units(px_units),
+            qty=Qty.from_units(qty_units),
+            time_in_force=self.time_in_force,
+            client_order_id=client_order_id,
+        )
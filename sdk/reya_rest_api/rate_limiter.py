@@ -0,0 +1,313 @@
+"""
+Rate Limiter - Client-side, priority-aware token bucket scheduling for API requests.
+
+Requests wait in priority lanes (cancels, then mass cancels, then creates, then
+queries) and are released as tokens become available in their endpoint/account
+bucket and in the optional global bucket, so risk-reducing requests are never
+stuck behind a burst of order creation.
+"""
+
+from typing import AsyncIterator, Optional
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from sdk.reya_rest_api.constants.enums import RequestPriority
+
+logger = logging.getLogger("reya_trading.rate_limiter")
+
+# Endpoint names used for per-endpoint budgets
+CREATE_ORDER_ENDPOINT = "create_order"
+CANCEL_ORDER_ENDPOINT = "cancel_order"
+CANCEL_ALL_ENDPOINT = "cancel_all"
+QUERY_ENDPOINT = "query"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket budget: `rate` requests per second with bursts of up to `burst` requests."""
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self):
+        if self.rate <= 0:
+            raise ValueError(f"rate must be positive, got {self.rate}")
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
+
+
+@dataclass(frozen=True)
+class LaneMetrics:
+    """Queue statistics for one priority lane."""
+
+    requests: int
+    queued: int
+    total_wait_s: float
+    max_wait_s: float
+
+    @property
+    def mean_wait_s(self) -> float:
+        """Mean time spent queued per dispatched request."""
+        return self.total_wait_s / self.requests if self.requests else 0.0
+
+
+class _TokenBucket:
+    def __init__(self, limit: RateLimit, now: float):
+        self.limit = limit
+        self.tokens = float(limit.burst)
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(float(self.limit.burst), self.tokens + (now - self.updated) * self.limit.rate)
+        self.updated = now
+
+    def available(self) -> bool:
+        return self.tokens >= 1.0
+
+    def take(self) -> None:
+        self.tokens -= 1.0
+
+    def seconds_until_available(self) -> float:
+        return max(0.0, (1.0 - self.tokens) / self.limit.rate)
+
+
+@dataclass
+class _LaneCounters:
+    requests: int = 0
+    queued: int = 0
+    total_wait_s: float = 0.0
+    max_wait_s: float = 0.0
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    endpoint: str = field(compare=False)
+    account_id: Optional[int] = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: "asyncio.Future[None]" = field(compare=False)
+
+
+class RateLimiter:
+    """
+    Priority-aware token bucket scheduler for one event loop.
+
+    Each request takes one token from the bucket of its (endpoint, account) pair and
+    one from the global bucket, if configured. Waiting requests are dispatched in
+    priority order, FIFO within a lane. A request whose own bucket is empty does not
+    hold up requests for other endpoints or accounts, while the global bucket and
+    the in-flight limit are always granted strictly by priority.
+
+    Example:
+        limiter = RateLimiter(
+            limits={"create_order": RateLimit(rate=20, burst=40)},
+            global_limit=RateLimit(rate=50, burst=50),
+        )
+        async with limiter.acquire("create_order", RequestPriority.CREATE, account_id):
+            await send()
+    """
+
+    def __init__(
+        self,
+        limits: Optional[dict[str, RateLimit]] = None,
+        account_limits: Optional[dict[int, dict[str, RateLimit]]] = None,
+        global_limit: Optional[RateLimit] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            limits: Budget per endpoint, applied separately to each account. Endpoints
+                without a budget are only subject to the global limits.
+            account_limits: Per-account overrides of `limits`, keyed by account ID.
+            global_limit: Budget shared by all requests (e.g. the server's per-client limit).
+            max_in_flight: Maximum number of requests sent but not yet completed.
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+
+        self._limits = dict(limits or {})
+        self._account_limits = {account_id: dict(budgets) for account_id, budgets in (account_limits or {}).items()}
+        self._max_in_flight = max_in_flight
+
+        now = time.monotonic()
+        self._global_bucket = _TokenBucket(global_limit, now) if global_limit is not None else None
+        self._buckets: dict[tuple[str, Optional[int]], Optional[_TokenBucket]] = {}
+        self._in_flight = 0
+
+        self._queue: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lanes = {priority: _LaneCounters() for priority in RequestPriority}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    def set_limit(self, endpoint: str, limit: Optional[RateLimit], account_id: Optional[int] = None) -> None:
+        """
+        Set or remove (with None) the budget of an endpoint, for all accounts or for one account.
+
+        Existing buckets are reset to the new budget.
+        """
+        if account_id is None:
+            if limit is None:
+                self._limits.pop(endpoint, None)
+            else:
+                self._limits[endpoint] = limit
+            stale = [key for key in self._buckets if key[0] == endpoint]
+        else:
+            budgets = self._account_limits.setdefault(account_id, {})
+            if limit is None:
+                budgets.pop(endpoint, None)
+            else:
+                budgets[endpoint] = limit
+            stale = [(endpoint, account_id)]
+        for key in stale:
+            self._buckets.pop(key, None)
+        self._schedule_dispatch()
+
+    def metrics(self) -> dict[RequestPriority, LaneMetrics]:
+        """Snapshot of queue statistics per priority lane."""
+        return {
+            priority: LaneMetrics(
+                requests=counters.requests,
+                queued=counters.queued,
+                total_wait_s=counters.total_wait_s,
+                max_wait_s=counters.max_wait_s,
+            )
+            for priority, counters in self._lanes.items()
+        }
+
+    def reset_metrics(self) -> None:
+        """Reset the dispatched-request counters; queue depths are kept."""
+        for counters in self._lanes.values():
+            counters.requests = 0
+            counters.total_wait_s = 0.0
+            counters.max_wait_s = 0.0
+
+    @asynccontextmanager
+    async def acquire(
+        self, endpoint: str, priority: RequestPriority, account_id: Optional[int] = None
+    ) -> AsyncIterator[None]:
+        """
+        Wait for a slot, then hold it for the duration of the block.
+
+        Args:
+            endpoint: Endpoint name used to select the budget
+            priority: Lane the request waits in
+            account_id: Account the request acts on (None for wallet-level queries)
+        """
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            priority=int(priority),
+            seq=next(self._seq),
+            endpoint=endpoint,
+            account_id=account_id,
+            enqueued_at=time.monotonic(),
+            future=loop.create_future(),
+        )
+        heapq.heappush(self._queue, waiter)
+        self._lanes[priority].queued += 1
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just before the cancellation was delivered
+                self._release()
+            else:
+                self._lanes[priority].queued -= 1
+                self._dispatch()
+            raise
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _bucket(self, endpoint: str, account_id: Optional[int], now: float) -> Optional[_TokenBucket]:
+        key = (endpoint, account_id)
+        if key not in self._buckets:
+            limit = self._account_limits.get(account_id, {}).get(endpoint) if account_id is not None else None
+            if limit is None:
+                limit = self._limits.get(endpoint)
+            self._buckets[key] = _TokenBucket(limit, now) if limit is not None else None
+        return self._buckets[key]
+
+    def _schedule_dispatch(self) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant slots to waiters in priority order and arm a timer for the next refill."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        now = time.monotonic()
+        if self._global_bucket is not None:
+            self._global_bucket.refill(now)
+
+        retry_in: Optional[float] = None
+        skipped: list[_Waiter] = []
+        while self._queue:
+            waiter = self._queue[0]
+            if waiter.future.done():
+                # Cancelled while queued
+                heapq.heappop(self._queue)
+                continue
+            if self._max_in_flight is not None and self._in_flight >= self._max_in_flight:
+                break
+            if self._global_bucket is not None and not self._global_bucket.available():
+                retry_in = self._global_bucket.seconds_until_available()
+                break
+
+            heapq.heappop(self._queue)
+            bucket = self._bucket(waiter.endpoint, waiter.account_id, now)
+            if bucket is not None:
+                bucket.refill(now)
+                if not bucket.available():
+                    wait = bucket.seconds_until_available()
+                    retry_in = wait if retry_in is None else min(retry_in, wait)
+                    skipped.append(waiter)
+                    continue
+                bucket.take()
+            if self._global_bucket is not None:
+                self._global_bucket.take()
+            self._grant(waiter, now)
+
+        for waiter in skipped:
+            heapq.heappush(self._queue, waiter)
+
+        if retry_in is not None and self._queue:
+            self._timer = asyncio.get_running_loop().call_later(retry_in, self._dispatch)
+
+    def _grant(self, waiter: _Waiter, now: float) -> None:
+        self._in_flight += 1
+        wait = now - waiter.enqueued_at
+        counters = self._lanes[RequestPriority(waiter.priority)]
+        counters.queued -= 1
+        counters.requests += 1
+        counters.total_wait_s += wait
+        counters.max_wait_s = max(counters.max_wait_s, wait)
+        if wait > 1.0:
+            logger.debug(f"{waiter.endpoint} request waited {wait:.3f}s for a rate limit slot")
+        waiter.future.set_result(None)
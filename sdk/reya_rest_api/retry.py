@@ -0,0 +1,76 @@
+"""
+Retry - Policy and helpers for retrying order submissions after transport failures.
+
+A create order request that fails in transport may or may not have reached the
+exchange. Retries resend the exact same signed payload, whose nonce the server
+accepts at most once, so a resend rejected for its nonce means an earlier attempt
+landed.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+import aiohttp
+
+from sdk.open_api.exceptions import ApiException
+
+# Errors raised when the request or its response was lost on the wire
+TRANSPORT_ERRORS = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+    ConnectionError,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry policy for order submissions.
+
+    Attributes:
+        max_attempts: Total number of sends, including the first one.
+        backoff_s: Delay before the first retry; doubled for each further retry.
+        max_backoff_s: Upper bound of the retry delay.
+        retry_statuses: HTTP statuses treated like transport errors (gateway failures).
+    """
+
+    max_attempts: int = 3
+    backoff_s: float = 0.05
+    max_backoff_s: float = 0.5
+    retry_statuses: frozenset[int] = field(default_factory=lambda: frozenset({502, 503, 504}))
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {self.max_attempts}")
+
+    def delay(self, retry: int) -> float:
+        """Delay in seconds before a retry, counting retries from 0."""
+        return min(self.max_backoff_s, self.backoff_s * (1 << retry))
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Whether an error means the request may not have reached the exchange."""
+        if isinstance(error, ApiException):
+            return error.status in self.retry_statuses
+        return isinstance(error, TRANSPORT_ERRORS)
+
+
+@dataclass
+class RetryMetrics:
+    """Counters of order submission retries."""
+
+    submissions: int = 0  # Orders submitted with the retry policy
+    transport_errors: int = 0  # Attempts that failed with a retryable error
+    retries: int = 0  # Resends of an already-sent payload
+    recovered: int = 0  # Orders accepted on a retry
+    confirmed_landed: int = 0  # Failed attempts found on the exchange after their resend was rejected for its nonce
+    unknown_outcomes: int = 0  # Orders whose outcome could not be determined
+
+
+def is_nonce_rejection(error: BaseException) -> bool:
+    """Whether the server rejected a request because of its nonce."""
+    return (
+        isinstance(error, ApiException)
+        and error.status == 400
+        and "nonce" in str(error.body or error.reason or "").lower()
+    )
@@ -0,0 +1,788 @@
+"""
+Risk Engine - Client-side pre-trade checks against an incremental margin state.
+
+Market definitions, oracle prices, positions, balances and open orders are mirrored
+per account from REST snapshots and WebSocket updates. Each update only re-values
+the market it touches, adjusting the account's margin totals by the difference, so
+checking an order is a few float operations instead of a pass over the account.
+Orders the exchange would reject (or cancel without effect) are refused locally with
+a reason, before they are signed or use any rate budget.
+
+Margin model (a conservative approximation of the exchange's):
+    - Collateral is the account's balances valued with ``collateral_prices``
+      (rUSD at 1 by default); other assets do not count.
+    - Margin balance is collateral plus unrealized PnL at oracle prices.
+    - The initial margin of a perp market is its ``initial_margin_parameter`` times the
+      oracle notional of the worst-case position: the larger of the position with all
+      open buys filled and the position with all open sells filled.
+    - IOC orders are charged the worst execution against the oracle price at their limit.
+    - Orders that do not increase the worst-case position are never refused for margin.
+
+Ladder checks require the optional ``numpy`` dependency
+(``pip install reya-python-sdk[analytics]``).
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Optional, Union
+
+import asyncio
+import logging
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sdk.async_api.account_balance import AccountBalance as AsyncAccountBalance
+from sdk.async_api.account_balance_update_payload import AccountBalanceUpdatePayload
+from sdk.async_api.market_summary import MarketSummary as AsyncMarketSummary
+from sdk.async_api.market_summary_update_payload import MarketSummaryUpdatePayload
+from sdk.async_api.markets_summary_update_payload import MarketsSummaryUpdatePayload
+from sdk.async_api.order import Order as AsyncOrder
+from sdk.async_api.order_change_update_payload import OrderChangeUpdatePayload
+from sdk.async_api.position import Position as AsyncPosition
+from sdk.async_api.position_update_payload import PositionUpdatePayload
+from sdk.async_api.price import Price as AsyncPrice
+from sdk.async_api.price_update_payload import PriceUpdatePayload
+from sdk.async_api.prices_update_payload import PricesUpdatePayload
+from sdk.open_api.models.account_balance import AccountBalance
+from sdk.open_api.models.create_order_request import CreateOrderRequest
+from sdk.open_api.models.create_order_response import CreateOrderResponse
+from sdk.open_api.models.market_definition import MarketDefinition
+from sdk.open_api.models.market_summary import MarketSummary
+from sdk.open_api.models.order import Order
+from sdk.open_api.models.position import Position
+from sdk.open_api.models.price import Price
+from sdk.open_api.models.spot_market_definition import SpotMarketDefinition
+from sdk.open_api.models.time_in_force import TimeInForce
+from sdk.reya_rest_api.constants.enums import RiskRejectReason
+from sdk.reya_rest_api.models.orders import LimitOrderParameters, TriggerOrderParameters
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from sdk.reya_rest_api.client import ReyaTradingClient
+
+logger = logging.getLogger("reya_trading.risk_engine")
+
+DEFAULT_COLLATERAL_PRICES: Mapping[str, float] = {"RUSD": 1.0}
+DEFAULT_MAX_CLOSED_ORDERS = 10000
+
+# Tolerance for float comparisons of quantities and grid conformity
+_EPSILON = 1e-9
+
+AnyOrder = Union[Order, AsyncOrder]
+AnyPosition = Union[Position, AsyncPosition]
+AnyBalance = Union[AccountBalance, AsyncAccountBalance]
+AnyPrice = Union[Price, AsyncPrice]
+AnySummary = Union[MarketSummary, AsyncMarketSummary]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("RiskEngine.check_ladder requires numpy: pip install reya-python-sdk[analytics]")
+
+
+@dataclass(frozen=True)
+class RiskCheck:
+    """Outcome of a pre-trade check; ``reason`` is None when the order passed."""
+
+    reason: Optional[RiskRejectReason] = None
+    message: str = ""
+
+    @property
+    def passed(self) -> bool:
+        """Whether the order passed the checks."""
+        return self.reason is None
+
+
+PASSED = RiskCheck()
+
+
+@dataclass(frozen=True)
+class MarginState:
+    """Margin totals of an account at current oracle prices."""
+
+    collateral: float
+    unrealized_pnl: float
+    initial_margin: float
+    liquidation_margin: float
+    notional: float
+
+    @property
+    def margin_balance(self) -> float:
+        """Collateral plus unrealized PnL."""
+        return self.collateral + self.unrealized_pnl
+
+    @property
+    def free_margin(self) -> float:
+        """Margin balance not used by the initial margin."""
+        return self.margin_balance - self.initial_margin
+
+    @property
+    def leverage(self) -> float:
+        """Position notional over margin balance (inf without margin balance)."""
+        if self.margin_balance <= 0:
+            return math.inf if self.notional > 0 else 0.0
+        return self.notional / self.margin_balance
+
+
+class _Market:
+    __slots__ = (
+        "symbol",
+        "is_spot",
+        "min_qty",
+        "step",
+        "tick",
+        "imr",
+        "lmr",
+        "max_leverage",
+        "oi_cap",
+        "base_asset",
+        "quote_asset",
+        "price",
+        "oi",
+    )
+
+    def __init__(self, definition: Union[MarketDefinition, SpotMarketDefinition]):
+        self.symbol = definition.symbol
+        self.is_spot = isinstance(definition, SpotMarketDefinition)
+        self.min_qty = float(definition.min_order_qty)
+        self.step = float(definition.qty_step_size)
+        self.tick = float(definition.tick_size)
+        self.imr = 0.0
+        self.lmr = 0.0
+        self.max_leverage = math.inf
+        self.oi_cap = math.inf
+        self.base_asset = ""
+        self.quote_asset = ""
+        if isinstance(definition, SpotMarketDefinition):
+            self.base_asset = definition.base_asset
+            self.quote_asset = definition.quote_asset
+        else:
+            self.imr = float(definition.initial_margin_parameter)
+            self.lmr = float(definition.liquidation_margin_parameter)
+            self.max_leverage = float(definition.max_leverage) if definition.max_leverage > 0 else math.inf
+            oi_cap = float(definition.oi_cap)
+            self.oi_cap = oi_cap if oi_cap > 0 else math.inf
+        self.price: Optional[float] = None
+        self.oi: Optional[float] = None
+
+
+class _Exposure:
+    """Position and open orders of one account in one perp market, with its margin contributions."""
+
+    __slots__ = ("qty", "entry", "open_buy", "open_sell", "im", "lm", "upnl", "notional")
+
+    def __init__(self) -> None:
+        self.qty = 0.0  # Signed position
+        self.entry = 0.0
+        self.open_buy = 0.0
+        self.open_sell = 0.0
+        self.im = 0.0
+        self.lm = 0.0
+        self.upnl = 0.0
+        self.notional = 0.0
+
+    def worst(self) -> float:
+        return max(abs(self.qty + self.open_buy), abs(self.qty - self.open_sell))
+
+
+class _OpenOrder:
+    __slots__ = ("symbol", "is_buy", "px", "remaining", "updated_at")
+
+    def __init__(self, symbol: str, is_buy: bool, px: float, remaining: float, updated_at: int):
+        self.symbol = symbol
+        self.is_buy = is_buy
+        self.px = px
+        self.remaining = remaining
+        self.updated_at = updated_at
+
+
+class _Account:
+    def __init__(self) -> None:
+        self.balances: dict[str, float] = {}
+        self.reserved: dict[str, float] = {}  # Spot balances held by open orders
+        self.exposures: dict[str, _Exposure] = {}
+        self.orders: dict[str, _OpenOrder] = {}
+        self.collateral = 0.0
+        self.im = 0.0
+        self.lm = 0.0
+        self.upnl = 0.0
+        self.notional = 0.0
+
+
+class RiskEngine:
+    """
+    Pre-trade risk checks for a wallet's accounts.
+
+    Load it with ``refresh`` and keep it current by passing ``on_message`` the wallet
+    positions, balances and order changes channels and the prices channel (optionally
+    the market summaries, for open interest caps). Installed on a ``ReyaTradingClient``
+    (``risk_engine=...``), ``create_limit_order`` and ``create_trigger_order`` raise
+    ``RiskCheckError`` for refused orders without sending them.
+
+    All methods are thread-safe: WebSocket callbacks run on the socket thread while
+    checks run on the asyncio loop.
+    """
+
+    def __init__(
+        self,
+        account_id: Optional[int] = None,
+        collateral_prices: Optional[Mapping[str, float]] = None,
+        margin_buffer: float = 0.0,
+        max_closed_orders: int = DEFAULT_MAX_CLOSED_ORDERS,
+    ):
+        """
+        Initialize an empty risk engine.
+
+        Args:
+            account_id: Only mirror this account. Mirrors every account of the wallet if None.
+            collateral_prices: Value of each collateral asset in rUSD; assets not listed do not count.
+            margin_buffer: Fraction of the margin balance kept free, e.g. 0.1 refuses orders
+                           that would use more than 90% of it.
+            max_closed_orders: Number of closed order IDs remembered, to ignore late updates.
+        """
+        if not 0.0 <= margin_buffer < 1.0:
+            raise ValueError(f"margin_buffer must be in [0, 1), got {margin_buffer}")
+        self.account_id = account_id
+        self.margin_buffer = margin_buffer
+        self.max_closed_orders = max_closed_orders
+        self._collateral_prices = dict(
+            collateral_prices if collateral_prices is not None else DEFAULT_COLLATERAL_PRICES
+        )
+
+        self._lock = threading.RLock()
+        self._markets: dict[str, _Market] = {}
+        self._accounts: dict[int, _Account] = {}
+        # Accounts with exposure in each perp market, re-valued on its price updates
+        self._holders: dict[str, dict[int, None]] = {}
+        self._closed_orders: OrderedDict[str, None] = OrderedDict()
+
+    async def refresh(self, client: "ReyaTradingClient") -> None:
+        """
+        Rebuild the state from REST snapshots fetched concurrently.
+
+        Args:
+            client: Client of the wallet.
+        """
+        (definitions, spot_definitions, prices, summaries), (positions, balances, orders) = await asyncio.gather(
+            asyncio.gather(
+                client.reference.get_market_definitions(),
+                client.reference.get_spot_market_definitions(),
+                client.markets.get_prices(),
+                client.markets.get_markets_summary(),
+            ),
+            asyncio.gather(client.get_positions(), client.get_account_balances(), client.get_open_orders()),
+        )
+        self.load(definitions, spot_definitions, prices, positions, balances, orders, summaries)
+
+    def load(
+        self,
+        definitions: Iterable[MarketDefinition],
+        spot_definitions: Iterable[SpotMarketDefinition] = (),
+        prices: Iterable[AnyPrice] = (),
+        positions: Iterable[AnyPosition] = (),
+        balances: Iterable[AnyBalance] = (),
+        orders: Iterable[AnyOrder] = (),
+        summaries: Iterable[AnySummary] = (),
+    ) -> None:
+        """
+        Replace the state with snapshots.
+
+        Args:
+            definitions: Perp market definitions.
+            spot_definitions: Spot market definitions.
+            prices: Oracle prices.
+            positions: Open positions.
+            balances: Account balances.
+            orders: Open orders.
+            summaries: Market summaries (open interest).
+        """
+        with self._lock:
+            self._markets = {definition.symbol: _Market(definition) for definition in definitions}
+            for spot_definition in spot_definitions:
+                self._markets[spot_definition.symbol] = _Market(spot_definition)
+            self._accounts = {}
+            self._holders = {}
+            for price in prices:
+                self._apply_price(price)
+            for summary in summaries:
+                self._apply_summary(summary)
+            for balance in balances:
+                self._apply_balance(balance)
+            for position in positions:
+                self._apply_position(position)
+            for order in orders:
+                self._apply_order(order)
+        logger.info(f"Risk engine loaded {len(self._markets)} markets and {len(self._accounts)} accounts")
+
+    def on_message(self, _ws: Any, message: Any) -> None:
+        """
+        Apply a WebSocket message; messages of other channels are ignored.
+
+        Args:
+            _ws: The WebSocket connection (unused, for ``ReyaSocket`` compatibility).
+            message: Typed WebSocket message.
+        """
+        with self._lock:
+            if isinstance(message, PricesUpdatePayload):
+                for price in message.data:
+                    self._apply_price(price)
+            elif isinstance(message, PriceUpdatePayload):
+                self._apply_price(message.data)
+            elif isinstance(message, PositionUpdatePayload):
+                for position in message.data:
+                    self._apply_position(position)
+            elif isinstance(message, AccountBalanceUpdatePayload):
+                for balance in message.data:
+                    self._apply_balance(balance)
+            elif isinstance(message, OrderChangeUpdatePayload):
+                for order in message.data:
+                    self._apply_order(order)
+            elif isinstance(message, MarketsSummaryUpdatePayload):
+                for summary in message.data:
+                    self._apply_summary(summary)
+            elif isinstance(message, MarketSummaryUpdatePayload):
+                self._apply_summary(message.data)
+
+    def register_response(self, response: CreateOrderResponse, request: CreateOrderRequest) -> None:
+        """
+        Hold margin or balance for an order accepted as resting, before its first update arrives.
+
+        Args:
+            response: Response of the create order endpoint.
+            request: The request that produced it.
+        """
+        if response.order_id is None or response.status.value != "OPEN" or request.qty is None:
+            return
+        remaining = float(request.qty) - float(response.cum_qty or 0)
+        with self._lock:
+            if not self._tracks(request.account_id) or response.order_id in self._closed_orders:
+                return
+            account = self._account(request.account_id)
+            if response.order_id in account.orders:
+                return
+            order = _OpenOrder(request.symbol or "", request.is_buy, float(request.limit_px), remaining, 0)
+            self._add_order(request.account_id, account, response.order_id, order)
+
+    def set_price(self, symbol: str, price: float) -> None:
+        """Set the oracle price of a market, re-valuing the accounts exposed to it."""
+        with self._lock:
+            self._set_price(symbol, price)
+
+    def margin(self, account_id: Optional[int] = None) -> MarginState:
+        """
+        Margin totals of an account.
+
+        Args:
+            account_id: Account to report (defaults to the engine's account).
+
+        Returns:
+            The account's margin state; all zeros for an unknown account.
+        """
+        with self._lock:
+            account = self._lookup(account_id)
+            if account is None:
+                return MarginState(0.0, 0.0, 0.0, 0.0, 0.0)
+            return MarginState(account.collateral, account.upnl, account.im, account.lm, account.notional)
+
+    def position(self, symbol: str, account_id: Optional[int] = None) -> float:
+        """Signed position of an account in a perp market."""
+        with self._lock:
+            account = self._lookup(account_id)
+            exposure = account.exposures.get(symbol) if account is not None else None
+            return exposure.qty if exposure is not None else 0.0
+
+    def available_balance(self, asset: str, account_id: Optional[int] = None) -> float:
+        """Balance of an asset not held by open spot orders."""
+        with self._lock:
+            account = self._lookup(account_id)
+            if account is None:
+                return 0.0
+            return account.balances.get(asset, 0.0) - account.reserved.get(asset, 0.0)
+
+    def check_limit_order(self, params: LimitOrderParameters, account_id: Optional[int] = None) -> RiskCheck:
+        """
+        Check a limit (IOC/GTC) order.
+
+        Args:
+            params: Limit order parameters.
+            account_id: Account placing the order (defaults to the engine's account).
+
+        Returns:
+            The outcome; ``passed`` is False with a reason for orders that would fail.
+        """
+        return self.check_order(
+            params.symbol,
+            params.is_buy,
+            float(params.limit_px),
+            float(params.qty),
+            resting=params.time_in_force == TimeInForce.GTC,
+            reduce_only=bool(params.reduce_only),
+            account_id=account_id,
+        )
+
+    def check_order(
+        self,
+        symbol: str,
+        is_buy: bool,
+        px: float,
+        qty: float,
+        resting: bool = False,
+        reduce_only: bool = False,
+        account_id: Optional[int] = None,
+    ) -> RiskCheck:
+        """
+        Check an order given as floats.
+
+        Args:
+            symbol: Trading symbol.
+            is_buy: Order side.
+            px: Limit price.
+            qty: Base quantity.
+            resting: Whether the order rests on the book (GTC) rather than executing at once (IOC).
+            reduce_only: Whether the order may only reduce the position.
+            account_id: Account placing the order (defaults to the engine's account).
+
+        Returns:
+            The outcome; ``passed`` is False with a reason for orders that would fail.
+        """
+        with self._lock:
+            market = self._markets.get(symbol)
+            if market is None:
+                return RiskCheck(RiskRejectReason.UNKNOWN_SYMBOL, f"Unknown symbol {symbol}")
+            grid = self._check_grid(market, px, qty)
+            if grid is not None:
+                return grid
+            account = self._lookup(account_id) or _Account()
+            if market.is_spot:
+                return self._check_spot(account, market, is_buy, px, qty)
+            return self._check_perp(account, market, is_buy, px, qty, resting, reduce_only)
+
+    def check_trigger_order(self, params: TriggerOrderParameters, account_id: Optional[int] = None) -> RiskCheck:
+        """
+        Check a TP/SL order, which closes the position and is cancelled when there is none.
+
+        Args:
+            params: Trigger order parameters.
+            account_id: Account placing the order (defaults to the engine's account).
+
+        Returns:
+            The outcome; ``passed`` is False with a reason for orders that would fail.
+        """
+        with self._lock:
+            market = self._markets.get(params.symbol)
+            if market is None or market.is_spot:
+                return RiskCheck(RiskRejectReason.UNKNOWN_SYMBOL, f"Unknown perp symbol {params.symbol}")
+            account = self._lookup(account_id)
+            exposure = account.exposures.get(params.symbol) if account is not None else None
+            position = exposure.qty if exposure is not None else 0.0
+            closable = -position if params.is_buy else position
+            if closable <= _EPSILON:
+                side = "buy" if params.is_buy else "sell"
+                return RiskCheck(
+                    RiskRejectReason.NO_POSITION, f"No {params.symbol} position for a {side} TP/SL to close"
+                )
+            return PASSED
+
+    def check_ladder(
+        self,
+        symbol: str,
+        is_buy: bool,
+        prices: Any,
+        qtys: Any,
+        account_id: Optional[int] = None,
+    ) -> "np.ndarray":
+        """
+        Check a ladder of resting (GTC) orders on one side at once (requires numpy).
+
+        Each level is checked as if the accepted levels before it rest as well, so the
+        result is the ladder that can be placed in order. Use ``check_order`` for the
+        reason a level is refused.
+
+        Args:
+            symbol: Trading symbol.
+            is_buy: Side of every level.
+            prices: Limit prices.
+            qtys: Base quantities.
+            account_id: Account placing the orders (defaults to the engine's account).
+
+        Returns:
+            Boolean array, True for levels that pass.
+        """
+        _require_numpy()
+        px = np.asarray(prices, dtype=np.float64)
+        qty = np.asarray(qtys, dtype=np.float64)
+        with self._lock:
+            market = self._markets.get(symbol)
+            if market is None:
+                accepted: np.ndarray = np.zeros(len(px), dtype=bool)
+                return accepted
+            accepted = (qty >= market.min_qty - _EPSILON) & ~_off_grid_array(qty, market.step)
+            if market.is_spot:
+                accepted &= ~_off_grid_array(px, market.tick)
+            account = self._lookup(account_id) or _Account()
+            if market.is_spot:
+                asset = market.quote_asset if is_buy else market.base_asset
+                need = np.cumsum(np.where(accepted, px * qty if is_buy else qty, 0.0))
+                available = account.balances.get(asset, 0.0) - account.reserved.get(asset, 0.0)
+                accepted &= need <= available + _EPSILON
+                return accepted
+            if market.price is None:
+                accepted[:] = False
+                return accepted
+            exposure = account.exposures.get(symbol) or _Exposure()
+            added = np.cumsum(np.where(accepted, qty, 0.0))
+            if is_buy:
+                worst = np.maximum(
+                    np.abs(exposure.qty + exposure.open_buy + added), abs(exposure.qty - exposure.open_sell)
+                )
+            else:
+                worst = np.maximum(
+                    abs(exposure.qty + exposure.open_buy), np.abs(exposure.qty - exposure.open_sell - added)
+                )
+            increases = worst > exposure.worst() + _EPSILON
+            market_notional = worst * market.price
+            margin_balance = account.collateral + account.upnl
+            initial_margin = account.im - exposure.im + market_notional * market.imr
+            within = (initial_margin <= margin_balance * (1.0 - self.margin_buffer)) & (
+                market_notional <= market.max_leverage * margin_balance
+            )
+            accepted &= ~increases | within
+            return accepted
+
+    def _check_grid(self, market: _Market, px: float, qty: float) -> Optional[RiskCheck]:
+        if qty < market.min_qty - _EPSILON:
+            return RiskCheck(
+                RiskRejectReason.MIN_ORDER_QTY, f"Order quantity {qty} is below the minimum {market.min_qty}"
+            )
+        if _off_grid(qty, market.step):
+            return RiskCheck(
+                RiskRejectReason.QTY_STEP, f"Order quantity {qty} does not conform to base spacing {market.step}"
+            )
+        if market.is_spot and _off_grid(px, market.tick):
+            return RiskCheck(
+                RiskRejectReason.TICK_SIZE, f"Order price {px} does not conform to price spacing {market.tick}"
+            )
+        return None
+
+    def _check_spot(self, account: _Account, market: _Market, is_buy: bool, px: float, qty: float) -> RiskCheck:
+        asset = market.quote_asset if is_buy else market.base_asset
+        need = px * qty if is_buy else qty
+        available = account.balances.get(asset, 0.0) - account.reserved.get(asset, 0.0)
+        if need > available + _EPSILON:
+            return RiskCheck(
+                RiskRejectReason.INSUFFICIENT_BALANCE,
+                f"Order needs {need} {asset} but only {available} is available",
+            )
+        return PASSED
+
+    def _check_perp(
+        self,
+        account: _Account,
+        market: _Market,
+        is_buy: bool,
+        px: float,
+        qty: float,
+        resting: bool,
+        reduce_only: bool,
+    ) -> RiskCheck:
+        exposure = account.exposures.get(market.symbol) or _Exposure()
+        if reduce_only:
+            reducible = -exposure.qty if is_buy else exposure.qty
+            if reducible <= _EPSILON:
+                return RiskCheck(
+                    RiskRejectReason.REDUCE_ONLY, f"Reduce-only order would not reduce the {market.symbol} position"
+                )
+            return PASSED
+
+        price = market.price
+        if price is None:
+            return RiskCheck(RiskRejectReason.NO_PRICE, f"No oracle price for {market.symbol}")
+
+        signed = qty if is_buy else -qty
+        if resting:
+            buys = exposure.open_buy + (qty if is_buy else 0.0)
+            sells = exposure.open_sell + (0.0 if is_buy else qty)
+            worst = max(abs(exposure.qty + buys), abs(exposure.qty - sells))
+        else:
+            filled = exposure.qty + signed
+            worst = max(abs(filled + exposure.open_buy), abs(filled - exposure.open_sell))
+        if worst <= exposure.worst() + _EPSILON:
+            return PASSED
+
+        if market.oi is not None:
+            added_oi = abs(exposure.qty + signed) - abs(exposure.qty)
+            if added_oi > 0 and market.oi + added_oi > market.oi_cap:
+                return RiskCheck(
+                    RiskRejectReason.OI_CAP,
+                    f"{market.symbol} open interest {market.oi + added_oi} would exceed its cap {market.oi_cap}",
+                )
+
+        # An IOC order may execute anywhere up to its limit price
+        slippage = 0.0 if resting else max(0.0, (px - price) if is_buy else (price - px)) * qty
+        margin_balance = account.collateral + account.upnl - slippage
+        market_notional = worst * price
+        initial_margin = account.im - exposure.im + market_notional * market.imr
+        if initial_margin > margin_balance * (1.0 - self.margin_buffer):
+            return RiskCheck(
+                RiskRejectReason.INSUFFICIENT_MARGIN,
+                f"Initial margin {initial_margin:.2f} would exceed the margin balance {margin_balance:.2f}",
+            )
+        if market_notional > market.max_leverage * margin_balance:
+            return RiskCheck(
+                RiskRejectReason.MAX_LEVERAGE,
+                f"{market.symbol} exposure {market_notional:.2f} would exceed {market.max_leverage:g}x leverage",
+            )
+        return PASSED
+
+    def _lookup(self, account_id: Optional[int]) -> Optional[_Account]:
+        """State of an account, defaulting to the engine's account."""
+        if account_id is None:
+            account_id = self.account_id
+        return self._accounts.get(account_id) if account_id is not None else None
+
+    def _tracks(self, account_id: int) -> bool:
+        return self.account_id is None or account_id == self.account_id
+
+    def _account(self, account_id: int) -> _Account:
+        account = self._accounts.get(account_id)
+        if account is None:
+            account = self._accounts[account_id] = _Account()
+        return account
+
+    def _apply_price(self, price: AnyPrice) -> None:
+        self._set_price(price.symbol, float(price.oracle_price))
+
+    def _set_price(self, symbol: str, price: float) -> None:
+        market = self._markets.get(symbol)
+        if market is None or market.price == price:
+            return
+        market.price = price
+        for account_id in self._holders.get(symbol, ()):
+            account = self._accounts[account_id]
+            self._revalue(account, market, account.exposures[symbol])
+
+    def _apply_summary(self, summary: AnySummary) -> None:
+        market = self._markets.get(summary.symbol)
+        if market is not None and summary.oi_qty is not None:
+            market.oi = float(summary.oi_qty)
+
+    def _apply_balance(self, balance: AnyBalance) -> None:
+        if not self._tracks(balance.account_id):
+            return
+        account = self._account(balance.account_id)
+        value = float(balance.real_balance)
+        previous = account.balances.get(balance.asset, 0.0)
+        account.balances[balance.asset] = value
+        collateral_price = self._collateral_prices.get(balance.asset)
+        if collateral_price is not None:
+            account.collateral += (value - previous) * collateral_price
+
+    def _apply_position(self, position: AnyPosition) -> None:
+        market = self._markets.get(position.symbol)
+        if market is None or market.is_spot or not self._tracks(position.account_id):
+            return
+        account = self._account(position.account_id)
+        exposure = self._exposure(position.account_id, account, position.symbol)
+        qty = float(position.qty)
+        exposure.qty = qty if position.side.value == "B" else -qty
+        exposure.entry = float(position.avg_entry_price)
+        self._revalue(account, market, exposure)
+        self._drop_if_flat(position.account_id, account, position.symbol)
+
+    def _apply_order(self, order: AnyOrder) -> None:
+        if not self._tracks(order.account_id) or order.qty is None or order.limit_px is None:
+            return
+        if order.order_id in self._closed_orders:
+            return
+        account = self._account(order.account_id)
+        current = account.orders.get(order.order_id)
+        if current is not None:
+            if order.last_update_at < current.updated_at:
+                return
+            self._remove_order(order.account_id, account, order.order_id)
+        remaining = float(order.qty) - float(order.cum_qty or 0)
+        if order.status.value != "OPEN" or remaining <= _EPSILON:
+            self._closed_orders[order.order_id] = None
+            while len(self._closed_orders) > self.max_closed_orders:
+                self._closed_orders.popitem(last=False)
+            return
+        tracked = _OpenOrder(
+            order.symbol, order.side.value == "B", float(order.limit_px), remaining, order.last_update_at
+        )
+        self._add_order(order.account_id, account, order.order_id, tracked)
+
+    def _add_order(self, account_id: int, account: _Account, order_id: str, order: _OpenOrder) -> None:
+        self._hold(account_id, account, order, 1.0)
+        account.orders[order_id] = order
+
+    def _remove_order(self, account_id: int, account: _Account, order_id: str) -> None:
+        order = account.orders.pop(order_id)
+        self._hold(account_id, account, order, -1.0)
+
+    def _hold(self, account_id: int, account: _Account, order: _OpenOrder, sign: float) -> None:
+        """Add (sign 1) or release (sign -1) what an open order holds."""
+        market = self._markets.get(order.symbol)
+        if market is None:
+            return
+        if market.is_spot:
+            asset = market.quote_asset if order.is_buy else market.base_asset
+            amount = order.px * order.remaining if order.is_buy else order.remaining
+            account.reserved[asset] = account.reserved.get(asset, 0.0) + sign * amount
+            return
+        exposure = self._exposure(account_id, account, order.symbol)
+        if order.is_buy:
+            exposure.open_buy = max(0.0, exposure.open_buy + sign * order.remaining)
+        else:
+            exposure.open_sell = max(0.0, exposure.open_sell + sign * order.remaining)
+        self._revalue(account, market, exposure)
+        self._drop_if_flat(account_id, account, order.symbol)
+
+    def _exposure(self, account_id: int, account: _Account, symbol: str) -> _Exposure:
+        exposure = account.exposures.get(symbol)
+        if exposure is None:
+            exposure = account.exposures[symbol] = _Exposure()
+            self._holders.setdefault(symbol, {})[account_id] = None
+        return exposure
+
+    def _drop_if_flat(self, account_id: int, account: _Account, symbol: str) -> None:
+        exposure = account.exposures[symbol]
+        if abs(exposure.qty) > _EPSILON or exposure.open_buy > _EPSILON or exposure.open_sell > _EPSILON:
+            return
+        self._revalue(account, self._markets[symbol], exposure, flat=True)
+        del account.exposures[symbol]
+        self._holders[symbol].pop(account_id, None)
+
+    @staticmethod
+    def _revalue(account: _Account, market: _Market, exposure: _Exposure, flat: bool = False) -> None:
+        """Recompute one market's margin contributions and apply the difference to the account totals."""
+        if flat:
+            im = lm = upnl = notional = 0.0
+        else:
+            # Without an oracle price the position is valued at its entry price
+            price = market.price if market.price is not None else exposure.entry
+            notional = abs(exposure.qty) * price
+            im = exposure.worst() * price * market.imr
+            lm = notional * market.lmr
+            upnl = (price - exposure.entry) * exposure.qty
+        account.im += im - exposure.im
+        account.lm += lm - exposure.lm
+        account.upnl += upnl - exposure.upnl
+        account.notional += notional - exposure.notional
+        exposure.im, exposure.lm, exposure.upnl, exposure.notional = im, lm, upnl, notional
+
+
+def _off_grid(value: float, step: float) -> bool:
+    """Whether a value is not a multiple of ``step``."""
+    ratio = value / step
+    return abs(ratio - round(ratio)) > 1e-6
+
+
+def _off_grid_array(values: "np.ndarray", step: float) -> "np.ndarray":
+    """Element-wise ``_off_grid``."""
+    ratio = values / step
+    off: np.ndarray = np.abs(ratio - np.rint(ratio)) > 1e-6
+    return off
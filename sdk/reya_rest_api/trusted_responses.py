@@ -0,0 +1,174 @@
+"""
+Trusted Responses - Deserialization of generated REST models without validation.
+
+The generated models check every field in strict mode and every numeric string with a
+regular expression, which dominates the cost of large responses such as market
+summaries or execution pages. For responses from the configured API host, which are
+produced from the same schema, ``construct_model`` builds the same models without
+validation: nested models, lists of models and enums are converted, symbols and asset
+names are interned (``sdk.reya_data.interning``), unknown keys go to
+``additional_properties`` and every other value is kept as parsed from JSON.
+
+The strict path (``Model.from_dict``) is unchanged and remains the default.
+"""
+
+from typing import Any, Callable, Optional, Union, get_args, get_origin
+
+import json
+import re
+from enum import Enum
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+import sdk.open_api.models
+from sdk.reya_data.interning import INTERNED_KEYS, SHARED_TABLE
+
+Converter = Callable[[Any], Any]
+
+_JSON_CONTENT_TYPE = re.compile(r"^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)", re.IGNORECASE)
+_LIST_TYPE = re.compile(r"List\[(.*)]")
+
+_object_setattr = object.__setattr__
+
+
+def _enum_converter(enum: type[Enum]) -> Converter:
+    members = {member.value: member for member in enum}
+
+    def convert(value: Any) -> Any:
+        member = members.get(value)
+        return member if member is not None else enum(value)
+
+    return convert
+
+
+def _converter(annotation: Any) -> Optional[Converter]:
+    """Converter of non-null JSON values to a field's type, or None if values are kept as they are."""
+    origin = get_origin(annotation)
+    if origin is Union:  # Optional[X]
+        inner = [_converter(arg) for arg in get_args(annotation) if arg is not type(None)]
+        return inner[0] if len(inner) == 1 else None
+    if origin is list:
+        (item,) = get_args(annotation)
+        convert_item = _converter(item)
+        if convert_item is None:
+            return None
+        return lambda value: [None if element is None else convert_item(element) for element in value]
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return _enum_converter(annotation)
+        if issubclass(annotation, BaseModel):
+            return lambda value: construct_model(annotation, value)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _builder(model: type[BaseModel]) -> Converter:
+    """Compile the construction of a generated model from a JSON object."""
+    fields = []
+    for name, field in model.model_fields.items():
+        if name == "additional_properties":
+            continue
+        key = field.alias or name
+        convert = _converter(field.annotation)
+        if convert is None and key in INTERNED_KEYS:
+            convert = SHARED_TABLE.intern
+        fields.append((name, key, convert))
+    plain = [(name, key) for name, key, convert in fields if convert is None]
+    converted = [(name, key, convert) for name, key, convert in fields if convert is not None]
+    keys = frozenset(key for _, key, _ in fields)
+    # Like from_dict, which passes every field (None when absent) to model_validate
+    fields_set = frozenset(name for name, _, _ in fields) | {"additional_properties"}
+    # Set the instance state as model_construct does when the model has no hooks for it to run
+    direct = (
+        model.__pydantic_post_init__ is None
+        and not model.__pydantic_root_model__
+        and not model.__private_attributes__
+        and model.model_config.get("extra") != "allow"
+    )
+
+    def build(data: dict[str, Any]) -> Any:
+        get = data.get
+        values = {name: get(key) for name, key in plain}
+        for name, key, convert in converted:
+            value = get(key)
+            values[name] = None if value is None else convert(value)
+        if keys.issuperset(data):
+            values["additional_properties"] = {}
+        else:
+            values["additional_properties"] = {key: value for key, value in data.items() if key not in keys}
+        if not direct:
+            return model.model_construct(_fields_set=set(fields_set), **values)
+        instance = model.__new__(model)
+        _object_setattr(instance, "__dict__", values)
+        _object_setattr(instance, "__pydantic_fields_set__", set(fields_set))
+        _object_setattr(instance, "__pydantic_extra__", None)
+        _object_setattr(instance, "__pydantic_private__", None)
+        return instance
+
+    return build
+
+
+def construct_model(model: type[BaseModel], data: Any) -> Any:
+    """
+    Build a generated model from a decoded JSON object without validating it.
+
+    The result compares equal to ``model.from_dict(data)`` for any valid object.
+
+    Args:
+        model: Generated model class.
+        data: Decoded JSON object.
+
+    Returns:
+        The model instance (None if data is None).
+    """
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        return model.from_dict(data)  # type: ignore[attr-defined]
+    return _builder(model)(data)
+
+
+@lru_cache(maxsize=None)
+def response_converter(response_type: str) -> Optional[Converter]:
+    """
+    Converter of decoded JSON to an OpenAPI response type without validation.
+
+    Args:
+        response_type: Response type name as in the generated response type maps,
+                       e.g. "MarketSummary" or "List[MarketSummary]".
+
+    Returns:
+        The converter, or None for types that are not (lists of) generated models.
+    """
+    match = _LIST_TYPE.fullmatch(response_type)
+    if match is not None:
+        convert_item = response_converter(match.group(1))
+        if convert_item is None:
+            return None
+        return lambda data: None if data is None else [convert_item(item) for item in data]
+    model = getattr(sdk.open_api.models, response_type, None)
+    if not isinstance(model, type) or not issubclass(model, BaseModel):
+        return None
+    return lambda data: construct_model(model, data)
+
+
+def deserialize_trusted(response_text: str, response_type: str, content_type: Optional[str]) -> tuple[bool, Any]:
+    """
+    Deserialize a JSON response body into generated models without validation.
+
+    Args:
+        response_text: Response body.
+        response_type: Response type name.
+        content_type: Content-Type header of the response.
+
+    Returns:
+        (True, deserialized data), or (False, None) if the body is not JSON or the type is
+        not a (list of) generated model(s), to be handled by the generic deserializer.
+    """
+    convert = response_converter(response_type)
+    if convert is None or not response_text:
+        return False, None
+    if content_type is not None and not _JSON_CONTENT_TYPE.match(content_type):
+        return False, None
+    return True, convert(json.loads(response_text))
@@ -0,0 +1,34 @@
+"""
+Reya Simulation - Offline replay of recorded markets and an in-process simulated exchange.
+"""
+
+from sdk.reya_data.fee_model import effective_fee_rates
+from sdk.reya_simulation.backtester import (
+    BacktestClient,
+    BacktestConfig,
+    Backtester,
+    BacktestResult,
+    SimulatedFill,
+    run_backtest,
+    run_parallel,
+)
+from sdk.reya_simulation.exchange import SimulatedExchange
+from sdk.reya_simulation.replay import EventKind, MarketReplay
+from sdk.reya_simulation.resources import SimulatedResources
+from sdk.reya_simulation.socket import SimulatedSocket
+
+__all__ = [
+    "MarketReplay",
+    "EventKind",
+    "Backtester",
+    "BacktestClient",
+    "BacktestConfig",
+    "BacktestResult",
+    "SimulatedFill",
+    "effective_fee_rates",
+    "run_backtest",
+    "run_parallel",
+    "SimulatedExchange",
+    "SimulatedResources",
+    "SimulatedSocket",
+]
@@ -0,0 +1,959 @@
+"""
+Backtester - Event-driven replay of a spot market with simulated order entry.
+
+Recorded depth, price and execution events are replayed through an in-memory book.
+Strategy code calls a ``BacktestClient`` that mirrors the ``ReyaTradingClient`` order
+entry and query methods, and receives the same WebSocket payload models (order
+changes, wallet executions, balances, prices) through listeners, so it can run
+unchanged against history.
+
+Fill model:
+    - Orders that cross the replayed book take liquidity level by level, paying the
+      taker fee; the consumed quantity stays removed until the level is next updated.
+    - Resting orders join the back of the queue at their price. Replayed trades at
+      the order's price first consume the quantity queued ahead of it; trades through
+      the price fill it directly. The queue ahead shrinks when the level shrinks.
+    - Orders crossing one of our own resting orders are cancelled without trading
+      (self-match prevention cancels the taker, as on the exchange).
+    - Requests take effect at the simulated time of the call; there is no latency model.
+"""
+
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
+
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from decimal import ROUND_DOWN, Decimal
+
+from sdk.async_api.account_balance_update_payload import AccountBalanceUpdatePayload
+from sdk.async_api.order_change_update_payload import OrderChangeUpdatePayload
+from sdk.async_api.price_update_payload import PriceUpdatePayload
+from sdk.async_api.wallet_spot_execution_update_payload import WalletSpotExecutionUpdatePayload
+from sdk.open_api.exceptions import ApiException
+from sdk.open_api.models.account_balance import AccountBalance
+from sdk.open_api.models.cancel_order_response import CancelOrderResponse
+from sdk.open_api.models.create_order_response import CreateOrderResponse
+from sdk.open_api.models.depth import Depth
+from sdk.open_api.models.depth_type import DepthType
+from sdk.open_api.models.fee_tier_parameters import FeeTierParameters
+from sdk.open_api.models.global_fee_parameters import GlobalFeeParameters
+from sdk.open_api.models.level import Level
+from sdk.open_api.models.mass_cancel_response import MassCancelResponse
+from sdk.open_api.models.order import Order
+from sdk.open_api.models.order_status import OrderStatus
+from sdk.open_api.models.order_type import OrderType
+from sdk.open_api.models.price import Price
+from sdk.open_api.models.side import Side
+from sdk.open_api.models.spot_market_definition import SpotMarketDefinition
+from sdk.open_api.models.time_in_force import TimeInForce
+from sdk.open_api.models.wallet_configuration import WalletConfiguration
+from sdk.reya_data.fee_model import effective_fee_rates
+from sdk.reya_rest_api.constants.enums import ReplaceOrderStatus
+from sdk.reya_rest_api.models.orders import LimitOrderParameters, ReplaceOrderResult
+from sdk.reya_simulation.replay import EventKind, MarketReplay
+
+logger = logging.getLogger("reya_simulation.backtester")
+
+ResultT = TypeVar("ResultT")
+Listener = Callable[[Any, Any], None]
+
+
+@dataclass(frozen=True)
+class BacktestConfig:
+    """
+    Market and account being simulated.
+
+    Attributes:
+        symbol: Spot market symbol.
+        base_asset: Base asset of the market.
+        quote_asset: Quote asset of the market (fees are paid in it).
+        tick_size: Price tick size.
+        qty_step_size: Quantity step size.
+        min_order_qty: Minimum order quantity.
+        market_id: Market ID reported by the reference data methods.
+        account_id: Simulated account ID.
+        wallet_address: Simulated wallet address (used in WebSocket channel names).
+        exchange_id: Exchange ID reported on orders.
+        maker_fee: Maker fee as a fraction of notional (negative for a rebate).
+        taker_fee: Taker fee as a fraction of notional.
+        initial_balances: Starting balance per asset.
+    """
+
+    symbol: str
+    base_asset: str
+    quote_asset: str
+    tick_size: str
+    qty_step_size: str
+    min_order_qty: str = "0"
+    market_id: int = 0
+    account_id: int = 1
+    wallet_address: str = "0x" + "0" * 40
+    exchange_id: int = 1
+    maker_fee: str = "0"
+    taker_fee: str = "0"
+    initial_balances: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_definition(
+        cls,
+        definition: SpotMarketDefinition,
+        fee_tier: Optional[FeeTierParameters] = None,
+        global_fees: Optional[GlobalFeeParameters] = None,
+        configuration: Optional[WalletConfiguration] = None,
+        **overrides: Any,
+    ) -> "BacktestConfig":
+        """
+        Configuration for a spot market definition, with the fees of a wallet.
+
+        Args:
+            definition: Spot market definition.
+            fee_tier: Fee tier of the wallet; fees are zero if omitted.
+            global_fees: Global fee parameters (discounts).
+            configuration: Wallet configuration (OG and referee status).
+            overrides: Other BacktestConfig fields, e.g. initial_balances.
+        """
+        fees: dict[str, Any] = {}
+        if fee_tier is not None:
+            maker_fee, taker_fee = effective_fee_rates(fee_tier, global_fees, configuration)
+            fees = {"maker_fee": str(maker_fee), "taker_fee": str(taker_fee)}
+        return cls(
+            symbol=definition.symbol,
+            base_asset=definition.base_asset,
+            quote_asset=definition.quote_asset,
+            tick_size=definition.tick_size,
+            qty_step_size=definition.qty_step_size,
+            min_order_qty=definition.min_order_qty,
+            market_id=definition.market_id,
+            **{**fees, **overrides},
+        )
+
+
+@dataclass(frozen=True)
+class SimulatedFill:
+    """One simulated fill of our order."""
+
+    timestamp: int
+    order_id: str
+    client_order_id: Optional[int]
+    is_buy: bool
+    price: Decimal
+    qty: Decimal
+    fee: Decimal
+    is_maker: bool
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    """
+    Outcome of a backtest.
+
+    Attributes:
+        events: Replayed events.
+        wall_time_s: Wall-clock duration of the run.
+        start_time: Timestamp (ms) of the first event.
+        end_time: Timestamp (ms) of the last event.
+        fills: Fills of our orders, in order.
+        orders_created: Orders accepted.
+        orders_cancelled: Orders cancelled by request.
+        orders_rejected: Orders rejected (validation or balance).
+        self_match_cancels: Orders cancelled by self-match prevention.
+        fees: Total fees paid in the quote asset (negative for net rebates).
+        balances: Final balances.
+        mark_price: Last oracle price, or the last mid price without one.
+        initial_value: Starting balances valued in the quote asset at the mark price.
+        final_value: Final balances valued in the quote asset at the mark price.
+    """
+
+    events: int
+    wall_time_s: float
+    start_time: Optional[int]
+    end_time: Optional[int]
+    fills: list[SimulatedFill]
+    orders_created: int
+    orders_cancelled: int
+    orders_rejected: int
+    self_match_cancels: int
+    fees: Decimal
+    balances: dict[str, Decimal]
+    mark_price: Optional[Decimal]
+    initial_value: Optional[Decimal]
+    final_value: Optional[Decimal]
+
+    @property
+    def pnl(self) -> Optional[Decimal]:
+        """Change in value at the final mark price."""
+        if self.initial_value is None or self.final_value is None:
+            return None
+        return self.final_value - self.initial_value
+
+    @property
+    def events_per_second(self) -> float:
+        """Replay throughput."""
+        return self.events / self.wall_time_s if self.wall_time_s > 0 else 0.0
+
+    @property
+    def maker_fills(self) -> int:
+        """Number of fills as maker."""
+        return sum(1 for fill in self.fills if fill.is_maker)
+
+
+class _SimOrder:
+    __slots__ = (
+        "order_id",
+        "client_order_id",
+        "is_buy",
+        "price_ticks",
+        "price",
+        "qty",
+        "filled",
+        "queue_ahead",
+        "created_at",
+        "updated_at",
+        "status",
+    )
+
+    def __init__(
+        self,
+        order_id: str,
+        client_order_id: Optional[int],
+        is_buy: bool,
+        price_ticks: int,
+        price: Decimal,
+        qty: Decimal,
+        created_at: int,
+    ):
+        self.order_id = order_id
+        self.client_order_id = client_order_id
+        self.is_buy = is_buy
+        self.price_ticks = price_ticks
+        self.price = price
+        self.qty = qty
+        self.filled = Decimal(0)
+        self.queue_ahead = 0.0
+        self.created_at = created_at
+        self.updated_at = created_at
+        self.status = OrderStatus.OPEN
+
+    @property
+    def remaining(self) -> Decimal:
+        return self.qty - self.filled
+
+
+def _rejection(message: str) -> ApiException:
+    """An error shaped like the exchange's 400 responses."""
+    return ApiException(status=400, reason="Bad Request", body=json.dumps({"message": message}))
+
+
+class Backtester:
+    """
+    Replays a market and simulates our orders against it.
+
+    Example:
+        replay = MarketReplay.from_archive(TickArchive("ticks"), "WETHRUSD", start, end)
+        backtester = Backtester(replay, BacktestConfig.from_definition(definition, initial_balances=...))
+        backtester.add_listener(handler.on_message)
+
+        async def on_interval(client, now):
+            await adjust_orders(client, state, cycle)
+
+        result = await backtester.run(on_interval, interval_ms=1000)
+    """
+
+    def __init__(self, replay: MarketReplay, config: BacktestConfig):
+        """
+        Initialize the backtester.
+
+        Args:
+            replay: Recorded events of the market.
+            config: Simulated market and account.
+        """
+        if replay.symbol != config.symbol:
+            raise ValueError(f"Replay is for {replay.symbol}, config for {config.symbol}")
+        self.replay = replay
+        self.config = config
+        self._tick_size = Decimal(config.tick_size)
+        self._qty_step = Decimal(config.qty_step_size)
+        self._min_qty = Decimal(config.min_order_qty)
+        self._maker_fee = Decimal(config.maker_fee)
+        self._taker_fee = Decimal(config.taker_fee)
+        self._listeners: list[Listener] = []
+        self.client = BacktestClient(self)
+        self._now = 0
+        self._price_ticks: Optional[int] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._now = self.replay.start_time or 0
+        self._bids: dict[int, float] = {}
+        self._asks: dict[int, float] = {}
+        self._price_ticks = None
+        self._orders: dict[str, _SimOrder] = {}
+        # Resting orders per price level, in time priority
+        self._resting_bids: dict[int, list[_SimOrder]] = {}
+        self._resting_asks: dict[int, list[_SimOrder]] = {}
+        self._balances: dict[str, Decimal] = {
+            asset: Decimal(amount) for asset, amount in self.config.initial_balances.items()
+        }
+        self._balances.setdefault(self.config.base_asset, Decimal(0))
+        self._balances.setdefault(self.config.quote_asset, Decimal(0))
+        self._fills: list[SimulatedFill] = []
+        self._next_order_id = 1
+        self._created = 0
+        self._cancelled = 0
+        self._rejected = 0
+        self._self_match_cancels = 0
+        self._fees = Decimal(0)
+
+    @property
+    def now(self) -> int:
+        """Current simulated time in milliseconds."""
+        return self._now
+
+    def add_listener(self, listener: Listener) -> None:
+        """
+        Register a WebSocket-style ``on_message(ws, message)`` callback.
+
+        It receives ``PriceUpdatePayload``, ``OrderChangeUpdatePayload``,
+        ``WalletSpotExecutionUpdatePayload`` and ``AccountBalanceUpdatePayload``
+        messages, with ``ws`` set to None.
+
+        Args:
+            listener: The callback.
+        """
+        self._listeners.append(listener)
+
+    async def run(
+        self,
+        on_interval: Optional[Callable[["BacktestClient", int], Awaitable[None]]] = None,
+        interval_ms: int = 1000,
+    ) -> BacktestResult:
+        """
+        Replay all events, calling the strategy at a fixed simulated interval.
+
+        Args:
+            on_interval: Strategy callback, awaited with the client and the simulated time.
+            interval_ms: Simulated milliseconds between strategy calls.
+
+        Returns:
+            The backtest result.
+        """
+        if interval_ms <= 0:
+            raise ValueError(f"interval_ms must be positive, got {interval_ms}")
+        self._reset()
+        replay = self.replay
+        started = time.perf_counter()
+        initial_balances = dict(self._balances)
+
+        timestamps = replay.timestamps
+        kinds = replay.kinds
+        sides = replay.sides
+        ticks = replay.price_ticks
+        qtys = replay.qtys
+        bids = self._bids
+        asks = self._asks
+        resting_bids = self._resting_bids
+        resting_asks = self._resting_asks
+        book_level = EventKind.BOOK_LEVEL
+        trade = EventKind.TRADE
+        book_clear = EventKind.BOOK_CLEAR
+
+        next_call = (replay.start_time or 0) if on_interval is not None else None
+        snapshot_ts: Optional[int] = None
+
+        for index, timestamp in enumerate(timestamps):
+            kind = kinds[index]
+            if snapshot_ts is not None and (kind != book_level or timestamp != snapshot_ts):
+                self._finish_snapshot()
+                snapshot_ts = None
+            while next_call is not None and timestamp >= next_call:
+                assert on_interval is not None
+                self._now = next_call
+                await on_interval(self.client, next_call)
+                next_call += interval_ms
+            self._now = timestamp
+
+            if kind == book_level:
+                price = ticks[index]
+                qty = qtys[index]
+                if sides[index] > 0:
+                    if qty > 0:
+                        bids[price] = qty
+                    else:
+                        bids.pop(price, None)
+                    queue = resting_bids.get(price)
+                else:
+                    if qty > 0:
+                        asks[price] = qty
+                    else:
+                        asks.pop(price, None)
+                    queue = resting_asks.get(price)
+                if queue:
+                    for order in queue:
+                        order.queue_ahead = min(order.queue_ahead, qty)
+            elif kind == trade:
+                if sides[index] < 0:
+                    if resting_bids:
+                        self._on_trade(False, ticks[index], qtys[index])
+                elif resting_asks:
+                    self._on_trade(True, ticks[index], qtys[index])
+            elif kind == book_clear:
+                bids.clear()
+                asks.clear()
+                snapshot_ts = timestamp
+            else:
+                self._price_ticks = ticks[index]
+                if self._listeners:
+                    self._publish_price()
+
+        if snapshot_ts is not None:
+            self._finish_snapshot()
+
+        mark = self._mark_price()
+        return BacktestResult(
+            events=len(replay),
+            wall_time_s=time.perf_counter() - started,
+            start_time=replay.start_time,
+            end_time=replay.end_time,
+            fills=list(self._fills),
+            orders_created=self._created,
+            orders_cancelled=self._cancelled,
+            orders_rejected=self._rejected,
+            self_match_cancels=self._self_match_cancels,
+            fees=self._fees,
+            balances=dict(self._balances),
+            mark_price=mark,
+            initial_value=self._value(initial_balances, mark),
+            final_value=self._value(self._balances, mark),
+        )
+
+    # Order entry, used by BacktestClient
+
+    def create_order(self, params: LimitOrderParameters) -> CreateOrderResponse:
+        """Validate, match and (for GTC) rest a limit order."""
+        if params.symbol != self.config.symbol:
+            raise self._reject(f"Unknown symbol {params.symbol}")
+        price = Decimal(str(params.limit_px))
+        qty = Decimal(str(params.qty))
+        if price <= 0 or price % self._tick_size:
+            raise self._reject(f"Price {params.limit_px} is not a multiple of the tick size {self._tick_size}")
+        if qty <= 0 or qty % self._qty_step:
+            raise self._reject(f"Quantity {params.qty} is not a multiple of the step size {self._qty_step}")
+        if qty < self._min_qty:
+            raise self._reject(f"Quantity {params.qty} is below the minimum {self._min_qty}")
+        if params.is_buy:
+            if price * qty > self._available(self.config.quote_asset):
+                raise self._reject(f"Insufficient balance of {self.config.quote_asset}")
+        elif qty > self._available(self.config.base_asset):
+            raise self._reject(f"Insufficient balance of {self.config.base_asset}")
+
+        is_ioc = params.time_in_force == TimeInForce.IOC
+        order_id = str(self._next_order_id)
+        self._next_order_id += 1
+        order = _SimOrder(
+            order_id=order_id,
+            client_order_id=params.client_order_id,
+            is_buy=params.is_buy,
+            price_ticks=int(price / self._tick_size),
+            price=price,
+            qty=qty,
+            created_at=self._now,
+        )
+        self._created += 1
+
+        if self._crosses_own_order(order):
+            self._self_match_cancels += 1
+            order.status = OrderStatus.CANCELLED
+            self._publish_order(order, is_ioc)
+            return self._create_response(order, is_ioc)
+
+        self._take(order)
+        if order.remaining > 0:
+            if is_ioc:
+                order.status = OrderStatus.CANCELLED
+            else:
+                book = self._bids if order.is_buy else self._asks
+                order.queue_ahead = book.get(order.price_ticks, 0.0)
+                resting = self._resting_bids if order.is_buy else self._resting_asks
+                resting.setdefault(order.price_ticks, []).append(order)
+                self._orders[order_id] = order
+        else:
+            order.status = OrderStatus.FILLED
+        self._publish_order(order, is_ioc)
+        return self._create_response(order, is_ioc)
+
+    def cancel_order(self, order_id: Optional[str], client_order_id: Optional[int]) -> CancelOrderResponse:
+        """Cancel an open order by order ID or client order ID."""
+        order = self._orders.get(order_id) if order_id is not None else None
+        if order is None and client_order_id is not None:
+            order = next((o for o in self._orders.values() if o.client_order_id == client_order_id), None)
+        if order is None:
+            raise _rejection("Order not found")
+        self._remove(order, OrderStatus.CANCELLED)
+        self._cancelled += 1
+        self._publish_order(order, False)
+        return CancelOrderResponse(
+            status=OrderStatus.CANCELLED, orderId=order.order_id, clientOrderId=order.client_order_id
+        )
+
+    def cancel_all(self) -> MassCancelResponse:
+        """Cancel all open orders."""
+        orders = list(self._orders.values())
+        for order in orders:
+            self._remove(order, OrderStatus.CANCELLED)
+            self._cancelled += 1
+            self._publish_order(order, False)
+        return MassCancelResponse(cancelledCount=len(orders))
+
+    def open_orders(self) -> list[Order]:
+        """Open orders as REST models."""
+        return [self._order_model(order, False) for order in self._orders.values()]
+
+    def balances(self) -> list[AccountBalance]:
+        """Balances as REST models."""
+        return [
+            AccountBalance(
+                accountId=self.config.account_id,
+                asset=asset,
+                realBalance=str(amount),
+                balanceDEPRECATED=str(amount),
+            )
+            for asset, amount in self._balances.items()
+        ]
+
+    def price(self) -> Price:
+        """Current oracle price (or mid price before the first price event) as a REST model."""
+        mark = self._mark_price()
+        if mark is None:
+            raise _rejection(f"No price available for {self.config.symbol}")
+        return Price(symbol=self.config.symbol, oraclePrice=str(mark), updatedAt=self._now)
+
+    def depth(self) -> Depth:
+        """Current replayed book (without our orders) as a REST model."""
+        return Depth(
+            symbol=self.config.symbol,
+            type=DepthType.SNAPSHOT,
+            bids=[self._level(price, self._bids[price]) for price in sorted(self._bids, reverse=True)],
+            asks=[self._level(price, self._asks[price]) for price in sorted(self._asks)],
+            updatedAt=self._now,
+        )
+
+    def definition(self) -> SpotMarketDefinition:
+        """The simulated market as a spot market definition."""
+        return SpotMarketDefinition(
+            symbol=self.config.symbol,
+            marketId=self.config.market_id,
+            baseAsset=self.config.base_asset,
+            quoteAsset=self.config.quote_asset,
+            minOrderQty=self.config.min_order_qty,
+            qtyStepSize=self.config.qty_step_size,
+            tickSize=self.config.tick_size,
+        )
+
+    # Matching
+
+    def _crosses_own_order(self, order: _SimOrder) -> bool:
+        if order.is_buy:
+            return any(price <= order.price_ticks for price in self._resting_asks)
+        return any(price >= order.price_ticks for price in self._resting_bids)
+
+    def _take(self, order: _SimOrder) -> None:
+        """Match an incoming order against the replayed book."""
+        book = self._asks if order.is_buy else self._bids
+        while order.remaining > 0 and book:
+            best = min(book) if order.is_buy else max(book)
+            if (order.is_buy and best > order.price_ticks) or (not order.is_buy and best < order.price_ticks):
+                break
+            available = self._floor_qty(book[best])
+            if available <= 0:
+                del book[best]
+                continue
+            qty = min(order.remaining, available)
+            remaining_level = book[best] - float(qty)
+            if remaining_level > 0:
+                book[best] = remaining_level
+            else:
+                del book[best]
+            self._fill(order, Decimal(best) * self._tick_size, qty, is_maker=False)
+
+    def _on_trade(self, taker_is_buy: bool, price_ticks: int, qty: float) -> None:
+        """Fill our resting orders against a replayed trade."""
+        resting = self._resting_asks if taker_is_buy else self._resting_bids
+        if taker_is_buy:
+            levels = sorted(price for price in resting if price <= price_ticks)
+        else:
+            levels = sorted((price for price in resting if price >= price_ticks), reverse=True)
+        left = qty
+        for level in levels:
+            for order in list(resting[level]):
+                if left <= 0:
+                    return
+                if level == price_ticks:
+                    # The trade first consumes the quantity queued ahead of us
+                    consumed = min(order.queue_ahead, left)
+                    order.queue_ahead -= consumed
+                    left -= consumed
+                    if left <= 0:
+                        return
+                fill = min(order.remaining, self._floor_qty(left))
+                if fill <= 0:
+                    continue
+                left -= float(fill)
+                self._fill(order, order.price, fill, is_maker=True)
+                if order.remaining <= 0:
+                    self._remove(order, OrderStatus.FILLED)
+                self._publish_order(order, False)
+
+    def _finish_snapshot(self) -> None:
+        """Levels missing from a depth snapshot are empty, so nothing is queued ahead there."""
+        for resting, book in ((self._resting_bids, self._bids), (self._resting_asks, self._asks)):
+            for price, queue in resting.items():
+                if price not in book:
+                    for order in queue:
+                        order.queue_ahead = 0.0
+
+    def _fill(self, order: _SimOrder, price: Decimal, qty: Decimal, is_maker: bool) -> None:
+        notional = price * qty
+        fee = notional * (self._maker_fee if is_maker else self._taker_fee)
+        base, quote = self.config.base_asset, self.config.quote_asset
+        if order.is_buy:
+            self._balances[base] += qty
+            self._balances[quote] -= notional + fee
+        else:
+            self._balances[base] -= qty
+            self._balances[quote] += notional - fee
+        self._fees += fee
+        order.filled += qty
+        order.updated_at = self._now
+        fill = SimulatedFill(
+            timestamp=self._now,
+            order_id=order.order_id,
+            client_order_id=order.client_order_id,
+            is_buy=order.is_buy,
+            price=price,
+            qty=qty,
+            fee=fee,
+            is_maker=is_maker,
+        )
+        self._fills.append(fill)
+        if self._listeners:
+            self._publish_fill(fill)
+
+    def _remove(self, order: _SimOrder, status: OrderStatus) -> None:
+        order.status = status
+        order.updated_at = self._now
+        self._orders.pop(order.order_id, None)
+        resting = self._resting_bids if order.is_buy else self._resting_asks
+        queue = resting.get(order.price_ticks)
+        if queue is not None:
+            queue.remove(order)
+            if not queue:
+                del resting[order.price_ticks]
+
+    # Accounting
+
+    def _available(self, asset: str) -> Decimal:
+        """Balance not reserved by open orders."""
+        reserved = Decimal(0)
+        for order in self._orders.values():
+            if order.is_buy and asset == self.config.quote_asset:
+                reserved += order.price * order.remaining
+            elif not order.is_buy and asset == self.config.base_asset:
+                reserved += order.remaining
+        return self._balances.get(asset, Decimal(0)) - reserved
+
+    def _floor_qty(self, qty: float) -> Decimal:
+        return (Decimal(repr(qty)) / self._qty_step).to_integral_value(rounding=ROUND_DOWN) * self._qty_step
+
+    def _mark_price(self) -> Optional[Decimal]:
+        if self._price_ticks is not None:
+            return Decimal(self._price_ticks) * self._tick_size
+        if self._bids and self._asks:
+            return (Decimal(max(self._bids)) + Decimal(min(self._asks))) * self._tick_size / 2
+        return None
+
+    def _value(self, balances: dict[str, Decimal], mark: Optional[Decimal]) -> Optional[Decimal]:
+        if mark is None:
+            return None
+        base = balances.get(self.config.base_asset, Decimal(0))
+        return balances.get(self.config.quote_asset, Decimal(0)) + base * mark
+
+    def _reject(self, message: str) -> ApiException:
+        self._rejected += 1
+        return _rejection(message)
+
+    # Models and publishing
+
+    def _level(self, price_ticks: int, qty: float) -> Level:
+        return Level(px=str(Decimal(price_ticks) * self._tick_size), qty=repr(qty))
+
+    def _create_response(self, order: _SimOrder, is_ioc: bool) -> CreateOrderResponse:
+        return CreateOrderResponse(
+            status=order.status,
+            execQty=str(order.filled),
+            cumQty=str(order.filled),
+            orderId=None if is_ioc else order.order_id,
+            clientOrderId=order.client_order_id,
+        )
+
+    def _order_fields(self, order: _SimOrder, is_ioc: bool) -> dict[str, Any]:
+        return {
+            "exchangeId": self.config.exchange_id,
+            "symbol": self.config.symbol,
+            "accountId": self.config.account_id,
+            "orderId": order.order_id,
+            "qty": str(order.qty),
+            "execQty": str(order.filled),
+            "cumQty": str(order.filled),
+            "side": Side.B.value if order.is_buy else Side.A.value,
+            "limitPx": str(order.price),
+            "orderType": OrderType.LIMIT.value,
+            "timeInForce": TimeInForce.IOC.value if is_ioc else TimeInForce.GTC.value,
+            "status": order.status.value,
+            "createdAt": order.created_at,
+            "lastUpdateAt": order.updated_at,
+        }
+
+    def _order_model(self, order: _SimOrder, is_ioc: bool) -> Order:
+        return Order.from_dict(self._order_fields(order, is_ioc))  # type: ignore[return-value]
+
+    def _emit(self, message: Any) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(None, message)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(f"Backtest listener failed: {e}")
+
+    def _channel_message(self, channel: str, data: Any) -> dict[str, Any]:
+        return {"type": "channel_data", "timestamp": self._now, "channel": channel, "data": data}
+
+    def _publish_price(self) -> None:
+        assert self._price_ticks is not None
+        price = {
+            "symbol": self.config.symbol,
+            "oraclePrice": str(Decimal(self._price_ticks) * self._tick_size),
+            "updatedAt": self._now,
+        }
+        self._emit(PriceUpdatePayload.model_validate(self._channel_message(f"/v2/prices/{self.config.symbol}", price)))
+
+    def _publish_order(self, order: _SimOrder, is_ioc: bool) -> None:
+        if not self._listeners or is_ioc:
+            return
+        channel = f"/v2/wallet/{self.config.wallet_address}/orderChanges"
+        self._emit(
+            OrderChangeUpdatePayload.model_validate(self._channel_message(channel, [self._order_fields(order, is_ioc)]))
+        )
+
+    def _publish_fill(self, fill: SimulatedFill) -> None:
+        wallet = self.config.wallet_address
+        execution = {
+            "exchangeId": self.config.exchange_id,
+            "symbol": self.config.symbol,
+            "accountId": self.config.account_id,
+            # Replayed counterparties are anonymous; account 0 stands in for them
+            "makerAccountId": self.config.account_id if fill.is_maker else 0,
+            "orderId": fill.order_id,
+            "makerOrderId": fill.order_id if fill.is_maker else None,
+            "side": Side.B.value if fill.is_buy else Side.A.value,
+            "qty": str(fill.qty),
+            "price": str(fill.price),
+            "fee": str(fill.fee),
+            "type": "ORDER_MATCH",
+            "timestamp": fill.timestamp,
+        }
+        self._emit(
+            WalletSpotExecutionUpdatePayload.model_validate(
+                self._channel_message(f"/v2/wallet/{wallet}/spotExecutions", [execution])
+            )
+        )
+        balances = [
+            {
+                "accountId": self.config.account_id,
+                "asset": asset,
+                "realBalance": str(self._balances[asset]),
+                "balanceDEPRECATED": str(self._balances[asset]),
+            }
+            for asset in (self.config.base_asset, self.config.quote_asset)
+        ]
+        self._emit(
+            AccountBalanceUpdatePayload.model_validate(
+                self._channel_message(f"/v2/wallet/{wallet}/accountBalances", balances)
+            )
+        )
+
+
+class _BacktestMarkets:
+    def __init__(self, backtester: Backtester):
+        self._backtester = backtester
+
+    async def get_price(self, symbol: str) -> Price:
+        self._backtester.client.check_symbol(symbol)
+        return self._backtester.price()
+
+    async def get_market_depth(self, symbol: str) -> Depth:
+        self._backtester.client.check_symbol(symbol)
+        return self._backtester.depth()
+
+
+class _BacktestReference:
+    def __init__(self, backtester: Backtester):
+        self._backtester = backtester
+
+    async def get_spot_market_definitions(self) -> list[SpotMarketDefinition]:
+        return [self._backtester.definition()]
+
+    async def get_market_definitions(self) -> list[Any]:
+        return []
+
+
+class BacktestClient:
+    """
+    Stand-in for ``ReyaTradingClient`` inside a backtest.
+
+    Implements the order entry methods (``create_limit_order``, ``cancel_order``,
+    ``replace_order``, ``mass_cancel``), the account queries (``get_open_orders``,
+    ``get_account_balances``) and ``markets.get_price``/``get_market_depth``,
+    ``reference.get_spot_market_definitions`` with the same signatures and return
+    models. Rejections raise ``ApiException`` like the API does.
+    """
+
+    def __init__(self, backtester: Backtester):
+        self._backtester = backtester
+        self.markets = _BacktestMarkets(backtester)
+        self.reference = _BacktestReference(backtester)
+
+    @property
+    def config(self) -> BacktestConfig:
+        """The simulated market and account."""
+        return self._backtester.config
+
+    @property
+    def owner_wallet_address(self) -> str:
+        """Simulated wallet address."""
+        return self._backtester.config.wallet_address
+
+    def check_symbol(self, symbol: str) -> None:
+        """Reject requests for other markets than the simulated one."""
+        if symbol != self._backtester.config.symbol:
+            raise _rejection(f"Unknown symbol {symbol}")
+
+    async def start(self) -> None:
+        """No-op, for compatibility."""
+
+    async def close(self) -> None:
+        """No-op, for compatibility."""
+
+    async def __aenter__(self) -> "BacktestClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def create_limit_order(self, params: LimitOrderParameters) -> CreateOrderResponse:
+        """Place a simulated IOC or GTC limit order."""
+        return self._backtester.create_order(params)
+
+    async def cancel_order(
+        self,
+        order_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        account_id: Optional[int] = None,
+        client_order_id: Optional[int] = None,
+    ) -> CancelOrderResponse:
+        """Cancel a simulated order."""
+        del account_id
+        if symbol is not None:
+            self.check_symbol(symbol)
+        if order_id is None and client_order_id is None:
+            raise ValueError("Either order_id or client_order_id must be provided")
+        return self._backtester.cancel_order(order_id, client_order_id)
+
+    async def replace_order(
+        self,
+        order_id: str,
+        new_params: LimitOrderParameters,
+        account_id: Optional[int] = None,
+        create_first: bool = False,
+    ) -> ReplaceOrderResult:
+        """Cancel a simulated order and place its replacement."""
+        cancel_response: Optional[CancelOrderResponse] = None
+        create_response: Optional[CreateOrderResponse] = None
+        cancel_error: Optional[Exception] = None
+        create_error: Optional[Exception] = None
+
+        async def cancel() -> None:
+            nonlocal cancel_response, cancel_error
+            try:
+                cancel_response = await self.cancel_order(order_id, new_params.symbol, account_id)
+            except ApiException as e:
+                cancel_error = e
+
+        async def create() -> None:
+            nonlocal create_response, create_error
+            try:
+                create_response = await self.create_limit_order(new_params)
+            except ApiException as e:
+                create_error = e
+
+        for step in (create, cancel) if create_first else (cancel, create):
+            await step()
+
+        if cancel_error is None and create_error is None:
+            status = ReplaceOrderStatus.REPLACED
+        elif create_error is None:
+            status = ReplaceOrderStatus.CANCEL_FAILED
+        elif cancel_error is None:
+            status = ReplaceOrderStatus.CREATE_FAILED
+        else:
+            status = ReplaceOrderStatus.BOTH_FAILED
+        return ReplaceOrderResult(
+            status=status,
+            cancel_response=cancel_response,
+            create_response=create_response,
+            cancel_error=cancel_error,
+            create_error=create_error,
+        )
+
+    async def mass_cancel(self, symbol: str, account_id: Optional[int] = None) -> MassCancelResponse:
+        """Cancel all simulated orders."""
+        del account_id
+        self.check_symbol(symbol)
+        return self._backtester.cancel_all()
+
+    async def get_open_orders(self) -> list[Order]:
+        """Open simulated orders."""
+        return self._backtester.open_orders()
+
+    async def get_account_balances(self) -> list[AccountBalance]:
+        """Simulated balances."""
+        return self._backtester.balances()
+
+
+def run_parallel(
+    func: Callable[[Any], ResultT], params: Iterable[Any], max_workers: Optional[int] = None
+) -> list[ResultT]:
+    """
+    Run independent backtests (e.g. a parameter sweep) in separate processes.
+
+    Args:
+        func: Module-level function taking one parameter set and returning a picklable
+            result; typically it builds a replay and runs ``asyncio.run(backtester.run(...))``.
+        params: Parameter sets.
+        max_workers: Number of processes; defaults to the CPU count.
+
+    Returns:
+        Results in the order of ``params``.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, params))
+
+
+def run_backtest(
+    backtester: Backtester,
+    on_interval: Optional[Callable[[BacktestClient, int], Awaitable[None]]] = None,
+    interval_ms: int = 1000,
+) -> BacktestResult:
+    """Run a backtest to completion from synchronous code (e.g. inside ``run_parallel`` workers)."""
+    return asyncio.run(backtester.run(on_interval, interval_ms))
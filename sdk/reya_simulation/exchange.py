@@ -0,0 +1,1219 @@
+"""
+Simulated Exchange - In-process matching engine behind the order entry API.
+
+``SimulatedExchange`` accepts the same ``CreateOrderRequest``, ``CancelOrderRequest``
+and ``MassCancelRequest`` models as the REST API and keeps orders, balances,
+positions and executions in memory:
+
+    - Spot markets: GTC and IOC limit orders matched price-time against a central
+      book, with self-match prevention (an order reaching its own account's resting
+      order is cancelled there, keeping earlier fills) and balances settled per fill.
+      Orders are checked against balances not reserved by open orders.
+    - Perp markets: market (IOC, optionally reduce-only), GTC limit and TP/SL orders
+      filled against the pool at the oracle price; limit and trigger orders wait for
+      ``set_price`` to cross them. Positions track size and average entry price, and
+      realized PnL and fees settle in the quote asset.
+
+Every state change is published as the WebSocket payload model of its channel, to
+listeners and to ``SimulatedSocket`` subscriptions; depth is published as updates
+of the changed levels. Signatures are not verified;
+nonces and deadlines of spot requests are, so nonce retries behave as against the
+API.
+"""
+
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import bisect
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from eth_account import Account as EthAccount
+
+from sdk.async_api.account_balance_update_payload import AccountBalanceUpdatePayload
+from sdk.async_api.market_depth_update_payload import MarketDepthUpdatePayload
+from sdk.async_api.market_spot_execution_update_payload import MarketSpotExecutionUpdatePayload
+from sdk.async_api.order_change_update_payload import OrderChangeUpdatePayload
+from sdk.async_api.position_update_payload import PositionUpdatePayload
+from sdk.async_api.price_update_payload import PriceUpdatePayload
+from sdk.async_api.prices_update_payload import PricesUpdatePayload
+from sdk.async_api.wallet_perp_execution_update_payload import WalletPerpExecutionUpdatePayload
+from sdk.async_api.wallet_spot_execution_update_payload import WalletSpotExecutionUpdatePayload
+from sdk.open_api.exceptions import ApiException, BadRequestException
+from sdk.open_api.models.account import Account
+from sdk.open_api.models.account_balance import AccountBalance
+from sdk.open_api.models.account_type import AccountType
+from sdk.open_api.models.cancel_order_request import CancelOrderRequest
+from sdk.open_api.models.cancel_order_response import CancelOrderResponse
+from sdk.open_api.models.create_order_request import CreateOrderRequest
+from sdk.open_api.models.create_order_response import CreateOrderResponse
+from sdk.open_api.models.depth import Depth
+from sdk.open_api.models.execution_type import ExecutionType
+from sdk.open_api.models.fee_tier_parameters import FeeTierParameters
+from sdk.open_api.models.global_fee_parameters import GlobalFeeParameters
+from sdk.open_api.models.market_definition import MarketDefinition
+from sdk.open_api.models.market_summary import MarketSummary
+from sdk.open_api.models.mass_cancel_request import MassCancelRequest
+from sdk.open_api.models.mass_cancel_response import MassCancelResponse
+from sdk.open_api.models.order import Order
+from sdk.open_api.models.order_status import OrderStatus
+from sdk.open_api.models.order_type import OrderType
+from sdk.open_api.models.pagination_meta import PaginationMeta
+from sdk.open_api.models.perp_execution import PerpExecution
+from sdk.open_api.models.perp_execution_list import PerpExecutionList
+from sdk.open_api.models.position import Position
+from sdk.open_api.models.price import Price
+from sdk.open_api.models.request_error import RequestError
+from sdk.open_api.models.request_error_code import RequestErrorCode
+from sdk.open_api.models.side import Side
+from sdk.open_api.models.spot_execution import SpotExecution
+from sdk.open_api.models.spot_execution_list import SpotExecutionList
+from sdk.open_api.models.spot_market_definition import SpotMarketDefinition
+from sdk.open_api.models.tier_type import TierType
+from sdk.open_api.models.time_in_force import TimeInForce
+from sdk.open_api.models.wallet_configuration import WalletConfiguration
+from sdk.reya_rest_api.config import TradingConfig
+from sdk.reya_rest_api.constants.enums import OrdersGatewayOrderType
+
+logger = logging.getLogger("reya_simulation.exchange")
+
+DEFAULT_QUOTE_ASSET = "RUSD"
+SIMULATED_API_URL = "simulated://reya"
+SIMULATED_CHAIN_ID = 89346162
+EXECUTIONS_PAGE_SIZE = 100
+
+CREATE_ORDER_ERROR = "CREATE_ORDER_OTHER_ERROR"
+CANCEL_ORDER_ERROR = "CANCEL_ORDER_OTHER_ERROR"
+INPUT_ERROR = "INPUT_VALIDATION_ERROR"
+SYMBOL_ERROR = "SYMBOL_NOT_FOUND"
+
+Listener = Callable[[Any, Any], None]
+
+
+def _api_error(error: str, message: str) -> ApiException:
+    """A 400 error with the body of the API's errors, parsed into ``data`` like the generated client does."""
+    return BadRequestException(
+        status=400,
+        reason="Bad Request",
+        body=json.dumps({"error": error, "message": message}),
+        data=RequestError(error=RequestErrorCode(error), message=message),
+    )
+
+
+def _decimal_str(value: Decimal) -> str:
+    """Decimal without trailing zeros or exponent, as the API formats amounts ("0" when flat, not "0.000")."""
+    return format(value.normalize(), "f")
+
+
+@dataclass
+class _Position:
+    qty: Decimal = Decimal(0)  # Signed, positive for long
+    avg_entry_price: Decimal = Decimal(0)
+    last_trade_sequence_number: int = 0
+
+
+@dataclass
+class _Account:
+    account_id: int
+    wallet: str
+    name: str
+    account_type: AccountType
+    balances: dict[str, Decimal] = field(default_factory=dict)
+    positions: dict[str, _Position] = field(default_factory=dict)
+    signers: set[str] = field(default_factory=set)
+    reserved: dict[str, Decimal] = field(default_factory=dict)
+    last_nonce: int = 0
+
+
+class _Order:
+    __slots__ = (
+        "order_id",
+        "account_id",
+        "symbol",
+        "is_buy",
+        "price",
+        "qty",
+        "filled",
+        "order_type",
+        "time_in_force",
+        "trigger_px",
+        "reduce_only",
+        "client_order_id",
+        "status",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        order_id: str,
+        request: CreateOrderRequest,
+        qty: Optional[Decimal],
+        now: int,
+    ):
+        self.order_id = order_id
+        self.account_id = request.account_id
+        self.symbol: str = request.symbol or ""
+        self.is_buy = request.is_buy
+        self.price = Decimal(request.limit_px)
+        self.qty = qty
+        self.filled = Decimal(0)
+        self.order_type = request.order_type
+        self.time_in_force = request.time_in_force
+        self.trigger_px = Decimal(request.trigger_px) if request.trigger_px is not None else None
+        self.reduce_only = request.reduce_only
+        self.client_order_id = request.client_order_id
+        self.status = OrderStatus.OPEN
+        self.created_at = now
+        self.updated_at = now
+
+    @property
+    def remaining(self) -> Decimal:
+        return (self.qty or Decimal(0)) - self.filled
+
+
+class _Book:
+    """
+    Resting spot orders of one market, in price-time priority.
+
+    Keeps the resting quantity of each level and the levels changed since the last
+    depth update was taken.
+    """
+
+    def __init__(self) -> None:
+        # Indexed by is_buy: asks, bids
+        self.levels: tuple[dict[Decimal, dict[str, _Order]], dict[Decimal, dict[str, _Order]]] = ({}, {})
+        self.sizes: tuple[dict[Decimal, Decimal], dict[Decimal, Decimal]] = ({}, {})
+        self.prices: tuple[list[Decimal], list[Decimal]] = ([], [])  # ascending
+        self.changed: tuple[set[Decimal], set[Decimal]] = (set(), set())
+
+    def add(self, order: _Order) -> None:
+        levels = self.levels[order.is_buy]
+        queue = levels.get(order.price)
+        if queue is None:
+            levels[order.price] = queue = {}
+            self.sizes[order.is_buy][order.price] = Decimal(0)
+            bisect.insort(self.prices[order.is_buy], order.price)
+        queue[order.order_id] = order
+        self.sizes[order.is_buy][order.price] += order.remaining
+        self.changed[order.is_buy].add(order.price)
+
+    def fill(self, order: _Order, qty: Decimal) -> None:
+        """Account for a fill of a resting order; call before updating the order."""
+        sizes = self.sizes[order.is_buy]
+        if order.price in sizes:
+            sizes[order.price] -= qty
+            self.changed[order.is_buy].add(order.price)
+
+    def remove(self, order: _Order) -> None:
+        levels = self.levels[order.is_buy]
+        queue = levels.get(order.price)
+        if queue is None or queue.pop(order.order_id, None) is None:
+            return
+        self.sizes[order.is_buy][order.price] -= order.remaining
+        self.changed[order.is_buy].add(order.price)
+        if not queue:
+            del levels[order.price]
+            del self.sizes[order.is_buy][order.price]
+            prices = self.prices[order.is_buy]
+            del prices[bisect.bisect_left(prices, order.price)]
+
+    def crossing(self, is_buy: bool, limit: Decimal) -> Iterator[_Order]:
+        """Resting orders an incoming order can trade with, best price first; the book must not change meanwhile."""
+        prices = self.prices[not is_buy]
+        levels = self.levels[not is_buy]
+        if is_buy:
+            candidates: Iterable[int] = range(bisect.bisect_right(prices, limit))
+        else:
+            candidates = range(len(prices) - 1, bisect.bisect_left(prices, limit) - 1, -1)
+        for index in candidates:
+            yield from levels[prices[index]].values()
+
+    def take_changes(self, is_buy: bool) -> list[dict[str, str]]:
+        """Changed levels since the last call, best first; removed levels have quantity 0."""
+        changed = self.changed[is_buy]
+        sizes = self.sizes[is_buy]
+        levels = [{"px": str(price), "qty": str(sizes.get(price, 0))} for price in sorted(changed, reverse=is_buy)]
+        changed.clear()
+        return levels
+
+    def depth(self, is_buy: bool) -> list[dict[str, str]]:
+        prices = self.prices[is_buy]
+        sizes = self.sizes[is_buy]
+        ordered = reversed(prices) if is_buy else prices
+        return [{"px": str(price), "qty": str(sizes[price])} for price in ordered]
+
+
+class SimulatedExchange:
+    """
+    In-process exchange for strategy and integration tests.
+
+    Example:
+        exchange = SimulatedExchange(spot_markets=[weth_rusd], perp_markets=[eth_perp])
+        exchange.set_price("ETHRUSDPERP", "3000")
+        config = exchange.create_account({"RUSD": "10000", "WETH": "2"})
+
+        client = ReyaTradingClient(config=config)
+        exchange.attach(client)
+        await client.start()
+        await client.create_limit_order(params)  # matched in process
+
+        socket = exchange.socket(on_open=..., on_message=...)
+        socket.connect()
+    """
+
+    def __init__(
+        self,
+        spot_markets: Iterable[SpotMarketDefinition] = (),
+        perp_markets: Iterable[MarketDefinition] = (),
+        prices: Optional[dict[str, str]] = None,
+        maker_fee: str = "0",
+        taker_fee: str = "0",
+        exchange_id: int = 2,
+        quote_asset: str = DEFAULT_QUOTE_ASSET,
+        clock: Optional[Callable[[], int]] = None,
+    ):
+        """
+        Initialize the exchange.
+
+        Args:
+            spot_markets: Spot markets to list.
+            perp_markets: Perp markets to list.
+            prices: Initial oracle prices by symbol.
+            maker_fee: Maker fee as a fraction of notional (negative for a rebate).
+            taker_fee: Taker fee as a fraction of notional.
+            exchange_id: Exchange ID reported on orders and executions.
+            quote_asset: Asset perp PnL and fees settle in.
+            clock: Time source in milliseconds; defaults to the wall clock.
+        """
+        self.exchange_id = exchange_id
+        self.quote_asset = quote_asset
+        self._maker_fee = Decimal(maker_fee)
+        self._taker_fee = Decimal(taker_fee)
+        self._clock = clock or (lambda: int(time.time() * 1000))
+        self._lock = threading.Lock()
+
+        self._spot_markets: dict[str, SpotMarketDefinition] = {}
+        self._perp_markets: dict[str, MarketDefinition] = {}
+        self._books: dict[str, _Book] = {}
+        self._prices: dict[str, tuple[Decimal, int]] = {}
+
+        self._accounts: dict[int, _Account] = {}
+        self._orders: dict[str, _Order] = {}
+        self._perp_resting: dict[str, dict[str, _Order]] = {}
+        self._client_order_ids: dict[tuple[int, int], str] = {}
+        self._spot_executions: list[SpotExecution] = []
+        self._perp_executions: list[PerpExecution] = []
+        self._next_order_id = 1
+        self._next_account_id = 1000
+        self._sequence_number = 0
+
+        self._listeners: list[Listener] = []
+        self._subscribers: dict[str, list[Listener]] = {}
+
+        for spot_market in spot_markets:
+            self.add_spot_market(spot_market)
+        for perp_market in perp_markets:
+            self.add_perp_market(perp_market)
+        for symbol, price in (prices or {}).items():
+            self.set_price(symbol, price)
+
+    # Setup
+
+    def add_spot_market(self, definition: SpotMarketDefinition) -> None:
+        """List a spot market."""
+        with self._lock:
+            self._spot_markets[definition.symbol] = definition
+            self._books.setdefault(definition.symbol, _Book())
+
+    def add_perp_market(self, definition: MarketDefinition) -> None:
+        """List a perp market."""
+        with self._lock:
+            self._perp_markets[definition.symbol] = definition
+
+    def add_account(
+        self,
+        wallet_address: str,
+        account_id: Optional[int] = None,
+        balances: Optional[dict[str, str]] = None,
+        account_type: AccountType = AccountType.MAINPERP,
+    ) -> int:
+        """
+        Open an account owned by a wallet.
+
+        Args:
+            wallet_address: Owner wallet address.
+            account_id: Account ID; allocated if omitted.
+            balances: Initial balance per asset.
+            account_type: Account type reported by the wallet accounts query.
+
+        Returns:
+            The account ID.
+        """
+        with self._lock:
+            if account_id is None:
+                account_id = self._next_account_id
+                self._next_account_id += 1
+            elif account_id in self._accounts:
+                raise ValueError(f"Account {account_id} already exists")
+            self._accounts[account_id] = _Account(
+                account_id=account_id,
+                wallet=wallet_address.lower(),
+                name=f"Account {account_id}",
+                account_type=account_type,
+                balances={asset: Decimal(amount) for asset, amount in (balances or {}).items()},
+            )
+            return account_id
+
+    def create_account(
+        self, balances: Optional[dict[str, str]] = None, account_type: AccountType = AccountType.MAINPERP
+    ) -> TradingConfig:
+        """
+        Open an account for a new random wallet and return a client configuration for it.
+
+        Args:
+            balances: Initial balance per asset.
+            account_type: Account type reported by the wallet accounts query.
+
+        Returns:
+            Configuration for a ``ReyaTradingClient`` to be attached to this exchange.
+        """
+        wallet = EthAccount.create()  # pylint: disable=no-value-for-parameter
+        account_id = self.add_account(wallet.address, balances=balances, account_type=account_type)
+        return TradingConfig(
+            api_url=SIMULATED_API_URL,
+            chain_id=SIMULATED_CHAIN_ID,
+            owner_wallet_address=wallet.address,
+            private_key=wallet.key.hex(),
+            account_id=account_id,
+        )
+
+    def permit_signer(self, account_id: int, signer_wallet: str) -> None:
+        """Allow a wallet other than the owner to sign orders for an account."""
+        with self._lock:
+            self._account(account_id).signers.add(signer_wallet.lower())
+
+    def deposit(self, account_id: int, asset: str, amount: str) -> None:
+        """Credit (or with a negative amount, debit) an account balance."""
+        with self._lock:
+            account = self._account(account_id)
+            account.balances[asset] = account.balances.get(asset, Decimal(0)) + Decimal(amount)
+            messages = self._balance_messages(account, [asset])
+        self._deliver(messages)
+
+    def set_price(self, symbol: str, price: str) -> None:
+        """
+        Update an oracle price, filling perp limit orders and triggering TP/SL orders it crosses.
+
+        Args:
+            symbol: Market symbol.
+            price: New oracle price.
+        """
+        with self._lock:
+            now = self._clock()
+            self._prices[symbol] = (Decimal(price), now)
+            messages: list[Any] = []
+            self._queue_price(messages, symbol)
+            if symbol in self._perp_markets:
+                self._check_resting_perp_orders(messages, symbol)
+        self._deliver(messages)
+
+    def attach(self, client: Any) -> None:
+        """
+        Route a ``ReyaTradingClient``'s REST resources to this exchange.
+
+        Args:
+            client: The trading client; call ``start()`` on it afterwards as usual.
+        """
+        # Imported here: resources wraps this class
+        from sdk.reya_simulation.resources import SimulatedResources  # pylint: disable=import-outside-toplevel
+
+        client._resources = SimulatedResources(self)  # pylint: disable=protected-access
+
+    def socket(
+        self,
+        on_open: Optional[Callable[[Any], None]] = None,
+        on_message: Optional[Listener] = None,
+    ) -> Any:
+        """
+        Create a ``SimulatedSocket`` (a ``ReyaSocket`` stand-in) fed by this exchange.
+
+        Args:
+            on_open: Called with the socket on ``connect()``, typically to subscribe.
+            on_message: Called with (socket, payload model) for subscribed channels.
+        """
+        # Imported here: the socket wraps this class
+        from sdk.reya_simulation.socket import SimulatedSocket  # pylint: disable=import-outside-toplevel
+
+        return SimulatedSocket(self, on_open=on_open, on_message=on_message)
+
+    def add_listener(self, listener: Listener) -> None:
+        """Register an ``on_message(ws, message)`` callback for every published payload (ws is None)."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """Unregister a callback registered with ``add_listener``."""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def subscribe(self, channel: str, listener: Listener) -> Optional[dict[str, Any]]:
+        """
+        Deliver the payloads of one channel to a listener.
+
+        Args:
+            channel: WebSocket channel path, e.g. ``/v2/wallet/{address}/orderChanges``.
+            listener: ``on_message(ws, message)`` callback.
+
+        Returns:
+            The initial contents of the channel, as sent in its subscribed message.
+        """
+        with self._lock:
+            # Keyed case-insensitively: wallet addresses may be checksummed or not
+            listeners = self._subscribers.setdefault(channel.lower(), [])
+            if listener not in listeners:
+                listeners.append(listener)
+            return self._channel_contents(channel)
+
+    def unsubscribe(self, channel: str, listener: Listener) -> None:
+        """Stop delivering a channel to a listener."""
+        with self._lock:
+            listeners = self._subscribers.get(channel.lower(), [])
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners:
+                self._subscribers.pop(channel.lower(), None)
+
+    # Order entry
+
+    def create_order(self, request: CreateOrderRequest) -> CreateOrderResponse:
+        """Handle a create order request like ``POST /createOrder``."""
+        with self._lock:
+            messages: list[Any] = []
+            response = self._create_order(messages, request)
+        self._deliver(messages)
+        return response
+
+    def cancel_order(self, request: CancelOrderRequest) -> CancelOrderResponse:
+        """Handle a cancel order request like ``POST /cancelOrder``."""
+        with self._lock:
+            messages: list[Any] = []
+            order: Optional[_Order] = None
+            if request.order_id is not None:
+                order = self._orders.get(request.order_id)
+            elif request.client_order_id is not None and request.account_id is not None:
+                order_id = self._client_order_ids.get((request.account_id, request.client_order_id))
+                order = self._orders.get(order_id) if order_id is not None else None
+            if order is not None and order.symbol in self._spot_markets:
+                self._check_spot_request(CANCEL_ORDER_ERROR, request.account_id, request.nonce, request.expires_after)
+                if request.account_id != order.account_id:
+                    order = None
+            if order is None or order.status != OrderStatus.OPEN:
+                raise _api_error(
+                    CANCEL_ORDER_ERROR, f"Missing order with id {request.order_id or request.client_order_id}"
+                )
+            self._close_order(messages, order, OrderStatus.CANCELLED)
+            response = CancelOrderResponse(
+                status=OrderStatus.CANCELLED, orderId=order.order_id, clientOrderId=order.client_order_id
+            )
+        self._deliver(messages)
+        return response
+
+    def cancel_all(self, request: MassCancelRequest) -> MassCancelResponse:
+        """Handle a mass cancel request like ``POST /cancelAll``."""
+        with self._lock:
+            messages: list[Any] = []
+            self._check_spot_request(CANCEL_ORDER_ERROR, request.account_id, request.nonce, request.expires_after)
+            orders = [
+                order
+                for order in self._orders.values()
+                if order.account_id == request.account_id
+                and order.status == OrderStatus.OPEN
+                and (request.symbol is None or order.symbol == request.symbol)
+            ]
+            for order in orders:
+                self._close_order(messages, order, OrderStatus.CANCELLED)
+        self._deliver(messages)
+        return MassCancelResponse(cancelledCount=len(orders))
+
+    # Queries
+
+    def open_orders(self, wallet_address: str) -> list[Order]:
+        """Open orders of a wallet's accounts."""
+        with self._lock:
+            account_ids = self._wallet_account_ids(wallet_address)
+            return [
+                Order.from_dict(self._order_fields(order))  # type: ignore[misc]
+                for order in self._orders.values()
+                if order.status == OrderStatus.OPEN and order.account_id in account_ids
+            ]
+
+    def account_balances(self, wallet_address: str) -> list[AccountBalance]:
+        """Balances of a wallet's accounts."""
+        with self._lock:
+            return [
+                AccountBalance(
+                    accountId=account.account_id,
+                    asset=asset,
+                    realBalance=str(amount),
+                    balanceDEPRECATED=str(amount),
+                )
+                for account in self._wallet_accounts(wallet_address)
+                for asset, amount in account.balances.items()
+            ]
+
+    def positions(self, wallet_address: str) -> list[Position]:
+        """Open perp positions of a wallet's accounts."""
+        with self._lock:
+            return [
+                Position.from_dict(self._position_fields(account, symbol))  # type: ignore[misc]
+                for account in self._wallet_accounts(wallet_address)
+                for symbol, position in account.positions.items()
+                if position.qty != 0
+            ]
+
+    def accounts(self, wallet_address: str) -> list[Account]:
+        """Accounts of a wallet."""
+        with self._lock:
+            return [
+                Account(accountId=account.account_id, name=account.name, type=account.account_type)
+                for account in self._wallet_accounts(wallet_address)
+            ]
+
+    def wallet_configuration(self, wallet_address: str) -> WalletConfiguration:
+        """Fee configuration of a wallet (always the base tier)."""
+        del wallet_address
+        return WalletConfiguration(feeTierId=0, ogStatus=False, affiliateStatus=False, refereeStatus=False)
+
+    def fee_tier_parameters(self) -> list[FeeTierParameters]:
+        """The single fee tier, charging the exchange's maker and taker fees."""
+        return [
+            FeeTierParameters(
+                tierId=0,
+                takerFee=str(self._taker_fee),
+                makerFee=str(self._maker_fee),
+                volume14d="0",
+                tierType=TierType.REGULAR,
+            )
+        ]
+
+    def global_fee_parameters(self) -> GlobalFeeParameters:
+        """Fee discounts and rebates (none are simulated)."""
+        return GlobalFeeParameters(ogDiscount="0", refereeDiscount="0", referrerRebate="0", affiliateReferrerRebate="0")
+
+    def markets_summary(self) -> list[MarketSummary]:
+        """Open interest of the perp markets, summed over all positions; funding is not simulated."""
+        with self._lock:
+            summaries = []
+            for symbol in self._perp_markets:
+                positions = [
+                    account.positions[symbol].qty for account in self._accounts.values() if symbol in account.positions
+                ]
+                long_oi = sum((qty for qty in positions if qty > 0), Decimal(0))
+                short_oi = -sum((qty for qty in positions if qty < 0), Decimal(0))
+                price, updated_at = self._prices.get(symbol, (Decimal(0), self._clock()))
+                summaries.append(
+                    MarketSummary(
+                        symbol=symbol,
+                        updatedAt=updated_at,
+                        longOiQty=str(long_oi),
+                        shortOiQty=str(short_oi),
+                        oiQty=str(max(long_oi, short_oi)),
+                        fundingRate="0",
+                        longFundingValue="0",
+                        shortFundingValue="0",
+                        fundingRateVelocity="0",
+                        volume24h="0",
+                        pxChange24h="0",
+                        throttledOraclePrice=str(price),
+                        throttledPoolPrice=str(price),
+                        pricesUpdatedAt=updated_at,
+                    )
+                )
+            return summaries
+
+    def spot_executions(
+        self,
+        wallet_address: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> SpotExecutionList:
+        """Spot executions of a wallet (as taker or maker) or a market, newest first, one page."""
+        with self._lock:
+            if symbol is not None and symbol not in self._spot_markets:
+                raise _api_error(SYMBOL_ERROR, f"Symbol {symbol} not found")
+            account_ids = self._wallet_account_ids(wallet_address) if wallet_address is not None else None
+            rows = [
+                execution
+                for execution in reversed(self._spot_executions)
+                if (symbol is None or execution.symbol == symbol)
+                and (
+                    account_ids is None
+                    or execution.account_id in account_ids
+                    or execution.maker_account_id in account_ids
+                )
+                and (start_time is None or execution.timestamp >= start_time)
+                and (end_time is None or execution.timestamp <= end_time)
+            ][:EXECUTIONS_PAGE_SIZE]
+        return SpotExecutionList(data=rows, meta=self._page_meta(rows, start_time, end_time))
+
+    def perp_executions(
+        self,
+        wallet_address: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> PerpExecutionList:
+        """Perp executions of a wallet or a market, newest first, one page."""
+        with self._lock:
+            if symbol is not None and symbol not in self._perp_markets:
+                raise _api_error(SYMBOL_ERROR, f"Symbol {symbol} not found")
+            account_ids = self._wallet_account_ids(wallet_address) if wallet_address is not None else None
+            rows = [
+                execution
+                for execution in reversed(self._perp_executions)
+                if (symbol is None or execution.symbol == symbol)
+                and (account_ids is None or execution.account_id in account_ids)
+                and (start_time is None or execution.timestamp >= start_time)
+                and (end_time is None or execution.timestamp <= end_time)
+            ][:EXECUTIONS_PAGE_SIZE]
+        return PerpExecutionList(data=rows, meta=self._page_meta(rows, start_time, end_time))
+
+    def depth(self, symbol: str) -> Depth:
+        """Aggregated book of a spot market."""
+        with self._lock:
+            return Depth.from_dict(self._depth_fields(symbol))  # type: ignore[return-value]
+
+    def price(self, symbol: str) -> Price:
+        """Oracle price of a market."""
+        with self._lock:
+            if symbol not in self._prices:
+                raise _api_error("NO_PRICES_FOUND_FOR_SYMBOL", f"No prices found for symbol {symbol}")
+            return Price.from_dict(self._price_fields(symbol))  # type: ignore[return-value]
+
+    def prices(self) -> list[Price]:
+        """All oracle prices."""
+        with self._lock:
+            return [Price.from_dict(self._price_fields(symbol)) for symbol in self._prices]  # type: ignore[misc]
+
+    def spot_market_definitions(self) -> list[SpotMarketDefinition]:
+        """Listed spot markets."""
+        with self._lock:
+            return list(self._spot_markets.values())
+
+    def market_definitions(self) -> list[MarketDefinition]:
+        """Listed perp markets."""
+        with self._lock:
+            return list(self._perp_markets.values())
+
+    # Order handling (called with the lock held)
+
+    def _create_order(self, messages: list[Any], request: CreateOrderRequest) -> CreateOrderResponse:
+        symbol = request.symbol or ""
+        if request.exchange_id <= 0:
+            raise _api_error(INPUT_ERROR, "exchangeId must be a positive integer")
+        if not request.signature:
+            raise _api_error(INPUT_ERROR, "signature is required")
+        account = self._accounts.get(request.account_id)
+        if account is None:
+            raise _api_error(CREATE_ORDER_ERROR, f"Account {request.account_id} not found")
+        signer = request.signer_wallet.lower()
+        if signer != account.wallet and signer not in account.signers:
+            raise _api_error(CREATE_ORDER_ERROR, "Unauthorized: signer does not have permission")
+        if symbol in self._spot_markets:
+            self._check_spot_request(CREATE_ORDER_ERROR, account.account_id, request.nonce, request.expires_after)
+            return self._create_spot_order(messages, account, request)
+        if symbol in self._perp_markets:
+            return self._create_perp_order(messages, account, request)
+        raise _api_error(CREATE_ORDER_ERROR, f"Unknown symbol {symbol}")
+
+    def _check_spot_request(
+        self, error: str, account_id: Optional[int], nonce: Optional[str], expires_after: Optional[int]
+    ) -> None:
+        """Spot requests carry an increasing nonce per account and a deadline in seconds."""
+        account = self._accounts.get(account_id) if account_id is not None else None
+        if account is None:
+            raise _api_error(error, f"Account {account_id} not found")
+        if not nonce or not nonce.isdigit():
+            raise _api_error(INPUT_ERROR, "nonce must be a non-negative integer string")
+        if expires_after is None:
+            raise _api_error(INPUT_ERROR, "expiresAfter is required for spot orders")
+        if int(nonce) <= account.last_nonce:
+            raise _api_error(error, f"Invalid nonce {nonce}: must be greater than {account.last_nonce}")
+        if expires_after * 1000 < self._clock():
+            raise _api_error(error, f"Deadline {expires_after} has expired")
+        account.last_nonce = int(nonce)
+
+    def _validate_qty_price(self, definition: Any, qty: Decimal, price: Optional[Decimal]) -> None:
+        min_qty = Decimal(definition.min_order_qty)
+        if qty < min_qty:
+            raise _api_error(CREATE_ORDER_ERROR, f"Order quantity {qty} is below minimum order base {min_qty}")
+        if qty % Decimal(definition.qty_step_size):
+            raise _api_error(
+                CREATE_ORDER_ERROR, f"Order quantity {qty} does not conform to base spacing {definition.qty_step_size}"
+            )
+        if price is not None and (price <= 0 or price % Decimal(definition.tick_size)):
+            raise _api_error(
+                CREATE_ORDER_ERROR, f"Order price {price} does not conform to price spacing {definition.tick_size}"
+            )
+
+    def _new_order(self, request: CreateOrderRequest, qty: Optional[Decimal]) -> _Order:
+        order = _Order(str(self._next_order_id), request, qty, self._clock())
+        self._next_order_id += 1
+        return order
+
+    def _create_spot_order(
+        self, messages: list[Any], account: _Account, request: CreateOrderRequest
+    ) -> CreateOrderResponse:
+        definition = self._spot_markets[request.symbol or ""]
+        if request.order_type != OrderType.LIMIT:
+            raise _api_error(CREATE_ORDER_ERROR, f"Order type {request.order_type.value} is not supported for spot")
+        if request.qty is None:
+            raise _api_error(CREATE_ORDER_ERROR, "Order quantity is required")
+        qty = Decimal(request.qty)
+        price = Decimal(request.limit_px)
+        self._validate_qty_price(definition, qty, price)
+
+        if request.is_buy:
+            asset, required = definition.quote_asset, price * qty
+        else:
+            asset, required = definition.base_asset, qty
+        available = self._available(account, asset)
+        if required > available:
+            raise _api_error(CREATE_ORDER_ERROR, f"Insufficient balance: required {required}, available {available}")
+
+        order = self._new_order(request, qty)
+        is_ioc = request.time_in_force == TimeInForce.IOC
+        book = self._books[order.symbol]
+        # Makers the order reaches, up to the first one of its own account (self-match)
+        crossing = []
+        self_match = False
+        needed = order.remaining
+        for maker in book.crossing(order.is_buy, order.price):
+            if needed <= 0:
+                break
+            if maker.account_id == order.account_id:
+                self_match = True
+                break
+            crossing.append(maker)
+            needed -= maker.remaining
+
+        for maker in crossing:
+            self._match_spot(messages, definition, order, maker)
+        if order.remaining <= 0:
+            order.status = OrderStatus.FILLED
+        elif self_match or is_ioc:
+            order.status = OrderStatus.CANCELLED
+            if self_match:
+                logger.debug(f"Order {order.order_id} cancelled by self-match prevention after filling {order.filled}")
+        else:
+            book.add(order)
+            self._orders[order.order_id] = order
+            self._reserve(order, definition, order.remaining)
+            if order.client_order_id is not None:
+                self._client_order_ids[(order.account_id, order.client_order_id)] = order.order_id
+        self._queue_depth(messages, order.symbol)
+
+        if not is_ioc:
+            self._queue_order(messages, order)
+        return CreateOrderResponse(
+            status=order.status,
+            execQty=str(order.filled),
+            cumQty=str(order.filled),
+            orderId=order.order_id,
+            clientOrderId=order.client_order_id,
+        )
+
+    def _match_spot(self, messages: list[Any], definition: SpotMarketDefinition, taker: _Order, maker: _Order) -> None:
+        qty = min(taker.remaining, maker.remaining)
+        price = maker.price
+        notional = price * qty
+        taker_fee = notional * self._taker_fee
+        maker_fee = notional * self._maker_fee
+        base, quote = definition.base_asset, definition.quote_asset
+        taker_account = self._accounts[taker.account_id]
+        maker_account = self._accounts[maker.account_id]
+        for account, is_buy, fee in (
+            (taker_account, taker.is_buy, taker_fee),
+            (maker_account, maker.is_buy, maker_fee),
+        ):
+            sign = 1 if is_buy else -1
+            account.balances[base] = account.balances.get(base, Decimal(0)) + sign * qty
+            account.balances[quote] = account.balances.get(quote, Decimal(0)) - sign * notional - fee
+
+        self._reserve(maker, definition, -qty)
+        self._books[maker.symbol].fill(maker, qty)
+        now = self._clock()
+        for order in (taker, maker):
+            order.filled += qty
+            order.updated_at = now
+        if maker.remaining <= 0:
+            self._close_order(messages, maker, OrderStatus.FILLED, publish_depth=False)
+        else:
+            self._queue_order(messages, maker)
+
+        execution = SpotExecution(
+            exchangeId=self.exchange_id,
+            symbol=taker.symbol,
+            accountId=taker.account_id,
+            makerAccountId=maker.account_id,
+            orderId=taker.order_id,
+            makerOrderId=maker.order_id,
+            side=Side.B if taker.is_buy else Side.A,
+            qty=str(qty),
+            price=str(price),
+            fee=str(taker_fee),
+            type=ExecutionType.ORDER_MATCH,
+            timestamp=now,
+        )
+        self._spot_executions.append(execution)
+        self._queue_spot_execution(messages, execution, taker_account, maker_account)
+        for account in (taker_account, maker_account) if maker_account is not taker_account else (taker_account,):
+            messages.extend(self._balance_messages(account, [base, quote]))
+
+    def _create_perp_order(
+        self, messages: list[Any], account: _Account, request: CreateOrderRequest
+    ) -> CreateOrderResponse:
+        definition = self._perp_markets[request.symbol or ""]
+        gateway_type = _gateway_order_type(request)
+        qty: Optional[Decimal] = None
+        if gateway_type in (OrdersGatewayOrderType.TAKE_PROFIT, OrdersGatewayOrderType.STOP_LOSS):
+            if request.trigger_px is None:
+                raise _api_error(CREATE_ORDER_ERROR, "Trigger price is required for TP/SL orders")
+        else:
+            if request.qty is None:
+                raise _api_error(CREATE_ORDER_ERROR, "Order quantity is required")
+            qty = Decimal(request.qty)
+            self._validate_qty_price(definition, qty, None)
+        if request.symbol not in self._prices:
+            raise _api_error(CREATE_ORDER_ERROR, f"No oracle price for {request.symbol}")
+
+        order = self._new_order(request, qty)
+        oracle = self._prices[order.symbol][0]
+        if gateway_type in (OrdersGatewayOrderType.MARKET_ORDER, OrdersGatewayOrderType.REDUCE_ONLY_MARKET_ORDER):
+            if gateway_type == OrdersGatewayOrderType.REDUCE_ONLY_MARKET_ORDER:
+                position = account.positions.get(order.symbol, _Position()).qty
+                reducible = -position if order.is_buy else position
+                if reducible <= 0:
+                    raise _api_error(CREATE_ORDER_ERROR, "ReduceOnlyConditionFailed: no position to reduce")
+                order.qty = min(order.remaining, reducible)
+            crosses = oracle <= order.price if order.is_buy else oracle >= order.price
+            if order.remaining > 0 and crosses:
+                self._fill_perp(messages, order, oracle, is_maker=False)
+                order.status = OrderStatus.FILLED
+                # The position changed: cancel the TP/SL orders it no longer backs
+                self._check_resting_perp_orders(messages, order.symbol)
+            else:
+                order.status = OrderStatus.CANCELLED
+            return CreateOrderResponse(
+                status=order.status,
+                execQty=str(order.filled),
+                cumQty=str(order.filled),
+                clientOrderId=order.client_order_id,
+            )
+
+        self._orders[order.order_id] = order
+        self._perp_resting.setdefault(order.symbol, {})[order.order_id] = order
+        if order.client_order_id is not None:
+            self._client_order_ids[(order.account_id, order.client_order_id)] = order.order_id
+        self._queue_order(messages, order)
+        self._check_resting_perp_orders(messages, order.symbol)
+        return CreateOrderResponse(
+            status=order.status,
+            execQty=str(order.filled),
+            cumQty=str(order.filled),
+            orderId=order.order_id,
+            clientOrderId=order.client_order_id,
+        )
+
+    def _check_resting_perp_orders(self, messages: list[Any], symbol: str) -> None:
+        """Fill perp limit orders and fire TP/SL orders crossed by the oracle price."""
+        oracle = self._prices[symbol][0]
+        resting = list(self._perp_resting.get(symbol, {}).values())
+        filled = False
+        for order in resting:
+            if order.order_id not in self._orders:
+                continue
+            if order.order_type == OrderType.LIMIT:
+                if oracle <= order.price if order.is_buy else oracle >= order.price:
+                    self._fill_perp(messages, order, order.price, is_maker=True)
+                    self._close_order(messages, order, OrderStatus.FILLED)
+                    filled = True
+                continue
+            assert order.trigger_px is not None
+            position = self._accounts[order.account_id].positions.get(symbol, _Position()).qty
+            closable = -position if order.is_buy else position
+            if closable <= 0:
+                # TP/SL orders only close a position: with none (or after a flip) they are cancelled
+                self._close_order(messages, order, OrderStatus.CANCELLED)
+                continue
+            # TP buys and SL sells trigger when the price falls to the trigger, the others when it rises to it
+            falls = order.is_buy == (order.order_type == OrderType.TP)
+            if not (oracle <= order.trigger_px if falls else oracle >= order.trigger_px):
+                continue
+            order.qty = closable
+            self._fill_perp(messages, order, oracle, is_maker=False)
+            self._close_order(messages, order, OrderStatus.FILLED)
+            filled = True
+        if filled:
+            # Fills move positions, which can cancel TP/SL orders already checked above
+            self._check_resting_perp_orders(messages, symbol)
+
+    def _fill_perp(self, messages: list[Any], order: _Order, price: Decimal, is_maker: bool) -> None:
+        qty = order.remaining
+        account = self._accounts[order.account_id]
+        position = account.positions.setdefault(order.symbol, _Position())
+        signed = qty if order.is_buy else -qty
+        fee = price * qty * (self._maker_fee if is_maker else self._taker_fee)
+
+        realized = Decimal(0)
+        if position.qty == 0 or (position.qty > 0) == (signed > 0):
+            total = position.qty + signed
+            position.avg_entry_price = (position.avg_entry_price * abs(position.qty) + price * qty) / abs(total)
+            position.qty = total
+        else:
+            closed = min(abs(signed), abs(position.qty))
+            direction = 1 if position.qty > 0 else -1
+            realized = (price - position.avg_entry_price) * closed * direction
+            position.qty += signed
+            if position.qty == 0:
+                position.avg_entry_price = Decimal(0)
+            elif (position.qty > 0) != (direction > 0):
+                position.avg_entry_price = price
+        account.balances[self.quote_asset] = account.balances.get(self.quote_asset, Decimal(0)) + realized - fee
+
+        self._sequence_number += 1
+        position.last_trade_sequence_number = self._sequence_number
+        now = self._clock()
+        order.filled += qty
+        order.updated_at = now
+        execution = PerpExecution(
+            exchangeId=self.exchange_id,
+            symbol=order.symbol,
+            accountId=order.account_id,
+            qty=str(qty),
+            side=Side.B if order.is_buy else Side.A,
+            price=str(price),
+            fee=str(fee),
+            type=ExecutionType.ORDER_MATCH,
+            timestamp=now,
+            sequenceNumber=self._sequence_number,
+        )
+        self._perp_executions.append(execution)
+        self._queue_perp_execution(messages, execution, account)
+        messages.extend(self._balance_messages(account, [self.quote_asset]))
+
+    def _close_order(self, messages: list[Any], order: _Order, status: OrderStatus, publish_depth: bool = True) -> None:
+        order.status = status
+        order.updated_at = self._clock()
+        if self._orders.pop(order.order_id, None) is not None:
+            definition = self._spot_markets.get(order.symbol)
+            if definition is not None:
+                self._reserve(order, definition, -order.remaining)
+            else:
+                self._perp_resting.get(order.symbol, {}).pop(order.order_id, None)
+        if order.client_order_id is not None:
+            self._client_order_ids.pop((order.account_id, order.client_order_id), None)
+        book = self._books.get(order.symbol)
+        if book is not None:
+            book.remove(order)
+            if publish_depth:
+                self._queue_depth(messages, order.symbol)
+        self._queue_order(messages, order)
+
+    # Accounting helpers
+
+    def _account(self, account_id: int) -> _Account:
+        account = self._accounts.get(account_id)
+        if account is None:
+            raise ValueError(f"Unknown account {account_id}")
+        return account
+
+    def _wallet_accounts(self, wallet_address: str) -> list[_Account]:
+        wallet = wallet_address.lower()
+        return [account for account in self._accounts.values() if account.wallet == wallet]
+
+    def _wallet_account_ids(self, wallet_address: str) -> set[int]:
+        return {account.account_id for account in self._wallet_accounts(wallet_address)}
+
+    def _available(self, account: _Account, asset: str) -> Decimal:
+        """Balance not reserved by open spot orders."""
+        return account.balances.get(asset, Decimal(0)) - account.reserved.get(asset, Decimal(0))
+
+    def _reserve(self, order: _Order, definition: SpotMarketDefinition, qty: Decimal) -> None:
+        """Reserve (or release, for a negative qty) the balance backing a resting spot order."""
+        account = self._accounts[order.account_id]
+        if order.is_buy:
+            asset, amount = definition.quote_asset, order.price * qty
+        else:
+            asset, amount = definition.base_asset, qty
+        account.reserved[asset] = account.reserved.get(asset, Decimal(0)) + amount
+
+    @staticmethod
+    def _page_meta(rows: list[Any], start_time: Optional[int], end_time: Optional[int]) -> PaginationMeta:
+        return PaginationMeta(limit=EXECUTIONS_PAGE_SIZE, count=len(rows), startTime=start_time, endTime=end_time)
+
+    # Payloads
+
+    def _order_fields(self, order: _Order) -> dict[str, Any]:
+        fields: dict[str, Any] = {
+            "exchangeId": self.exchange_id,
+            "symbol": order.symbol,
+            "accountId": order.account_id,
+            "orderId": order.order_id,
+            "side": Side.B.value if order.is_buy else Side.A.value,
+            "limitPx": str(order.price),
+            "orderType": order.order_type.value,
+            "status": order.status.value,
+            "createdAt": order.created_at,
+            "lastUpdateAt": order.updated_at,
+        }
+        if order.qty is not None:
+            fields.update(qty=str(order.qty), execQty=str(order.filled), cumQty=str(order.filled))
+        if order.time_in_force is not None:
+            fields["timeInForce"] = order.time_in_force.value
+        if order.trigger_px is not None:
+            fields["triggerPx"] = str(order.trigger_px)
+        return fields
+
+    def _position_fields(self, account: _Account, symbol: str) -> dict[str, Any]:
+        position = account.positions[symbol]
+        return {
+            "exchangeId": self.exchange_id,
+            "symbol": symbol,
+            "accountId": account.account_id,
+            "qty": _decimal_str(abs(position.qty)),
+            "side": Side.B.value if position.qty >= 0 else Side.A.value,
+            "avgEntryPrice": _decimal_str(position.avg_entry_price),
+            "avgEntryFundingValue": "0",
+            "lastTradeSequenceNumber": position.last_trade_sequence_number,
+        }
+
+    def _depth_fields(self, symbol: str) -> dict[str, Any]:
+        book = self._books.get(symbol)
+        if book is None:
+            raise _api_error(SYMBOL_ERROR, f"Symbol {symbol} not found")
+        return {
+            "symbol": symbol,
+            "type": "SNAPSHOT",
+            "bids": book.depth(True),
+            "asks": book.depth(False),
+            "updatedAt": self._clock(),
+        }
+
+    def _price_fields(self, symbol: str) -> dict[str, Any]:
+        price, updated_at = self._prices[symbol]
+        return {"symbol": symbol, "oraclePrice": str(price), "updatedAt": updated_at}
+
+    def _balance_fields(self, account: _Account, assets: Iterable[str]) -> list[dict[str, Any]]:
+        return [
+            {
+                "accountId": account.account_id,
+                "asset": asset,
+                "realBalance": str(account.balances.get(asset, Decimal(0))),
+                "balanceDEPRECATED": str(account.balances.get(asset, Decimal(0))),
+            }
+            for asset in assets
+        ]
+
+    def _channel_contents(self, channel: str) -> Optional[dict[str, Any]]:
+        """Initial contents sent with the subscribed message of a channel."""
+        parts = channel.strip("/").split("/")  # e.g. v2, market, {symbol}, depth
+        if len(parts) == 4 and parts[1] == "market" and parts[3] == "depth" and parts[2] in self._books:
+            return self._depth_fields(parts[2])
+        if len(parts) == 4 and parts[1] == "market" and parts[3] == "spotExecutions":
+            rows = [e for e in reversed(self._spot_executions) if e.symbol == parts[2]][:EXECUTIONS_PAGE_SIZE]
+            return {"data": [row.to_dict() for row in rows]}
+        if len(parts) == 4 and parts[1] == "wallet" and parts[3] == "accountBalances":
+            accounts = self._wallet_accounts(parts[2])
+            return {"data": [b for account in accounts for b in self._balance_fields(account, account.balances)]}
+        return None
+
+    def _wants(self, channel: str) -> bool:
+        return bool(self._listeners) or channel.lower() in self._subscribers
+
+    def _message(self, payload_type: Any, channel: str, data: Any) -> tuple[str, Any]:
+        return channel, payload_type.model_validate(
+            {"type": "channel_data", "timestamp": self._clock(), "channel": channel, "data": data}
+        )
+
+    def _queue_order(self, messages: list[Any], order: _Order) -> None:
+        channel = f"/v2/wallet/{self._accounts[order.account_id].wallet}/orderChanges"
+        if self._wants(channel):
+            messages.append(self._message(OrderChangeUpdatePayload, channel, [self._order_fields(order)]))
+
+    def _queue_depth(self, messages: list[Any], symbol: str) -> None:
+        """Publish the levels changed since the last depth update."""
+        book = self._books[symbol]
+        bids, asks = book.take_changes(True), book.take_changes(False)
+        channel = f"/v2/market/{symbol}/depth"
+        if (bids or asks) and self._wants(channel):
+            fields = {"symbol": symbol, "type": "UPDATE", "bids": bids, "asks": asks, "updatedAt": self._clock()}
+            messages.append(self._message(MarketDepthUpdatePayload, channel, fields))
+
+    def _queue_price(self, messages: list[Any], symbol: str) -> None:
+        channel = f"/v2/prices/{symbol}"
+        if self._wants(channel):
+            messages.append(self._message(PriceUpdatePayload, channel, self._price_fields(symbol)))
+        if self._wants("/v2/prices"):
+            messages.append(self._message(PricesUpdatePayload, "/v2/prices", [self._price_fields(symbol)]))
+
+    def _queue_spot_execution(
+        self, messages: list[Any], execution: SpotExecution, taker: _Account, maker: _Account
+    ) -> None:
+        data = [execution.to_dict()]
+        channel = f"/v2/market/{execution.symbol}/spotExecutions"
+        if self._wants(channel):
+            messages.append(self._message(MarketSpotExecutionUpdatePayload, channel, data))
+        for wallet in dict.fromkeys((taker.wallet, maker.wallet)):
+            channel = f"/v2/wallet/{wallet}/spotExecutions"
+            if self._wants(channel):
+                messages.append(self._message(WalletSpotExecutionUpdatePayload, channel, data))
+
+    def _queue_perp_execution(self, messages: list[Any], execution: PerpExecution, account: _Account) -> None:
+        channel = f"/v2/wallet/{account.wallet}/perpExecutions"
+        if self._wants(channel):
+            messages.append(self._message(WalletPerpExecutionUpdatePayload, channel, [execution.to_dict()]))
+        channel = f"/v2/wallet/{account.wallet}/positions"
+        if self._wants(channel):
+            messages.append(
+                self._message(PositionUpdatePayload, channel, [self._position_fields(account, execution.symbol)])
+            )
+
+    def _balance_messages(self, account: _Account, assets: Iterable[str]) -> list[Any]:
+        channel = f"/v2/wallet/{account.wallet}/accountBalances"
+        if not self._wants(channel):
+            return []
+        return [self._message(AccountBalanceUpdatePayload, channel, self._balance_fields(account, assets))]
+
+    def _deliver(self, messages: list[tuple[str, Any]]) -> None:
+        """Hand queued payloads to listeners and subscribers, outside the lock."""
+        if not messages:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+            subscribers = {channel: list(self._subscribers.get(channel.lower(), ())) for channel, _ in messages}
+        for channel, message in messages:
+            for listener in listeners + subscribers[channel]:
+                try:
+                    listener(None, message)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error(f"Simulated exchange listener failed on {channel}: {e}")
+
+
+def _gateway_order_type(request: CreateOrderRequest) -> OrdersGatewayOrderType:
+    """Perp order type of a request, as the client derives it when signing."""
+    if request.order_type == OrderType.TP:
+        return OrdersGatewayOrderType.TAKE_PROFIT
+    if request.order_type == OrderType.SL:
+        return OrdersGatewayOrderType.STOP_LOSS
+    if request.time_in_force == TimeInForce.GTC:
+        return OrdersGatewayOrderType.LIMIT_ORDER
+    if request.reduce_only:
+        return OrdersGatewayOrderType.REDUCE_ONLY_MARKET_ORDER
+    return OrdersGatewayOrderType.MARKET_ORDER
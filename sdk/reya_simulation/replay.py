@@ -0,0 +1,219 @@
+"""
+Market Replay - Time-ordered stream of recorded depth, price and execution events.
+
+Events are kept as parallel lists of plain ints and floats (prices in ticks), so a
+backtest can iterate over millions of them without building model objects.
+"""
+
+from typing import Any, Iterable, Optional
+
+from decimal import Decimal
+from enum import IntEnum
+
+from sdk.async_api.market_depth_update_payload import MarketDepthUpdatePayload
+from sdk.async_api.market_perp_execution_update_payload import MarketPerpExecutionUpdatePayload
+from sdk.async_api.market_spot_execution_update_payload import MarketSpotExecutionUpdatePayload
+from sdk.async_api.price_update_payload import PriceUpdatePayload
+from sdk.async_api.prices_update_payload import PricesUpdatePayload
+from sdk.reya_data.tick_archive import DEPTH, EXECUTIONS, TickArchive, price_units_to_ticks
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+
+class EventKind(IntEnum):
+    """Kinds of replayed events."""
+
+    BOOK_CLEAR = 0  # A depth snapshot follows; drop all levels
+    BOOK_LEVEL = 1  # Set the quantity of a price level (0 removes it)
+    TRADE = 2  # Public execution; side is the taker side
+    PRICE = 3  # Oracle price update
+
+
+class MarketReplay:
+    """
+    Recorded events of one market, ordered by timestamp.
+
+    Attributes:
+        symbol: Trading symbol.
+        tick_size: Price tick size the prices are expressed in.
+        timestamps: Event times in milliseconds.
+        kinds: EventKind of each event.
+        sides: 1 for bids/buys, -1 for asks/sells, 0 for other events.
+        price_ticks: Price in ticks.
+        qtys: Base quantity (level size or traded quantity).
+    """
+
+    def __init__(self, symbol: str, tick_size: str):
+        """
+        Initialize an empty replay.
+
+        Args:
+            symbol: Trading symbol.
+            tick_size: Price tick size of the market.
+        """
+        self.symbol = symbol
+        self.tick_size = Decimal(tick_size)
+        self.timestamps: list[int] = []
+        self.kinds: list[int] = []
+        self.sides: list[int] = []
+        self.price_ticks: list[int] = []
+        self.qtys: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def start_time(self) -> Optional[int]:
+        """Timestamp of the first event."""
+        return self.timestamps[0] if self.timestamps else None
+
+    @property
+    def end_time(self) -> Optional[int]:
+        """Timestamp of the last event."""
+        return self.timestamps[-1] if self.timestamps else None
+
+    def to_ticks(self, price: str) -> int:
+        """Convert a price string to ticks."""
+        return int((Decimal(price) / self.tick_size).to_integral_value())
+
+    def append(self, timestamp: int, kind: EventKind, side: int = 0, price_ticks: int = 0, qty: float = 0.0) -> None:
+        """Append one event; events must be appended in timestamp order (see ``sort``)."""
+        self.timestamps.append(timestamp)
+        self.kinds.append(kind)
+        self.sides.append(side)
+        self.price_ticks.append(price_ticks)
+        self.qtys.append(qty)
+
+    def add_message(self, message: Any) -> None:
+        """
+        Append the events of a recorded WebSocket message; other messages are ignored.
+
+        Args:
+            message: Depth, market execution or price payload of this replay's symbol.
+        """
+        if isinstance(message, MarketDepthUpdatePayload):
+            depth = message.data
+            if depth.symbol != self.symbol:
+                return
+            if depth.type.value == "SNAPSHOT":
+                self.append(depth.updated_at, EventKind.BOOK_CLEAR)
+            for side, levels in ((1, depth.bids), (-1, depth.asks)):
+                for level in levels:
+                    self.append(depth.updated_at, EventKind.BOOK_LEVEL, side, self.to_ticks(level.px), float(level.qty))
+        elif isinstance(message, (MarketPerpExecutionUpdatePayload, MarketSpotExecutionUpdatePayload)):
+            for execution in message.data:
+                if execution.symbol == self.symbol:
+                    side = 1 if execution.side.value == "B" else -1
+                    self.append(
+                        execution.timestamp,
+                        EventKind.TRADE,
+                        side,
+                        self.to_ticks(execution.price),
+                        abs(float(execution.qty)),
+                    )
+        elif isinstance(message, (PriceUpdatePayload, PricesUpdatePayload)):
+            prices = message.data if isinstance(message, PricesUpdatePayload) else [message.data]
+            for price in prices:
+                if price.symbol == self.symbol:
+                    self.append(price.updated_at, EventKind.PRICE, 0, self.to_ticks(price.oracle_price))
+
+    def sort(self) -> None:
+        """Order events by timestamp, keeping the recorded order of events with equal timestamps."""
+        order = sorted(range(len(self.timestamps)), key=self.timestamps.__getitem__)
+        self.timestamps = [self.timestamps[i] for i in order]
+        self.kinds = [self.kinds[i] for i in order]
+        self.sides = [self.sides[i] for i in order]
+        self.price_ticks = [self.price_ticks[i] for i in order]
+        self.qtys = [self.qtys[i] for i in order]
+
+    @classmethod
+    def from_messages(cls, symbol: str, tick_size: str, messages: Iterable[Any]) -> "MarketReplay":
+        """
+        Build a replay from recorded WebSocket messages.
+
+        Args:
+            symbol: Trading symbol.
+            tick_size: Price tick size of the market.
+            messages: Depth, market execution and price payloads, in any order.
+
+        Returns:
+            The replay, sorted by timestamp.
+        """
+        replay = cls(symbol, tick_size)
+        for message in messages:
+            replay.add_message(message)
+        replay.sort()
+        return replay
+
+    @classmethod
+    def from_archive(
+        cls,
+        archive: TickArchive,
+        symbol: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        prices: Optional[tuple[Any, Any]] = None,
+    ) -> "MarketReplay":
+        """
+        Build a replay from a tick archive (requires numpy).
+
+        Args:
+            archive: Tick archive with the symbol's executions and depth.
+            symbol: Trading symbol.
+            start_time: Only events at or after this timestamp (ms).
+            end_time: Only events before this timestamp (ms).
+            prices: Optional (timestamps, prices) arrays of oracle prices.
+
+        Returns:
+            The replay, sorted by timestamp; at equal timestamps depth comes before prices and trades.
+        """
+        tick_size = archive.tick_size(symbol)
+        price_unit = archive.price_unit(symbol)
+        replay = cls(symbol, str(tick_size))
+        depth = archive.load(symbol, DEPTH, start_time, end_time)
+        trades = archive.load(symbol, EXECUTIONS, start_time, end_time)
+        depth_ticks = price_units_to_ticks(depth["price_units"], tick_size, price_unit)
+        trade_ticks = price_units_to_ticks(trades["price_units"], tick_size, price_unit)
+
+        # A snapshot starts at each level-0 row that does not continue the previous snapshot
+        levels = depth["level"]
+        depth_ts = depth["timestamp"]
+        previous_level = np.concatenate(([-1], levels[:-1]))
+        previous_ts = np.concatenate(([-1], depth_ts[:-1]))
+        clears = (levels >= 0) & ((previous_level < 0) | (previous_ts != depth_ts))
+        clear_ts = depth_ts[clears]
+
+        parts = [
+            # Clears are placed before the rows of their snapshot by the stable sort below
+            (clear_ts, EventKind.BOOK_CLEAR, np.zeros(len(clear_ts)), np.zeros(len(clear_ts)), np.zeros(len(clear_ts))),
+            (depth_ts, EventKind.BOOK_LEVEL, depth["side"], depth_ticks, depth["qty"]),
+        ]
+        if prices is not None:
+            price_ts = np.asarray(prices[0], dtype=np.int64)
+            price_ticks = np.rint(np.asarray(prices[1], dtype=np.float64) / float(tick_size))
+            mask = np.ones(len(price_ts), dtype=bool)
+            if start_time is not None:
+                mask &= price_ts >= start_time
+            if end_time is not None:
+                mask &= price_ts < end_time
+            parts.append(
+                (price_ts[mask], EventKind.PRICE, np.zeros(mask.sum()), price_ticks[mask], np.zeros(mask.sum()))
+            )
+        parts.append((trades["timestamp"], EventKind.TRADE, trades["side"], trade_ticks, trades["qty"]))
+
+        timestamps = np.concatenate([part[0] for part in parts]).astype(np.int64)
+        kinds = np.concatenate([np.full(len(part[0]), int(part[1]), dtype=np.int8) for part in parts])
+        sides = np.concatenate([part[2] for part in parts]).astype(np.int8)
+        ticks = np.concatenate([part[3] for part in parts]).astype(np.int64)
+        qtys = np.concatenate([part[4] for part in parts]).astype(np.float64)
+
+        order = np.argsort(timestamps, kind="stable")
+        replay.timestamps = timestamps[order].tolist()
+        replay.kinds = kinds[order].tolist()
+        replay.sides = sides[order].tolist()
+        replay.price_ticks = ticks[order].tolist()
+        replay.qtys = qtys[order].tolist()
+        return replay
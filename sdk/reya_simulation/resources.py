@@ -0,0 +1,139 @@
+"""
+Simulated Resources - REST API resources served by a SimulatedExchange.
+
+Each class has the methods and signatures of the generated API class it stands in
+for, so ``ReyaTradingClient`` (and code calling ``client.orders``, ``client.wallet``,
+``client.markets`` or ``client.reference`` directly) runs unchanged.
+"""
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from sdk.open_api.models.account import Account
+from sdk.open_api.models.account_balance import AccountBalance
+from sdk.open_api.models.cancel_order_request import CancelOrderRequest
+from sdk.open_api.models.cancel_order_response import CancelOrderResponse
+from sdk.open_api.models.create_order_request import CreateOrderRequest
+from sdk.open_api.models.create_order_response import CreateOrderResponse
+from sdk.open_api.models.depth import Depth
+from sdk.open_api.models.fee_tier_parameters import FeeTierParameters
+from sdk.open_api.models.global_fee_parameters import GlobalFeeParameters
+from sdk.open_api.models.market_definition import MarketDefinition
+from sdk.open_api.models.market_summary import MarketSummary
+from sdk.open_api.models.mass_cancel_request import MassCancelRequest
+from sdk.open_api.models.mass_cancel_response import MassCancelResponse
+from sdk.open_api.models.order import Order
+from sdk.open_api.models.perp_execution_list import PerpExecutionList
+from sdk.open_api.models.position import Position
+from sdk.open_api.models.price import Price
+from sdk.open_api.models.spot_execution_list import SpotExecutionList
+from sdk.open_api.models.spot_market_definition import SpotMarketDefinition
+from sdk.open_api.models.wallet_configuration import WalletConfiguration
+
+if TYPE_CHECKING:
+    from sdk.reya_simulation.exchange import SimulatedExchange
+
+
+class SimulatedOrderEntryApi:
+    """Stand-in for ``OrderEntryApi``."""
+
+    def __init__(self, exchange: "SimulatedExchange"):
+        self._exchange = exchange
+
+    async def create_order(self, create_order_request: CreateOrderRequest, **_kwargs: Any) -> CreateOrderResponse:
+        return self._exchange.create_order(create_order_request)
+
+    async def cancel_order(self, cancel_order_request: CancelOrderRequest, **_kwargs: Any) -> CancelOrderResponse:
+        return self._exchange.cancel_order(cancel_order_request)
+
+    async def cancel_all(self, mass_cancel_request: MassCancelRequest, **_kwargs: Any) -> MassCancelResponse:
+        return self._exchange.cancel_all(mass_cancel_request)
+
+
+class SimulatedWalletDataApi:
+    """Stand-in for ``WalletDataApi``."""
+
+    def __init__(self, exchange: "SimulatedExchange"):
+        self._exchange = exchange
+
+    async def get_wallet_open_orders(self, address: str, **_kwargs: Any) -> list[Order]:
+        return self._exchange.open_orders(address)
+
+    async def get_wallet_account_balances(self, address: str, **_kwargs: Any) -> list[AccountBalance]:
+        return self._exchange.account_balances(address)
+
+    async def get_wallet_positions(self, address: str, **_kwargs: Any) -> list[Position]:
+        return self._exchange.positions(address)
+
+    async def get_wallet_accounts(self, address: str, **_kwargs: Any) -> list[Account]:
+        return self._exchange.accounts(address)
+
+    async def get_wallet_configuration(self, address: str, **_kwargs: Any) -> WalletConfiguration:
+        return self._exchange.wallet_configuration(address)
+
+    async def get_wallet_spot_executions(
+        self, address: str, start_time: Optional[int] = None, end_time: Optional[int] = None, **_kwargs: Any
+    ) -> SpotExecutionList:
+        return self._exchange.spot_executions(address, start_time=start_time, end_time=end_time)
+
+    async def get_wallet_perp_executions(
+        self, address: str, start_time: Optional[int] = None, end_time: Optional[int] = None, **_kwargs: Any
+    ) -> PerpExecutionList:
+        return self._exchange.perp_executions(address, start_time=start_time, end_time=end_time)
+
+
+class SimulatedMarketDataApi:
+    """Stand-in for the order book, execution, summary and price methods of ``MarketDataApi``."""
+
+    def __init__(self, exchange: "SimulatedExchange"):
+        self._exchange = exchange
+
+    async def get_market_depth(self, symbol: str, **_kwargs: Any) -> Depth:
+        return self._exchange.depth(symbol)
+
+    async def get_price(self, symbol: str, **_kwargs: Any) -> Price:
+        return self._exchange.price(symbol)
+
+    async def get_markets_summary(self, **_kwargs: Any) -> list[MarketSummary]:
+        return self._exchange.markets_summary()
+
+    async def get_prices(self, **_kwargs: Any) -> list[Price]:
+        return self._exchange.prices()
+
+    async def get_market_spot_executions(
+        self, symbol: str, start_time: Optional[int] = None, end_time: Optional[int] = None, **_kwargs: Any
+    ) -> SpotExecutionList:
+        return self._exchange.spot_executions(symbol=symbol, start_time=start_time, end_time=end_time)
+
+    async def get_market_perp_executions(
+        self, symbol: str, start_time: Optional[int] = None, end_time: Optional[int] = None, **_kwargs: Any
+    ) -> PerpExecutionList:
+        return self._exchange.perp_executions(symbol=symbol, start_time=start_time, end_time=end_time)
+
+
+class SimulatedReferenceDataApi:
+    """Stand-in for the market listing and fee methods of ``ReferenceDataApi``."""
+
+    def __init__(self, exchange: "SimulatedExchange"):
+        self._exchange = exchange
+
+    async def get_market_definitions(self, **_kwargs: Any) -> list[MarketDefinition]:
+        return self._exchange.market_definitions()
+
+    async def get_fee_tier_parameters(self, **_kwargs: Any) -> list[FeeTierParameters]:
+        return self._exchange.fee_tier_parameters()
+
+    async def get_global_fee_parameters(self, **_kwargs: Any) -> GlobalFeeParameters:
+        return self._exchange.global_fee_parameters()
+
+    async def get_spot_market_definitions(self, **_kwargs: Any) -> list[SpotMarketDefinition]:
+        return self._exchange.spot_market_definitions()
+
+
+class SimulatedResources:
+    """Stand-in for the client's ``ResourceManager``."""
+
+    def __init__(self, exchange: "SimulatedExchange"):
+        self.orders = SimulatedOrderEntryApi(exchange)
+        self.wallet = SimulatedWalletDataApi(exchange)
+        self.markets = SimulatedMarketDataApi(exchange)
+        self.reference = SimulatedReferenceDataApi(exchange)
@@ -0,0 +1,125 @@
+"""
+Simulated Socket - ReyaSocket stand-in fed by a SimulatedExchange.
+
+It exposes the same ``market``, ``wallet`` and ``prices`` resources as ``ReyaSocket``,
+so subscription code runs unchanged; subscriptions are registered with the exchange
+and payload models are delivered to ``on_message`` synchronously, on the thread that
+changed the exchange state.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+import logging
+
+from sdk.async_api.subscribed_message_payload import SubscribedMessagePayload
+from sdk.async_api.subscribed_message_type import SubscribedMessageType
+from sdk.reya_websocket.resources.market import MarketResource
+from sdk.reya_websocket.resources.prices import PricesResource
+from sdk.reya_websocket.resources.wallet import WalletResource
+from sdk.reya_websocket.socket import BulkSubscriptionResult, SubscriptionResult
+
+if TYPE_CHECKING:
+    from sdk.reya_simulation.exchange import SimulatedExchange
+
+logger = logging.getLogger("reya_simulation.socket")
+
+
+class SimulatedSocket:
+    """WebSocket client stand-in for a simulated exchange."""
+
+    def __init__(
+        self,
+        exchange: "SimulatedExchange",
+        on_open: Optional[Callable[[Any], None]] = None,
+        on_message: Optional[Callable[[Any, Any], None]] = None,
+    ):
+        """
+        Initialize the socket.
+
+        Args:
+            exchange: Exchange publishing the payloads.
+            on_open: Called with the socket on ``connect()``.
+            on_message: Called with (socket, payload model) for each message.
+        """
+        self._exchange = exchange
+        self._on_open = on_open
+        self._on_message = on_message
+        self._market = MarketResource(self)  # type: ignore[arg-type]
+        self._wallet = WalletResource(self)  # type: ignore[arg-type]
+        self._prices = PricesResource(self)  # type: ignore[arg-type]
+        self.active_subscriptions: set[str] = set()
+        self.connected = False
+
+    @property
+    def market(self) -> MarketResource:
+        """Access market-related resources."""
+        return self._market
+
+    @property
+    def wallet(self) -> WalletResource:
+        """Access wallet-related resources."""
+        return self._wallet
+
+    @property
+    def prices(self) -> PricesResource:
+        """Access price-related resources."""
+        return self._prices
+
+    def connect(self, **_kwargs: Any) -> None:
+        """Mark the socket connected and call ``on_open``."""
+        self.connected = True
+        if self._on_open is not None:
+            self._on_open(self)
+
+    def close(self) -> None:
+        """Drop all subscriptions."""
+        for channel in list(self.active_subscriptions):
+            self.send_unsubscribe(channel)
+        self.connected = False
+
+    def send_subscribe(self, channel: str, **_kwargs: Any) -> None:
+        """Subscribe to a channel and deliver its subscribed message with the current contents."""
+        self.active_subscriptions.add(channel)
+        logger.info(f"Subscribing to {channel}")
+        contents = self._exchange.subscribe(channel, self._deliver)
+        self._deliver(
+            None, SubscribedMessagePayload(type=SubscribedMessageType.SUBSCRIBED, channel=channel, contents=contents)
+        )
+
+    def send_unsubscribe(self, channel: str, **_kwargs: Any) -> None:
+        """Unsubscribe from a channel."""
+        if channel not in self.active_subscriptions:
+            return
+        self.active_subscriptions.remove(channel)
+        logger.info(f"Unsubscribing from {channel}")
+        self._exchange.unsubscribe(channel, self._deliver)
+
+    def subscribe_many(
+        self, channels: Iterable[Any], batched: bool = False, timeout: Optional[float] = None
+    ) -> BulkSubscriptionResult:
+        """Subscribe to many channels; each is confirmed as soon as it is registered."""
+        del timeout
+        paths = list(dict.fromkeys(_channel_path(channel) for channel in channels))
+        for path in paths:
+            self.send_subscribe(channel=path, batched=batched)
+        return BulkSubscriptionResult(results=[SubscriptionResult(channel=path, confirmed=True) for path in paths])
+
+    def unsubscribe_many(self, channels: Iterable[Any], timeout: Optional[float] = None) -> BulkSubscriptionResult:
+        """Unsubscribe from many channels."""
+        del timeout
+        paths = list(dict.fromkeys(_channel_path(channel) for channel in channels))
+        for path in paths:
+            self.send_unsubscribe(channel=path)
+        return BulkSubscriptionResult(results=[SubscriptionResult(channel=path, confirmed=True) for path in paths])
+
+    def _deliver(self, _ws: Any, message: Any) -> None:
+        if self._on_message is not None:
+            self._on_message(self, message)
+
+
+def _channel_path(channel: Any) -> str:
+    """Resolve a channel path from a string or a subscription object."""
+    path = channel if isinstance(channel, str) else getattr(channel, "path", None)
+    if not isinstance(path, str):
+        raise ValueError(f"Cannot determine channel path for {channel!r}")
+    return path
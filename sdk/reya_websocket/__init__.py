@@ -1,12 +1,20 @@
 from sdk.reya_websocket.resources.market import MarketResource
 from sdk.reya_websocket.resources.prices import PricesResource
 from sdk.reya_websocket.resources.wallet import WalletResource
-from sdk.reya_websocket.socket import ReyaSocket, WebSocketDataError, WebSocketMessage
+from sdk.reya_websocket.socket import (
+    BulkSubscriptionResult,
+    ReyaSocket,
+    SubscriptionResult,
+    WebSocketDataError,
+    WebSocketMessage,
+)
 
 __all__ = [
     "ReyaSocket",
     "WebSocketMessage",
     "WebSocketDataError",
+    "SubscriptionResult",
+    "BulkSubscriptionResult",
     "MarketResource",
     "WalletResource",
     "PricesResource",
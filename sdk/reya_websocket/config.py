@@ -19,6 +19,8 @@ class WebSocketConfig:
     reconnect_attempts: int = 3
     reconnect_delay: int = 5
     subscription_batch_size: int = 10
+    subscription_batch_interval: float = 1.0
+    subscription_timeout: float = 10.0
 
     @classmethod
     def from_env(cls) -> "WebSocketConfig":
@@ -34,6 +36,9 @@ class WebSocketConfig:
             ping_timeout=int(os.environ.get("REYA_WS_PING_TIMEOUT", "10")),
             reconnect_attempts=int(os.environ.get("REYA_WS_RECONNECT_ATTEMPTS", "3")),
             reconnect_delay=int(os.environ.get("REYA_WS_RECONNECT_DELAY", "5")),
+            subscription_batch_size=int(os.environ.get("REYA_WS_SUBSCRIPTION_BATCH_SIZE", "10")),
+            subscription_batch_interval=float(os.environ.get("REYA_WS_SUBSCRIPTION_BATCH_INTERVAL", "1.0")),
+            subscription_timeout=float(os.environ.get("REYA_WS_SUBSCRIPTION_TIMEOUT", "10.0")),
         )
 
 
@@ -4,27 +4,36 @@ This module provides a WebSocket client that follows the same patterns as the RE
 - All messages are parsed into typed Pydantic models
 - Callbacks receive typed payloads directly (no raw dict access)
 - Parsing failures raise exceptions (fail-fast, like REST)
+
+In lean mode, the rows of execution, order change and depth channels are built
+without validation as compact records (``sdk.reya_data.records``) instead of models.
+Channel paths, symbols and asset names are interned (``sdk.reya_data.interning``).
 """
 
-from typing import Callable, Optional, Union, cast
+from typing import Any, Callable, Iterable, Optional, Union, cast
 
 import json
 import logging
 import ssl
 import threading
+import time
+from dataclasses import dataclass, field
 
 from pydantic import BaseModel, ValidationError
-from websocket import WebSocket, WebSocketApp  # type: ignore[attr-defined]  # pylint: disable=no-name-in-module
+from websocket import (  # type: ignore[attr-defined]  # pylint: disable=no-name-in-module
+    WebSocket,
+    WebSocketApp,
+    WebSocketException,
+)
 
 from sdk.async_api.account_balance_update_payload import AccountBalanceUpdatePayload
+from sdk.async_api.channel_data_message_type import ChannelDataMessageType
+from sdk.async_api.depth import Depth
+from sdk.async_api.depth_type import DepthType
 from sdk.async_api.error_message_payload import ErrorMessagePayload
 from sdk.async_api.market_depth_update_payload import MarketDepthUpdatePayload
-from sdk.async_api.market_perp_execution_update_payload import (
-    MarketPerpExecutionUpdatePayload,
-)
-from sdk.async_api.market_spot_execution_update_payload import (
-    MarketSpotExecutionUpdatePayload,
-)
+from sdk.async_api.market_perp_execution_update_payload import MarketPerpExecutionUpdatePayload
+from sdk.async_api.market_spot_execution_update_payload import MarketSpotExecutionUpdatePayload
 from sdk.async_api.market_summary_update_payload import MarketSummaryUpdatePayload
 from sdk.async_api.markets_summary_update_payload import MarketsSummaryUpdatePayload
 from sdk.async_api.order_change_update_payload import OrderChangeUpdatePayload
@@ -35,12 +44,10 @@ from sdk.async_api.price_update_payload import PriceUpdatePayload
 from sdk.async_api.prices_update_payload import PricesUpdatePayload
 from sdk.async_api.subscribed_message_payload import SubscribedMessagePayload
 from sdk.async_api.unsubscribed_message_payload import UnsubscribedMessagePayload
-from sdk.async_api.wallet_perp_execution_update_payload import (
-    WalletPerpExecutionUpdatePayload,
-)
-from sdk.async_api.wallet_spot_execution_update_payload import (
-    WalletSpotExecutionUpdatePayload,
-)
+from sdk.async_api.wallet_perp_execution_update_payload import WalletPerpExecutionUpdatePayload
+from sdk.async_api.wallet_spot_execution_update_payload import WalletSpotExecutionUpdatePayload
+from sdk.reya_data.interning import SHARED_TABLE
+from sdk.reya_data.records import LevelRecord, OrderRecord, PerpExecutionRecord, SpotExecutionRecord
 from sdk.reya_websocket.config import WebSocketConfig, get_config
 from sdk.reya_websocket.resources.market import MarketResource
 from sdk.reya_websocket.resources.prices import PricesResource
@@ -77,10 +84,60 @@ WebSocketMessage = Union[
 ]
 
 
+# Channel data payloads whose rows are records in lean mode, with the row converter
+LEAN_ROW_TYPES: dict[type[BaseModel], Callable[[dict[str, Any]], Any]] = {
+    MarketPerpExecutionUpdatePayload: PerpExecutionRecord.from_json,
+    WalletPerpExecutionUpdatePayload: PerpExecutionRecord.from_json,
+    MarketSpotExecutionUpdatePayload: SpotExecutionRecord.from_json,
+    WalletSpotExecutionUpdatePayload: SpotExecutionRecord.from_json,
+    OrderChangeUpdatePayload: OrderRecord.from_json,
+}
+
+
 class WebSocketDataError(Exception):
     """Exception raised when WebSocket data cannot be parsed into a typed model."""
 
 
+@dataclass(frozen=True)
+class SubscriptionResult:
+    """Outcome of a single channel in a bulk subscribe/unsubscribe request."""
+
+    channel: str
+    confirmed: bool
+    error: Optional[str] = None
+    timed_out: bool = False
+
+
+@dataclass(frozen=True)
+class BulkSubscriptionResult:
+    """Per-channel outcomes of a bulk subscribe/unsubscribe request."""
+
+    results: list[SubscriptionResult]
+
+    @property
+    def confirmed(self) -> list[str]:
+        """Channels the server confirmed."""
+        return [result.channel for result in self.results if result.confirmed]
+
+    @property
+    def failed(self) -> list[SubscriptionResult]:
+        """Channels that were rejected, could not be sent or timed out."""
+        return [result for result in self.results if not result.confirmed]
+
+    @property
+    def all_confirmed(self) -> bool:
+        """Whether every channel was confirmed."""
+        return all(result.confirmed for result in self.results)
+
+
+@dataclass
+class _PendingConfirmation:
+    """Confirmation slot for a channel awaiting a subscribed/unsubscribed reply."""
+
+    event: threading.Event = field(default_factory=threading.Event)
+    error: Optional[str] = None
+
+
 class ReyaSocket(WebSocketApp):
     """WebSocket client for Reya API v2 with resource-based access and type safety."""
 
@@ -105,6 +162,7 @@ class ReyaSocket(WebSocketApp):
         on_error: Optional[Callable[[WebSocket, Exception], None]] = None,
         on_close: Optional[Callable[[WebSocket, int, str], None]] = None,
         config: Optional[WebSocketConfig] = None,
+        lean: bool = False,
         **kwargs,
     ):
         """Initialize the WebSocket client with resources.
@@ -117,11 +175,16 @@ class ReyaSocket(WebSocketApp):
             on_error: Callback for error events.
             on_close: Callback for connection close events.
             config: WebSocket configuration. If None, loads from env file.
+            lean: Build execution, order change and depth payloads without validation,
+                  with their rows (``data``, or the depth levels) as compact records
+                  such as PerpExecutionRecord instead of models. For long-running
+                  collectors; other channels are parsed as usual.
             **kwargs: Additional keyword arguments for WebSocketApp.
         """
         # Set up configuration
         self.config = config or get_config()
         url = url or self.config.url
+        self.lean = lean
 
         # Initialize resources
         self._market = MarketResource(self)
@@ -130,6 +193,12 @@ class ReyaSocket(WebSocketApp):
 
         # Initialize thread attribute
         self._thread: Optional[threading.Thread] = None
+        # Ident of the thread running the dispatch loop (and therefore all callbacks)
+        self._dispatch_thread_id: Optional[int] = None
+
+        # Confirmations awaited by subscribe_many/unsubscribe_many, keyed by (action, channel)
+        self._pending_confirmations: dict[tuple[str, str], _PendingConfirmation] = {}
+        self._pending_lock = threading.Lock()
 
         # Store user callback for wrapping
         self._user_on_message = on_message
@@ -170,6 +239,9 @@ class ReyaSocket(WebSocketApp):
             # Parse into typed model (raises WebSocketDataError on failure)
             typed_message = self._parse_message(raw)
 
+            # Resolve any bulk subscribe/unsubscribe waiting on this confirmation
+            self._resolve_pending_confirmation(typed_message)
+
             # Call user callback or default with typed message
             if self._user_on_message is not None:
                 self._user_on_message(ws, typed_message)
@@ -259,6 +331,12 @@ class ReyaSocket(WebSocketApp):
                 payload_type = self._get_payload_type(channel)
                 if payload_type is None:
                     raise WebSocketDataError(f"Unknown channel: {channel}")
+                message["channel"] = SHARED_TABLE.intern(channel)
+                if self.lean:
+                    lean_message = self._parse_lean(payload_type, message)
+                    if lean_message is not None:
+                        return lean_message
+                SHARED_TABLE.intern_fields(message.get("data"))
                 return cast(WebSocketMessage, payload_type.model_validate(message))
 
             else:
@@ -268,6 +346,38 @@ class ReyaSocket(WebSocketApp):
             logger.error(f"Failed to parse {message_type} message: {e}")
             raise WebSocketDataError(f"Invalid {message_type} message format: {e}")
 
+    @staticmethod
+    def _parse_lean(payload_type: type[BaseModel], message: dict) -> Optional[WebSocketMessage]:
+        """Build a channel data payload with record rows, or return None for channels without records."""
+        try:
+            convert = LEAN_ROW_TYPES.get(payload_type)
+            data: Any
+            if convert is not None:
+                data = [convert(row) for row in message["data"]]
+            elif payload_type is MarketDepthUpdatePayload:
+                depth = message["data"]
+                data = Depth.model_construct(
+                    symbol=SHARED_TABLE.intern(depth["symbol"]),
+                    type=DepthType(depth["type"]),
+                    bids=[LevelRecord.from_json(level) for level in depth["bids"]],
+                    asks=[LevelRecord.from_json(level) for level in depth["asks"]],
+                    updated_at=depth["updatedAt"],
+                )
+            else:
+                return None
+            return cast(
+                WebSocketMessage,
+                payload_type.model_construct(
+                    type=ChannelDataMessageType.CHANNEL_DATA,
+                    timestamp=message["timestamp"],
+                    channel=message["channel"],
+                    data=data,
+                ),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"Failed to parse channel_data message: {e!r}")
+            raise WebSocketDataError(f"Invalid channel_data message format: {e!r}") from e
+
     @property
     def market(self) -> MarketResource:
         """Access market-related resources."""
@@ -309,6 +419,169 @@ class ReyaSocket(WebSocketApp):
         logger.info(f"Unsubscribing from {channel}")
         self.send(json.dumps(message))
 
+    def subscribe_many(
+        self, channels: Iterable[Any], batched: bool = False, timeout: Optional[float] = None
+    ) -> BulkSubscriptionResult:
+        """Subscribe to many channels with paced frames and wait for confirmations.
+
+        At most ``config.subscription_batch_size`` subscribe frames are sent per
+        ``config.subscription_batch_interval`` seconds so large subscription sets do not
+        trip server-side throttling. Confirmations are collected as they arrive, while
+        later frames are still being sent.
+
+        Args:
+            channels: Channel paths or subscription objects exposing a ``path`` attribute
+                      (e.g. ``socket.market.depth("BTCRUSDPERP")``).
+            batched: Whether to receive updates in batches.
+            timeout: Seconds to wait for each channel's confirmation after its frame was
+                     sent. Defaults to ``config.subscription_timeout``.
+
+        Returns:
+            Per-channel results. Channels rejected by the server or that could not be
+            sent are removed from ``active_subscriptions``; timed-out channels are kept
+            since their confirmation may still arrive.
+
+        Raises:
+            RuntimeError: If called from a WebSocket callback (e.g. ``on_open``), where
+                          confirmations could never be dispatched.
+            ValueError: If a channel is neither a string nor has a ``path``.
+        """
+        result = self._send_many(
+            "subscribe", channels, lambda channel: self.send_subscribe(channel=channel, batched=batched), timeout
+        )
+        for failure in result.failed:
+            if not failure.timed_out:
+                self.active_subscriptions.discard(failure.channel)
+        return result
+
+    def unsubscribe_many(self, channels: Iterable[Any], timeout: Optional[float] = None) -> BulkSubscriptionResult:
+        """Unsubscribe from many channels with paced frames and wait for confirmations.
+
+        Args:
+            channels: Channel paths or subscription objects exposing a ``path`` attribute.
+            timeout: Seconds to wait for each channel's confirmation after its frame was
+                     sent. Defaults to ``config.subscription_timeout``.
+
+        Returns:
+            Per-channel results.
+
+        Raises:
+            RuntimeError: If called from a WebSocket callback.
+            ValueError: If a channel is neither a string nor has a ``path``.
+        """
+        return self._send_many("unsubscribe", channels, lambda channel: self.send_unsubscribe(channel=channel), timeout)
+
+    @staticmethod
+    def _channel_path(channel: Any) -> str:
+        """Resolve a channel path from a string or a subscription object."""
+        if isinstance(channel, str):
+            return channel
+        path = getattr(channel, "path", None)
+        if not isinstance(path, str):
+            raise ValueError(f"Cannot determine channel path for {channel!r}")
+        return path
+
+    def _send_many(
+        self, action: str, channels: Iterable[Any], send: Callable[[str], None], timeout: Optional[float]
+    ) -> BulkSubscriptionResult:
+        """Send paced subscribe/unsubscribe frames and collect per-channel confirmations.
+
+        Args:
+            action: Either "subscribe" or "unsubscribe".
+            channels: Channel paths or subscription objects.
+            send: Function sending a single frame for a channel path.
+            timeout: Per-channel confirmation timeout in seconds.
+
+        Returns:
+            Per-channel results in request order.
+        """
+        if self._dispatch_thread_id is not None and self._dispatch_thread_id == threading.get_ident():
+            raise RuntimeError(
+                f"{action}_many() cannot be called from a WebSocket callback; "
+                "call it from another thread once the connection is open"
+            )
+
+        paths = list(dict.fromkeys(self._channel_path(channel) for channel in channels))
+        timeout = self.config.subscription_timeout if timeout is None else timeout
+        batch_size = max(1, self.config.subscription_batch_size)
+        interval = self.config.subscription_batch_interval
+
+        pending: dict[str, _PendingConfirmation] = {}
+        with self._pending_lock:
+            for path in paths:
+                pending[path] = self._pending_confirmations[(action, path)] = _PendingConfirmation()
+
+        send_errors: dict[str, str] = {}
+        sent_at: dict[str, float] = {}
+        try:
+            batch_started = time.monotonic()
+            for index, path in enumerate(paths):
+                if index and index % batch_size == 0:
+                    delay = batch_started + interval - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    batch_started = time.monotonic()
+                try:
+                    send(path)
+                except WebSocketException as e:
+                    send_errors[path] = f"Failed to send {action} frame: {e}"
+                    continue
+                sent_at[path] = time.monotonic()
+
+            results = []
+            for path in paths:
+                if path in send_errors:
+                    results.append(SubscriptionResult(channel=path, confirmed=False, error=send_errors[path]))
+                    continue
+                confirmation = pending[path]
+                if confirmation.event.wait(max(0.0, sent_at[path] + timeout - time.monotonic())):
+                    results.append(
+                        SubscriptionResult(channel=path, confirmed=confirmation.error is None, error=confirmation.error)
+                    )
+                else:
+                    results.append(
+                        SubscriptionResult(
+                            channel=path,
+                            confirmed=False,
+                            error=f"No confirmation received within {timeout}s",
+                            timed_out=True,
+                        )
+                    )
+        finally:
+            with self._pending_lock:
+                for path, confirmation in pending.items():
+                    if self._pending_confirmations.get((action, path)) is confirmation:
+                        del self._pending_confirmations[(action, path)]
+
+        result = BulkSubscriptionResult(results=results)
+        if not result.all_confirmed:
+            logger.warning(f"{len(result.failed)}/{len(results)} channels failed to {action}")
+        return result
+
+    def _resolve_pending_confirmation(self, message: WebSocketMessage) -> None:
+        """Signal waiters in subscribe_many/unsubscribe_many for a control message.
+
+        Args:
+            message: Typed message received from the server.
+        """
+        if isinstance(message, SubscribedMessagePayload):
+            keys = [("subscribe", message.channel)]
+            error = None
+        elif isinstance(message, UnsubscribedMessagePayload):
+            keys = [("unsubscribe", message.channel)]
+            error = None
+        elif isinstance(message, ErrorMessagePayload) and message.channel is not None:
+            keys = [("subscribe", message.channel), ("unsubscribe", message.channel)]
+            error = message.message
+        else:
+            return
+
+        with self._pending_lock:
+            confirmations = [self._pending_confirmations[key] for key in keys if key in self._pending_confirmations]
+        for confirmation in confirmations:
+            confirmation.error = error
+            confirmation.event.set()
+
     def connect(self, sslopt=None, blocking=False) -> None:
         """Connect to the WebSocket server.
 
@@ -333,24 +606,22 @@ class ReyaSocket(WebSocketApp):
 
         if blocking:
             # Run the WebSocket directly (blocking)
-            self.run_forever(
-                sslopt=sslopt,
-                ping_interval=self.config.ping_interval,
-                ping_timeout=self.config.ping_timeout,
-            )
+            self._run_dispatch(sslopt)
         else:
             # Run the WebSocket in a thread (non-blocking)
-            self._thread = threading.Thread(
-                target=self.run_forever,
-                kwargs={
-                    "sslopt": sslopt,
-                    "ping_interval": self.config.ping_interval,
-                    "ping_timeout": self.config.ping_timeout,
-                },
-            )
+            self._thread = threading.Thread(target=self._run_dispatch, args=(sslopt,))
             self._thread.daemon = True
             self._thread.start()
 
+    def _run_dispatch(self, sslopt: dict) -> None:
+        """Run the WebSocket on the calling thread, recorded as the dispatch thread before any callback runs."""
+        self._dispatch_thread_id = threading.get_ident()
+        self.run_forever(
+            sslopt=sslopt,
+            ping_interval=self.config.ping_interval,
+            ping_timeout=self.config.ping_timeout,
+        )
+
     def _default_on_open(self, _ws):
         """Default handler for connection open events."""
         logger.info("WebSocket connection established")
@@ -15,14 +15,13 @@ from dotenv import load_dotenv
 
 from sdk.open_api.exceptions import ApiException
 from sdk.open_api.models import TimeInForce
+from sdk.open_api.models.market_definition import MarketDefinition
+from sdk.open_api.models.spot_market_definition import SpotMarketDefinition
 from sdk.reya_rest_api.models.orders import LimitOrderParameters
+from sdk.reya_simulation import SimulatedExchange
 from tests.helpers import ReyaTester
 from tests.helpers.reya_tester import logger
-from tests.test_spot.spot_config import (
-    SpotMarketConfig,
-    SpotTestConfig,
-    fetch_spot_market_configs,
-)
+from tests.test_spot.spot_config import SpotMarketConfig, SpotTestConfig, fetch_spot_market_configs
 
 # Time delay between tests
 TEST_DELAY_SECONDS = 0.1
@@ -42,6 +41,22 @@ def pytest_addoption(parser):
         default=DEFAULT_SPOT_ASSET,
         help="Asset to use for spot tests (e.g., ETH, BTC). Default: ETH",
     )
+    parser.addoption(
+        "--simulated-exchange",
+        action="store_true",
+        default=False,
+        help="Run against an in-process simulated exchange instead of the live API",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests that need the live API when running against the simulated exchange."""
+    if not config.getoption("--simulated-exchange"):
+        return
+    skip_live = pytest.mark.skip(reason="needs the live API (signature checks, raw HTTP or WebSocket reconnects)")
+    for item in items:
+        if "live_api" in item.keywords:
+            item.add_marker(skip_live)
 
 
 @pytest.fixture(scope="session")
@@ -50,6 +65,44 @@ def spot_asset(request):
     return request.config.getoption("--spot-asset").upper()
 
 
+@pytest.fixture(scope="session")
+def simulated_exchange(request):
+    """
+    In-process exchange seeded with the ETH spot and perp markets, or None for the live API.
+
+    Enabled with --simulated-exchange; every tester then gets a fresh funded account on it.
+    """
+    if not request.config.getoption("--simulated-exchange"):
+        return None
+    return SimulatedExchange(
+        spot_markets=[
+            SpotMarketDefinition(
+                symbol="WETHRUSD",
+                marketId=5,
+                baseAsset="ETH",
+                quoteAsset="RUSD",
+                minOrderQty="0.001",
+                qtyStepSize="0.001",
+                tickSize="0.01",
+            )
+        ],
+        perp_markets=[
+            MarketDefinition(
+                symbol="ETHRUSDPERP",
+                marketId=1,
+                minOrderQty="0.01",
+                qtyStepSize="0.01",
+                tickSize="0.1",
+                liquidationMarginParameter="0.01",
+                initialMarginParameter="0.02",
+                maxLeverage=50,
+                oiCap="1000000",
+            )
+        ],
+        prices={"ETHRUSDPERP": "3000"},
+    )
+
+
 @pytest_asyncio.fixture(loop_scope="session", scope="function", autouse=True)
 async def rate_limit_delay():
     """
@@ -70,7 +123,7 @@ async def rate_limit_delay():
 
 
 @pytest_asyncio.fixture(loop_scope="session", scope="session")
-async def reya_tester_session():
+async def reya_tester_session(simulated_exchange):  # pylint: disable=redefined-outer-name
     """
     Session-scoped ReyaTester - ONE connection for the entire test suite.
 
@@ -79,7 +132,7 @@ async def reya_tester_session():
     """
     load_dotenv()
 
-    tester = ReyaTester()
+    tester = ReyaTester(exchange=simulated_exchange)
 
     if not tester.owner_wallet_address or not tester.account_id:
         pytest.skip("Missing required wallet address or account ID for tests")
@@ -137,7 +190,7 @@ async def reya_tester(reya_tester_session):  # pylint: disable=redefined-outer-n
 
 
 @pytest_asyncio.fixture(loop_scope="session", scope="session")
-async def maker_tester_session():
+async def maker_tester_session(simulated_exchange):  # pylint: disable=redefined-outer-name
     """
     Session-scoped maker account - ONE connection for entire test suite.
 
@@ -146,7 +199,7 @@ async def maker_tester_session():
     load_dotenv()
 
     # Maker uses Spot Account 1
-    tester = ReyaTester(spot_account_number=1)
+    tester = ReyaTester(spot_account_number=1, exchange=simulated_exchange)
 
     if not tester.owner_wallet_address or not tester.account_id:
         pytest.skip(
@@ -176,7 +229,7 @@ async def maker_tester_session():
 
 
 @pytest_asyncio.fixture(loop_scope="session", scope="session")
-async def taker_tester_session():
+async def taker_tester_session(simulated_exchange):  # pylint: disable=redefined-outer-name
     """
     Session-scoped taker account - ONE connection for entire test suite.
 
@@ -185,7 +238,7 @@ async def taker_tester_session():
     load_dotenv()
 
     # Taker uses Spot Account 2
-    tester = ReyaTester(spot_account_number=2)
+    tester = ReyaTester(spot_account_number=2, exchange=simulated_exchange)
 
     if not tester.owner_wallet_address or not tester.account_id:
         pytest.skip(
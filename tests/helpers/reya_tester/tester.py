@@ -10,6 +10,7 @@ from dotenv import load_dotenv
 
 from sdk.reya_rest_api import ReyaTradingClient
 from sdk.reya_rest_api.config import TradingConfig
+from sdk.reya_simulation import SimulatedExchange
 from sdk.reya_websocket import ReyaSocket
 
 from .checks import Checks
@@ -23,6 +24,9 @@ from .websocket import WebSocketState
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("reya.integration_tests")
 
+# Initial balances of accounts opened on a simulated exchange
+SIMULATED_ACCOUNT_BALANCES = {"RUSD": "1000000", "ETH": "100"}
+
 
 class ReyaTester:
     """
@@ -59,7 +63,7 @@ class ReyaTester:
         tester.ws.get_balance_update_count()
     """
 
-    def __init__(self, spot_account_number: Optional[int] = None):
+    def __init__(self, spot_account_number: Optional[int] = None, exchange: Optional[SimulatedExchange] = None):
         """
         Initialize ReyaTester with specified account configuration.
 
@@ -68,14 +72,20 @@ class ReyaTester:
                                 If None, uses default PERP_ACCOUNT_ID_1, PERP_PRIVATE_KEY_1, PERP_WALLET_ADDRESS_1.
                                 If 1, uses SPOT_ACCOUNT_ID_1, SPOT_PRIVATE_KEY_1, SPOT_WALLET_ADDRESS_1.
                                 If 2, uses SPOT_ACCOUNT_ID_2, SPOT_PRIVATE_KEY_2, SPOT_WALLET_ADDRESS_2.
+            exchange: Optional simulated exchange; if set, a new funded account is opened on it
+                      and the client and WebSocket are routed to it instead of the live API.
         """
         load_dotenv()
 
         # Track if this is a spot account (cannot trade perps)
         self._is_spot_account = spot_account_number is not None
         self._spot_account_number = spot_account_number
+        self._exchange = exchange
 
-        if spot_account_number is None:
+        if exchange is not None:
+            self.client = ReyaTradingClient(config=exchange.create_account(SIMULATED_ACCOUNT_BALANCES))
+            exchange.attach(self.client)
+        elif spot_account_number is None:
             # Default - use standard config (PERP_ACCOUNT_ID_1, PERP_PRIVATE_KEY_1, PERP_WALLET_ADDRESS_1)
             self.client = ReyaTradingClient()
         elif spot_account_number in (1, 2):
@@ -145,11 +155,14 @@ class ReyaTester:
         ws_url = os.environ.get("REYA_WS_URL", "wss://ws.reya.xyz/")
         await self.client.start()
 
-        self._websocket = ReyaSocket(
-            url=ws_url,
-            on_open=self.ws.on_open,
-            on_message=self.ws.on_message,
-        )
+        if self._exchange is not None:
+            self._websocket = self._exchange.socket(on_open=self.ws.on_open, on_message=self.ws.on_message)
+        else:
+            self._websocket = ReyaSocket(
+                url=ws_url,
+                on_open=self.ws.on_open,
+                on_message=self.ws.on_message,
+            )
 
         self._websocket.connect()
         logger.info("WebSocket connected for trade monitoring")
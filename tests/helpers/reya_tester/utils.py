@@ -14,10 +14,10 @@ def limit_order_params_to_order(params: LimitOrderParameters, account_id: int) -
         symbol=params.symbol,
         accountId=account_id,
         orderId="",  # Will be set when order is created
-        qty=params.qty,
+        qty=str(params.qty),
         execQty="0",
         side=Side.B if params.is_buy else Side.A,
-        limitPx=params.limit_px,
+        limitPx=str(params.limit_px),
         orderType=OrderType.LIMIT,
         triggerPx=None,
         timeInForce=params.time_in_force,
@@ -38,9 +38,9 @@ def trigger_order_params_to_order(params: TriggerOrderParameters, account_id: in
         qty=None,  # Trigger orders don't have qty until execution
         execQty="0",
         side=Side.B if params.is_buy else Side.A,
-        limitPx=params.trigger_px,
+        limitPx=str(params.trigger_px),
         orderType=params.trigger_type,
-        triggerPx=params.trigger_px,
+        triggerPx=str(params.trigger_px),
         timeInForce=None,
         reduceOnly=False,
         status=OrderStatus.OPEN,
@@ -280,6 +280,9 @@ class WebSocketState:
             )
             self.orders.add(order_data)
 
+        # Feed the client's order tracker so wait_for_order/wait_for_fill resolve from WS
+        self._t.client.order_tracker.apply_order_changes(message)
+
     def _handle_position_updates(self, message: PositionUpdatePayload) -> None:
         """Handle position updates."""
         for pos_data in message.data:
@@ -25,6 +25,9 @@ from tests.helpers import ReyaTester
 from tests.helpers.market_trackers import fetch_market_trackers, fetch_price
 from tests.helpers.reya_tester import limit_order_params_to_order, logger
 
+# Raw HTTP calls to the API (trackers, pool prices) that the simulated exchange does not serve
+pytestmark = pytest.mark.live_api
+
 SYMBOL = "ETHRUSDPERP"
 TRADE_QTY = "0.01"
 # ETH market ID — used for the legacy v1 trackers endpoint
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 import re
 import time
+from decimal import Decimal
 
 import pytest
 
 from sdk.open_api.exceptions import ServiceException
+from sdk.reya_data import Candle, CandleBuilder, FundingAnalytics, TickArchive, TickArchiveWriter
+from sdk.reya_data.tick_archive import PRICE_SUBTICKS, price_units_to_ticks
 from tests.helpers import ReyaTester
 from tests.helpers.reya_tester import logger
 
@@ -41,6 +44,7 @@ async def test_market_definitions(reya_tester: ReyaTester):
         assert 0 <= float(market_definition.oi_cap) < 10**18, "Wrong oi cap"
 
 
+@pytest.mark.live_api
 @pytest.mark.asyncio
 async def test_market_price(reya_tester: ReyaTester):
     symbol = "ETHRUSDPERP"
@@ -76,6 +80,7 @@ async def test_all_prices(reya_tester: ReyaTester):
     assert "ETHRUSDPERP" in symbols, "Should include ETHRUSDPERP in all prices"
 
 
+@pytest.mark.live_api
 @pytest.mark.asyncio
 async def test_market_summary(reya_tester: ReyaTester):
     symbol = "ETHRUSDPERP"
@@ -119,6 +124,7 @@ async def test_markets_summary(reya_tester: ReyaTester):
     assert len(markets_summary) > 0
 
 
+@pytest.mark.live_api
 @pytest.mark.asyncio
 async def test_candles(reya_tester: ReyaTester):
     symbol = "ETHRUSDPERP"
@@ -189,6 +195,7 @@ async def test_market_perp_executions(reya_tester: ReyaTester):
     ], f"Unexpected execution type: {execution.type}"
 
 
+@pytest.mark.live_api
 @pytest.mark.asyncio
 async def test_asset_definitions(reya_tester: ReyaTester):
     try:
@@ -255,6 +262,7 @@ async def test_global_fee_parameters(reya_tester: ReyaTester):
     assert 0 <= float(global_fees.affiliate_referrer_rebate) <= 1
 
 
+@pytest.mark.live_api
 @pytest.mark.asyncio
 async def test_liquidity_parameters(reya_tester: ReyaTester):
     """Test getting liquidity parameters."""
@@ -284,3 +292,107 @@ async def test_liquidity_parameters(reya_tester: ReyaTester):
     assert (
         float(eth_param.velocity_multiplier) > 0
     ), f"ETH velocity multiplier should be positive, got: {eth_param.velocity_multiplier}"
+
+
+@pytest.mark.live_api
+@pytest.mark.asyncio
+async def test_candle_builder(reya_tester: ReyaTester):
+    symbol = "ETHRUSDPERP"
+    builder = CandleBuilder(resolutions=("1m", "1h"), capacity=100)
+    closed: list[Candle] = []
+    builder.add_listener(closed.append)
+
+    await builder.seed(reya_tester.client, [symbol])
+    for resolution in ("1m", "1h"):
+        candles = builder.candles(symbol, resolution)
+        assert 0 < len(candles) <= 100, f"Seeded {resolution} candles should fill the ring buffer"
+        starts = [candle.start for candle in candles]
+        assert starts == sorted(starts), "Candles should be ordered oldest first"
+        assert list(builder.column(symbol, resolution, "start")) == starts
+
+    # Replay the latest executions in order; candles only move forward
+    executions = await reya_tester.client.markets.get_market_perp_executions(symbol)
+    trades = sorted(executions.data, key=lambda execution: execution.timestamp)
+    for execution in trades:
+        builder.apply_trade(symbol, float(execution.price), float(execution.qty), execution.timestamp)
+    builder.close_elapsed()
+
+    for candle in closed:
+        assert candle.closed
+        assert candle.low <= min(candle.open, candle.close) <= max(candle.open, candle.close) <= candle.high
+    last = builder.candles(symbol, "1m", 1)
+    assert len(last) == 1
+    assert last[0].end <= time.time(), "Only elapsed candles should be closed"
+
+
+@pytest.mark.live_api
+@pytest.mark.asyncio
+async def test_tick_archive(reya_tester: ReyaTester, tmp_path):
+    pytest.importorskip("numpy")
+    symbol = "ETHRUSDPERP"
+    executions = (await reya_tester.client.markets.get_market_perp_executions(symbol)).data
+    assert len(executions) > 0
+    executions.sort(key=lambda execution: execution.timestamp)
+    depth = await reya_tester.client.markets.get_market_depth(symbol)
+
+    with TickArchiveWriter(str(tmp_path)) as writer:
+        await writer.load_tick_sizes(reya_tester.client)
+        assert writer.append_executions(executions) == len(executions)
+        writer.append_depth(depth)
+
+    archive = TickArchive(str(tmp_path))
+    loaded = archive.load(symbol)
+    assert list(loaded["sequence"]) == [execution.sequence_number for execution in executions]
+    assert list(loaded["timestamp"]) == [execution.timestamp for execution in executions]
+    # Perp prices fall between ticks; they are kept to a millionth of a tick, not rounded to whole ticks
+    tick_size = archive.tick_size(symbol)
+    price_unit = archive.price_unit(symbol)
+    assert price_unit == tick_size / PRICE_SUBTICKS
+    prices = loaded["price_units"] * float(price_unit)
+    ticks = price_units_to_ticks(loaded["price_units"], tick_size, price_unit)
+    for index, execution in enumerate(executions):
+        assert abs(prices[index] - float(execution.price)) <= float(price_unit) / 2 + 1e-12 * float(execution.price)
+        assert ticks[index] == int((Decimal(execution.price) / tick_size).to_integral_value())
+
+    # Time range slicing is served from memory-mapped views
+    middle = executions[len(executions) // 2].timestamp
+    tail = archive.slices(symbol, start_time=middle)
+    assert sum(len(part) for part in tail) == sum(1 for execution in executions if execution.timestamp >= middle)
+
+    book = archive.load(symbol, "depth")
+    assert len(book["timestamp"]) == len(depth.bids) + len(depth.asks)
+
+
+@pytest.mark.asyncio
+async def test_funding_analytics(reya_tester: ReyaTester):
+    """
+    Test funding and OI analytics over the REST market summaries.
+    """
+    np = pytest.importorskip("numpy")
+    logger.info("=" * 80)
+    logger.info("FUNDING ANALYTICS TEST")
+    logger.info("=" * 80)
+
+    summaries = await reya_tester.client.markets.get_markets_summary()
+    analytics = FundingAnalytics()
+    assert analytics.apply_summaries(summaries) == len({summary.symbol for summary in summaries})
+    assert set(analytics.symbols) == {summary.symbol for summary in summaries}
+
+    screen = analytics.screen(horizon=8.0)
+    assert len(screen.symbols) == len(analytics)
+    by_symbol = {summary.symbol: summary for summary in summaries}
+    for index, symbol in enumerate(screen.symbols):
+        rate = float(by_symbol[symbol].funding_rate)
+        velocity = float(by_symbol[symbol].funding_rate_velocity)
+        assert screen.projected_funding[index] == pytest.approx(rate * 8.0 + 0.5 * velocity * 64.0)
+        assert -1.0 <= screen.oi_imbalance[index] <= 1.0
+
+    ranked = screen.ranked("projected_funding", by_abs=True)
+    magnitudes = [abs(screen.projected_funding[screen.symbols.index(symbol)]) for symbol in ranked]
+    assert magnitudes == sorted(magnitudes, reverse=True)
+    assert np.all(analytics.column("oi_qty") >= 0)
+
+    for symbol, value in screen.top(5):
+        logger.info(f"{symbol}: projected funding {value:.6f}")
+
+    logger.info("✅ FUNDING ANALYTICS TEST COMPLETED")
@@ -36,6 +36,7 @@ from tests.test_spot.spot_config import SpotTestConfig
 
 
 @pytest.mark.spot
+@pytest.mark.live_api
 @pytest.mark.validation
 @pytest.mark.asyncio
 async def test_spot_order_invalid_signature(spot_config: SpotTestConfig, spot_tester: ReyaTester):
@@ -854,6 +855,7 @@ async def test_spot_order_price_not_tick_multiple(spot_config: SpotTestConfig, s
 
 
 @pytest.mark.spot
+@pytest.mark.live_api
 @pytest.mark.validation
 @pytest.mark.asyncio
 async def test_spot_cancel_invalid_signature(spot_config: SpotTestConfig, spot_tester: ReyaTester):
@@ -1146,6 +1148,7 @@ async def test_spot_cancel_old_nonce(spot_config: SpotTestConfig, spot_tester: R
 
 
 @pytest.mark.spot
+@pytest.mark.live_api
 @pytest.mark.validation
 @pytest.mark.asyncio
 async def test_spot_mass_cancel_invalid_signature(spot_config: SpotTestConfig, spot_tester: ReyaTester):
@@ -1392,6 +1395,7 @@ async def test_spot_mass_cancel_old_nonce(spot_config: SpotTestConfig, spot_test
 
 
 @pytest.mark.spot
+@pytest.mark.live_api
 @pytest.mark.validation
 @pytest.mark.asyncio
 async def test_spot_cancel_wrong_signer(spot_config: SpotTestConfig, spot_tester: ReyaTester):
@@ -1482,6 +1486,7 @@ async def test_spot_cancel_wrong_signer(spot_config: SpotTestConfig, spot_tester
 
 
 @pytest.mark.spot
+@pytest.mark.live_api
 @pytest.mark.validation
 @pytest.mark.asyncio
 async def test_spot_mass_cancel_wrong_signer(spot_config: SpotTestConfig, spot_tester: ReyaTester):
@@ -1838,6 +1843,7 @@ async def test_spot_order_missing_nonce(spot_config: SpotTestConfig, spot_tester
 
 
 @pytest.mark.spot
+@pytest.mark.live_api
 @pytest.mark.validation
 @pytest.mark.asyncio
 async def test_spot_order_invalid_time_in_force(spot_config: SpotTestConfig, spot_tester: ReyaTester):
@@ -1915,6 +1921,7 @@ async def test_spot_order_invalid_time_in_force(spot_config: SpotTestConfig, spo
 
 
 @pytest.mark.spot
+@pytest.mark.live_api
 @pytest.mark.validation
 @pytest.mark.asyncio
 async def test_spot_order_missing_expiration(spot_config: SpotTestConfig, spot_tester: ReyaTester):
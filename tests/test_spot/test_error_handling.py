@@ -17,6 +17,9 @@ import pytest
 from eth_abi.exceptions import EncodingError
 
 from sdk.open_api.exceptions import ApiException
+from sdk.open_api.models.order_type import OrderType
+from sdk.reya_rest_api import RiskCheckError, RiskEngine, RiskRejectReason
+from sdk.reya_rest_api.models.orders import TriggerOrderParameters
 from tests.helpers import ReyaTester
 from tests.helpers.builders.order_builder import OrderBuilder
 from tests.test_spot.spot_config import SpotTestConfig
@@ -268,3 +271,82 @@ async def test_spot_extreme_price(spot_config: SpotTestConfig, spot_tester: Reya
     await spot_tester.check.no_open_orders()
 
     logger.info("✅ SPOT EXTREME PRICE TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.error
+@pytest.mark.asyncio
+async def test_spot_risk_engine_refuses_orders(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test that the client-side risk engine refuses failing orders without sending them.
+
+    Flow:
+    1. Load the risk engine from the wallet's REST snapshots
+    2. Check spot orders over the balance or off the market grid, and perp orders without margin or position
+    3. Install the engine on the client and verify refused orders raise RiskCheckError
+    4. Verify an accepted GTC order holds its quote balance
+    """
+    logger.info("=" * 80)
+    logger.info("SPOT RISK ENGINE TEST")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+    client = spot_tester.client
+    engine = RiskEngine(account_id=spot_tester.account_id)
+    await engine.refresh(client)
+
+    price = spot_config.price(0.96)
+    builder = OrderBuilder().symbol(spot_config.symbol).buy().price(str(price)).qty(spot_config.min_qty).gtc()
+    quote_asset = next(
+        d.quote_asset for d in await client.reference.get_spot_market_definitions() if d.symbol == spot_config.symbol
+    )
+    available = engine.available_balance(quote_asset)
+    logger.info(f"Available {quote_asset}: {available}")
+
+    assert engine.check_limit_order(builder.build()).passed
+    too_large = builder.copy().qty(str(int(available / price) + 1)).build()
+    assert engine.check_limit_order(too_large).reason == RiskRejectReason.INSUFFICIENT_BALANCE
+    off_step = builder.copy().qty(spot_config.min_qty + "1").build()
+    assert engine.check_limit_order(off_step).reason == RiskRejectReason.QTY_STEP
+    off_tick = builder.copy().price(str(price) + "001").build()
+    assert engine.check_limit_order(off_tick).reason == RiskRejectReason.TICK_SIZE
+    unknown = builder.copy().symbol("UNKNOWNRUSD").build()
+    assert engine.check_limit_order(unknown).reason == RiskRejectReason.UNKNOWN_SYMBOL
+
+    # Perp checks on a market where this account has no position
+    perp = next(d for d in await client.reference.get_market_definitions() if d.symbol == "ETHRUSDPERP")
+    perp_price = float((await client.markets.get_price("ETHRUSDPERP")).oracle_price)
+    reduce_only = OrderBuilder().symbol(perp.symbol).buy().price(str(perp_price * 1.1)).qty(perp.min_order_qty)
+    check = engine.check_limit_order(reduce_only.ioc().reduce_only().build())
+    assert check.reason == RiskRejectReason.REDUCE_ONLY
+    stop_loss = TriggerOrderParameters(perp.symbol, False, str(perp_price * 0.9), OrderType.SL)
+    assert engine.check_trigger_order(stop_loss).reason == RiskRejectReason.NO_POSITION
+    margin = engine.margin()
+    beyond_margin = margin.margin_balance / (perp_price * float(perp.initial_margin_parameter)) * 2
+    check = engine.check_order(
+        perp.symbol,
+        True,
+        perp_price,
+        round(beyond_margin / float(perp.qty_step_size)) * float(perp.qty_step_size),
+        resting=True,
+    )
+    assert check.reason in (RiskRejectReason.INSUFFICIENT_MARGIN, RiskRejectReason.OI_CAP)
+    logger.info(f"Refused: {check.message}")
+
+    client.risk_engine = engine
+    try:
+        with pytest.raises(RiskCheckError) as refused:
+            await client.create_limit_order(too_large)
+        assert refused.value.check.reason == RiskRejectReason.INSUFFICIENT_BALANCE
+        await spot_tester.check.no_open_orders()
+
+        order_id = await spot_tester.orders.create_limit(builder.build())
+        assert engine.available_balance(quote_asset) == pytest.approx(available - price * float(spot_config.min_qty))
+        await client.cancel_order(order_id=order_id, symbol=spot_config.symbol, account_id=spot_tester.account_id)
+        await asyncio.sleep(0.05)
+    finally:
+        client.risk_engine = None
+
+    await spot_tester.check.no_open_orders()
+
+    logger.info("✅ SPOT RISK ENGINE TEST COMPLETED")
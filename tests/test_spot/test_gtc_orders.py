@@ -15,17 +15,30 @@ These tests support both empty and non-empty order books:
 - Execution assertions are flexible to handle order book changes
 """
 
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import asyncio
+import json
 import logging
 import random
-from decimal import Decimal
+from decimal import ROUND_FLOOR, Decimal
 
+import aiohttp
 import pytest
+from eth_account import Account
 
+from sdk.open_api.api.order_entry_api import OrderEntryApi
+from sdk.open_api.configuration import Configuration
 from sdk.open_api.models import OrderStatus
+from sdk.open_api.models.cancel_order_request import CancelOrderRequest
+from sdk.open_api.models.create_order_request import CreateOrderRequest
 from sdk.open_api.models.depth import Depth
+from sdk.open_api.models.order_type import OrderType
+from sdk.open_api.models.time_in_force import TimeInForce
+from sdk.reya_rest_api import LocalSignerBackend, ProcessPoolSignerBackend, RetryPolicy, ReyaApiClient
+from sdk.reya_rest_api.models import LimitOrderParameters, MarketGrid
+from sdk.reya_rest_api.order_entry import OrderEntryRequest, encode_request, orjson
+from sdk.reya_rest_api.presigned_pool import PresignedOrderPool
 from tests.helpers import ReyaTester
 from tests.helpers.builders.order_builder import OrderBuilder
 from tests.test_spot.spot_config import SpotTestConfig
@@ -530,3 +543,288 @@ async def test_spot_gtc_with_client_order_id(spot_config: SpotTestConfig, spot_t
     logger.info("✅ Order cancelled (API prefers order_id when both provided)")
 
     logger.info("✅ SPOT GTC WITH CLIENT ORDER ID TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.gtc
+@pytest.mark.asyncio
+async def test_spot_gtc_retry_after_lost_response(
+    spot_config: SpotTestConfig, spot_tester: ReyaTester, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test that a GTC order whose create response is lost in transport is resent unchanged, and
+    recovered from the exchange state when the resend is rejected for its nonce, instead of
+    being placed twice.
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT GTC RETRY AFTER LOST RESPONSE TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+
+    client = spot_tester.client
+    send_order = client.orders.create_order
+    attempts = 0
+
+    async def lossy_create_order(create_order_request):
+        nonlocal attempts
+        attempts += 1
+        response = await send_order(create_order_request=create_order_request)
+        if attempts == 1:
+            raise aiohttp.ServerDisconnectedError()
+        return response
+
+    monkeypatch.setattr(client.orders, "create_order", lossy_create_order)
+    client.retry_policy = RetryPolicy()
+    metrics_before = client.retry_metrics
+    try:
+        # A price no other test uses, so their recent orders cannot be mistaken for this one
+        price = round(spot_config.oracle_price * 0.955, 2)
+        params = (
+            OrderBuilder.from_config(spot_config)
+            .buy()
+            .price(str(price))
+            .gtc()
+            .client_order_id(random.randint(1, 2**32 - 1))  # nosec B311
+            .build()
+        )
+        response = await client.create_limit_order(params)
+    finally:
+        client.retry_policy = None
+        monkeypatch.undo()
+
+    metrics = client.retry_metrics
+    assert attempts == 2, f"Expected the order to be resent once, got {attempts} sends"
+    assert metrics.confirmed_landed == metrics_before.confirmed_landed + 1
+    assert response.order_id is not None
+    assert response.client_order_id == params.client_order_id
+    logger.info(f"✅ Order {response.order_id} recovered after lost response")
+
+    open_orders = await client.get_open_orders()
+    ours = [o for o in open_orders if o.symbol == spot_config.symbol and o.account_id == spot_tester.account_id]
+    assert [o.order_id for o in ours] == [response.order_id], f"Expected exactly one order, got {ours}"
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+    await spot_tester.check.no_open_orders()
+
+    logger.info("✅ SPOT GTC RETRY AFTER LOST RESPONSE TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.gtc
+@pytest.mark.asyncio
+async def test_spot_gtc_fixed_point_order(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test a GTC order placed with fixed-point Px/Qty values rounded on the market grid.
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT GTC FIXED POINT ORDER TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+
+    client = spot_tester.client
+    definition = next(d for d in await client.reference.get_spot_market_definitions() if d.symbol == spot_config.symbol)
+    grid = MarketGrid.from_definition(definition)
+
+    # An off-tick price, rounded down to the tick below it
+    raw_price = spot_config.oracle_price * 0.96 + float(definition.tick_size) / 3
+    px = grid.px(raw_price, ROUND_FLOOR)
+    qty = grid.min_order_qty
+    assert px.is_aligned and qty.is_aligned
+    expected_px = (Decimal(repr(raw_price)) / Decimal(definition.tick_size)).to_integral_value(ROUND_FLOOR) * Decimal(
+        definition.tick_size
+    )
+    assert px.to_decimal() == expected_px
+    assert qty.to_decimal() == Decimal(definition.min_order_qty)
+    assert (px + grid.tick_px(1)).steps == px.steps + 1
+    logger.info(f"Placing GTC buy: {qty} @ {px}")
+
+    response = await client.create_limit_order(LimitOrderParameters(spot_config.symbol, True, px, qty, TimeInForce.GTC))
+    assert response.order_id is not None
+    await spot_tester.wait.for_order_creation(response.order_id)
+
+    open_orders = await client.get_open_orders()
+    order = next(o for o in open_orders if o.order_id == response.order_id)
+    assert order.qty is not None
+    assert Decimal(order.limit_px) == px.to_decimal()
+    assert Decimal(order.qty) == qty.to_decimal()
+    logger.info(f"✅ Order {order.order_id} on book at {order.limit_px}")
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+    await spot_tester.check.no_open_orders()
+
+    logger.info("✅ SPOT GTC FIXED POINT ORDER TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.gtc
+@pytest.mark.asyncio
+async def test_spot_gtc_order_request_encoding(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test that order entry bodies encoded directly match the generic OpenAPI serializer.
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT GTC ORDER REQUEST ENCODING TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    client = spot_tester.client
+    api = OrderEntryApi(ReyaApiClient(Configuration(host=client.config.api_url)))
+    signature = "0x" + "5c" * 65
+    requests: list[tuple[Callable[..., Any], OrderEntryRequest]] = [
+        (
+            api._create_order_serialize,  # pylint: disable=protected-access
+            CreateOrderRequest(
+                exchangeId=client.config.dex_id,
+                symbol=spot_config.symbol,
+                accountId=spot_tester.account_id,
+                isBuy=True,
+                limitPx=str(round(spot_config.oracle_price * 0.96, 2)),
+                qty=spot_config.min_qty,
+                orderType=OrderType.LIMIT,
+                timeInForce=TimeInForce.GTC,
+                signature=signature,
+                nonce=str(client.get_next_nonce()),
+                signerWallet=client.signer_wallet_address,
+                expiresAfter=1760086400000,
+                clientOrderId=random.randint(1, 2**32 - 1),  # nosec B311
+            ),
+        ),
+        (
+            api._cancel_order_serialize,  # pylint: disable=protected-access
+            CancelOrderRequest(
+                clientOrderId=42, signature=signature, nonce="7", symbol=spot_config.symbol, accountId=1
+            ),
+        ),
+        (
+            api._cancel_all_serialize,  # pylint: disable=protected-access
+            client.build_mass_cancel_request(spot_config.symbol, spot_tester.account_id),
+        ),
+    ]
+
+    for serialize, request in requests:
+        _method, _url, _headers, body, _post_params = serialize(request, None, None, None, 0)
+        assert encode_request(request) == json.dumps(body).encode()
+        if orjson is not None:
+            assert json.loads(encode_request(request, use_orjson=True)) == body
+        logger.info(f"✅ {type(request).__name__} encoded identically")
+
+    logger.info("✅ SPOT GTC ORDER REQUEST ENCODING TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.gtc
+@pytest.mark.asyncio
+async def test_spot_gtc_presigned_order_pool(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test GTC orders handed out by a pre-signed order pool.
+
+    Flow:
+    1. Pool a small bid ladder far below the market
+    2. Submit the inner and outer levels from the pool (no signing)
+    3. Verify a level below a used nonce is evicted and re-signed on refresh
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT GTC PRESIGNED ORDER POOL TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+
+    client = spot_tester.client
+    definition = next(d for d in await client.reference.get_spot_market_definitions() if d.symbol == spot_config.symbol)
+    grid = MarketGrid.from_definition(definition)
+    prices = [grid.px(spot_config.oracle_price * (0.96 - 0.01 * level), ROUND_FLOOR) for level in range(3)]
+    qty = grid.min_order_qty
+
+    pool = PresignedOrderPool(client, spot_config.symbol)
+    pool.set_levels(bid_prices=prices, ask_prices=[], sizes=[qty])
+    assert pool.refresh() == 3
+    assert len(pool) == 3
+
+    inner = await pool.submit(True, prices[0], qty)
+    outer = await pool.submit(True, prices[2], qty)
+    assert pool.metrics.hits == 2 and pool.metrics.misses == 0
+    for response in (inner, outer):
+        assert response.order_id is not None
+        await spot_tester.wait.for_order_creation(response.order_id)
+    logger.info(f"✅ Pooled orders {inner.order_id} and {outer.order_id} accepted")
+
+    # The middle level's nonce is below the outer level's, which was used
+    assert pool.take(True, prices[1], qty) is None
+    assert pool.metrics.nonce_stale == 1
+    assert pool.refresh() == 3
+    assert pool.take(True, "1", qty) is None  # Not a candidate
+
+    open_orders = await client.get_open_orders()
+    assert {inner.order_id, outer.order_id} <= {o.order_id for o in open_orders}
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+    await spot_tester.check.no_open_orders()
+
+    logger.info("✅ SPOT GTC PRESIGNED ORDER POOL TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.gtc
+@pytest.mark.asyncio
+async def test_spot_gtc_batch_signed_orders(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test GTC orders signed in one batch, and signer backends against eth_account.
+
+    Flow:
+    1. Sign order digests with a process pool backend, in a batch and concurrently from the
+       event loop, and compare with eth_account
+    2. Build a small bid ladder far below the market in one signing batch
+    3. Send the orders and verify they are on the book
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT GTC BATCH SIGNED ORDERS TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+
+    client = spot_tester.client
+    generator = client.signature_generator
+    private_key = client.config.private_key
+    assert private_key is not None
+    inputs = generator.encode_inputs_limit_order(is_buy=True, limit_px="100", qty=spot_config.min_qty)
+    digests = [generator.raw_order_digest(1, 5, 5, [], 0, inputs, 1_900_000_000, nonce) for nonce in range(1, 9)]
+    # pylint: disable-next=no-value-for-parameter
+    expected = [bytes(Account.unsafe_sign_hash(digest, private_key).signature) for digest in digests]
+    with ProcessPoolSignerBackend(private_key, workers=2, min_batch=1) as backend:
+        assert backend.sign_digests(digests) == expected
+        # Single signs awaited concurrently are batched in the pool
+        assert list(await asyncio.gather(*(backend.sign_digest_async(digest) for digest in digests))) == expected
+    assert LocalSignerBackend(private_key).sign_digests(digests) == expected
+    logger.info("✅ Process pool signatures match eth_account")
+
+    definition = next(d for d in await client.reference.get_spot_market_definitions() if d.symbol == spot_config.symbol)
+    grid = MarketGrid.from_definition(definition)
+    params = [
+        LimitOrderParameters(
+            symbol=spot_config.symbol,
+            is_buy=True,
+            limit_px=grid.px(spot_config.oracle_price * (0.96 - 0.01 * level), ROUND_FLOOR),
+            qty=grid.min_order_qty,
+            time_in_force=TimeInForce.GTC,
+        )
+        for level in range(3)
+    ]
+    requests = client.build_limit_order_requests(params)
+    assert len({request.nonce for request in requests}) == 3
+
+    order_ids = []
+    for order_params, request in zip(params, requests):
+        response = await client.send_order_request(request, order_params)
+        assert response.order_id is not None
+        await spot_tester.wait.for_order_creation(response.order_id)
+        order_ids.append(response.order_id)
+    logger.info(f"✅ Batch signed orders {order_ids} accepted")
+
+    open_orders = await client.get_open_orders()
+    assert set(order_ids) <= {o.order_id for o in open_orders}
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+    await spot_tester.check.no_open_orders()
+
+    logger.info("✅ SPOT GTC BATCH SIGNED ORDERS TEST COMPLETED")
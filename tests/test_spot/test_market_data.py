@@ -5,6 +5,8 @@ Tests for spot-specific market data:
 - Market definitions
 - Spot executions via REST
 - Spot executions pagination
+- Hedged GET requests
+- Market snapshot table
 """
 
 import asyncio
@@ -13,8 +15,13 @@ from decimal import Decimal
 
 import pytest
 
-from sdk.open_api.models import OrderStatus
+from sdk.async_api.prices_update_payload import PricesUpdatePayload
+from sdk.open_api.models import OrderStatus, TimeInForce
 from sdk.open_api.models.depth import Depth
+from sdk.reya_data import FeeModel, MarketSnapshot, effective_fee_rates
+from sdk.reya_rest_api import HedgingPolicy, ReyaTradingClient
+from sdk.reya_rest_api.models.orders import LimitOrderParameters
+from sdk.reya_simulation import BacktestClient, BacktestConfig, Backtester, EventKind, MarketReplay
 from tests.helpers import ReyaTester
 from tests.helpers.builders.order_builder import OrderBuilder
 from tests.test_spot.spot_config import SpotTestConfig
@@ -319,3 +326,231 @@ async def test_spot_executions_multiple_trades(
     await taker_tester.check.no_open_orders()
 
     logger.info("✅ SPOT EXECUTIONS MULTIPLE TRADES TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.live_api
+@pytest.mark.market_data
+@pytest.mark.asyncio
+async def test_spot_hedged_market_data_requests(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test that market data reads with hedging enabled return the same data as without,
+    and that hedges stay within the configured budget.
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT HEDGED MARKET DATA TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    num_requests = 20
+    policy = HedgingPolicy(min_samples=5, budget_ratio=0.1, max_burst=1)
+    async with ReyaTradingClient(spot_tester.client.config, hedging_policy=policy) as client:
+        for _ in range(num_requests):
+            depth = await client.markets.get_market_depth(symbol=spot_config.symbol)
+            assert isinstance(depth, Depth)
+            assert depth.symbol == spot_config.symbol
+
+        reference_prices = await spot_tester.client.markets.get_prices()
+        hedged_prices = await client.markets.get_prices()
+        assert {p.symbol for p in hedged_prices} == {p.symbol for p in reference_prices}
+
+        metrics = client.hedge_metrics
+    logger.info(f"Hedge metrics: {metrics}")
+
+    assert metrics.requests == num_requests + 1
+    assert metrics.hedged <= policy.max_burst + metrics.requests * policy.budget_ratio
+    assert metrics.hedge_wins <= metrics.hedged
+
+    logger.info("✅ SPOT HEDGED MARKET DATA TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.market_data
+@pytest.mark.asyncio
+async def test_spot_market_snapshot(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test building the market snapshot from REST and applying a price delta.
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT MARKET SNAPSHOT TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    snapshot = MarketSnapshot(spot_tester.client)
+    await snapshot.refresh()
+    logger.info(f"Snapshot has {len(snapshot)} markets")
+
+    assert spot_config.symbol in snapshot
+    row = snapshot.row_for_symbol(spot_config.symbol)
+    assert row is not None
+    assert row["is_spot"] == 1
+    assert row["market_id"] == spot_config.market_id
+    assert Decimal(str(row["qty_step_size"])) == Decimal(spot_config.qty_step_size)
+
+    market_ids = list(snapshot.column("market_id"))
+    assert market_ids == sorted(market_ids), "Rows should be ordered by market ID"
+
+    # Apply a newer price delta in the WebSocket format
+    new_price = spot_config.oracle_price * 1.01
+    version = snapshot.version
+    delta = PricesUpdatePayload.model_validate(
+        {
+            "type": "channel_data",
+            "timestamp": 0,
+            "channel": "/v2/prices",
+            "data": [
+                {
+                    "symbol": spot_config.symbol,
+                    "oraclePrice": str(new_price),
+                    "updatedAt": max(row["price_updated_at"], 1) + 1,
+                }
+            ],
+        }
+    )
+    snapshot.on_message(None, delta)
+
+    updated = snapshot.row_for_symbol(spot_config.symbol)
+    assert updated is not None
+    assert updated["oracle_price"] == pytest.approx(new_price)
+    assert snapshot.version == version + 1
+
+    logger.info("✅ SPOT MARKET SNAPSHOT TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.market_data
+@pytest.mark.asyncio
+async def test_spot_backtester(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test the backtester on a replay around the current price, with the wallet's market and fees.
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT BACKTESTER TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    client = spot_tester.client
+    definitions = await client.reference.get_spot_market_definitions()
+    definition = next(d for d in definitions if d.symbol == spot_config.symbol)
+    configuration = await client.wallet.get_wallet_configuration(address=client.owner_wallet_address)
+    fee_tier = next(
+        tier for tier in await client.reference.get_fee_tier_parameters() if tier.tier_id == configuration.fee_tier_id
+    )
+    global_fees = await client.reference.get_global_fee_parameters()
+    qty = Decimal(definition.min_order_qty)
+    config = BacktestConfig.from_definition(
+        definition,
+        fee_tier,
+        global_fees,
+        configuration,
+        initial_balances={definition.base_asset: str(qty), definition.quote_asset: "1000000"},
+    )
+
+    # Bid and ask one hundred ticks around the oracle price, then sells into the bid
+    tick = Decimal(definition.tick_size)
+    replay = MarketReplay(definition.symbol, definition.tick_size)
+    mid = replay.to_ticks(str(spot_config.oracle_price))
+    bid, ask = mid - 100, mid + 100
+    replay.append(0, EventKind.BOOK_CLEAR)
+    replay.append(0, EventKind.BOOK_LEVEL, 1, bid, float(qty * 2))
+    replay.append(0, EventKind.BOOK_LEVEL, -1, ask, float(qty * 2))
+    replay.append(1500, EventKind.TRADE, -1, bid, float(qty * 2))
+    replay.append(2500, EventKind.TRADE, -1, bid, float(qty))
+
+    responses = {}
+
+    async def on_interval(sim: BacktestClient, now: int) -> None:
+        if now != 1000:
+            return
+        bid_px = str(bid * tick)
+        responses["gtc"] = await sim.create_limit_order(
+            LimitOrderParameters(definition.symbol, True, bid_px, str(qty), TimeInForce.GTC)
+        )
+        # Would trade against our own bid, so it is cancelled without trading
+        responses["self_match"] = await sim.create_limit_order(
+            LimitOrderParameters(definition.symbol, False, bid_px, str(qty), TimeInForce.IOC)
+        )
+        responses["ioc"] = await sim.create_limit_order(
+            LimitOrderParameters(definition.symbol, True, str(ask * tick), str(qty), TimeInForce.IOC)
+        )
+
+    backtester = Backtester(replay, config)
+    result = await backtester.run(on_interval, interval_ms=1000)
+    logger.info(f"Backtest: {result.events} events, {len(result.fills)} fills, fees {result.fees}")
+
+    assert responses["gtc"].status == OrderStatus.OPEN
+    assert responses["self_match"].status == OrderStatus.CANCELLED
+    assert responses["ioc"].status == OrderStatus.FILLED
+    assert result.self_match_cancels == 1
+
+    # The first trade only consumes the queue ahead of our bid; the second fills it
+    taker, maker = result.fills
+    assert not taker.is_maker and taker.price == ask * tick and taker.timestamp == 1000
+    assert maker.is_maker and maker.price == bid * tick and maker.timestamp == 2500
+    assert taker.fee == taker.price * qty * Decimal(config.taker_fee)
+    assert maker.fee == maker.price * qty * Decimal(config.maker_fee)
+
+    assert result.balances[definition.base_asset] == qty * 3
+    spent = sum(fill.price * fill.qty + fill.fee for fill in result.fills)
+    assert result.balances[definition.quote_asset] == Decimal("1000000") - spent
+    assert await backtester.client.get_open_orders() == []
+
+    logger.info("✅ SPOT BACKTESTER TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.market_data
+@pytest.mark.asyncio
+async def test_spot_fee_model(spot_config: SpotTestConfig, spot_tester: ReyaTester, monkeypatch):
+    """
+    Test precomputed fee rates against the wallet's tier and the Decimal fee rates.
+    """
+    np = pytest.importorskip("numpy")
+    logger.info("=" * 80)
+    logger.info("FEE MODEL TEST")
+    logger.info("=" * 80)
+
+    client = spot_tester.client
+    fees = await FeeModel.from_client(client)
+    configuration = await client.get_configuration()
+    fee_tiers = await client.reference.get_fee_tier_parameters()
+    global_fees = await client.reference.get_global_fee_parameters()
+    fee_tier = next(tier for tier in fee_tiers if tier.tier_id == configuration.fee_tier_id)
+    maker_fee, taker_fee = effective_fee_rates(fee_tier, global_fees, configuration)
+    logger.info(f"Tier {fees.tier_id}: maker {fees.maker_bps} bps, taker {fees.taker_bps} bps")
+
+    assert fees.tier_id == configuration.fee_tier_id
+    assert fees.maker_bps == pytest.approx(float(maker_fee) * 10_000)
+    assert fees.taker_bps == pytest.approx(float(taker_fee) * 10_000)
+
+    qty = float(spot_config.min_qty)
+    px = float(spot_config.oracle_price)
+    assert fees.estimate_fee(-qty, px, is_maker=False) == pytest.approx(qty * px * float(taker_fee))
+    assert fees.estimate_fee(qty, px, is_maker=True) == pytest.approx(qty * px * float(maker_fee))
+
+    qtys = np.array([qty, -2 * qty, 3 * qty])
+    pxs = np.full(3, px)
+    is_maker = np.array([True, False, True])
+    expected = [float(abs(q) * px * float(maker_fee if m else taker_fee)) for q, m in zip(qtys, is_maker)]
+    assert fees.estimate_fees(qtys, pxs, is_maker) == pytest.approx(expected)
+
+    # The configuration is unchanged, so a refresh keeps the selected rates
+    assert await fees.refresh(client) is False
+    assert await fees.refresh(client, reload_tiers=True) is False
+
+    # A reload whose wallet tier is gone fails without touching the selected rates
+    unknown = configuration.model_copy(update={"fee_tier_id": max(tier.tier_id for tier in fee_tiers) + 1})
+
+    async def get_unknown_configuration():
+        return unknown
+
+    monkeypatch.setattr(client, "get_configuration", get_unknown_configuration)
+    with pytest.raises(ValueError):
+        await fees.refresh(client, reload_tiers=True)
+    assert fees.tier_id == configuration.fee_tier_id
+    assert fees.taker_bps == pytest.approx(float(taker_fee) * 10_000)
+    monkeypatch.undo()
+    for tier in fee_tiers:
+        maker, taker = effective_fee_rates(tier)
+        fixed_maker, fixed_taker = fees.rates(tier.tier_id)
+        assert fixed_maker == pytest.approx(float(maker) * 10**10, abs=1)
+        assert fixed_taker == pytest.approx(float(taker) * 10**10, abs=1)
+
+    logger.info("✅ FEE MODEL TEST COMPLETED")
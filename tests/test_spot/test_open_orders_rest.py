@@ -14,6 +14,8 @@ import pytest
 
 from sdk.open_api.models.order import Order
 from sdk.open_api.models.order_status import OrderStatus
+from sdk.open_api.models.side import Side
+from sdk.reya_rest_api import OrderTracker
 from tests.helpers import ReyaTester
 from tests.helpers.builders.order_builder import OrderBuilder
 from tests.test_spot.spot_config import SpotTestConfig
@@ -244,3 +246,53 @@ async def test_rest_get_open_orders_filters_by_wallet(
     await maker_tester.check.no_open_orders()
 
     logger.info("✅ OPEN ORDERS REST - FILTER BY WALLET TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.rest_api
+@pytest.mark.asyncio
+async def test_order_tracker_reconciles_with_open_orders(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test OrderTracker reconciliation against the open orders REST endpoint.
+
+    Flow:
+    1. Place a GTC order
+    2. Reconcile an empty tracker and verify the order is added and indexed
+    3. Cancel the order
+    4. Reconcile again and verify the order is closed and removed from the open indexes
+    """
+    logger.info("=" * 80)
+    logger.info("ORDER TRACKER RECONCILIATION TEST")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+
+    await spot_config.refresh_order_book(spot_tester.data)
+    safe_price = spot_config.get_safe_no_match_buy_price()
+    order_params = OrderBuilder.from_config(spot_config).buy().price(str(safe_price)).gtc().build()
+
+    order_id = await spot_tester.orders.create_limit(order_params)
+    await spot_tester.wait.for_order_creation(order_id)
+    assert order_id is not None
+
+    tracker = OrderTracker(account_id=spot_tester.account_id, reconcile_grace_ms=0)
+    result = await tracker.reconcile(spot_tester.client)
+
+    assert order_id in result.added, f"Order {order_id} should be added by reconciliation"
+    assert [o.order_id for o in tracker.open_orders(spot_config.symbol, Side.B)] == [order_id]
+    logger.info("✅ Tracker picked up the open order")
+
+    await spot_tester.client.cancel_order(
+        order_id=order_id, symbol=spot_config.symbol, account_id=spot_tester.account_id
+    )
+    await spot_tester.wait.for_order_state(order_id, OrderStatus.CANCELLED)
+
+    result = await tracker.reconcile(spot_tester.client)
+
+    assert order_id in result.removed, f"Order {order_id} should be removed by reconciliation"
+    tracked = tracker.get(order_id)
+    assert tracked is not None and tracked.status == OrderStatus.CANCELLED
+    assert tracker.open_orders(spot_config.symbol) == []
+    logger.info("✅ Tracker closed the cancelled order")
+
+    logger.info("✅ ORDER TRACKER RECONCILIATION TEST COMPLETED")
@@ -9,12 +9,15 @@ without matching existing liquidity.
 """
 
 import asyncio
+from decimal import Decimal
 
 import pytest
 
 from sdk.open_api.models.depth import Depth
+from sdk.open_api.models.depth_type import DepthType
 from sdk.open_api.models.level import Level
 from sdk.open_api.models.order_status import OrderStatus
+from sdk.reya_data import DepthAggregator
 from tests.helpers import ReyaTester
 from tests.helpers.builders import OrderBuilder
 from tests.helpers.reya_tester import logger
@@ -282,3 +285,97 @@ async def test_spot_bid_ask_spread(spot_config: SpotTestConfig, maker_tester: Re
     await taker_tester.check.no_open_orders()
 
     logger.info("✅ SPOT BID/ASK SPREAD TEST COMPLETED")
+
+
+def _depth_update(before: Depth, after: Depth) -> Depth:
+    """UPDATE message with the levels that changed between two snapshots; removed levels have quantity 0."""
+    sides = []
+    for old_levels, new_levels in ((before.bids, after.bids), (before.asks, after.asks)):
+        old = {level.px: level.qty for level in old_levels}
+        new = {level.px: level.qty for level in new_levels}
+        changed = [Level(px=px, qty=qty) for px, qty in new.items() if old.get(px) != qty]
+        changed += [Level(px=px, qty="0") for px in old if px not in new]
+        sides.append(changed)
+    return Depth(symbol=after.symbol, type=DepthType.UPDATE, bids=sides[0], asks=sides[1], updatedAt=after.updated_at)
+
+
+@pytest.mark.spot
+@pytest.mark.asyncio
+async def test_spot_aggregated_depth_views(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test bucketed depth views: snapshot grouping and incremental single-level updates.
+
+    Flow:
+    1. Place GTC bids at two safe no-match prices
+    2. Apply the REST depth snapshot to a DepthAggregator and check the views
+    3. Cancel one order and apply the changed levels as an UPDATE
+    4. Verify the incrementally updated views equal views rebuilt from a new snapshot
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT AGGREGATED DEPTH VIEWS TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+    await spot_config.refresh_order_book(spot_tester.data)
+    low_price = spot_config.get_safe_no_match_buy_price()
+    order_ids = []
+    for price in (low_price, low_price + Decimal("1")):
+        order_params = OrderBuilder.from_config(spot_config).buy().price(str(price)).gtc().build()
+        order_id = await spot_tester.orders.create_limit(order_params)
+        await spot_tester.wait.for_order_creation(order_id)
+        order_ids.append(order_id)
+    await asyncio.sleep(0.1)
+
+    granularities = ("1ticks", "10ticks", "5bps")
+    aggregator = DepthAggregator(granularities)
+    await aggregator.load_tick_sizes(spot_tester.client)
+    before = await spot_tester.data.market_depth(spot_config.symbol)
+    aggregator.apply_depth(before)
+
+    # One tick buckets are the raw levels
+    view = aggregator.view(spot_config.symbol, "1ticks")
+    assert list(view.bid_prices) == [float(level.px) for level in before.bids]
+    assert list(view.bid_sizes) == pytest.approx([float(level.qty) for level in before.bids])
+    total = sum(float(level.qty) for level in before.bids)
+    for granularity in granularities:
+        coarse = aggregator.view(spot_config.symbol, granularity)
+        assert list(coarse.bid_prices) == sorted(coarse.bid_prices, reverse=True)
+        assert coarse.bid_cumulative[-1] == pytest.approx(total), f"{granularity} should hold every bid"
+        assert all(Decimal(str(price)) % coarse.width == 0 for price in coarse.bid_prices)
+    assert len(aggregator.view(spot_config.symbol, "10ticks", depth=1).bid_prices) == 1
+    logger.info(f"✅ Snapshot of {len(before.bids)} bids grouped at {granularities}")
+
+    await spot_tester.client.cancel_order(
+        order_id=order_ids[0], symbol=spot_config.symbol, account_id=spot_tester.account_id
+    )
+    await spot_tester.wait.for_order_state(order_ids[0], OrderStatus.CANCELLED)
+    await asyncio.sleep(0.1)
+    after = await spot_tester.data.market_depth(spot_config.symbol)
+    aggregator.apply_depth(_depth_update(before, after))
+
+    rebuilt = DepthAggregator(("1ticks", "10ticks"))
+    await rebuilt.load_tick_sizes(spot_tester.client)
+    rebuilt.apply_depth(after)
+    for granularity in ("1ticks", "10ticks"):
+        updated = aggregator.view(spot_config.symbol, granularity)
+        expected = rebuilt.view(spot_config.symbol, granularity)
+        assert list(updated.bid_prices) == list(expected.bid_prices)
+        assert list(updated.bid_cumulative) == pytest.approx(list(expected.bid_cumulative))
+    logger.info("✅ Incremental update matches views rebuilt from the new snapshot")
+
+    # Perp levels priced between ticks stay distinct even when they round to the same tick
+    perp = DepthAggregator(("1ticks",), {"ETHRUSDPERP": "0.01"})
+    bids = [Level(px="3000.001", qty="1"), Level(px="3000.004", qty="2")]
+    perp.apply_depth(Depth(symbol="ETHRUSDPERP", type=DepthType.SNAPSHOT, bids=bids, asks=[], updatedAt=1))
+    assert list(perp.view("ETHRUSDPERP", "1ticks").bid_sizes) == [3.0]
+    removal = [Level(px="3000.004", qty="0")]
+    perp.apply_depth(Depth(symbol="ETHRUSDPERP", type=DepthType.UPDATE, bids=removal, asks=[], updatedAt=2))
+    assert list(perp.view("ETHRUSDPERP", "1ticks").bid_sizes) == [1.0]
+
+    await spot_tester.client.cancel_order(
+        order_id=order_ids[1], symbol=spot_config.symbol, account_id=spot_tester.account_id
+    )
+    await asyncio.sleep(0.05)
+    await spot_tester.check.no_open_orders()
+
+    logger.info("✅ SPOT AGGREGATED DEPTH VIEWS TEST COMPLETED")
@@ -12,6 +12,8 @@ import pytest
 
 from sdk.open_api.exceptions import ApiException
 from sdk.open_api.models.order_status import OrderStatus
+from sdk.reya_rest_api import OrderStateError, RateLimit, RateLimiter, RequestPriority
+from sdk.reya_rest_api.constants.enums import ReplaceOrderStatus
 from tests.helpers import ReyaTester
 from tests.helpers.builders import OrderBuilder
 from tests.helpers.reya_tester import limit_order_params_to_order, logger
@@ -139,6 +141,121 @@ async def test_spot_mass_cancel(spot_config: SpotTestConfig, spot_tester: ReyaTe
     logger.info("=" * 80)
 
 
+@pytest.mark.spot
+@pytest.mark.cancel
+@pytest.mark.asyncio
+async def test_spot_mass_cancel_all(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test cancelling orders across spot markets concurrently via mass_cancel_all.
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT MASS CANCEL ALL TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+
+    buy_price = round(spot_config.oracle_price * 0.96, 2)
+    order_params = OrderBuilder.from_config(spot_config).buy().price(str(buy_price)).gtc().build()
+    order_id = await spot_tester.orders.create_limit(order_params)
+    await spot_tester.wait.for_order_creation(order_id)
+    logger.info(f"✅ Order created: {order_id}")
+
+    result = await spot_tester.client.mass_cancel_all(symbols=[spot_config.symbol], account_id=spot_tester.account_id)
+    logger.info(f"Mass cancel all result: {result}")
+
+    assert result.succeeded, f"Mass cancel failed for: {result.errors}"
+    assert result.cancelled_count >= 1, f"Expected at least one cancelled order, got {result.cancelled_count}"
+
+    await spot_tester.wait.for_order_state(order_id, OrderStatus.CANCELLED)
+    await spot_tester.check.no_open_orders()
+
+    logger.info("✅ SPOT MASS CANCEL ALL TEST COMPLETED SUCCESSFULLY")
+
+
+@pytest.mark.spot
+@pytest.mark.cancel
+@pytest.mark.asyncio
+async def test_spot_rate_limited_cancels_jump_creates(
+    spot_config: SpotTestConfig, spot_tester: ReyaTester, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test that with a rate limiter installed, concurrent creates and cancels all go through,
+    cancels are dispatched ahead of queued creates, and every request is signed once granted
+    a slot, so nonces reach the exchange in increasing order.
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT RATE LIMITED ORDER ENTRY TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+
+    # Seed an order to cancel
+    seed_price = round(spot_config.oracle_price * 0.96, 2)
+    seed_params = OrderBuilder.from_config(spot_config).buy().price(str(seed_price)).gtc().build()
+    seed_order_id = await spot_tester.orders.create_limit(seed_params)
+    await spot_tester.wait.for_order_creation(seed_order_id)
+
+    client = spot_tester.client
+    sent_nonces: list[int] = []
+    send_create, send_cancel = client.orders.create_order, client.orders.cancel_order
+
+    async def recording_create_order(create_order_request):
+        sent_nonces.append(int(create_order_request.nonce))
+        return await send_create(create_order_request=create_order_request)
+
+    async def recording_cancel_order(cancel_order_request):
+        sent_nonces.append(int(cancel_order_request.nonce))
+        return await send_cancel(cancel_order_request=cancel_order_request)
+
+    monkeypatch.setattr(client.orders, "create_order", recording_create_order)
+    monkeypatch.setattr(client.orders, "cancel_order", recording_cancel_order)
+    limiter = RateLimiter(global_limit=RateLimit(rate=2, burst=1))
+    client.rate_limiter = limiter
+    try:
+        creates = [
+            asyncio.create_task(
+                client.create_limit_order(
+                    OrderBuilder.from_config(spot_config)
+                    .buy()
+                    .price(str(round(spot_config.oracle_price * (0.961 + i * 0.001), 2)))
+                    .gtc()
+                    .build()
+                )
+            )
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        cancel = asyncio.create_task(
+            client.cancel_order(order_id=seed_order_id, symbol=spot_config.symbol, account_id=spot_tester.account_id)
+        )
+
+        await cancel
+        assert not all(task.done() for task in creates), "Cancel should not wait for all queued creates"
+        responses = await asyncio.gather(*creates)
+    finally:
+        client.rate_limiter = None
+        monkeypatch.undo()
+
+    assert len(sent_nonces) == 4, f"Expected no request to be re-signed, got nonces {sent_nonces}"
+    assert sent_nonces == sorted(sent_nonces), f"Nonces were sent out of order: {sent_nonces}"
+
+    metrics = limiter.metrics()
+    logger.info(f"Rate limiter metrics: {metrics}")
+    assert metrics[RequestPriority.CREATE].requests == 3
+    assert metrics[RequestPriority.CANCEL].requests == 1
+    assert metrics[RequestPriority.CREATE].max_wait_s > metrics[RequestPriority.CANCEL].max_wait_s
+
+    await spot_tester.wait.for_order_state(seed_order_id, OrderStatus.CANCELLED)
+    for response in responses:
+        assert response.order_id is not None
+        await spot_tester.wait.for_order_creation(response.order_id)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+    await spot_tester.check.no_open_orders()
+
+    logger.info("✅ SPOT RATE LIMITED ORDER ENTRY TEST COMPLETED SUCCESSFULLY")
+
+
 @pytest.mark.spot
 @pytest.mark.cancel
 @pytest.mark.asyncio
@@ -452,3 +569,93 @@ async def test_spot_mass_cancel_no_orders(spot_config: SpotTestConfig, spot_test
     await spot_tester.check.no_open_orders()
 
     logger.info("✅ SPOT MASS CANCEL NO ORDERS TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.cancel
+@pytest.mark.asyncio
+async def test_spot_wait_for_order_cancelled(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test event-driven waits on order state transitions.
+
+    Flow:
+    1. Place a GTC order with a client order ID and wait for it to be OPEN
+    2. Cancel it and wait for CANCELLED via the client's order tracker
+    3. Verify waiting for a fill raises OrderStateError for the cancelled order
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT WAIT FOR ORDER TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+
+    client_order_id = int(time.time() * 1000) % (2**31 - 1)
+    order_params = (
+        OrderBuilder.from_config(spot_config).buy().at_price(0.96).gtc().client_order_id(client_order_id).build()
+    )
+
+    order_id = await spot_tester.orders.create_limit(order_params)
+    assert order_id is not None
+
+    opened = await spot_tester.client.wait_for_order(order_id, OrderStatus.OPEN, timeout=5)
+    assert opened.client_order_id == client_order_id
+    logger.info(f"✅ Order open: {order_id}")
+
+    await spot_tester.client.cancel_order(
+        order_id=order_id, symbol=spot_config.symbol, account_id=spot_tester.account_id
+    )
+
+    cancelled = await spot_tester.client.wait_for_order(order_id, OrderStatus.CANCELLED, timeout=5)
+    assert cancelled.status == OrderStatus.CANCELLED
+    logger.info("✅ Cancellation observed without polling")
+
+    with pytest.raises(OrderStateError):
+        await spot_tester.client.wait_for_fill(client_order_id, timeout=1)
+
+    await spot_tester.check.no_open_orders()
+
+    logger.info("✅ SPOT WAIT FOR ORDER TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.cancel
+@pytest.mark.asyncio
+async def test_spot_replace_order(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test replacing a resting order with concurrent cancel and create requests.
+
+    Flow:
+    1. Place a GTC order far from the market
+    2. Replace it with an order at a different price
+    3. Verify the old order is cancelled and the new one is on the book
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT REPLACE ORDER TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+
+    order_params = OrderBuilder.from_config(spot_config).buy().at_price(0.96).gtc().build()
+    old_order_id = await spot_tester.orders.create_limit(order_params)
+    await spot_tester.wait.for_order_creation(old_order_id)
+    assert old_order_id is not None
+
+    new_params = OrderBuilder.from_config(spot_config).buy().at_price(0.95).gtc().build()
+    result = await spot_tester.client.replace_order(old_order_id, new_params, account_id=spot_tester.account_id)
+
+    assert result.status == ReplaceOrderStatus.REPLACED, f"Replace failed: {result}"
+    assert result.create_response is not None and result.create_response.order_id is not None
+    new_order_id = result.create_response.order_id
+    logger.info(f"✅ Replaced {old_order_id} with {new_order_id}")
+
+    await spot_tester.wait.for_order_state(old_order_id, OrderStatus.CANCELLED)
+    await spot_tester.wait.for_order_creation(new_order_id)
+    logger.info("✅ Old order cancelled and new order on the book")
+
+    await spot_tester.client.cancel_order(
+        order_id=new_order_id, symbol=spot_config.symbol, account_id=spot_tester.account_id
+    )
+    await spot_tester.wait.for_order_state(new_order_id, OrderStatus.CANCELLED)
+    await spot_tester.check.no_open_orders()
+
+    logger.info("✅ SPOT REPLACE ORDER TEST COMPLETED")
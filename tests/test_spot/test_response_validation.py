@@ -8,17 +8,20 @@ Tests for validating the structure and data types of API responses:
 """
 
 import asyncio
+import json
 import logging
 from decimal import Decimal
 
 import pytest
 
+from sdk.open_api.configuration import Configuration
 from sdk.open_api.models import OrderStatus
 from sdk.open_api.models.depth import Depth
 from sdk.open_api.models.level import Level
 from sdk.open_api.models.order import Order
 from sdk.open_api.models.spot_execution import SpotExecution
 from sdk.open_api.models.spot_execution_list import SpotExecutionList
+from sdk.reya_rest_api import ReyaApiClient
 from tests.helpers import ReyaTester
 from tests.helpers.builders.order_builder import OrderBuilder
 from tests.helpers.validators import validate_order_fields, validate_spot_execution_fields
@@ -734,6 +737,72 @@ async def test_depth_quantity_aggregation(spot_config: SpotTestConfig, spot_test
     logger.info("✅ DEPTH QUANTITY AGGREGATION VALIDATION COMPLETED")
 
 
+# =============================================================================
+# TRUSTED RESPONSE DESERIALIZATION
+# =============================================================================
+
+
+@pytest.mark.spot
+@pytest.mark.validation
+@pytest.mark.asyncio
+async def test_trusted_response_deserialization(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test that responses deserialized in trusted mode equal the validated models.
+
+    Flow:
+    1. Place a GTC order and fetch open orders, depth and market definitions
+    2. Deserialize their JSON bodies with and without validation
+    3. Verify both give the same models, with enums and nested models converted
+    """
+    logger.info("=" * 80)
+    logger.info("TRUSTED RESPONSE DESERIALIZATION")
+    logger.info("=" * 80)
+
+    await spot_tester.orders.close_all(fail_if_none=False)
+
+    await spot_config.refresh_order_book(spot_tester.data)
+    safe_price = spot_config.get_safe_no_match_buy_price()
+    order_params = OrderBuilder.from_config(spot_config).buy().price(str(safe_price)).gtc().build()
+    order_id = await spot_tester.orders.create_limit(order_params)
+    await spot_tester.wait.for_order_creation(order_id)
+
+    client = spot_tester.client
+    strict = ReyaApiClient(Configuration(host=client.config.api_url))
+    trusted = ReyaApiClient(Configuration(host=client.config.api_url), trusted_responses=True)
+    open_orders = await client.get_open_orders()
+    depth = await spot_tester.data.market_depth(spot_config.symbol)
+    responses = [
+        ("List[Order]", open_orders),
+        ("Depth", depth),
+        ("List[SpotMarketDefinition]", await client.reference.get_spot_market_definitions()),
+    ]
+    content_type = "application/json"
+    for response_type, models in responses:
+        body_text = json.dumps(strict.sanitize_for_serialization(models))
+        expected = strict.deserialize(body_text, response_type, content_type)
+        assert expected == models
+        assert trusted.deserialize(body_text, response_type, content_type) == expected
+        logger.info(f"✅ {response_type} deserialized identically")
+
+    body_text = json.dumps(strict.sanitize_for_serialization(open_orders))
+    order = next(o for o in trusted.deserialize(body_text, "List[Order]", content_type) if o.order_id == order_id)
+    assert order.status == OrderStatus.OPEN
+
+    # Unknown keys are kept, as from_dict does
+    body = {**strict.sanitize_for_serialization(depth), "sequence": 7}
+    trusted_depth = trusted.deserialize(json.dumps(body), "Depth", content_type)
+    assert all(isinstance(level, Level) for level in trusted_depth.bids + trusted_depth.asks)
+    assert trusted_depth.additional_properties == {"sequence": 7}
+
+    await spot_tester.client.cancel_order(
+        order_id=order_id, symbol=spot_config.symbol, account_id=spot_tester.account_id
+    )
+    await asyncio.sleep(0.1)
+    await spot_tester.check.no_open_orders()
+
+    logger.info("✅ TRUSTED RESPONSE DESERIALIZATION COMPLETED")
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -25,6 +25,7 @@ logger = logging.getLogger("reya.integration_tests")
 
 
 @pytest.mark.spot
+@pytest.mark.live_api
 @pytest.mark.websocket
 @pytest.mark.asyncio
 async def test_spot_order_survives_ws_reconnect(spot_config: SpotTestConfig, spot_tester: ReyaTester):
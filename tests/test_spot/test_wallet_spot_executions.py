@@ -8,13 +8,18 @@ Tests for the GET /v2/wallet/:address/spotExecutions endpoint:
 """
 
 import asyncio
+import json
 import logging
 
 import pytest
 
+from sdk.async_api.wallet_spot_execution_update_payload import WalletSpotExecutionUpdatePayload
 from sdk.open_api.models import OrderStatus
 from sdk.open_api.models.spot_execution import SpotExecution
 from sdk.open_api.models.spot_execution_list import SpotExecutionList
+from sdk.reya_data import SHARED_TABLE, ExecutionStore, SpotExecutionRecord
+from sdk.reya_websocket import ReyaSocket
+from sdk.reya_websocket.config import WebSocketConfig
 from tests.helpers import ReyaTester
 from tests.helpers.builders.order_builder import OrderBuilder
 from tests.test_spot.spot_config import SpotTestConfig
@@ -272,3 +277,188 @@ async def test_rest_get_wallet_spot_executions_filters_by_wallet(
     await taker_tester.check.no_open_orders()
 
     logger.info("✅ WALLET SPOT EXECUTIONS FILTER BY WALLET TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.rest_api
+@pytest.mark.asyncio
+async def test_execution_store_incremental_sync(
+    spot_config: SpotTestConfig, maker_tester: ReyaTester, taker_tester: ReyaTester, tmp_path
+):
+    """
+    Test the local execution store: full sync, no-op resync, then an incremental sync after a trade.
+    """
+    logger.info("=" * 80)
+    logger.info("EXECUTION STORE INCREMENTAL SYNC TEST")
+    logger.info("=" * 80)
+
+    await maker_tester.orders.close_all(fail_if_none=False)
+    await taker_tester.orders.close_all(fail_if_none=False)
+
+    wallet_address = taker_tester.owner_wallet_address
+    assert wallet_address is not None, "Wallet address required"
+
+    with ExecutionStore(str(tmp_path / "executions.db")) as store:
+        first = await store.sync(taker_tester.client)
+        logger.info(f"Initial sync: {first}")
+        high_water = store.high_water_mark(wallet_address, "spot")
+
+        # Nothing new since the first sync
+        second = await store.sync(taker_tester.client)
+        assert second.perp_inserted == 0 and second.spot_inserted == 0, f"Resync should insert nothing: {second}"
+
+        # Trade, then sync only the new execution
+        maker_params = OrderBuilder.from_config(spot_config).buy().at_price(0.97).gtc().build()
+        maker_order_id = await maker_tester.orders.create_limit(maker_params)
+        await maker_tester.wait.for_order_creation(maker_order_id)
+        taker_params = OrderBuilder.from_config(spot_config).sell().at_price(0.97).ioc().build()
+        await taker_tester.orders.create_limit(taker_params)
+        await maker_tester.wait.for_order_state(maker_order_id, OrderStatus.FILLED, timeout=5)
+        await asyncio.sleep(0.5)
+
+        third = await store.sync(taker_tester.client)
+        assert third.spot_inserted >= 1, f"Incremental sync should pick up the new trade: {third}"
+        new_high_water = store.high_water_mark(wallet_address, "spot")
+        assert new_high_water is not None and (high_water is None or new_high_water > high_water)
+
+        local = store.spot_executions(wallet_address, symbol=spot_config.symbol, start_time=new_high_water)
+        assert len(local) >= 1, "Range query should return the new trade"
+        latest = (await taker_tester.client.wallet.get_wallet_spot_executions(address=wallet_address)).data[0]
+        assert local[-1].timestamp == latest.timestamp
+        assert local[-1].qty == latest.qty
+        assert local[-1].price == latest.price
+
+        # Re-adding REST rows (as if also received over the WebSocket) stores nothing new
+        assert store.add_spot_executions(wallet_address, [latest]) == 0
+
+    await maker_tester.check.no_open_orders()
+    await taker_tester.check.no_open_orders()
+
+    logger.info("✅ EXECUTION STORE INCREMENTAL SYNC TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.rest_api
+@pytest.mark.asyncio
+async def test_execution_records_lean_mode(
+    spot_config: SpotTestConfig, maker_tester: ReyaTester, taker_tester: ReyaTester
+):
+    """
+    Test compact execution records: lean store queries, model conversions and lean WebSocket parsing.
+    """
+    logger.info("=" * 80)
+    logger.info("EXECUTION RECORDS LEAN MODE TEST")
+    logger.info("=" * 80)
+
+    await maker_tester.orders.close_all(fail_if_none=False)
+    await taker_tester.orders.close_all(fail_if_none=False)
+
+    maker_params = OrderBuilder.from_config(spot_config).buy().at_price(0.97).gtc().build()
+    maker_order_id = await maker_tester.orders.create_limit(maker_params)
+    await maker_tester.wait.for_order_creation(maker_order_id)
+    taker_params = OrderBuilder.from_config(spot_config).sell().at_price(0.97).ioc().build()
+    await taker_tester.orders.create_limit(taker_params)
+    await maker_tester.wait.for_order_state(maker_order_id, OrderStatus.FILLED, timeout=5)
+    await asyncio.sleep(0.5)
+
+    wallet_address = taker_tester.owner_wallet_address
+    assert wallet_address is not None, "Wallet address required"
+    executions = (await taker_tester.client.wallet.get_wallet_spot_executions(address=wallet_address)).data
+    assert executions, "Trade should produce an execution"
+
+    records = [SpotExecutionRecord.from_model(execution) for execution in executions]
+    assert [record.to_model() for record in records] == executions
+    latest = records[0]
+    assert latest.side.value in ("B", "A") and latest.price == executions[0].price
+    logger.info(f"✅ {len(records)} executions converted to records and back")
+
+    with ExecutionStore() as store:
+        store.add_spot_executions(wallet_address, executions)
+        models = store.spot_executions(wallet_address, symbol=spot_config.symbol)
+        lean = store.spot_executions(wallet_address, symbol=spot_config.symbol, lean=True)
+        assert lean == [SpotExecutionRecord.from_model(model) for model in models]
+        # Records are accepted wherever executions are, and stored once
+        assert store.add_spot_executions(wallet_address, lean) == 0
+    logger.info(f"✅ Lean store query returned {len(lean)} records")
+
+    socket = ReyaSocket(url="ws://localhost", config=WebSocketConfig(url="ws://localhost"), lean=True)
+    channel = f"/v2/wallet/{wallet_address}/spotExecutions"
+    message = {
+        "type": "channel_data",
+        "timestamp": 1760000000000,
+        "channel": channel,
+        "data": [execution.to_dict() for execution in executions],
+    }
+    payload = socket._parse_message(message)  # pylint: disable=protected-access
+    assert isinstance(payload, WalletSpotExecutionUpdatePayload)
+    rows: list[object] = list(payload.data)  # Records in lean mode, not the declared models
+    assert rows == records
+    logger.info("✅ Lean WebSocket payload rows are records")
+
+    await maker_tester.check.no_open_orders()
+    await taker_tester.check.no_open_orders()
+
+    logger.info("✅ EXECUTION RECORDS LEAN MODE TEST COMPLETED")
+
+
+@pytest.mark.spot
+@pytest.mark.websocket
+@pytest.mark.asyncio
+async def test_parsed_payloads_share_interned_symbols(
+    spot_config: SpotTestConfig, maker_tester: ReyaTester, taker_tester: ReyaTester
+):
+    """
+    Test that parsed WebSocket payloads and records share one instance of each symbol and channel.
+    """
+    logger.info("=" * 80)
+    logger.info("INTERNED SYMBOLS TEST")
+    logger.info("=" * 80)
+
+    # The client seeds the shared table from the market definitions on start
+    assert spot_config.symbol in SHARED_TABLE
+
+    await maker_tester.orders.close_all(fail_if_none=False)
+    await taker_tester.orders.close_all(fail_if_none=False)
+
+    maker_params = OrderBuilder.from_config(spot_config).buy().at_price(0.97).gtc().build()
+    maker_order_id = await maker_tester.orders.create_limit(maker_params)
+    await maker_tester.wait.for_order_creation(maker_order_id)
+    taker_params = OrderBuilder.from_config(spot_config).sell().at_price(0.97).ioc().build()
+    await taker_tester.orders.create_limit(taker_params)
+    await maker_tester.wait.for_order_state(maker_order_id, OrderStatus.FILLED, timeout=5)
+    await asyncio.sleep(0.5)
+
+    wallet_address = taker_tester.owner_wallet_address
+    assert wallet_address is not None, "Wallet address required"
+    executions = (await taker_tester.client.wallet.get_wallet_spot_executions(address=wallet_address)).data
+    assert executions, "Trade should produce an execution"
+
+    def message() -> dict:
+        # Decoded from text, as received, so every string is a fresh copy
+        decoded: dict = json.loads(
+            json.dumps(
+                {
+                    "type": "channel_data",
+                    "timestamp": 1760000000000,
+                    "channel": f"/v2/wallet/{wallet_address}/spotExecutions",
+                    "data": [execution.to_dict() for execution in executions],
+                }
+            )
+        )
+        return decoded
+
+    for lean in (False, True):
+        socket = ReyaSocket(url="ws://localhost", config=WebSocketConfig(url="ws://localhost"), lean=lean)
+        first = socket._parse_message(message())  # pylint: disable=protected-access
+        second = socket._parse_message(message())  # pylint: disable=protected-access
+        assert isinstance(first, WalletSpotExecutionUpdatePayload)
+        assert isinstance(second, WalletSpotExecutionUpdatePayload)
+        assert first.channel is second.channel
+        assert first.data[0].symbol is second.data[0].symbol is SHARED_TABLE.intern(spot_config.symbol)
+        assert first.data[0].side is second.data[0].side
+        logger.info(f"✅ {'Lean' if lean else 'Validated'} payloads share symbol and channel strings")
+
+    await maker_tester.check.no_open_orders()
+    await taker_tester.check.no_open_orders()
+
+    logger.info("✅ INTERNED SYMBOLS TEST COMPLETED")
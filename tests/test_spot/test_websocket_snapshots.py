@@ -11,6 +11,8 @@ These tests verify that when subscribing to a WebSocket channel,
 the initial snapshot contains the correct state before incremental updates.
 """
 
+from typing import Union
+
 import asyncio
 import logging
 
@@ -19,6 +21,11 @@ import pytest
 from sdk.async_api.depth import Depth
 from sdk.async_api.level import Level
 from sdk.open_api.models import OrderStatus
+from sdk.reya_websocket.resources.market import (
+    MarketDepthSubscription,
+    MarketSpotExecutionsSubscription,
+    MarketSummarySubscription,
+)
 from tests.helpers import ReyaTester
 from tests.helpers.builders import OrderBuilder
 from tests.test_spot.spot_config import SpotTestConfig
@@ -626,3 +633,45 @@ async def test_spot_balances_ws_update_after_trade(
     await taker_tester.check.no_open_orders()
 
     logger.info("✅ SPOT BALANCES WS UPDATE AFTER TRADE TEST COMPLETED")
+
+
+# BULK SUBSCRIPTION TESTS
+# ============================================================================
+
+
+@pytest.mark.spot
+@pytest.mark.websocket
+@pytest.mark.asyncio
+async def test_spot_bulk_subscribe_and_unsubscribe(spot_config: SpotTestConfig, spot_tester: ReyaTester):
+    """
+    Test that subscribe_many/unsubscribe_many confirm every market channel.
+
+    Flow:
+    1. Bulk subscribe to the market channels of the spot symbol
+    2. Verify every channel was confirmed and is tracked as active
+    3. Bulk unsubscribe and verify every channel was confirmed and removed
+    """
+    logger.info("=" * 80)
+    logger.info(f"SPOT BULK SUBSCRIPTION TEST: {spot_config.symbol}")
+    logger.info("=" * 80)
+
+    websocket = spot_tester.websocket
+    assert websocket is not None, "WebSocket should be connected"
+
+    channels: list[Union[MarketDepthSubscription, MarketSpotExecutionsSubscription, MarketSummarySubscription]] = [
+        websocket.market.depth(spot_config.symbol),
+        websocket.market.spot_executions(spot_config.symbol),
+        websocket.market.summary(spot_config.symbol),
+    ]
+
+    result = await asyncio.to_thread(websocket.subscribe_many, channels)
+    assert result.all_confirmed, f"Bulk subscribe failed: {result.failed}"
+    assert {channel.path for channel in channels} <= websocket.active_subscriptions
+    logger.info(f"✅ Bulk subscribed to {len(result.confirmed)} channels")
+
+    result = await asyncio.to_thread(websocket.unsubscribe_many, channels)
+    assert result.all_confirmed, f"Bulk unsubscribe failed: {result.failed}"
+    assert not {channel.path for channel in channels} & websocket.active_subscriptions
+    logger.info(f"✅ Bulk unsubscribed from {len(result.confirmed)} channels")
+
+    logger.info("✅ SPOT BULK SUBSCRIPTION TEST COMPLETED")